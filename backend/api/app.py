@@ -1,10 +1,17 @@
+import asyncio
+import contextlib
 import logging
+from collections.abc import AsyncGenerator
 
 import sentry_sdk
 from fastapi import FastAPI, APIRouter, Depends
 from starlette.middleware.cors import CORSMiddleware
 
-from api.deps import validate_access_token, validate_api_token
+from api.deps import (
+    dispose_async_engine,
+    validate_access_token,
+    validate_api_token,
+)
 from api.routes.admin.chat import admin_chat_router
 from api.routes.admin.resource import admin_resource_router
 from api.routes.auth import auth_router
@@ -15,6 +22,7 @@ from api.routes.stats import stats_router
 from api.routes.system import system_router, system_non_authenticated_router
 from api.routes.user import user_router
 from api.settings import api_settings
+from core.services.user_snapshot import UserSnapshotCacheService
 
 
 logging.basicConfig(
@@ -65,8 +73,23 @@ def include_admin_routes(_app: FastAPI) -> None:
     _app.include_router(admin_router)
 
 
+@contextlib.asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    invalidations_listener = asyncio.create_task(
+        UserSnapshotCacheService.listen_invalidations()
+    )
+    try:
+        yield
+    finally:
+        invalidations_listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await invalidations_listener
+        await dispose_async_engine()
+
+
 def create_app() -> FastAPI:
     _app = FastAPI(
+        lifespan=lifespan,
         root_path="/api",
         title="Access",
         summary="Your access to the web3 world",
@@ -7,7 +7,7 @@ from urllib.parse import unquote_plus
 
 from fastapi import HTTPException, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.requests import Request
 from starlette.status import (
     HTTP_401_UNAUTHORIZED,
@@ -17,26 +17,59 @@ from starlette.status import (
 
 from api.pos.auth import InitDataPO
 from api.pos.chat import validate_address
+from core.db import DB_POOL_SIZE, create_async_db_engine
 from core.dtos.pagination import PaginationMetadataDTO, OrderingRuleDTO
-from core.dtos.user import UserInitDataPO
+from core.dtos.user import UserInitDataPO, UserSnapshotDTO
 from api.services.authentication import AuthenticationService, UnauthorizedError
 from api.settings import api_settings
-from core.models.user import User
 from core.services.db import DBService
 from core.services.user import UserService
+from core.services.user_snapshot import UserSnapshotCacheService
 
 security = HTTPBearer(auto_error=False)
 logger = logging.getLogger(__name__)
 
+# Secret key of the WebApp init data signature only depends on the bot token
+WEBAPP_SECRET_KEY = hmac.new(
+    b"WebAppData", api_settings.telegram_bot_token.encode(), hashlib.sha256
+).digest()
+
 
 def get_db_session():
     with DBService().db_session() as db_session:
         yield db_session
 
 
-def validate_user_init_data(init_data_po: InitDataPO) -> UserInitDataPO:
-    c_str = "WebAppData"
+_async_engine: AsyncEngine | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Returns the async engine of the API process, creating it on the first use.
+    The connections budget of a single sync pool is split between all the API workers,
+    so the async pools don't multiply the number of connections to the database.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(
+            pool_size=max(DB_POOL_SIZE // api_settings.web_concurrency, 1)
+        )
+    return _async_engine
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
+async def get_async_db_session():
+    async with DBService().async_db_session(bind=get_async_engine()) as db_session:
+        yield db_session
 
+
+def validate_user_init_data(init_data_po: InitDataPO) -> UserInitDataPO:
     init_data = init_data_po.init_data
 
     init_data = dict(
@@ -56,10 +89,7 @@ def validate_user_init_data(init_data_po: InitDataPO) -> UserInitDataPO:
         [f"{key}={value}" for key, value in init_data.items()]
     )
 
-    secret_key = hmac.new(
-        c_str.encode(), api_settings.telegram_bot_token.encode(), hashlib.sha256
-    ).digest()
-    data_check = hmac.new(secret_key, data_check_string.encode(), hashlib.sha256)
+    data_check = hmac.new(WEBAPP_SECRET_KEY, data_check_string.encode(), hashlib.sha256)
 
     if data_check.hexdigest() != _hash:
         raise HTTPException(status_code=400, detail="Invalid user data: wrong hash")
@@ -71,19 +101,34 @@ def validate_user_init_data(init_data_po: InitDataPO) -> UserInitDataPO:
     return user_data_init_po
 
 
+def get_user_snapshot(user_id: int) -> UserSnapshotDTO:
+    """
+    Returns the cached snapshot of the user or loads it from the database on a cache miss.
+
+    :param user_id: ID of the user
+    :return: Snapshot of the user
+    :raises NoResultFound: If the user doesn't exist
+    """
+    if snapshot := UserSnapshotCacheService.get(user_id):
+        return snapshot
+
+    version = UserSnapshotCacheService.get_version()
+    with DBService().db_session() as db_session:
+        snapshot = UserSnapshotDTO.from_orm(UserService(db_session).get(user_id))
+    UserSnapshotCacheService.set(snapshot, version=version)
+    return snapshot
+
+
 def validate_access_token(
     request: Request,
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(security)],
-    db_session: Session = Depends(get_db_session),
-) -> User:
+) -> UserSnapshotDTO:
     if not credentials:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Unauthorized")
     access_token = credentials.credentials
     try:
         user_id = AuthenticationService.verify_token(access_token)
-        user_service = UserService(db_session)
-        user = user_service.get(user_id)
-        request.state.user = user
+        request.state.user = get_user_snapshot(user_id)
         return request.state.user
     except UnauthorizedError:
         raise HTTPException(
@@ -92,9 +137,14 @@ def validate_access_token(
 
 
 def validate_admin_access(
-    user: User = Depends(validate_access_token),
+    user: UserSnapshotDTO = Depends(validate_access_token),
 ) -> None:
-    if not user.is_admin:
+    # Admin flag is changed manually and isn't invalidated in the cached snapshots,
+    # so it's always checked against the database
+    with DBService().db_session() as db_session:
+        is_admin = UserService(db_session).is_admin(user.id)
+
+    if not is_admin:
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="You are not allowed to access this resource",
@@ -136,10 +186,13 @@ def get_pagination_params(
     offset: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
     include_total_count: Annotated[bool, Query(alias="includeTotalCount")] = True,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
 ) -> PaginationMetadataDTO:
     """
     Retrieves pagination parameters with specified offset, limit, and an optional
     flag to include the total count in the metadata.
+    The offset pagination is kept for backwards compatibility,
+    the cursor takes precedence over it when provided.
 
     :param offset: The starting point of the pagination.
         Must be a non-negative integer.
@@ -148,11 +201,16 @@ def get_pagination_params(
     :param include_total_count: A boolean indicating whether to include the total
         count of items in the pagination metadata.
         Should mostly be used for performance reasons.
-    :return: Pagination metadata containing the offset, limit, and include_total_count
-        flag.
+    :param cursor: Opaque cursor of the next page returned with the previous page
+        for the keyset pagination.
+    :return: Pagination metadata containing the offset, limit, include_total_count
+        flag and cursor.
     """
     return PaginationMetadataDTO(
-        offset=offset, limit=limit, include_total_count=include_total_count
+        offset=offset,
+        limit=limit,
+        include_total_count=include_total_count,
+        cursor=cursor,
     )
 
 
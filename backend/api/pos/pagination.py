@@ -3,3 +3,4 @@ from api.pos.base import BaseFDO
 
 class PaginationMetadataFDO(BaseFDO):
     total_count: int | None
+    next_cursor: str | None = None
@@ -3,6 +3,7 @@ from typing import Any, Self, Annotated
 from pydantic import Field
 
 from api.pos.base import BaseFDO
+from core.dtos.user import UserSnapshotDTO
 
 
 class UserFDO(BaseFDO):
@@ -28,6 +29,19 @@ class UserFDO(BaseFDO):
             wallets=[w.address for w in obj.wallets],
         )
 
+    @classmethod
+    def from_dto(cls, dto: UserSnapshotDTO) -> Self:
+        return cls(
+            id=dto.id,
+            first_name=dto.first_name,
+            last_name=dto.last_name,
+            username=dto.username,
+            is_premium=dto.is_premium,
+            language_code=dto.language,
+            photo_url=None,
+            wallets=list(dto.wallets),
+        )
+
 
 class UpdateUserWalletFDO(BaseFDO):
     user: UserFDO
@@ -32,7 +32,7 @@ manage_rules_router.include_router(manage_external_source_rules_router)
 
 
 @manage_rules_router.put("/move", description="Move rule to another group")
-async def move_rule(
+def move_rule(
     request: Request,
     slug: str,
     item: UpdateRuleGroupCPO,
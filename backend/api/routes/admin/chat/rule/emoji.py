@@ -21,7 +21,7 @@ manage_emoji_rules_router = APIRouter(prefix="/emoji")
         },
     },
 )
-async def get_emoji_rule(
+def get_emoji_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -47,7 +47,7 @@ async def get_emoji_rule(
         },
     },
 )
-async def add_emoji_rule(
+def add_emoji_rule(
     request: Request,
     slug: str,
     rule: TelegramChatEmojiRuleCPO,
@@ -76,7 +76,7 @@ async def add_emoji_rule(
         },
     },
 )
-async def update_emoji_rule(
+def update_emoji_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -105,7 +105,7 @@ async def update_emoji_rule(
         },
     },
 )
-async def delete_emoji_rule(
+def delete_emoji_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -4,6 +4,7 @@ from starlette.requests import Request
 
 from api.deps import get_db_session
 from api.pos.chat import TelegramChatJettonRuleCPO, JettonEligibilityRuleFDO
+from api.utils import run_async_action
 from core.actions.chat.rule.blockchain import TelegramChatJettonAction
 
 
@@ -11,7 +12,7 @@ manage_jetton_rules_router = APIRouter(prefix="/jettons")
 
 
 @manage_jetton_rules_router.get("/{rule_id}")
-async def get_chat_jetton_rule(
+def get_chat_jetton_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -28,7 +29,7 @@ async def get_chat_jetton_rule(
 
 
 @manage_jetton_rules_router.post("")
-async def add_chat_jetton_rule(
+def add_chat_jetton_rule(
     request: Request,
     slug: str,
     rule: TelegramChatJettonRuleCPO,
@@ -39,7 +40,8 @@ async def add_chat_jetton_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    chat_jetton_rule = await telegram_chat_jetton_action.create(
+    chat_jetton_rule = run_async_action(
+        telegram_chat_jetton_action.create,
         group_id=rule.group_id,
         category=rule.category,
         address_raw=rule.address,
@@ -49,7 +51,7 @@ async def add_chat_jetton_rule(
 
 
 @manage_jetton_rules_router.put("/{rule_id}")
-async def update_chat_jetton_rule(
+def update_chat_jetton_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -61,7 +63,8 @@ async def update_chat_jetton_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    chat_jetton_rule = await action.update(
+    chat_jetton_rule = run_async_action(
+        action.update,
         rule_id=rule_id,
         category=rule.category,
         address_raw=rule.address,
@@ -72,7 +75,7 @@ async def update_chat_jetton_rule(
 
 
 @manage_jetton_rules_router.delete("/{rule_id}")
-async def delete_chat_jetton_rule(
+def delete_chat_jetton_rule(
     request: Request,
     slug: str,
     rule_id: int,
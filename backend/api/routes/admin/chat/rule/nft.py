@@ -4,6 +4,7 @@ from starlette.requests import Request
 
 from api.deps import get_db_session
 from api.pos.chat import NftEligibilityRuleFDO, TelegramChatNFTCollectionRuleCPO
+from api.utils import run_async_action
 from core.actions.chat.rule.blockchain import TelegramChatNFTCollectionAction
 
 
@@ -11,7 +12,7 @@ manage_nft_collection_rules_router = APIRouter(prefix="/nft-collections")
 
 
 @manage_nft_collection_rules_router.get("/{rule_id}")
-async def get_chat_nft_collection_rule(
+def get_chat_nft_collection_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -28,7 +29,7 @@ async def get_chat_nft_collection_rule(
 
 
 @manage_nft_collection_rules_router.post("")
-async def add_chat_nft_collection_rule(
+def add_chat_nft_collection_rule(
     request: Request,
     slug: str,
     rule: TelegramChatNFTCollectionRuleCPO,
@@ -39,7 +40,8 @@ async def add_chat_nft_collection_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    chat_nft_collection_rule = await action.create(
+    chat_nft_collection_rule = run_async_action(
+        action.create,
         group_id=rule.group_id,
         address_raw=rule.address,
         threshold=rule.expected,
@@ -50,7 +52,7 @@ async def add_chat_nft_collection_rule(
 
 
 @manage_nft_collection_rules_router.put("/{rule_id}")
-async def update_chat_nft_collection_rule(
+def update_chat_nft_collection_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -62,7 +64,8 @@ async def update_chat_nft_collection_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    nft_collection_rule = await action.update(
+    nft_collection_rule = run_async_action(
+        action.update,
         rule_id=rule_id,
         asset=rule.asset,
         address_raw=rule.address,
@@ -74,7 +77,7 @@ async def update_chat_nft_collection_rule(
 
 
 @manage_nft_collection_rules_router.delete("/{rule_id}")
-async def delete_chat_nft_collection_rule(
+def delete_chat_nft_collection_rule(
     request: Request,
     slug: str,
     rule_id: int,
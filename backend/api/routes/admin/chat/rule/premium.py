@@ -25,7 +25,7 @@ manage_premium_rules_router = APIRouter(prefix="/premium")
         },
     },
 )
-async def get_premium_rule(
+def get_premium_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -51,7 +51,7 @@ async def get_premium_rule(
         },
     },
 )
-async def add_premium_rule(
+def add_premium_rule(
     request: Request,
     slug: str,
     rule: CreateTelegramChatPremiumRuleCPO,
@@ -79,7 +79,7 @@ async def add_premium_rule(
     deprecated=True,
     summary="[DEPRECATED] Update Telegram Premium Rule",
 )
-async def update_premium_rule(
+def update_premium_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -106,7 +106,7 @@ async def update_premium_rule(
         },
     },
 )
-async def delete_premium_rule(
+def delete_premium_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -4,13 +4,14 @@ from starlette.requests import Request
 
 from api.deps import get_db_session
 from api.pos.chat import StickerChatEligibilityRuleFDO, TelegramChatStickerRuleCPO
+from api.utils import run_async_action
 from core.actions.chat.rule.sticker import TelegramChatStickerCollectionAction
 
 manage_sticker_rules_router = APIRouter(prefix="/stickers")
 
 
 @manage_sticker_rules_router.get("/{rule_id}")
-async def get_chat_sticker_rule(
+def get_chat_sticker_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -21,12 +22,12 @@ async def get_chat_sticker_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    rule = await action.read(rule_id=rule_id)
+    rule = run_async_action(action.read, rule_id=rule_id)
     return StickerChatEligibilityRuleFDO.model_validate(rule.model_dump())
 
 
 @manage_sticker_rules_router.post("")
-async def add_chat_sticker_rule(
+def add_chat_sticker_rule(
     request: Request,
     slug: str,
     rule: TelegramChatStickerRuleCPO,
@@ -37,7 +38,8 @@ async def add_chat_sticker_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    new_rule = await action.create(
+    new_rule = run_async_action(
+        action.create,
         group_id=rule.group_id,
         collection_id=rule.collection_id,
         character_id=rule.character_id,
@@ -48,7 +50,7 @@ async def add_chat_sticker_rule(
 
 
 @manage_sticker_rules_router.put("/{rule_id}")
-async def update_chat_sticker_rule(
+def update_chat_sticker_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -60,7 +62,8 @@ async def update_chat_sticker_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    updated_rule = await action.update(
+    updated_rule = run_async_action(
+        action.update,
         rule_id=rule_id,
         collection_id=rule.collection_id,
         character_id=rule.character_id,
@@ -72,7 +75,7 @@ async def update_chat_sticker_rule(
 
 
 @manage_sticker_rules_router.delete("/{rule_id}")
-async def delete_chat_sticker_rule(
+def delete_chat_sticker_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -83,4 +86,4 @@ async def delete_chat_sticker_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    await action.delete(rule_id=rule_id)
+    run_async_action(action.delete, rule_id=rule_id)
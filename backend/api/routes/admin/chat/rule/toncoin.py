@@ -11,7 +11,7 @@ manage_toncoin_rules_router = APIRouter(prefix="/toncoin")
 
 
 @manage_toncoin_rules_router.get("/{rule_id}")
-async def get_chat_toncoin_rule(
+def get_chat_toncoin_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -28,7 +28,7 @@ async def get_chat_toncoin_rule(
 
 
 @manage_toncoin_rules_router.post("")
-async def add_chat_toncoin_rule(
+def add_chat_toncoin_rule(
     request: Request,
     slug: str,
     rule: TelegramChatToncoinRuleCPO,
@@ -49,7 +49,7 @@ async def add_chat_toncoin_rule(
 
 
 @manage_toncoin_rules_router.put("/{rule_id}")
-async def update_chat_toncoin_rule(
+def update_chat_toncoin_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -72,7 +72,7 @@ async def update_chat_toncoin_rule(
 
 
 @manage_toncoin_rules_router.delete("/{rule_id}")
-async def delete_chat_toncoin_rule(
+def delete_chat_toncoin_rule(
     request: Request,
     slug: str,
     rule_id: int,
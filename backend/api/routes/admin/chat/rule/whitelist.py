@@ -14,6 +14,7 @@ from api.pos.chat import (
     WhitelistRuleExternalFDO,
     UpdateWhitelistRuleExternalCPO,
 )
+from api.utils import run_async_action
 from core.actions.chat.rule.whitelist import (
     TelegramChatWhitelistAction,
     TelegramChatWhitelistExternalSourceAction,
@@ -26,7 +27,7 @@ manage_whitelist_rules_router = admin_chat_router = APIRouter(prefix="/whitelist
 
 
 @manage_whitelist_rules_router.post("")
-async def add_chat_whitelist_rule(
+def add_chat_whitelist_rule(
     request: Request,
     slug: str,
     rule: CreateWhitelistRuleCPO,
@@ -42,7 +43,8 @@ async def add_chat_whitelist_rule(
         name=rule.name,
         description=rule.description,
     )
-    result = await action.set_content(
+    result = run_async_action(
+        action.set_content,
         rule_id=new_rule.id,
         content=rule.users,
     )
@@ -50,7 +52,7 @@ async def add_chat_whitelist_rule(
 
 
 @manage_whitelist_rules_router.put("/{rule_id}")
-async def update_chat_whitelist_rule(
+def update_chat_whitelist_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -72,7 +74,7 @@ async def update_chat_whitelist_rule(
 
 
 @manage_whitelist_rules_router.delete("/{rule_id}")
-async def delete_chat_whitelist_rule(
+def delete_chat_whitelist_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -83,11 +85,11 @@ async def delete_chat_whitelist_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    await action.delete(rule_id=rule_id)
+    run_async_action(action.delete, rule_id=rule_id)
 
 
 @manage_whitelist_rules_router.get("/{rule_id}")
-async def get_chat_whitelist_rule(
+def get_chat_whitelist_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -108,7 +110,7 @@ manage_external_source_rules_router = APIRouter(prefix="/external-source")
 
 
 @manage_external_source_rules_router.post("")
-async def add_chat_whitelist_external_source_rule(
+def add_chat_whitelist_external_source_rule(
     request: Request,
     slug: str,
     rule: CreateWhitelistRuleExternalCPO,
@@ -120,7 +122,8 @@ async def add_chat_whitelist_external_source_rule(
         chat_slug=slug,
     )
     try:
-        new_rule = await action.create(
+        new_rule = run_async_action(
+            action.create,
             group_id=rule.group_id,
             name=rule.name,
             description=rule.description,
@@ -148,7 +151,7 @@ async def add_chat_whitelist_external_source_rule(
 
 
 @manage_external_source_rules_router.get("/{rule_id}")
-async def get_chat_whitelist_external_source_rule(
+def get_chat_whitelist_external_source_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -164,7 +167,7 @@ async def get_chat_whitelist_external_source_rule(
 
 
 @manage_external_source_rules_router.put("/{rule_id}")
-async def update_chat_whitelist_external_source_rule(
+def update_chat_whitelist_external_source_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -177,7 +180,8 @@ async def update_chat_whitelist_external_source_rule(
         chat_slug=slug,
     )
     try:
-        await action.update(
+        run_async_action(
+            action.update,
             rule_id=rule_id,
             name=rule.name,
             description=rule.description,
@@ -198,7 +202,7 @@ async def update_chat_whitelist_external_source_rule(
 
 
 @manage_external_source_rules_router.delete("/{rule_id}")
-async def delete_chat_whitelist_external_source_rule(
+def delete_chat_whitelist_external_source_rule(
     request: Request,
     slug: str,
     rule_id: int,
@@ -209,4 +213,4 @@ async def delete_chat_whitelist_external_source_rule(
         requestor=request.state.user,
         chat_slug=slug,
     )
-    await action.delete(rule_id=rule_id)
+    run_async_action(action.delete, rule_id=rule_id)
@@ -1,12 +1,12 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_404_NOT_FOUND, HTTP_200_OK, HTTP_400_BAD_REQUEST
 
 from api.deps import (
     validate_access_token,
-    get_db_session,
+    get_async_db_session,
     get_pagination_params,
     get_sorting_params,
 )
@@ -18,10 +18,10 @@ from api.pos.chat import (
 )
 from core.dtos.chat import TelegramChatOrderingRuleDTO
 from core.dtos.pagination import PaginationMetadataDTO
-from core.exceptions.api import InvalidSortingParameter
+from core.exceptions.api import InvalidSortingParameter, InvalidPaginationCursor
 from core.exceptions.chat import TelegramChatNotExists
-from core.actions.chat import TelegramChatAction
-from core.models.user import User
+from core.actions.chat import AsyncTelegramChatAction
+from core.dtos.user import UserSnapshotDTO
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +40,10 @@ chat_router = APIRouter(prefix="/chats", tags=["Chats"])
 )
 async def get_chat(
     slug: str,
-    user: User = Depends(validate_access_token),
-    db_session: Session = Depends(get_db_session),
+    user: UserSnapshotDTO = Depends(validate_access_token),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> TelegramChatWithEligibilitySummaryFDO:
-    telegram_chat_action = TelegramChatAction(db_session)
+    telegram_chat_action = AsyncTelegramChatAction(db_session)
     try:
         result = await telegram_chat_action.get_with_eligibility_summary(
             slug=slug,
@@ -62,26 +62,26 @@ async def get_chat(
     responses={
         HTTP_200_OK: {"model": PaginatedTelegramChatsFDO},
         HTTP_400_BAD_REQUEST: {
-            "description": "Bad request, e.g. wrong sorting params",
+            "description": "Bad request, e.g. wrong sorting params or pagination cursor",
             "model": BaseExceptionFDO,
         },
     },
 )
 async def get_chats(
-    _: User = Depends(validate_access_token),
-    db_session: Session = Depends(get_db_session),
+    _: UserSnapshotDTO = Depends(validate_access_token),
+    db_session: AsyncSession = Depends(get_async_db_session),
     pagination_params: PaginationMetadataDTO = Depends(get_pagination_params),
     sorting_params: TelegramChatOrderingRuleDTO | None = Depends(
         get_sorting_params(TelegramChatOrderingRuleDTO)
     ),
 ) -> PaginatedTelegramChatsFDO:
-    telegram_chat_action = TelegramChatAction(db_session)
+    telegram_chat_action = AsyncTelegramChatAction(db_session)
     try:
-        chats = telegram_chat_action.get_all(
+        chats = await telegram_chat_action.get_all(
             pagination_params=pagination_params,
             sorting_params=sorting_params,
         )
-    except InvalidSortingParameter:
+    except (InvalidSortingParameter, InvalidPaginationCursor):
         raise HTTPException(
             detail="Bad request",
             status_code=HTTP_400_BAD_REQUEST,
@@ -92,4 +92,5 @@ async def get_chats(
             for chat in chats.items
         ],
         total_count=chats.total_count,
+        next_cursor=chats.next_cursor,
     )
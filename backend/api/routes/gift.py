@@ -4,10 +4,10 @@ from typing import Annotated
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.params import Depends
 from pydantic import BeforeValidator
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND
 
-from api.deps import get_db_session
+from api.deps import get_async_db_session
 from api.pos.base import BaseExceptionFDO
 from api.pos.chat import WhitelistRuleUsersFDO
 from api.pos.gift import GiftFilterPO, GiftUniqueItemsFDO, GiftUniqueInfoFDO
@@ -31,11 +31,14 @@ async def get_gifts_owners(
         ...,
         description="Encoded list of filter values. The OR logic between items will be applied, meaning that any of the matched options will be returned.",
     ),
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> WhitelistRuleUsersFDO:
-    gift_unique_action = GiftUniqueAction(db_session=db_session)
     try:
-        holders = gift_unique_action.get_collections_holders(options=options)
+        holders = await db_session.run_sync(
+            lambda session: GiftUniqueAction(
+                db_session=session
+            ).get_collections_holders(options=options)
+        )
     except ValueError as e:
         logger.warning("Wrong filter format: %s", e)
         raise HTTPException(
@@ -59,10 +62,13 @@ async def get_gifts_owners(
 )
 async def get_collection_holders(
     collection_slug: str,
-    db_session: Session = Depends(get_db_session),
+    db_session: AsyncSession = Depends(get_async_db_session),
 ) -> GiftUniqueItemsFDO:
-    gift_unique_action = GiftUniqueAction(db_session=db_session)
-    items = gift_unique_action.get_all(collection_slug=collection_slug)
+    items = await db_session.run_sync(
+        lambda session: GiftUniqueAction(db_session=session).get_all(
+            collection_slug=collection_slug
+        )
+    )
     return GiftUniqueItemsFDO(
         items=[GiftUniqueInfoFDO.from_dto(item) for item in items]
     )
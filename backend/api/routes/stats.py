@@ -14,8 +14,10 @@ from api.services.prometheus import (
     jettons_count_gauge,
     jetton_wallets_count_gauge,
     wallets_count_gauge,
+    redis_pool_connections_gauge,
 )
 from core.actions.stats import StatsCollectorAction
+from core.services.superredis import RedisService
 
 
 stats_router = APIRouter(prefix="/stats", tags=["Internal Stats"])
@@ -36,4 +38,10 @@ def get_stats(db_session: Session = Depends(get_db_session)) -> Response:
     jetton_wallets_count_gauge.set(stats.total_jettons)
     wallets_count_gauge.set(stats.total_wallets)
 
+    for pool_stats in RedisService.get_pool_stats():
+        for state in ("created", "in_use", "available"):
+            redis_pool_connections_gauge.labels(pool=pool_stats.name, state=state).set(
+                getattr(pool_stats, state)
+            )
+
     return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -16,6 +16,7 @@ from core.exceptions.wallet import (
     ProofValidationError,
     UserWalletNotConnectedError,
 )
+from core.services.user import UserService
 
 user_router = APIRouter(prefix="/users")
 
@@ -24,7 +25,7 @@ user_router = APIRouter(prefix="/users")
 async def get_user_data(
     request: Request,
 ) -> UserFDO:
-    return UserFDO.from_orm(request.state.user)
+    return UserFDO.from_dto(request.state.user)
 
 
 @user_router.post(
@@ -79,7 +80,9 @@ async def connect_user_wallet(
         )
 
     return UpdateUserWalletFDO(
-        user=UserFDO.from_orm(request.state.user),
+        user=UserFDO.from_orm(
+            UserService(db_session).get(request.state.user.id, refresh=True)
+        ),
         task_id=task_id,
     )
 
@@ -130,7 +133,9 @@ async def set_user_wallet(
         )
 
     return UpdateUserWalletFDO(
-        user=UserFDO.from_orm(request.state.user),
+        user=UserFDO.from_orm(
+            UserService(db_session).get(request.state.user.id, refresh=True)
+        ),
         # No need to refresh wallet details if it is already a tracked wallet
         task_id=None,
     )
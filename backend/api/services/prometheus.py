@@ -25,3 +25,8 @@ jetton_wallets_count_gauge = Gauge(
 wallets_count_gauge = Gauge(
     "wallets_count", "Current number of connected wallets in the database"
 )
+redis_pool_connections_gauge = Gauge(
+    "redis_pool_connections",
+    "Current number of connections in the Redis connection pools of the process",
+    ["pool", "state"],
+)
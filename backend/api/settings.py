@@ -12,6 +12,8 @@ class ApiSettings(CoreSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiry: int = 3600
     sentry_dns: str | None = Field(None)
+    # Number of the API worker processes, the same variable is read by uvicorn and gunicorn
+    web_concurrency: int = 1
 
     allowed_api_tokens_raw: str | None = Field(
         None, validation_alias="ALLOWED_API_TOKENS"
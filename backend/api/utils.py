@@ -1,8 +1,28 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import ParamSpec, TypeVar
+
 from api.settings import api_settings
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
 
 def get_cdn_absolute_url(path: str | None) -> str | None:
     if not path or path.startswith("http"):
         return path
 
     return f"{api_settings.internal_cdn_base_url}/{path}"
+
+
+def run_async_action(
+    func: Callable[P, Awaitable[R]], *args: P.args, **kwargs: P.kwargs
+) -> R:
+    """
+    Runs the coroutine of an action using the sync database session
+    in a new event loop of the current thread.
+
+    Such actions mix blocking database queries with async requests, so they are called
+    from plain `def` routes that FastAPI runs in the threadpool instead of the main event loop.
+    """
+    return asyncio.run(func(*args, **kwargs))
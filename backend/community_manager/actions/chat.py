@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from collections import defaultdict
 from tempfile import NamedTemporaryFile
 
 from sqlalchemy.exc import IntegrityError, NoResultFound
@@ -19,11 +20,12 @@ from aiogram.utils.markdown import (
     markdown_decoration,
 )
 
-from community_manager.dtos.chat import TargetChatMembersDTO
+from community_manager.dtos.chat import KickTargetDTO, TargetChatMembersDTO
 from community_manager.events import ChatAdminChangeEventBuilder
 from community_manager.settings import community_manager_settings
 from community_manager.gateway.client import TelegramGatewayClient
 from community_manager.services.bot_api import TelegramBotApiService
+from community_manager.services.kick import KickExecutor
 from core.dtos.gateway import IndexChatCommand
 from community_manager.utils import (
     is_chat_participant_admin,
@@ -244,7 +246,7 @@ class CommunityManagerChatAction(BaseAction):
         chat, logo_path = await _get_chat_data_and_assets()
 
         # 2. Create chat entity in DB immediately with available data
-        telegram_chat_dto = await self._create(
+        await self._create(
             chat,
             logo_path=logo_path,
             sufficient_bot_privileges=event.sufficient_bot_privileges,
@@ -286,15 +288,13 @@ class CommunityManagerChatAction(BaseAction):
 
         logger.info(f"Chat {chat.id!r} indexed successfully")
 
-        members_count = self.telegram_chat_user_service.get_members_count(
-            telegram_chat_dto.id
-        )
         # Return updated DTO (refetching to include updates like invite_link)
         updated_chat = self.telegram_chat_service.get(chat_id)
         return TelegramChatDTO.from_object(
             obj=updated_chat,
             insufficient_privileges=not event.sufficient_bot_privileges,
-        ).model_copy(update={"members_count": members_count})
+            members_count=updated_chat.members_count,
+        )
 
     async def refresh_all(self) -> None:
         """
@@ -863,34 +863,17 @@ class CommunityManagerTaskChatAction:
         :return: A `TargetChatMembersDTO` object containing the updated wallet addresses,
             sticker owner IDs, and the compiled target chat members.
         """
-        wallets = self.redis_service.pop_from_set(
-            name=UPDATED_WALLETS_SET_NAME,
+        (
+            wallets,
+            sticker_owners_telegram_ids,
+            gift_owners_telegram_ids,
+        ) = self.redis_service.pop_from_sets(
+            UPDATED_WALLETS_SET_NAME,
+            UPDATED_STICKERS_USER_IDS,
+            UPDATED_GIFT_USER_IDS,
             count=community_manager_settings.items_per_task,
         )
-        if isinstance(wallets, str):
-            wallets = [wallets]
-
-        sticker_owners_telegram_ids = (
-            self.redis_service.pop_from_set(
-                name=UPDATED_STICKERS_USER_IDS,
-                count=community_manager_settings.items_per_task,
-            )
-            or []
-        )
-        if isinstance(sticker_owners_telegram_ids, str):
-            sticker_owners_telegram_ids = [sticker_owners_telegram_ids]
         sticker_owners_telegram_ids = set(map(int, sticker_owners_telegram_ids))
-
-        gift_owners_telegram_ids = (
-            self.redis_service.pop_from_set(
-                name=UPDATED_GIFT_USER_IDS,
-                count=community_manager_settings.items_per_task,
-            )
-            or []
-        )
-
-        if isinstance(gift_owners_telegram_ids, str):
-            gift_owners_telegram_ids = [gift_owners_telegram_ids]
         gift_owners_telegram_ids = set(map(int, gift_owners_telegram_ids))
 
         target_chat_members: set[tuple[int, int]] = set()
@@ -1024,8 +1007,8 @@ class CommunityManagerTaskChatAction:
         """
         Refreshes all enabled Telegram chat external sources.
 
-        This method retrieves the list of enabled external sources and performs validation
-        to refresh them.
+        This method retrieves the list of enabled external sources, fetches them concurrently
+        and refreshes only the ones which content was modified since the last refresh.
         For removed members, it handles appropriate actions such as kicking ineligible chat members.
         This ensures synchronization between the source's metadata and the chat's current state.
         """
@@ -1036,37 +1019,35 @@ class CommunityManagerTaskChatAction:
         community_user_action = CommunityManagerUserChatAction(
             db_session=self.db_session
         )
-        for source in sources:
+        async for (
+            source,
+            diff,
+            fetch_state,
+        ) in telegram_chat_external_source_service.fetch_modified(sources):
             logger.info(
-                f"Refreshing enabled chat source {source.chat_id!r} for chat {source.chat_id!r} with URL {source.url!r}"
-            )
-            # It should not raise, but log any validation error and continue
-            diff = await telegram_chat_external_source_service.validate_external_source(
-                url=source.url,
-                auth_key=source.auth_key,
-                auth_value=source.auth_value,
-                previous_content=source.content,
-                raise_for_error=False,
+                f"Refreshing modified chat source {source.id!r} for chat {source.chat_id!r} with URL {source.url!r}"
             )
-            if not diff:
-                logger.warning(f"Validation for {source.url!r} failed. Continue...")
-                continue
-
             # Update content before the eligibility check so that
             # is_whitelisted reads the current list, not the stale one
-            telegram_chat_external_source_service.set_content(source, diff.current)
+            telegram_chat_external_source_service.set_content(
+                source, diff.current, fetch_state=fetch_state
+            )
 
             if diff.removed:
                 logger.info(
                     f"Found {len(diff.removed)} removed members from the source {source.chat_id!r}"
                 )
-                users = self.user_service.get_all(telegram_ids=diff.removed)
-                chat_members = self.telegram_chat_user_service.get_all(
-                    user_ids=[_user.id for _user in users],
-                )
-                await community_user_action.kick_ineligible_chat_members(
-                    chat_members=chat_members
+                # Content of the source affects only the chat it belongs to,
+                #  so other memberships of the removed users are not rechecked
+                removed_members_batches = (
+                    self.telegram_chat_user_service.yield_by_telegram_ids(
+                        chat_id=source.chat_id, telegram_ids=diff.removed
+                    )
                 )
+                for chat_members in removed_members_batches:
+                    await community_user_action.kick_ineligible_chat_members(
+                        chat_members=chat_members
+                    )
 
         logger.info("All enabled chat sources refreshed.")
 
@@ -1205,90 +1186,79 @@ class CommunityManagerUserChatAction:
         )
         return total_processed
 
-    async def kick_chat_member(self, chat_member: TelegramChatUser) -> None:
-        """
-        Kicks a specified chat member from the chat. It ensures that the bot
-        has enough privileges to perform the action and sends a notification
-        to the user if they allow direct messages. The method handles exceptions
-        arising due to administrative restrictions or RPC errors and logs
-        appropriate messages for each case.
-
-        :param chat_member: A TelegramChatUser object representing the user to be
-            kicked from the chat. Must be a bot-managed user with attributes defining
-            their chat, user ID, and permission states.
-        """
+    @staticmethod
+    def _is_kickable(chat_member: TelegramChatUser) -> bool:
         if not chat_member.is_managed and not chat_member.chat.is_full_control:
             logger.warning(
                 f"Attempt to kick non-managed chat member {chat_member.chat_id=} and {chat_member.user_id=}. Skipping."
             )
-            return
+            return False
 
         if chat_member.is_admin:
             logger.warning(
                 f"Attempt to kick admin {chat_member.chat_id=} and {chat_member.user_id=}. Skipping."
             )
-            return
+            return False
 
         if chat_member.chat.insufficient_privileges:
             logger.warning(
                 f"Attempt to kick chat member {chat_member.chat_id=} and {chat_member.user_id=} "
                 f"failed as bot was lacking privileges to manage the chat. Skipping."
             )
-            return
+            return False
 
-        try:
-            async with TelegramBotApiService() as bot_service:
-                # use Bot API for kicking
-                await bot_service.kick_chat_member(
-                    chat_id=chat_member.chat_id,
-                    user_id=chat_member.user.telegram_id,
-                )
+        return True
 
-                if chat_member.user.allows_write_to_pm:
-                    try:
-                        await bot_service.send_message(
-                            chat_id=chat_member.user.telegram_id,
-                            text=fmt_text(
-                                "You were kicked out of the ",
-                                fmt_bold(chat_member.chat.title),
-                                "\\.",
-                                sep="",
-                            ),
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to send message to user {chat_member.user.telegram_id!r} "
-                            f"while kicking them from chat {chat_member.chat_id!r}",
-                            exc_info=e,
-                        )
+    async def kick_chat_members(self, chat_members: list[TelegramChatUser]) -> None:
+        """
+        Kicks the specified chat members from their chats. Only bot-managed non-admin members
+        of the chats where the bot has enough privileges are kicked.
+        Members are notified if they allow direct messages.
 
-            self.telegram_chat_user_service.delete(
-                chat_id=chat_member.chat_id, user_id=chat_member.user.id
-            )
-            logger.info(
-                f"User {chat_member.user.telegram_id!r} was kicked from chat {chat_member.chat_id!r}"
-            )
-        except (TelegramBadRequest, TelegramForbiddenError) as e:
-            if "owner" in str(e) or "administrator" in str(e):
-                logger.info("Marking as admin and skipping kick.")
-                chat_member.is_admin = True
-                # We don't know if they are manager admin, so we don't set it (defaults false if not set)
-                # But to be safe we can explicitly say we don't know, or leave as is.
-                # Since we likely just discovered they are admin, we set is_admin=True.
-                self.db_session.flush()
-                return
+        Kicks run concurrently within the Bot API rate limits over a single client,
+        and the database is updated once for the whole batch afterward:
+        kicked members are deleted per chat and members that turned out to be admins are marked as such.
 
-            # Common BotAPI errors: User not found (400) or Bot was blocked/kicked (403)
-            logger.warning(
-                f"Failed to kick user {chat_member.user.telegram_id!r} from chat {chat_member.chat_id!r}: {e}"
-            )
-        except Exception as e:
-            # Unexpected errors
-            logger.error(
-                f"Unexpected error kicking user {chat_member.user.telegram_id!r} from chat {chat_member.chat_id!r}",
-                exc_info=e,
+        :param chat_members: TelegramChatUser objects representing the users to be kicked.
+        """
+        targets = [
+            KickTargetDTO.from_orm(chat_member)
+            for chat_member in chat_members
+            if self._is_kickable(chat_member)
+        ]
+        if not targets:
+            return
+
+        async with TelegramBotApiService() as bot_service:
+            result = await KickExecutor(bot_service).kick(targets)
+
+        kicked_user_ids_per_chat: dict[int, list[int]] = defaultdict(list)
+        for target in result.kicked:
+            kicked_user_ids_per_chat[target.chat_id].append(target.user_id)
+        for chat_id, user_ids in kicked_user_ids_per_chat.items():
+            self.telegram_chat_user_service.delete_batch(
+                chat_id=chat_id, user_ids=user_ids
             )
 
+        if result.admins:
+            admins = {(target.chat_id, target.user_id) for target in result.admins}
+            for chat_member in chat_members:
+                if (chat_member.chat_id, chat_member.user_id) in admins:
+                    # We don't know if they are manager admin, so it's left as is
+                    chat_member.is_admin = True
+            self.db_session.flush()
+
+    async def kick_chat_member(self, chat_member: TelegramChatUser) -> None:
+        """
+        Kicks a specified chat member from the chat.
+        See `kick_chat_members` for details.
+
+        :param chat_member: A TelegramChatUser object representing the user to be
+            kicked from the chat. Must be a bot-managed user with attributes defining
+            their chat, user ID, and permission states.
+        """
+        await self.kick_chat_members([chat_member])
+
     async def kick_ineligible_chat_members(
         self,
         chat_members: list[TelegramChatUser],
@@ -1313,6 +1283,5 @@ class CommunityManagerUserChatAction:
 
         logger.info(f"Found {len(ineligible_members)} ineligible chat members")
 
-        for member in ineligible_members:
-            # kick_chat_member handles exceptions internally
-            await self.kick_chat_member(member)
+        # kick_chat_members handles exceptions internally
+        await self.kick_chat_members(ineligible_members)
@@ -1,9 +1,11 @@
 import logging
 
 from celery import Celery
-from celery.signals import worker_ready
+from celery.signals import worker_process_shutdown, worker_ready, worker_shutdown
 
+from community_manager.services.bot_api import TelegramBotApiService
 from community_manager.settings import community_manager_settings
+from core.utils.task import WorkerEventLoop
 
 
 logger = logging.getLogger(__name__)
@@ -47,3 +49,10 @@ def log_queue_stats_on_startup(sender, **kwargs):
         )
     except Exception as e:
         logger.warning(f"Could not fetch Celery queue stats: {e}")
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def close_worker_event_loop(**kwargs):
+    """Close the connections of the shared clients before the process exits"""
+    WorkerEventLoop.shutdown(TelegramBotApiService.close_shared)
@@ -1,8 +1,52 @@
+from typing import Self
+
 from pydantic import BaseModel
 
+from core.models.chat import TelegramChatUser
+
 
 class TargetChatMembersDTO(BaseModel):
     wallets: list[str]
     sticker_owners_ids: list[int]
     gift_owners_ids: list[int]
     target_chat_members: set[tuple[int, int]]
+
+
+class KickTargetDTO(BaseModel):
+    """
+    Attributes of the chat member required to kick them,
+    so kicks can run concurrently without touching the database session.
+    """
+
+    chat_id: int
+    chat_title: str
+    user_id: int
+    telegram_id: int
+    allows_write_to_pm: bool
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatUser) -> Self:
+        return cls(
+            chat_id=obj.chat_id,
+            chat_title=obj.chat.title,
+            user_id=obj.user_id,
+            telegram_id=obj.user.telegram_id,
+            allows_write_to_pm=bool(obj.user.allows_write_to_pm),
+        )
+
+
+class KickResultDTO(BaseModel):
+    """
+    Outcome of kicking a batch of chat members along with the throughput metrics.
+    """
+
+    kicked: list[KickTargetDTO] = []
+    # Members that turned out to be chat admins and can't be kicked
+    admins: list[KickTargetDTO] = []
+    failed: list[KickTargetDTO] = []
+    rate_limited_count: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def kicks_per_second(self) -> float:
+        return len(self.kicked) / self.elapsed if self.elapsed else 0.0
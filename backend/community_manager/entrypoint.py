@@ -12,12 +12,14 @@ from community_manager.handlers.chat import (
 )
 from core.utils.probe import start_health_check_server
 from community_manager.settings import community_manager_settings
+from core.services.superredis import AsyncRedisService
 from core.services.supertelethon import TelethonService
 from community_manager.events import (
     ChatJoinRequestEventBuilder,
     ChatAdminChangeEventBuilder,
 )
 from community_manager.gateway.service import TelegramGatewayService
+from community_manager.services.bot_api import TelegramBotApiService
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -81,6 +83,10 @@ def main() -> None:
     finally:
         gateway_service.stop()
         telethon_service.client.loop.run_until_complete(gateway_task)
+        telethon_service.client.loop.run_until_complete(
+            TelegramBotApiService.close_shared()
+        )
+        telethon_service.client.loop.run_until_complete(AsyncRedisService.close_pools())
 
 
 if __name__ == "__main__":
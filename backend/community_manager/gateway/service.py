@@ -1,22 +1,29 @@
 import asyncio
 import json
 import logging
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 
+from aiolimiter import AsyncLimiter
 from sqlalchemy.orm import sessionmaker, Session
+from telethon.tl.types import User as TelethonUser
 
 from core.db import engine
 from core.actions.user import UserAction
 from core.services.chat.user import TelegramChatUserService
 from core.dtos.gateway import IndexChatCommand
 from core.dtos.user import TelegramUserDTO
-from core.services.superredis import RedisService
+from core.services.superredis import AsyncRedisService
 from core.services.supertelethon import TelethonService
 from core.constants import (
     CELERY_SYSTEM_QUEUE_NAME,
     CELERY_GATEWAY_INDEX_QUEUE_NAME,
+    GATEWAY_INDEX_BATCH_SIZE,
+    GATEWAY_PARTICIPANTS_PAGE_SIZE,
 )
 
 from community_manager.celery_app import app
+from community_manager.settings import community_manager_settings
 from community_manager.utils import (
     is_chat_participant_manager_admin,
     is_chat_participant_admin,
@@ -28,35 +35,71 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
 class TelegramGatewayService:
-    def __init__(self, telethon_service: TelethonService) -> None:
+    def __init__(
+        self,
+        telethon_service: TelethonService,
+        concurrency: int | None = None,
+        flood_limiter: AsyncLimiter | None = None,
+    ) -> None:
         self.telethon_service = telethon_service
-        self.redis_service = RedisService()
+        self.redis_service = AsyncRedisService()
         self.queue_name = CELERY_GATEWAY_INDEX_QUEUE_NAME
+        self.concurrency = concurrency or community_manager_settings.gateway_concurrency
+        # Telegram applies flood limits per account, so the budget is shared by all workers
+        self.flood_limiter = flood_limiter or AsyncLimiter(
+            max_rate=community_manager_settings.gateway_flood_budget,
+            time_period=community_manager_settings.gateway_flood_budget_period,
+        )
         self.running = False
+        # Lock of the chat and the number of commands holding or awaiting it
+        self._chat_locks: dict[int, tuple[asyncio.Lock, int]] = {}
 
     async def start(self) -> None:
         """
         Starts the gateway service loop.
+        Commands are processed concurrently by up to ``concurrency`` workers.
+        A command is popped from the queue only when there is a free worker,
+        so pending commands stay in Redis rather than in the process memory.
         """
         self.running = True
-        logger.info("Starting Telegram Gateway Service...")
-        while self.running:
-            try:
-                # BLPOP blocks until an item is available
-                # returns tuple (queue_name, data)
-                # timeout=1 to allow loop checking for self.running
-                item = self.redis_service.blpop(self.queue_name, timeout=1)
+        logger.info(
+            f"Starting Telegram Gateway Service with {self.concurrency} workers..."
+        )
+        workers_semaphore = asyncio.Semaphore(self.concurrency)
+        in_progress: set[asyncio.Task] = set()
+        try:
+            while self.running:
+                await workers_semaphore.acquire()
+                try:
+                    # timeout=1 to allow loop checking for self.running
+                    item = await self.redis_service.blpop(self.queue_name, timeout=1)
+                except Exception as e:
+                    workers_semaphore.release()
+                    logger.error(f"Error in Gateway loop: {e}", exc_info=True)
+                    await asyncio.sleep(1)
+                    continue
 
-                if item:
-                    _, data = item
-                    await self._process_command(data)
+                if not item:
+                    workers_semaphore.release()
+                    continue
 
-                # Yield control to allow other tasks (Telethon events) to run
-                await asyncio.sleep(0.01)
+                _, data = item
+                task = asyncio.create_task(self._run_command(data, workers_semaphore))
+                in_progress.add(task)
+                task.add_done_callback(in_progress.discard)
+        finally:
+            if in_progress:
+                logger.info(f"Waiting for {len(in_progress)} commands to finish...")
+                await asyncio.gather(*in_progress, return_exceptions=True)
+            await self.redis_service.close()
 
-            except Exception as e:
-                logger.error(f"Error in Gateway loop: {e}", exc_info=True)
-                await asyncio.sleep(1)
+    async def _run_command(
+        self, data: str | bytes, workers_semaphore: asyncio.Semaphore
+    ) -> None:
+        try:
+            await self._process_command(data)
+        finally:
+            workers_semaphore.release()
 
     async def _process_command(self, data: str | bytes) -> None:
         try:
@@ -77,53 +120,190 @@ class TelegramGatewayService:
         except Exception as e:
             logger.error(f"Failed to process command: {data} - {e}", exc_info=True)
 
+    async def _iter_participants(
+        self, chat_id: int
+    ) -> AsyncGenerator[TelethonUser, None]:
+        """
+        Iterates over the chat participants, spending the flood budget
+        for every page Telethon is about to request.
+        """
+        participants = self.telethon_service.get_participants(chat_id)
+        index = 0
+        while True:
+            if index % GATEWAY_PARTICIPANTS_PAGE_SIZE == 0:
+                await self.flood_limiter.acquire()
+            try:
+                participant_user = await anext(participants)
+            except StopAsyncIteration:
+                return
+            index += 1
+            yield participant_user
+
+    @staticmethod
+    def _bulk_index_participants(
+        db_session: Session, chat_id: int, participants: list[TelethonUser]
+    ) -> list[int]:
+        """
+        Stores the batch of the chat participants with two bulk upserts.
+
+        :return: IDs of the stored users
+        """
+        user_ids = UserAction(db_session).bulk_create_or_update(
+            [
+                TelegramUserDTO.from_telethon_user(participant_user)
+                for participant_user in participants
+            ]
+        )
+        TelegramChatUserService(db_session).bulk_create_or_update(
+            chat_id=chat_id,
+            members=[
+                (
+                    user_ids[participant_user.id],
+                    is_chat_participant_admin(participant_user.participant),
+                    is_chat_participant_manager_admin(participant_user.participant),
+                )
+                for participant_user in participants
+            ],
+            is_managed=False,
+        )
+        return list(user_ids.values())
+
+    @staticmethod
+    def _index_participants_one_by_one(
+        db_session: Session, chat_id: int, participants: list[TelethonUser]
+    ) -> tuple[list[int], int]:
+        """
+        Stores the chat participants one by one, isolating failures of separate users.
+
+        :return: IDs of the stored users and the number of participants that failed to store
+        """
+        user_action = UserAction(db_session)
+        telegram_chat_user_service = TelegramChatUserService(db_session)
+
+        processed_user_ids = []
+        errors_count = 0
+        for participant_user in participants:
+            try:
+                with db_session.begin_nested():
+                    user = user_action.create_or_update(
+                        TelegramUserDTO.from_telethon_user(participant_user)
+                    )
+                    telegram_chat_user_service.create_or_update(
+                        chat_id=chat_id,
+                        user_id=user.id,
+                        is_admin=is_chat_participant_admin(
+                            participant_user.participant
+                        ),
+                        is_manager_admin=is_chat_participant_manager_admin(
+                            participant_user.participant
+                        ),
+                        is_managed=False,
+                    )
+                processed_user_ids.append(user.id)
+            except Exception as e:
+                errors_count += 1
+                logger.error(
+                    f"Failed to process user {participant_user.id}: {e}",
+                    exc_info=True,
+                )
+                # begin_nested() automatically rolls back the savepoint on exception
+
+        return processed_user_ids, errors_count
+
+    def _index_participants(
+        self, db_session: Session, chat_id: int, participants: list[TelethonUser]
+    ) -> tuple[list[int], int]:
+        """
+        Stores the batch of the chat participants.
+        Runs in a separate thread, so the blocking DB calls don't stall the event loop.
+        If the bulk write fails, the batch is retried row by row,
+        so only the failing participants are counted as errors.
+
+        :return: IDs of the stored users and the number of participants that failed to store
+        """
+        try:
+            with db_session.begin_nested():
+                return (
+                    self._bulk_index_participants(db_session, chat_id, participants),
+                    0,
+                )
+        except Exception as e:
+            logger.warning(
+                f"Bulk indexing of {len(participants)} participants of chat {chat_id} "
+                f"failed, falling back to per-user writes: {e}",
+            )
+
+        return self._index_participants_one_by_one(db_session, chat_id, participants)
+
+    @staticmethod
+    def _finalize_index(
+        db_session: Session,
+        chat_id: int,
+        processed_user_ids: list[int],
+        cleanup: bool,
+    ) -> None:
+        if cleanup:
+            TelegramChatUserService(db_session).delete_stale_participants(
+                chat_id=chat_id, active_user_ids=processed_user_ids
+            )
+
+        db_session.commit()
+
+    @asynccontextmanager
+    async def _chat_lock(self, chat_id: int) -> AsyncGenerator[None, None]:
+        """
+        Serializes the commands of the same chat.
+        The lock is dropped once no command holds or awaits it,
+        so the locks of all the chats ever indexed are not kept in memory.
+        """
+        lock, users_count = self._chat_locks.get(chat_id, (asyncio.Lock(), 0))
+        self._chat_locks[chat_id] = (lock, users_count + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users_count = self._chat_locks[chat_id]
+            if users_count > 1:
+                self._chat_locks[chat_id] = (lock, users_count - 1)
+            else:
+                del self._chat_locks[chat_id]
+
     async def _handle_index_chat(self, command: IndexChatCommand) -> None:
+        # Concurrent indexing of the same chat would race on the same rows
+        async with self._chat_lock(command.chat_id):
+            await self._index_chat(command)
+
+    async def _index_chat(self, command: IndexChatCommand) -> None:
         chat_id = command.chat_id
         logger.info(f"Indexing chat {chat_id}...")
 
         db_session: Session = SessionLocal()
         try:
-            user_action = UserAction(db_session)
-            telegram_chat_user_service = TelegramChatUserService(db_session)
-
             processed_user_ids = []
-            count = 0
             errors_count = 0
 
-            # TODO: We might need to handle flood waits here if iteration is fast?
-            # Telethon handles it internally mostly.
-
-            async for participant_user in self.telethon_service.get_participants(
-                chat_id
-            ):
+            batch: list[TelethonUser] = []
+            async for participant_user in self._iter_participants(chat_id):
                 if participant_user.bot:
                     continue
 
-                try:
-                    with db_session.begin_nested():
-                        user = user_action.create_or_update(
-                            TelegramUserDTO.from_telethon_user(participant_user)
-                        )
-                        telegram_chat_user_service.create_or_update(
-                            chat_id=chat_id,
-                            user_id=user.id,
-                            is_admin=is_chat_participant_admin(
-                                participant_user.participant
-                            ),
-                            is_manager_admin=is_chat_participant_manager_admin(
-                                participant_user.participant
-                            ),
-                            is_managed=False,
-                        )
-                    processed_user_ids.append(user.id)
-                    count += 1
-                except Exception as e:
-                    errors_count += 1
-                    logger.error(
-                        f"Failed to process user {participant_user.id}: {e}",
-                        exc_info=True,
-                    )
-                    # begin_nested() automatically rolls back the savepoint on exception
+                batch.append(participant_user)
+                if len(batch) < GATEWAY_INDEX_BATCH_SIZE:
+                    continue
+
+                batch_user_ids, batch_errors_count = await asyncio.to_thread(
+                    self._index_participants, db_session, chat_id, batch
+                )
+                processed_user_ids.extend(batch_user_ids)
+                errors_count += batch_errors_count
+                batch = []
+
+            if batch:
+                batch_user_ids, batch_errors_count = await asyncio.to_thread(
+                    self._index_participants, db_session, chat_id, batch
+                )
+                processed_user_ids.extend(batch_user_ids)
+                errors_count += batch_errors_count
 
             cleanup_safe = command.cleanup and errors_count == 0
             if command.cleanup and not cleanup_safe:
@@ -132,16 +312,21 @@ class TelegramGatewayService:
                     f"failed to index, active_user_ids list is incomplete."
                 )
 
-            if cleanup_safe:
-                telegram_chat_user_service.delete_stale_participants(
-                    chat_id=chat_id, active_user_ids=processed_user_ids
-                )
-
-            db_session.commit()
-            logger.info(f"Finished indexing chat {chat_id}. Found {count} members.")
+            await asyncio.to_thread(
+                self._finalize_index,
+                db_session,
+                chat_id,
+                processed_user_ids,
+                cleanup_safe,
+            )
+            logger.info(
+                f"Finished indexing chat {chat_id}. "
+                f"Found {len(processed_user_ids)} members."
+            )
 
             if cleanup_safe:
-                app.send_task(
+                await asyncio.to_thread(
+                    app.send_task,
                     "check-target-chat-members",
                     args=(chat_id,),
                     queue=CELERY_SYSTEM_QUEUE_NAME,
@@ -152,9 +337,9 @@ class TelegramGatewayService:
 
         except Exception as e:
             logger.error(f"Error indexing chat {chat_id}: {e}", exc_info=True)
-            db_session.rollback()
+            await asyncio.to_thread(db_session.rollback)
         finally:
-            db_session.close()
+            await asyncio.to_thread(db_session.close)
 
     def stop(self) -> None:
         self.running = False
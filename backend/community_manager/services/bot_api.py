@@ -15,25 +15,75 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramBotApiService:
-    def __init__(self) -> None:
+    """
+    Bot API client used as an async context manager.
+
+    By default, all the services in the process share a single bot, so requests reuse
+    the keep-alive connections of its pool instead of doing a TLS handshake with the Bot API
+    on every `async with`. The shared bot is closed with `close_shared` when the process stops.
+    """
+
+    _shared_bot: Bot | None = None
+    # aiohttp sessions are bound to the event loop they were created in
+    _shared_bot_loop: asyncio.AbstractEventLoop | None = None
+
+    def __init__(self, shared: bool = True) -> None:
+        """
+        :param shared: Whether to use the bot shared by the process.
+            Otherwise, a new bot is created on enter and closed on exit.
+        """
+        self.shared = shared
         self.bot: Bot | None = None
 
-    async def __aenter__(self) -> "TelegramBotApiService":
-        session = AiohttpSession()
-        self.bot = Bot(
+    @staticmethod
+    def _create_bot() -> Bot:
+        return Bot(
             token=community_manager_settings.telegram_bot_token,
-            session=session,
+            session=AiohttpSession(
+                limit=community_manager_settings.bot_api_connections_limit
+            ),
             default=DefaultBotProperties(parse_mode="MarkdownV2"),
         )
+
+    @classmethod
+    def get_shared_bot(cls) -> Bot:
+        loop = asyncio.get_running_loop()
+        if cls._shared_bot is None or cls._shared_bot_loop is not loop:
+            if cls._shared_bot is not None:
+                logger.warning(
+                    "Shared Bot API client was created in another event loop. "
+                    "Creating a new one."
+                )
+            cls._shared_bot = cls._create_bot()
+            cls._shared_bot_loop = loop
+        return cls._shared_bot
+
+    @classmethod
+    async def close_shared(cls) -> None:
+        """
+        Closes the connections of the shared bot.
+        Should be awaited in the event loop the bot was used in before the process stops.
+        """
+        bot, loop = cls._shared_bot, cls._shared_bot_loop
+        cls._shared_bot = cls._shared_bot_loop = None
+        if bot and loop is asyncio.get_running_loop():
+            await bot.session.close()
+
+    async def __aenter__(self) -> "TelegramBotApiService":
+        self.bot = self.get_shared_bot() if self.shared else self._create_bot()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self.bot:
+        if self.bot and not self.shared:
             await self.bot.session.close()
 
-    async def _safe_request(self, func, *args, **kwargs) -> Any:
+    async def _safe_request(
+        self, func, *args, sleep_on_rate_limit: bool = True, **kwargs
+    ) -> Any:
         """
         Wraps a request with basic retry logic for 429s.
+        If `sleep_on_rate_limit` is False, `TelegramRetryAfter` is raised to the caller,
+        so it can pause other requests as well.
         """
         if not self.bot:
             raise RuntimeError(
@@ -43,6 +93,8 @@ class TelegramBotApiService:
         try:
             return await func(*args, **kwargs)
         except TelegramRetryAfter as e:
+            if not sleep_on_rate_limit:
+                raise
             logger.warning(f"Rate limited. Sleeping for {e.retry_after} seconds.")
             await asyncio.sleep(e.retry_after)
             return await func(*args, **kwargs)
@@ -51,7 +103,11 @@ class TelegramBotApiService:
             raise e
 
     async def kick_chat_member(
-        self, chat_id: int | str, user_id: int, ban_duration_minutes: int = 1
+        self,
+        chat_id: int | str,
+        user_id: int,
+        ban_duration_minutes: int = 1,
+        sleep_on_rate_limit: bool = True,
     ) -> bool:
         """
         Kicks a user from a chat by temporarily banning them.
@@ -60,6 +116,7 @@ class TelegramBotApiService:
             chat_id: The chat ID to kick the user from
             user_id: The user ID to kick
             ban_duration_minutes: Duration of the ban in minutes (default: 1)
+            sleep_on_rate_limit: Whether to sleep and retry once if rate limited (default: True)
         """
         logger.info(
             f"Kicking user {user_id} from chat {chat_id} "
@@ -75,6 +132,7 @@ class TelegramBotApiService:
             chat_id=chat_id,
             user_id=user_id,
             until_date=until_date,
+            sleep_on_rate_limit=sleep_on_rate_limit,
         )
 
     async def unban_chat_member(self, chat_id: int | str, user_id: int) -> bool:
@@ -87,14 +145,22 @@ class TelegramBotApiService:
         )
 
     async def send_message(
-        self, chat_id: int | str, text: str, reply_markup: Any = None
+        self,
+        chat_id: int | str,
+        text: str,
+        reply_markup: Any = None,
+        sleep_on_rate_limit: bool = True,
     ) -> Any:
         """
         Sends a text message to a chat with optional reply markup.
         """
         logger.info(f"Sending message to chat {chat_id}: {text[:50]}...")
         return await self._safe_request(
-            self.bot.send_message, chat_id=chat_id, text=text, reply_markup=reply_markup
+            self.bot.send_message,
+            chat_id=chat_id,
+            text=text,
+            reply_markup=reply_markup,
+            sleep_on_rate_limit=sleep_on_rate_limit,
         )
 
     async def create_chat_invite_link(
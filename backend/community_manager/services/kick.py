@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramRetryAfter,
+)
+from aiogram.utils.markdown import bold as fmt_bold, text as fmt_text
+from aiolimiter import AsyncLimiter
+
+from community_manager.dtos.chat import KickResultDTO, KickTargetDTO
+from community_manager.services.bot_api import TelegramBotApiService
+from community_manager.settings import community_manager_settings
+
+logger = logging.getLogger(__name__)
+
+# Attempts of a single request interrupted by the rate limits
+MAX_RATE_LIMITED_ATTEMPTS = 3
+
+# Limiters are shared by all executors of the process, so concurrent runs
+# don't exceed the limits of the bot together
+_global_limiter = AsyncLimiter(
+    max_rate=community_manager_settings.kick_rate_limit, time_period=1
+)
+_chat_limiters: dict[int, AsyncLimiter] = {}
+
+
+def _get_chat_limiter(chat_id: int) -> AsyncLimiter:
+    if chat_id not in _chat_limiters:
+        _chat_limiters[chat_id] = AsyncLimiter(
+            max_rate=community_manager_settings.kick_chat_rate_limit,
+            time_period=community_manager_settings.kick_chat_rate_limit_period,
+        )
+    return _chat_limiters[chat_id]
+
+
+def _prune_chat_limiters() -> None:
+    # Limiters that are fully drained keep no state and are recreated on demand
+    for chat_id, limiter in list(_chat_limiters.items()):
+        if limiter.has_capacity(limiter.max_rate):
+            del _chat_limiters[chat_id]
+
+
+class KickExecutor:
+    """
+    Kicks chat members concurrently over a single Bot API client.
+
+    Requests are throttled by the global limiter shared by all chats and by a limiter per chat.
+    Both are shared by all executors of the process.
+    When Telegram responds with `TelegramRetryAfter`, all workers pause for the requested time
+    and the interrupted request is retried.
+    """
+
+    def __init__(
+        self,
+        bot_service: TelegramBotApiService,
+        concurrency: int | None = None,
+        global_limiter: AsyncLimiter | None = None,
+    ) -> None:
+        self.bot_service = bot_service
+        self.concurrency = concurrency or community_manager_settings.kick_concurrency
+        self.global_limiter = global_limiter or _global_limiter
+        self._resume_at = 0.0
+
+    async def _request(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        result: KickResultDTO,
+        chat_limiter: AsyncLimiter | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        for attempt in range(1, MAX_RATE_LIMITED_ATTEMPTS + 1):
+            while (delay := self._resume_at - loop.time()) > 0:
+                await asyncio.sleep(delay)
+
+            if chat_limiter:
+                await chat_limiter.acquire()
+            await self.global_limiter.acquire()
+            try:
+                return await func(**kwargs, sleep_on_rate_limit=False)
+            except TelegramRetryAfter as e:
+                result.rate_limited_count += 1
+                self._resume_at = max(self._resume_at, loop.time() + e.retry_after)
+                logger.warning(
+                    f"Kicks are rate limited for {e.retry_after} seconds "
+                    f"(attempt {attempt}/{MAX_RATE_LIMITED_ATTEMPTS})."
+                )
+                if attempt == MAX_RATE_LIMITED_ATTEMPTS:
+                    raise
+
+    async def _kick(self, target: KickTargetDTO, result: KickResultDTO) -> None:
+        try:
+            await self._request(
+                self.bot_service.kick_chat_member,
+                result,
+                chat_limiter=_get_chat_limiter(target.chat_id),
+                chat_id=target.chat_id,
+                user_id=target.telegram_id,
+            )
+        except (TelegramBadRequest, TelegramForbiddenError) as e:
+            if "owner" in str(e) or "administrator" in str(e):
+                logger.info(
+                    f"User {target.telegram_id!r} is an admin of chat {target.chat_id!r}. Skipping kick."
+                )
+                result.admins.append(target)
+                return
+
+            # Common BotAPI errors: User not found (400) or Bot was blocked/kicked (403)
+            logger.warning(
+                f"Failed to kick user {target.telegram_id!r} from chat {target.chat_id!r}: {e}"
+            )
+            result.failed.append(target)
+            return
+        except Exception as e:
+            logger.error(
+                f"Unexpected error kicking user {target.telegram_id!r} from chat {target.chat_id!r}",
+                exc_info=e,
+            )
+            result.failed.append(target)
+            return
+
+        result.kicked.append(target)
+        logger.info(
+            f"User {target.telegram_id!r} was kicked from chat {target.chat_id!r}"
+        )
+
+        if not target.allows_write_to_pm:
+            return
+
+        try:
+            await self._request(
+                self.bot_service.send_message,
+                result,
+                chat_id=target.telegram_id,
+                text=fmt_text(
+                    "You were kicked out of the ",
+                    fmt_bold(target.chat_title),
+                    "\\.",
+                    sep="",
+                ),
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to send message to user {target.telegram_id!r} "
+                f"while kicking them from chat {target.chat_id!r}",
+                exc_info=e,
+            )
+
+    async def _worker(
+        self, targets: asyncio.Queue[KickTargetDTO], result: KickResultDTO
+    ) -> None:
+        while True:
+            try:
+                target = targets.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._kick(target, result)
+
+    async def kick(self, targets: list[KickTargetDTO]) -> KickResultDTO:
+        """
+        Kicks the chat members and notifies them if they allow messages from the bot.
+        Errors are logged and don't interrupt kicks of the other members.
+
+        :param targets: Chat members to kick
+        :return: Kicked members, members that turned out to be admins, failed members
+            and the throughput metrics of the run
+        """
+        result = KickResultDTO()
+        if not targets:
+            return result
+
+        _prune_chat_limiters()
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        queue: asyncio.Queue[KickTargetDTO] = asyncio.Queue()
+        for target in targets:
+            queue.put_nowait(target)
+
+        await asyncio.gather(
+            *(
+                self._worker(queue, result)
+                for _ in range(min(self.concurrency, len(targets)))
+            )
+        )
+        result.elapsed = loop.time() - started_at
+        logger.info(
+            f"Kicked {len(result.kicked)} of {len(targets)} chat members "
+            f"in {result.elapsed:.2f}s ({result.kicks_per_second:.2f} kicks/s). "
+            f"Admins: {len(result.admins)}, failed: {len(result.failed)}, "
+            f"rate limited: {result.rate_limited_count} time(s)."
+        )
+        return result
@@ -22,6 +22,23 @@ class CommunityManagerSettings(CoreSettings):
     enable_manager: bool
     items_per_task: int = 100
 
+    # Number of chats the gateway indexes concurrently
+    gateway_concurrency: int = 4
+    # Participant pages the account is allowed to request per period across all workers
+    gateway_flood_budget: int = 20
+    gateway_flood_budget_period: float = 1
+
+    # Number of members kicked concurrently
+    kick_concurrency: int = 10
+    # Bot API requests (kicks and notifications) allowed per second across all kicked chats
+    kick_rate_limit: int = 25
+    # Kicks allowed per period in a single chat
+    kick_chat_rate_limit: int = 10
+    kick_chat_rate_limit_period: float = 1
+
+    # Keep-alive connections the shared Bot API client may open
+    bot_api_connections_limit: int = 100
+
     base_api_url: str
 
 
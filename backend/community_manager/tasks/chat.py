@@ -1,4 +1,3 @@
-from asgiref.sync import async_to_sync
 from celery.utils.log import get_task_logger
 
 from community_manager.actions.chat import (
@@ -10,8 +9,13 @@ from community_manager.celery_app import app
 from community_manager.settings import community_manager_settings
 from core.constants import (
     CELERY_SYSTEM_QUEUE_NAME,
+    DEFAULT_BATCH_PROCESSING_SIZE,
+    UPDATED_MEMBERS_COUNTERS_CHAT_IDS,
 )
+from core.services.chat import TelegramChatService
 from core.services.db import DBService
+from core.services.superredis import RedisService
+from core.utils.task import WorkerEventLoop
 
 logger = get_task_logger(__name__)
 
@@ -36,7 +40,7 @@ def check_chat_members() -> None:
         logger.warning("Community manager is disabled.")
         return
 
-    async_to_sync(run_sanity_checks)()
+    WorkerEventLoop.run(run_sanity_checks)()
     logger.info("Chat members checked.")
 
 
@@ -53,7 +57,7 @@ async def check_target_chat_members(chat_id: int) -> None:
     ignore_result=True,
 )
 def check_target_chat_members_task(chat_id: int) -> None:
-    async_to_sync(check_target_chat_members)(chat_id)
+    WorkerEventLoop.run(check_target_chat_members)(chat_id)
 
 
 async def refresh_chat_external_sources_async() -> None:
@@ -74,10 +78,50 @@ def refresh_chat_external_sources() -> None:
         logger.warning("Community manager is disabled.")
         return
 
-    async_to_sync(refresh_chat_external_sources_async)()
+    WorkerEventLoop.run(refresh_chat_external_sources_async)()
     logger.info("Chat external sources refreshed.")
 
 
+@app.task(
+    name="refresh-chat-members-counters",
+    queue=CELERY_SYSTEM_QUEUE_NAME,
+    ignore_result=True,
+)
+def refresh_chat_members_counters() -> None:
+    """
+    Recalculates the members counters of the chats which members changed since the last run.
+    Every batch is recalculated in its own short transaction,
+    so the chat rows are not locked by the membership changes themselves.
+    """
+    redis_service = RedisService()
+    refreshed_count = 0
+    while chat_ids := redis_service.pop_from_set(
+        UPDATED_MEMBERS_COUNTERS_CHAT_IDS, count=DEFAULT_BATCH_PROCESSING_SIZE
+    ):
+        try:
+            with DBService().db_session() as db_session:
+                TelegramChatService(db_session).reconcile_members_counters(
+                    chat_ids=list(map(int, chat_ids))
+                )
+        except Exception:
+            # Put the chats back, so they are refreshed by the next run
+            redis_service.add_to_set(UPDATED_MEMBERS_COUNTERS_CHAT_IDS, *chat_ids)
+            raise
+        refreshed_count += len(chat_ids)
+    logger.info(f"Chat members counters refreshed for {refreshed_count} chats.")
+
+
+@app.task(
+    name="reconcile-chat-members-counters",
+    queue=CELERY_SYSTEM_QUEUE_NAME,
+    ignore_result=True,
+)
+def reconcile_chat_members_counters() -> None:
+    with DBService().db_session() as db_session:
+        chat_ids = TelegramChatService(db_session).reconcile_members_counters()
+    logger.info(f"Chat members counters reconciled for {len(chat_ids)} chats.")
+
+
 async def refresh_all_chats_async() -> None:
     """
     Separate function to ensure that the telethon client is initiated in the same event loop
@@ -98,7 +142,7 @@ def refresh_chats() -> None:
         logger.warning("Community manager is disabled.")
         return
 
-    # async_to_sync(refresh_all_chats_async)()
+    # WorkerEventLoop.run(refresh_all_chats_async)()
     # logger.info("Chats refreshed.")
 
 
@@ -114,7 +158,7 @@ async def async_disable_chat(chat_id: int) -> None:
     queue=CELERY_SYSTEM_QUEUE_NAME,
 )
 def disable_chat(chat_id: int) -> None:
-    async_to_sync(async_disable_chat)(chat_id)
+    WorkerEventLoop.run(async_disable_chat)(chat_id)
 
 
 async def async_enable_chat(chat_id: int) -> None:
@@ -129,7 +173,7 @@ async def async_enable_chat(chat_id: int) -> None:
     queue=CELERY_SYSTEM_QUEUE_NAME,
 )
 def enable_chat(chat_id: int) -> None:
-    async_to_sync(async_enable_chat)(chat_id)
+    WorkerEventLoop.run(async_enable_chat)(chat_id)
 
 
 async def notify_chat_mode_changed(
@@ -161,6 +205,6 @@ async def notify_chat_mode_changed(
 def notify_chat_mode_changed_task(
     chat_id: int, is_fully_managed: bool, effective_in_days: int
 ) -> None:
-    async_to_sync(notify_chat_mode_changed)(
+    WorkerEventLoop.run(notify_chat_mode_changed)(
         chat_id, is_fully_managed, effective_in_days
     )
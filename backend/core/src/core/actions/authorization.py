@@ -1,10 +1,14 @@
 import logging
 from collections import defaultdict
+from collections.abc import Iterable
 
+from redis import RedisError
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from core.actions.base import BaseAction
+from core.constants import DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE
 from core.dtos.chat.rule import (
     TelegramChatEligibilityRulesDTO,
 )
@@ -17,9 +21,8 @@ from core.dtos.chat.rule.internal import (
     EligibilitySummaryJettonInternalDTO,
     EligibilitySummaryNftCollectionInternalDTO,
 )
-from core.dtos.gift.collection import GiftCollectionDTO
-from core.dtos.resource import JettonDTO, NftCollectionDTO
-from core.dtos.sticker import MinimalStickerCollectionDTO, MinimalStickerCharacterDTO
+from core.dtos.chat.rule.plan import TelegramChatRulesPlanDTO, WhitelistRulePlanDTO
+from core.dtos.user import UserSnapshotDTO
 from core.enums.nft import NftCollectionAsset
 from core.enums.rule import EligibilityCheckType
 from core.models.gift import GiftUnique
@@ -27,10 +30,13 @@ from core.models.blockchain import NftItem
 from core.models.chat import (
     TelegramChatUser,
 )
-from core.models.rule import TelegramChatWhitelistExternalSource, TelegramChatWhitelist
 from core.models.sticker import StickerItem
 from core.models.user import User
 from core.models.wallet import JettonWallet, UserWallet
+from core.services.chat.eligibility import (
+    AsyncEligibilitySummaryCacheService,
+    EligibilitySummaryCacheService,
+)
 from core.services.chat.rule.blockchain import (
     TelegramChatJettonService,
     TelegramChatNFTCollectionService,
@@ -38,6 +44,11 @@ from core.services.chat.rule.blockchain import (
 )
 from core.services.chat.rule.emoji import TelegramChatEmojiService
 from core.services.chat.rule.gift import TelegramChatGiftCollectionService
+from core.services.chat.rule.plan import (
+    AsyncTelegramChatRulesPlanCacheService,
+    TelegramChatRulesPlanCacheService,
+    has_pending_invalidation,
+)
 from core.services.chat.rule.premium import TelegramChatPremiumService
 from core.services.chat.rule.sticker import TelegramChatStickerCollectionService
 from core.services.chat.rule.whitelist import (
@@ -48,8 +59,10 @@ from core.services.chat.user import TelegramChatUserService
 from core.services.gift.item import GiftUniqueService
 from core.services.nft import NftItemService
 from core.services.sticker.item import StickerItemService
+from core.services.superredis import AsyncRedisService
 from core.services.wallet import JettonWalletService, TelegramChatUserWalletService
 from core.utils.gift import find_relevant_gift_items
+from core.utils.misc import batched
 from core.utils.nft import find_relevant_nft_items
 from core.utils.sticker import find_relevant_sticker_items
 
@@ -91,7 +104,11 @@ class AuthorizationAction(BaseAction):
         )
 
     def is_user_eligible_chat_member(
-        self, user_id: int, chat_id: int, check_wallet: bool = True
+        self,
+        user_id: int,
+        chat_id: int,
+        check_wallet: bool = True,
+        rules_plan: TelegramChatRulesPlanDTO | None = None,
     ) -> RulesEligibilitySummaryInternalDTO:
         """
         Determines whether a user is eligible to be a chat member based on the eligibility
@@ -106,6 +123,7 @@ class AuthorizationAction(BaseAction):
         :param check_wallet: Whether the wallet should be checked
                         (e.g. if the user disconnects the wallet and eligibility after that action has to be checked)
                         If set to false, wallet-related rules will be skipped.
+        :param rules_plan: Rules plan of the chat if it's already fetched
         :return: An internal data object summarizing the user's eligibility based
                  on the chat-specific rules.
         """
@@ -113,7 +131,11 @@ class AuthorizationAction(BaseAction):
         telegram_chat_user = self.telegram_chat_user_service.find(
             chat_id=chat_id, user_id=user.id
         )
-        eligibility_rules = self.get_eligibility_rules(chat_id=chat_id)
+        eligibility_rules = (
+            rules_plan
+            if rules_plan is not None
+            else self.get_rules_plan(chat_id=chat_id)
+        )
 
         user_wallet: UserWallet | None = None
         user_nft_items = []
@@ -172,6 +194,61 @@ class AuthorizationAction(BaseAction):
         )
         return eligibility_summary
 
+    def get_user_eligibility_summary(
+        self, user: User | UserSnapshotDTO, chat_id: int
+    ) -> RulesEligibilitySummaryInternalDTO:
+        """
+        Get the eligibility summary of the user in the chat for displaying purposes.
+
+        The summary is cached in Redis with the stamp of the rules plan version of the chat
+        and of the versions of the user's wallet, stickers and gifts bumped by the indexers,
+        so it's recomputed with `is_user_eligible_chat_member` only when any of them has changed.
+        If rules were changed in the current session, but not committed yet,
+        the summary is computed from the database and is not cached.
+
+        :param user: The user for whom the summary is to be fetched
+        :param chat_id: The chat for which the summary is to be fetched
+        :return: An internal data object summarizing the user's eligibility
+        """
+        if has_pending_invalidation(self.db_session, chat_id=chat_id):
+            return self.is_user_eligible_chat_member(user_id=user.id, chat_id=chat_id)
+
+        wallet_address = self.telegram_chat_user_wallet_service.get_address(
+            user_id=user.id, chat_id=chat_id
+        )
+        eligibility_summary_cache_service = EligibilitySummaryCacheService()
+        try:
+            stamp, eligibility_summary = eligibility_summary_cache_service.get(
+                chat_id=chat_id, user=user, wallet_address=wallet_address
+            )
+        except RedisError as e:
+            logger.warning(
+                f"Failed to use eligibility summary cache for user {user.id!r} in chat {chat_id!r}. "
+                "Computing it from the database.",
+                exc_info=e,
+            )
+            return self.is_user_eligible_chat_member(user_id=user.id, chat_id=chat_id)
+
+        if eligibility_summary is not None:
+            return eligibility_summary
+
+        eligibility_summary = self.is_user_eligible_chat_member(
+            user_id=user.id, chat_id=chat_id
+        )
+        try:
+            eligibility_summary_cache_service.set(
+                chat_id=chat_id,
+                user_id=user.id,
+                stamp=stamp,
+                summary=eligibility_summary,
+            )
+        except RedisError as e:
+            logger.warning(
+                f"Failed to cache eligibility summary for user {user.id!r} in chat {chat_id!r}.",
+                exc_info=e,
+            )
+        return eligibility_summary
+
     def get_eligibility_rules(
         self, chat_id: int, enabled_only: bool = True
     ) -> TelegramChatEligibilityRulesDTO:
@@ -220,25 +297,76 @@ class AuthorizationAction(BaseAction):
             emoji=all_emoji_rules,
         )
 
+    def get_rules_plan(self, chat_id: int) -> TelegramChatRulesPlanDTO:
+        """
+        Get the compiled plan of the enabled eligibility rules for the chat.
+
+        The plan is cached in-process and in Redis under the current rules version of the chat,
+        that is bumped after every committed rule change.
+        If rules were changed in the current session, but not committed yet,
+        the plan is compiled from the database and is not cached.
+
+        :param chat_id: Chat ID for which the plan is to be fetched
+        :return: Compiled eligibility rules plan for the chat
+        """
+        if has_pending_invalidation(self.db_session, chat_id=chat_id):
+            return self._compile_rules_plan(chat_id=chat_id)
+
+        try:
+            rules_plan_cache_service = TelegramChatRulesPlanCacheService()
+            version = rules_plan_cache_service.get_version(chat_id=chat_id)
+            if rules_plan := rules_plan_cache_service.get(
+                chat_id=chat_id, version=version
+            ):
+                return rules_plan
+
+            rules_plan = self._compile_rules_plan(chat_id=chat_id)
+            rules_plan_cache_service.set(plan=rules_plan, version=version)
+            return rules_plan
+        except RedisError as e:
+            logger.warning(
+                f"Failed to use rules plan cache for chat {chat_id!r}. Compiling it from the database.",
+                exc_info=e,
+            )
+            return self._compile_rules_plan(chat_id=chat_id)
+
+    def _compile_rules_plan(self, chat_id: int) -> TelegramChatRulesPlanDTO:
+        return TelegramChatRulesPlanDTO.from_rules(
+            chat_id=chat_id,
+            eligibility_rules=self.get_eligibility_rules(chat_id=chat_id),
+        )
+
+    def get_rules_plan_per_chat(
+        self, chat_ids: Iterable[int]
+    ) -> dict[int, TelegramChatRulesPlanDTO]:
+        """
+        Get compiled eligibility rules plans for each of the given chats.
+        Plans are fetched exactly once per unique chat ID.
+
+        :param chat_ids: Chat IDs for which the plans are to be fetched
+        :return: A mapping of chat ID to its eligibility rules plan
+        """
+        return {
+            chat_id: self.get_rules_plan(chat_id=chat_id) for chat_id in set(chat_ids)
+        }
+
     def get_ineligible_chat_members(
         self,
         chat_members: list[TelegramChatUser],
     ) -> list[TelegramChatUser]:
         """
         Determines and returns a list of chat members who are ineligible to be part of their respective chats based on
-        eligibility rules and various related data sources such as wallets, NFTs, and gifts. This functionality checks
-        each member's eligibility against the chat's specific rules, wallet information, NFTs, jettons, stickers, and
-        other items associated with the user. Users that do not meet the criteria defined by the chat's eligibility
-        rules are considered ineligible.
+        eligibility rules and various related data sources such as wallets, NFTs, and gifts.
+
+        The evaluation is set-based: rules are loaded once per chat and the assets (NFT items, jetton wallets,
+        sticker items and gifts) are loaded for the whole batch with a constant number of ``IN (...)`` queries
+        (one per asset type and parameters chunk), only for the asset types required by at least one chat rule.
+        All members are then checked in memory, so the number of queries doesn't depend on the batch size.
 
         :param chat_members: A list of TelegramChatUser objects representing the members of various Telegram chats.
         :return: A list of TelegramChatUser objects representing chat members who are not eligible to be part of their
             respective chats.
         """
-        members_per_chat = defaultdict(list)
-        user_id_to_telegram_id = {}
-        eligibility_rules_per_chat: dict[int, TelegramChatEligibilityRulesDTO] = {}
-
         chat_members = [
             # Skip checks for non-managed users in the chats where full control is disabled
             # and skip checks for admins
@@ -252,49 +380,71 @@ class AuthorizationAction(BaseAction):
             logger.info("No chat members to check eligibility for. Skipping.")
             return []
 
+        members_per_chat: dict[int, list[TelegramChatUser]] = defaultdict(list)
         for chat_member in chat_members:
             members_per_chat[chat_member.chat_id].append(chat_member)
-            eligibility_rules_per_chat[
-                chat_member.chat_id
-            ] = self.get_eligibility_rules(chat_id=chat_member.chat_id)
-            user_id_to_telegram_id[chat_member.user_id] = chat_member.user.telegram_id
 
-        nft_item_service = NftItemService(self.db_session)
+        eligibility_rules_per_chat = self.get_rules_plan_per_chat(
+            chat_ids=members_per_chat.keys()
+        )
 
-        unique_wallets: set[tuple[int, str]] = {
-            (chat_member.user_id, chat_member.wallet_link.address)
-            for chat_member in chat_members
+        # Only wallets and users from the chats that have rules
+        #  for the corresponding asset type should be prefetched
+        nft_wallets: set[str] = set()
+        jetton_wallets: set[str] = set()
+        sticker_telegram_ids: set[int] = set()
+        gift_telegram_ids: set[int] = set()
+        for chat_id, members in members_per_chat.items():
+            eligibility_rules = eligibility_rules_per_chat[chat_id]
             # Some users might don't have the wallet connected,
             #  but are still chat members
-            if chat_member.wallet_link
-        }
-
-        nft_items_per_wallet = defaultdict(list)
-        jetton_wallets_per_wallet = defaultdict(list)
-        sticker_items_per_user = {}
-        gift_items_per_user = {}
+            wallets = {
+                member.wallet_link.address for member in members if member.wallet_link
+            }
+            telegram_ids = {member.user.telegram_id for member in members}
+            if eligibility_rules.nft_collections:
+                nft_wallets.update(wallets)
+            if eligibility_rules.jettons:
+                jetton_wallets.update(wallets)
+            if eligibility_rules.stickers:
+                sticker_telegram_ids.update(telegram_ids)
+            if eligibility_rules.gifts:
+                gift_telegram_ids.update(telegram_ids)
+
+        nft_items_per_wallet: dict[str, list[NftItem]] = defaultdict(list)
+        jetton_wallets_per_wallet: dict[str, list[JettonWallet]] = defaultdict(list)
+        sticker_items_per_user: dict[int, list[StickerItem]] = defaultdict(list)
+        gift_items_per_user: dict[int, list[GiftUnique]] = defaultdict(list)
 
+        nft_item_service = NftItemService(self.db_session)
         sticker_item_service = StickerItemService(self.db_session)
         gift_unique_service = GiftUniqueService(self.db_session)
 
-        # Prefetch wallet resources from the database
-        for user_id, wallet in unique_wallets:
-            nft_items_per_wallet[wallet] = nft_item_service.get_all(
-                owner_address=wallet
-            )
-            jetton_wallets_per_wallet[wallet] = self.jetton_wallet_service.get_all(
-                owner_address=wallet
-            )
-            # Users could be repeated if one user has multiple wallets connected
-            if user_id not in sticker_items_per_user:
-                sticker_items_per_user[user_id] = sticker_item_service.get_all(
-                    telegram_user_id=user_id_to_telegram_id[user_id]
+        # Prefetch resources for the whole batch from the database
+        for chunk in batched(nft_wallets, DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE):
+            for nft_item in nft_item_service.get_all(owner_addresses=chunk):
+                nft_items_per_wallet[nft_item.owner_address].append(nft_item)
+
+        for chunk in batched(jetton_wallets, DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE):
+            for jetton_wallet in self.jetton_wallet_service.get_all(
+                owner_addresses=chunk
+            ):
+                jetton_wallets_per_wallet[jetton_wallet.owner_address].append(
+                    jetton_wallet
                 )
-            if user_id not in gift_items_per_user:
-                gift_items_per_user[user_id] = gift_unique_service.get_all(
-                    telegram_user_id=user_id_to_telegram_id[user_id]
+
+        for chunk in batched(
+            sticker_telegram_ids, DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE
+        ):
+            for sticker_item in sticker_item_service.get_all(telegram_user_ids=chunk):
+                sticker_items_per_user[sticker_item.telegram_user_id].append(
+                    sticker_item
                 )
 
+        for chunk in batched(gift_telegram_ids, DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE):
+            for gift_item in gift_unique_service.get_all(telegram_user_ids=chunk):
+                gift_items_per_user[gift_item.telegram_owner_id].append(gift_item)
+
         ineligible_members = []
         for chat, members in members_per_chat.items():
             for member in members:
@@ -302,6 +452,7 @@ class AuthorizationAction(BaseAction):
                     member.wallet_link.wallet if member.wallet_link else None
                 )
                 member_wallet_address = member_wallet.address if member_wallet else None
+                member_telegram_id = member.user.telegram_id
                 if not (
                     eligibility_summary := self.check_chat_member_eligibility(
                         eligibility_rules=eligibility_rules_per_chat[chat],
@@ -314,14 +465,14 @@ class AuthorizationAction(BaseAction):
                             member_wallet_address, []
                         ),
                         user_sticker_items=sticker_items_per_user.get(
-                            member.user_id, []
+                            member_telegram_id, []
                         ),
-                        user_gift_items=gift_items_per_user.get(member.user_id, []),
+                        user_gift_items=gift_items_per_user.get(member_telegram_id, []),
                         chat_member=member,
                     )
                 ):
                     logger.debug(
-                        f"User {member.user.telegram_id!r} is not eligible to be in chat {chat!r}."
+                        f"User {member_telegram_id!r} is not eligible to be in chat {chat!r}."
                         f"Eligibility summary: {eligibility_summary!r}"
                     )
                     ineligible_members.append(member)
@@ -331,7 +482,7 @@ class AuthorizationAction(BaseAction):
     @classmethod
     def check_chat_member_eligibility(
         cls,
-        eligibility_rules: TelegramChatEligibilityRulesDTO,
+        eligibility_rules: TelegramChatRulesPlanDTO,
         user: User,
         user_wallet: UserWallet | None,
         user_jettons: list[JettonWallet],
@@ -346,7 +497,7 @@ class AuthorizationAction(BaseAction):
         validations. This method aggregates the eligibility information and returns a
         summary of the assessment.
 
-        :param eligibility_rules: A data object containing the eligibility conditions,
+        :param eligibility_rules: A compiled rules plan containing the eligibility conditions,
             including requirements for jetton balances, NFT collections, whitelist memberships,
             and other external sources.
         :param user: The Telegram chat user whose eligibility is being evaluated.
@@ -406,7 +557,7 @@ class AuthorizationAction(BaseAction):
                         else 0
                     ),
                     is_enabled=rule.is_enabled,
-                    jetton=JettonDTO.from_orm(rule.jetton),
+                    jetton=rule.jetton,
                 )
                 for rule in eligibility_rules.jettons
             ]
@@ -432,7 +583,7 @@ class AuthorizationAction(BaseAction):
                         )
                     ),
                     is_enabled=rule.is_enabled,
-                    collection=NftCollectionDTO.from_orm(rule.nft_collection),
+                    collection=rule.nft_collection,
                 )
                 for rule in eligibility_rules.nft_collections
             ]
@@ -463,12 +614,8 @@ class AuthorizationAction(BaseAction):
                         or (rule.character.name if rule.character else None)
                         or (rule.collection.title if rule.collection else None)
                     ),
-                    collection=MinimalStickerCollectionDTO.from_orm(rule.collection)
-                    if rule.collection
-                    else None,
-                    character=MinimalStickerCharacterDTO.from_orm(rule.character)
-                    if rule.character
-                    else None,
+                    collection=rule.collection,
+                    character=rule.character,
                     actual=len(
                         find_relevant_sticker_items(
                             rule=rule, sticker_items=user_sticker_items
@@ -488,9 +635,7 @@ class AuthorizationAction(BaseAction):
                     expected=rule.threshold,
                     title=(rule.collection.title if rule.collection else rule.category),
                     category=rule.category,
-                    collection=GiftCollectionDTO.from_orm(rule.collection)
-                    if rule.collection
-                    else None,
+                    collection=rule.collection,
                     model=rule.model,
                     backdrop=rule.backdrop,
                     pattern=rule.pattern,
@@ -564,12 +709,126 @@ class AuthorizationAction(BaseAction):
 
     @staticmethod
     def is_whitelisted(
-        user: User, rule: TelegramChatWhitelist | TelegramChatWhitelistExternalSource
+        user: User | UserSnapshotDTO,
+        rule: WhitelistRulePlanDTO,
     ) -> bool:
         """
-        Check if user is in whitelist by the rule
+        Check if user is in whitelist by the rule.
+        Members of the compiled rule are a sorted array, so the lookup is a binary search.
         :param user: User to check
         :param rule: Whitelist rule to check
         :return: True if user is whitelisted
         """
         return bool(rule.content and user.telegram_id in rule.content)
+
+
+class AsyncAuthorizationAction:
+    """
+    Read-only authorization actions for the code running in the event loop.
+
+    Database queries are executed with `AsyncSession.run_sync`, which runs them in the event loop thread,
+    so the cached eligibility summaries and rules plans are accessed over the async Redis client
+    outside of it instead of blocking the loop with the sync one.
+    """
+
+    def __init__(
+        self, db_session: AsyncSession, redis_service: AsyncRedisService | None = None
+    ) -> None:
+        self.db_session = db_session
+        self.redis_service = redis_service or AsyncRedisService()
+
+    async def get_rules_plan(self, chat_id: int) -> TelegramChatRulesPlanDTO:
+        """See `AuthorizationAction.get_rules_plan`."""
+        if has_pending_invalidation(self.db_session.sync_session, chat_id=chat_id):
+            return await self.db_session.run_sync(
+                lambda db_session: AuthorizationAction(db_session)._compile_rules_plan(
+                    chat_id=chat_id
+                )
+            )
+
+        rules_plan_cache_service = AsyncTelegramChatRulesPlanCacheService(
+            self.redis_service
+        )
+        try:
+            version = await rules_plan_cache_service.get_version(chat_id=chat_id)
+            if rules_plan := await rules_plan_cache_service.get(
+                chat_id=chat_id, version=version
+            ):
+                return rules_plan
+        except RedisError as e:
+            logger.warning(
+                f"Failed to use rules plan cache for chat {chat_id!r}. Compiling it from the database.",
+                exc_info=e,
+            )
+            version = None
+
+        rules_plan = await self.db_session.run_sync(
+            lambda db_session: AuthorizationAction(db_session)._compile_rules_plan(
+                chat_id=chat_id
+            )
+        )
+        if version is not None:
+            try:
+                await rules_plan_cache_service.set(plan=rules_plan, version=version)
+            except RedisError as e:
+                logger.warning(
+                    f"Failed to cache rules plan for chat {chat_id!r}.", exc_info=e
+                )
+        return rules_plan
+
+    async def get_user_eligibility_summary(
+        self, user: User | UserSnapshotDTO, chat_id: int
+    ) -> RulesEligibilitySummaryInternalDTO:
+        """See `AuthorizationAction.get_user_eligibility_summary`."""
+        if has_pending_invalidation(self.db_session.sync_session, chat_id=chat_id):
+            return await self.db_session.run_sync(
+                lambda db_session: AuthorizationAction(
+                    db_session
+                ).is_user_eligible_chat_member(user_id=user.id, chat_id=chat_id)
+            )
+
+        wallet_address = await self.db_session.run_sync(
+            lambda db_session: TelegramChatUserWalletService(db_session).get_address(
+                user_id=user.id, chat_id=chat_id
+            )
+        )
+        eligibility_summary_cache_service = AsyncEligibilitySummaryCacheService(
+            self.redis_service
+        )
+        try:
+            stamp, eligibility_summary = await eligibility_summary_cache_service.get(
+                chat_id=chat_id, user=user, wallet_address=wallet_address
+            )
+        except RedisError as e:
+            logger.warning(
+                f"Failed to use eligibility summary cache for user {user.id!r} in chat {chat_id!r}. "
+                "Computing it from the database.",
+                exc_info=e,
+            )
+            stamp, eligibility_summary = None, None
+
+        if eligibility_summary is not None:
+            return eligibility_summary
+
+        rules_plan = await self.get_rules_plan(chat_id=chat_id)
+        eligibility_summary = await self.db_session.run_sync(
+            lambda db_session: AuthorizationAction(
+                db_session
+            ).is_user_eligible_chat_member(
+                user_id=user.id, chat_id=chat_id, rules_plan=rules_plan
+            )
+        )
+        if stamp is not None:
+            try:
+                await eligibility_summary_cache_service.set(
+                    chat_id=chat_id,
+                    user_id=user.id,
+                    stamp=stamp,
+                    summary=eligibility_summary,
+                )
+            except RedisError as e:
+                logger.warning(
+                    f"Failed to cache eligibility summary for user {user.id!r} in chat {chat_id!r}.",
+                    exc_info=e,
+                )
+        return eligibility_summary
@@ -4,6 +4,7 @@ from collections import defaultdict
 from celery.result import AsyncResult
 from fastapi import HTTPException
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from starlette.status import (
     HTTP_502_BAD_GATEWAY,
@@ -11,7 +12,7 @@ from starlette.status import (
     HTTP_429_TOO_MANY_REQUESTS,
 )
 
-from core.actions.authorization import AuthorizationAction
+from core.actions.authorization import AsyncAuthorizationAction, AuthorizationAction
 from core.actions.base import BaseAction
 from core.actions.chat.base import ManagedChatBaseAction
 from core.constants import (
@@ -48,6 +49,7 @@ from core.dtos.chat.rule.sticker import (
     StickerChatEligibilityRuleDTO,
     StickerChatEligibilitySummaryDTO,
 )
+from core.dtos.chat.rule.internal import RulesEligibilitySummaryInternalDTO
 from core.dtos.chat.rule.summary import (
     RuleEligibilitySummaryDTO,
     TelegramChatWithEligibilitySummaryDTO,
@@ -62,6 +64,7 @@ from core.exceptions.chat import (
     TelegramChatNotExists,
 )
 from core.models.chat import TelegramChat
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.cdn import CDNService
 from core.services.chat import TelegramChatService
@@ -94,6 +97,7 @@ class TelegramChatAction(BaseAction):
             offset=pagination_params.offset,
             limit=pagination_params.limit,
             include_total_count=pagination_params.include_total_count,
+            cursor=pagination_params.cursor,
             configured_only=True,
             order_by=[sorting_params]
             if sorting_params
@@ -107,16 +111,19 @@ class TelegramChatAction(BaseAction):
         return PaginatedTelegramChatsPreviewDTO(
             items=[
                 TelegramChatPreviewDTO.from_object(
-                    chat, members_count=members_count, tcv=tcv
+                    chat, members_count=chat.members_count, tcv=chat.tcv
                 )
-                for chat, members_count, tcv in chats.items
+                for chat in chats.items
             ],
             total_count=chats.total_count
             if isinstance(chats, PaginatedResultDTO)
             else None,
+            next_cursor=chats.next_cursor,
         )
 
-    def get_all_managed(self, requestor: User) -> list[TelegramChatDTO]:
+    def get_all_managed(
+        self, requestor: User | UserSnapshotDTO
+    ) -> list[TelegramChatDTO]:
         """
         Retrieves all Telegram chats managed by the given user.
 
@@ -127,22 +134,16 @@ class TelegramChatAction(BaseAction):
         :return: A list of DTOs, each representing a managed Telegram chat.
         """
         chats = self.telegram_chat_service.get_all_managed(user_id=requestor.id)
-        chat_ids = [chat.id for chat in chats]
-
-        members_count = self.telegram_chat_user_service.get_members_count_by_chat_id(
-            chat_ids
-        )
-        tcvs = self.telegram_chat_service.get_tcv(chat_ids=chat_ids)
 
         return [
             TelegramChatDTO.from_object(
-                chat, members_count=members_count[chat.id], tcv=tcvs[chat.id]
+                chat, members_count=chat.members_count, tcv=chat.tcv
             )
             for chat in chats
         ]
 
-    async def get_with_eligibility_summary(
-        self, slug: str, user: User
+    def get_with_eligibility_summary(
+        self, slug: str, user: User | UserSnapshotDTO
     ) -> TelegramChatWithEligibilitySummaryDTO:
         """
         Retrieve a chat's details with the user's eligibility summary.
@@ -161,12 +162,37 @@ class TelegramChatAction(BaseAction):
         :raises TelegramChatNotExists: If the Telegram chat with the specified slug
             does not exist.
         """
+        chat = self._get_by_slug(slug)
+        if not chat.is_enabled:
+            return self._get_with_eligibility_summary(chat, user, None)
+
+        eligibility_summary = self.authorization_action.get_user_eligibility_summary(
+            chat_id=chat.id,
+            user=user,
+        )
+        return self._get_with_eligibility_summary(chat, user, eligibility_summary)
+
+    def _get_by_slug(self, slug: str) -> TelegramChat:
         try:
-            chat = self.telegram_chat_service.get_by_slug(slug)
+            return self.telegram_chat_service.get_by_slug(slug)
         except NoResultFound:
             logger.warning(f"Chat with slug {slug!r} not found")
             raise TelegramChatNotExists(f"Chat with slug {slug!r} not found")
 
+    def _get_with_eligibility_summary(
+        self,
+        chat: TelegramChat,
+        user: User | UserSnapshotDTO,
+        eligibility_summary: RulesEligibilitySummaryInternalDTO | None,
+    ) -> TelegramChatWithEligibilitySummaryDTO:
+        """
+        Formats the chat details with the user's eligibility summary.
+
+        :param chat: The chat to format
+        :param user: The user the summary belongs to
+        :param eligibility_summary: The summary of the user's eligibility in the chat.
+            Only missing for the disabled chats.
+        """
         if not chat.is_enabled:
             # Don't pull any records from the DB and just hide the chat page
             return TelegramChatWithEligibilitySummaryDTO(
@@ -182,10 +208,6 @@ class TelegramChatAction(BaseAction):
                 wallet=None,
             )
 
-        eligibility_summary = self.authorization_action.is_user_eligible_chat_member(
-            chat_id=chat.id,
-            user_id=user.id,
-        )
         is_chat_member = self.telegram_chat_user_service.is_chat_member(
             chat_id=chat.id,
             user_id=user.id,
@@ -200,8 +222,6 @@ class TelegramChatAction(BaseAction):
             EligibilityCheckType.GIFT_COLLECTION: GiftChatEligibilitySummaryDTO,
         }
 
-        members_count = self.telegram_chat_user_service.get_members_count(chat.id)
-
         formatted_groups = [
             TelegramChatGroupWithEligibilitySummaryDTO(
                 id=group.id,
@@ -221,7 +241,7 @@ class TelegramChatAction(BaseAction):
                 join_url=chat.invite_link if is_eligible else None,
                 is_member=is_chat_member,
                 is_eligible=is_eligible,
-                members_count=members_count,
+                members_count=chat.members_count,
             ),
             groups=formatted_groups,
             rules=[item for group in formatted_groups for item in group.items],
@@ -229,11 +249,57 @@ class TelegramChatAction(BaseAction):
         )
 
 
+class AsyncTelegramChatAction:
+    """
+    Read-only chat actions for the code running in the event loop.
+    The database queries of the synchronous action are executed over the async driver
+    with `AsyncSession.run_sync`, while the cached rules and summaries are read with
+    the async Redis client, so neither blocks other requests.
+    """
+
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.db_session = db_session
+
+    async def get_all(
+        self,
+        pagination_params: PaginationMetadataDTO,
+        sorting_params: TelegramChatOrderingRuleDTO | None,
+    ) -> PaginatedTelegramChatsPreviewDTO:
+        return await self.db_session.run_sync(
+            lambda db_session: TelegramChatAction(db_session).get_all(
+                pagination_params=pagination_params,
+                sorting_params=sorting_params,
+            )
+        )
+
+    async def get_with_eligibility_summary(
+        self, slug: str, user: User | UserSnapshotDTO
+    ) -> TelegramChatWithEligibilitySummaryDTO:
+        """
+        See `TelegramChatAction.get_with_eligibility_summary`.
+        Only the snapshot fields of the user are used, so it can be loaded in another session.
+        """
+        chat = await self.db_session.run_sync(
+            lambda db_session: TelegramChatAction(db_session)._get_by_slug(slug)
+        )
+        eligibility_summary = None
+        if chat.is_enabled:
+            eligibility_summary = await AsyncAuthorizationAction(
+                self.db_session
+            ).get_user_eligibility_summary(user=user, chat_id=chat.id)
+
+        return await self.db_session.run_sync(
+            lambda db_session: TelegramChatAction(
+                db_session
+            )._get_with_eligibility_summary(chat, user, eligibility_summary)
+        )
+
+
 class TelegramChatManageAction(ManagedChatBaseAction, TelegramChatAction):
     def __init__(
         self,
         db_session: Session,
-        requestor: User,
+        requestor: User | UserSnapshotDTO,
         chat_slug: str,
     ) -> None:
         super().__init__(db_session, requestor, chat_slug)
@@ -258,8 +324,7 @@ class TelegramChatManageAction(ManagedChatBaseAction, TelegramChatAction):
             description=description,
         )
 
-        members_count = self.telegram_chat_user_service.get_members_count(chat.id)
-        return TelegramChatDTO.from_object(chat, members_count=members_count)
+        return TelegramChatDTO.from_object(chat, members_count=chat.members_count)
 
     async def set_control_level(
         self, is_fully_managed: bool, effective_in_days: int
@@ -380,9 +445,6 @@ class TelegramChatManageAction(ManagedChatBaseAction, TelegramChatAction):
             chat_id=self.chat.id,
             enabled_only=False,
         )
-        members_count = self.telegram_chat_user_service.get_members_count(self.chat.id)
-        tcv = self.telegram_chat_service.get_tcv(chat_ids=[self.chat.id])[self.chat.id]
-
         rules = sorted(
             [
                 *(
@@ -432,8 +494,8 @@ class TelegramChatManageAction(ManagedChatBaseAction, TelegramChatAction):
         return TelegramChatWithRulesDTO(
             chat=TelegramChatDTO.from_object(
                 obj=self.chat,
-                members_count=members_count,
-                tcv=tcv,
+                members_count=self.chat.members_count,
+                tcv=self.chat.tcv,
             ),
             groups=[
                 ChatEligibilityRuleGroupDTO(
@@ -525,10 +587,9 @@ class TelegramChatManageAction(ManagedChatBaseAction, TelegramChatAction):
             chat = await self.enable()
         else:
             chat = await self.disable()
-        members_count = self.telegram_chat_user_service.get_members_count(chat.id)
         return TelegramChatDTO.from_object(
             obj=chat,
-            members_count=members_count,
+            members_count=chat.members_count,
         )
 
     async def delete(self) -> None:
@@ -8,6 +8,7 @@ from starlette.status import HTTP_403_FORBIDDEN, HTTP_404_NOT_FOUND
 from core.actions.authorization import AuthorizationAction
 from core.actions.base import BaseAction
 from core.exceptions.rule import TelegramChatRuleNotFound
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.models.chat import TelegramChat
 from core.services.chat import TelegramChatService
@@ -23,7 +24,11 @@ class ManagedChatBaseAction(BaseAction):
     is_admin_action: bool = True
 
     def __init__(
-        self, db_session: Session, requestor: User, chat_slug: str, **kwargs
+        self,
+        db_session: Session,
+        requestor: User | UserSnapshotDTO,
+        chat_slug: str,
+        **kwargs,
     ) -> None:
         super().__init__(db_session)
         self.authorization_action = AuthorizationAction(db_session)
@@ -33,14 +38,16 @@ class ManagedChatBaseAction(BaseAction):
 
         self._chat = self.__get_target_chat(requestor=requestor, chat_slug=chat_slug)
 
-    def __get_target_chat(self, requestor: User, chat_slug: str) -> TelegramChat:
+    def __get_target_chat(
+        self, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> TelegramChat:
         """
         Retrieves a target chat based on the given requestor and chat slug. It attempts
         to fetch the chat using the `telegram_chat_service`. If the chat is not found, an exception
         is raised. If the action requires administrative permission, it checks whether the requestor
         is an admin of the chat using the `telegram_chat_user_service`.
 
-        :param requestor: User object that makes the request
+        :param requestor: User | UserSnapshotDTO object that makes the request
         :param chat_slug: Unique slug identifier for the target chat
         :return: The target TelegramChat object
         :raises HTTPException: If the chat is not found or if the requestor lacks admin permissions
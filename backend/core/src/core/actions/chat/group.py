@@ -3,13 +3,18 @@ from sqlalchemy.orm import Session
 
 from core.actions.chat import ManagedChatBaseAction
 from core.dtos.chat.group import TelegramChatRuleGroupDTO
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.group import TelegramChatRuleGroupService
 
 
 class TelegramChatRuleGroupAction(ManagedChatBaseAction):
     def __init__(
-        self, db_session: Session, requestor: User, chat_slug: str, **kwargs
+        self,
+        db_session: Session,
+        requestor: User | UserSnapshotDTO,
+        chat_slug: str,
+        **kwargs,
     ) -> None:
         super().__init__(
             db_session=db_session, requestor=requestor, chat_slug=chat_slug
@@ -19,6 +19,7 @@ from core.models.rule import (
     TelegramChatToncoin,
     TelegramChatRuleBase,
 )
+from core.services.chat.rule.plan import invalidate_rules_plan
 
 MODEL_BY_RULE_TYPE = {
     EligibilityCheckType.EMOJI: TelegramChatEmoji,
@@ -105,6 +106,7 @@ class RuleAction(ManagedChatBaseAction):
 
         try:
             existing_item.group_id = new_group.id
+            invalidate_rules_plan(self.db_session, chat_id=self.chat.id)
             self.db_session.commit()
             logger.info(
                 f"Moved rule {item.rule_id!r} of type {item.type!r} for chat {self.chat.id!r} to group {new_group.id!r}."
@@ -31,6 +31,7 @@ from core.utils.custom_rules.addresses import (
     NFT_ASSET_TO_ADDRESS_MAPPING,
     NFT_CATEGORY_TO_ADDRESS_MAPPING,
 )
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.blockchain import (
     TelegramChatNFTCollectionService,
@@ -42,7 +43,9 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramChatNFTCollectionAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str) -> None:
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> None:
         super().__init__(
             db_session=db_session, requestor=requestor, chat_slug=chat_slug
         )
@@ -307,7 +310,9 @@ class TelegramChatNFTCollectionAction(ManagedChatBaseAction):
 
 
 class TelegramChatJettonAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str) -> None:
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> None:
         super().__init__(
             db_session=db_session, requestor=requestor, chat_slug=chat_slug
         )
@@ -490,7 +495,9 @@ class TelegramChatJettonAction(ManagedChatBaseAction):
 
 
 class TelegramChatToncoinAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str) -> None:
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> None:
         super().__init__(
             db_session=db_session, requestor=requestor, chat_slug=chat_slug
         )
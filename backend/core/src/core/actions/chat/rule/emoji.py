@@ -11,6 +11,7 @@ from core.dtos.chat.rule.emoji import (
     CreateTelegramChatEmojiRuleDTO,
     UpdateTelegramChatEmojiRuleDTO,
 )
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.emoji import TelegramChatEmojiService
 
@@ -19,7 +20,9 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramChatEmojiAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str):
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ):
         super().__init__(db_session, requestor, chat_slug)
         self.service = TelegramChatEmojiService(db_session)
 
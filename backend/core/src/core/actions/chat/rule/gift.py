@@ -11,6 +11,7 @@ from core.dtos.chat.rule.gift import (
     CreateTelegramChatGiftCollectionRuleDTO,
     UpdateTelegramChatGiftCollectionRuleDTO,
 )
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.gift import TelegramChatGiftCollectionService
 from core.services.gift.item import GiftUniqueService
@@ -19,7 +20,9 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramChatGiftCollectionAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str):
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ):
         super().__init__(db_session, requestor, chat_slug)
         self.service = TelegramChatGiftCollectionService(db_session)
         self.gift_unique_service = GiftUniqueService(db_session)
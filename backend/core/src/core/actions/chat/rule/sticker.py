@@ -11,6 +11,7 @@ from core.dtos.chat.rule.sticker import (
     CreateTelegramChatStickerCollectionRuleDTO,
     UpdateTelegramChatStickerCollectionRuleDTO,
 )
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.sticker import TelegramChatStickerCollectionService
 
@@ -19,7 +20,9 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramChatStickerCollectionAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str):
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ):
         super().__init__(db_session, requestor, chat_slug)
         self.telegram_chat_sticker_collection_service = (
             TelegramChatStickerCollectionService(db_session)
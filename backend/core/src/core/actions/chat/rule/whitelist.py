@@ -16,6 +16,7 @@ from core.dtos.chat.rule.whitelist import (
 )
 from core.exceptions.rule import TelegramChatRuleExists
 from core.models.rule import TelegramChatWhitelistExternalSource, TelegramChatWhitelist
+from core.dtos.user import UserSnapshotDTO
 from core.models.user import User
 from core.services.chat.rule.whitelist import (
     TelegramChatExternalSourceService,
@@ -26,7 +27,9 @@ logger = logging.getLogger(__name__)
 
 
 class TelegramChatWhitelistExternalSourceAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str) -> None:
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> None:
         super().__init__(
             db_session=db_session, requestor=requestor, chat_slug=chat_slug
         )
@@ -194,7 +197,9 @@ class TelegramChatWhitelistExternalSourceAction(ManagedChatBaseAction):
 
 
 class TelegramChatWhitelistAction(ManagedChatBaseAction):
-    def __init__(self, db_session: Session, requestor: User, chat_slug: str) -> None:
+    def __init__(
+        self, db_session: Session, requestor: User | UserSnapshotDTO, chat_slug: str
+    ) -> None:
         super().__init__(
             db_session=db_session,
             requestor=requestor,
@@ -30,12 +30,12 @@ class JettonWalletAction(BaseAction):
                 status_code=HTTP_404_NOT_FOUND,
             )
 
-        all_wallets = self.jetton_wallet_service.get_all(
+        owner_addresses = self.jetton_wallet_service.get_owner_addresses(
             jetton_master_address=jetton.address,
             min_balance=filters.threshold,
         )
 
         holders_telegram_ids = self.wallet_service.get_owners_telegram_ids(
-            addresses=[w.owner_address for w in all_wallets]
+            addresses=owner_addresses
         )
         return holders_telegram_ids
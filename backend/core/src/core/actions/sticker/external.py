@@ -1,13 +1,19 @@
 import hashlib
 import logging
+from collections.abc import Iterable, Iterator
 
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from core.actions.base import BaseAction
 from core.dtos.sticker import (
     StickerDomCollectionWithCharacters,
     StickerItemDTO,
-    ExternalStickerItemDTO,
+    StickerOwnershipSnapshotDTO,
+)
+from core.constants import (
+    STICKER_OWNERSHIP_FULL_RUN_INTERVAL,
+    STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE,
 )
 from core.services.sticker.collection import StickerCollectionService
 from core.services.superredis import RedisService
@@ -28,6 +34,10 @@ class ExternalStickerAction(BaseAction):
     def get_metadata_cache_key(collection_id: int) -> str:
         return f"sticker-dom::{collection_id}::ownership-metadata"
 
+    @staticmethod
+    def get_snapshot_cache_key(collection_id: int) -> str:
+        return f"sticker-dom::{collection_id}::ownership-snapshot"
+
     @staticmethod
     def get_collections_cache_key() -> str:
         return "sticker-dom::collections"
@@ -55,42 +65,128 @@ class ExternalStickerAction(BaseAction):
         hash_object = hashlib.sha256(collections_raw.encode())
         return hash_object.hexdigest()
 
+    @staticmethod
+    def get_snapshot_chunk(character_id: int, instance: int) -> tuple[int, int]:
+        """
+        Returns the snapshot chunk the item belongs to.
+        Chunks are ranges of instances of the character, so adding or burning items
+        in one range doesn't shift the others.
+        """
+        return character_id, instance // STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE
+
+    @staticmethod
+    def get_snapshot_chunk_key(chunk: tuple[int, int]) -> str:
+        return "{}:{}".format(*chunk)
+
+    @staticmethod
+    def get_ownership_digest(instance: int, telegram_user_id: int) -> int:
+        """
+        Returns the stable 64-bit digest of the (instance, owner) pair.
+        Unlike the builtin hash, it's well mixed and doesn't depend on the interpreter.
+        """
+        return int.from_bytes(
+            hashlib.blake2b(
+                f"{instance}:{telegram_user_id}".encode(), digest_size=8
+            ).digest()
+        )
+
+    @classmethod
+    def get_ownership_snapshot(cls, items: Iterable[StickerItemDTO]) -> dict[str, str]:
+        """
+        Builds a compact snapshot of the collection ownership: a hash per chunk of items.
+        Hashes are order-independent sums of the digests of the items,
+        so the items could be streamed in any order
+        and only one accumulator per chunk is kept in memory.
+
+        :param items: Internal sticker items of the collection
+        :return: Mapping of the chunk key to the hash of the (instance, owner) pairs in it
+        """
+        accumulators: dict[tuple[int, int], list[int]] = {}
+        for item in items:
+            chunk = cls.get_snapshot_chunk(item.character_id, item.instance)
+            accumulator = accumulators.setdefault(chunk, [0, 0])
+            accumulator[0] += 1
+            accumulator[1] = (
+                accumulator[1]
+                + cls.get_ownership_digest(item.instance, item.telegram_user_id)
+            ) % 2**64
+
+        return {
+            cls.get_snapshot_chunk_key(chunk): f"{count}-{digest:x}"
+            for chunk, (count, digest) in accumulators.items()
+        }
+
+    @staticmethod
+    def parse_ownership_snapshot(
+        collection_id: int, cached_snapshot: str | None
+    ) -> StickerOwnershipSnapshotDTO | None:
+        """
+        Parses the cached ownership snapshot of the collection.
+        Snapshots that can't be parsed, e.g. stored in the previous format,
+        are treated as missing, so a full run replaces them.
+        """
+        if cached_snapshot is None:
+            return None
+        try:
+            return StickerOwnershipSnapshotDTO.model_validate_json(cached_snapshot)
+        except ValidationError as e:
+            logger.warning(
+                f"Invalid ownership snapshot of collection {collection_id!r}: {e}"
+            )
+            return None
+
+    @staticmethod
+    def is_full_ownership_run(
+        previous_snapshot: StickerOwnershipSnapshotDTO | None, now: float
+    ) -> bool:
+        """
+        Checks whether every item should be compared with the database.
+        It's done without the previous snapshot and periodically
+        to reconcile the changes missed by the snapshot.
+        """
+        return (
+            previous_snapshot is None
+            or now - previous_snapshot.full_run_at
+            >= STICKER_OWNERSHIP_FULL_RUN_INTERVAL
+        )
+
     @staticmethod
     def map_external_data_to_internal(
         collection_id: int,
-        items: list[ExternalStickerItemDTO],
+        items: Iterable[tuple[int, int, int]],
         characters_id_by_external_id: dict[int, int],
-    ) -> list[StickerItemDTO]:
+    ) -> Iterator[StickerItemDTO]:
         """
         Maps external data to internal data format for stickers by integrating external data items
         with internal user and character references. The method filters out items that lack a corresponding
-        internal user or character mapping, logging the appropriate debug or warning messages in such cases.
+        internal character mapping, logging a warning once per missing character.
+        Items are mapped lazily, so the whole collection is never kept in memory.
 
         :param collection_id: Unique identifier for the sticker collection.
-        :param items: List of external sticker items to be mapped to the internal format.
+        :param items: External sticker items as (external character ID, Telegram user ID, instance) tuples.
         :param characters_id_by_external_id: Dictionary mapping external character IDs to their corresponding internal ID.
-        :return: A list of StickerItemDTO instances representing the mapped internal sticker items.
+        :return: An iterator of StickerItemDTO instances representing the mapped internal sticker items.
         """
+        missing_character_ids = set()
 
-        internally_mapped_items = []
-
-        for item in items:
+        for external_character_id, telegram_user_id, instance in items:
             if not (
-                character_id := characters_id_by_external_id.get(item.character_id)
+                character_id := characters_id_by_external_id.get(external_character_id)
             ):
-                # It would mean there is a desynchronization between Sticker Dom and the database.
-                logger.warning(
-                    f"Missing character {item.character_id!r} for collection {collection_id!r}. Skipping item."
-                )
+                if external_character_id not in missing_character_ids:
+                    missing_character_ids.add(external_character_id)
+                    # It would mean there is a desynchronization between Sticker Dom and the database.
+                    logger.warning(
+                        f"Missing character {external_character_id!r} for collection {collection_id!r}. Skipping items."
+                    )
                 continue
 
-            internally_mapped_items.append(
-                StickerItemDTO(
-                    id=item.id,
-                    collection_id=collection_id,
-                    character_id=character_id,
-                    telegram_user_id=item.telegram_user_id,
-                    instance=item.instance,
-                )
+            yield StickerItemDTO(
+                # ID should not contain ID of the owner (user_id) to ensure
+                # that after changing the owner it'll stay the same
+                id=f"{collection_id}_{external_character_id}_{instance}",
+                collection_id=collection_id,
+                character_id=character_id,
+                telegram_user_id=telegram_user_id,
+                instance=instance,
             )
-        return internally_mapped_items
@@ -58,6 +58,19 @@ class UserAction(BaseAction):
 
         return user
 
+    def bulk_create_or_update(
+        self, telegram_users: list[TelegramUserDTO]
+    ) -> dict[int, int]:
+        """
+        Creates or updates multiple users at once.
+        Unlike :meth:`create_or_update`, it doesn't load the ORM objects,
+        which makes it suitable for indexing large chats.
+
+        :param telegram_users: Data Transfer Objects of the Telegram users.
+        :return: Mapping of the Telegram ID to the user ID.
+        """
+        return self.user_service.bulk_create_or_update(telegram_users)
+
     def get_or_create(self, telegram_user: TelegramUserDTO) -> User:
         """
         Retrieves an existing user by their Telegram ID or creates a new user if no such
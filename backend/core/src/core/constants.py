@@ -22,9 +22,6 @@ DEFAULT_BATCH_PROCESSING_SIZE = 5_000
 # https://klotzandrew.com/blog/postgres-passing-65535-parameter-limit/
 DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE = 50_000
 DEFAULT_TELEGRAM_BATCH_PROCESSING_SIZE = 888
-DEFAULT_TELEGRAM_TASK_BATCH_PROCESSING_SIZE = (
-    DEFAULT_TELEGRAM_BATCH_PROCESSING_SIZE * 20
-)
 DEFAULT_TELEGRAM_BATCH_REQUEST_SIZE = 3
 # Privileges required for admin to manage the chat in the bot
 REQUIRED_ADMIN_PRIVILEGES = ["add_admins"]
@@ -35,13 +32,41 @@ REQUIRED_BOT_PRIVILEGES = ["invite_users", "ban_users"]
 UPDATED_TELEGRAM_USERS_SET_NAME = "updated_telegram_users"
 UPDATED_WALLETS_SET_NAME = "updated_wallets"
 DISCONNECTED_WALLETS_SET_NAME = "disconnected_wallets"
+# Chats which members changed since their members counters were recalculated
+UPDATED_MEMBERS_COUNTERS_CHAT_IDS = "updated_members_counters_chat_ids"
 CELERY_WALLET_FETCH_QUEUE_NAME = "wallet-fetch-queue"
 UPDATED_STICKERS_USER_IDS = "updated_stickers_user_ids"
 CELERY_STICKER_FETCH_QUEUE_NAME = "sticker-fetch-queue"
+# Number of consecutive instances of a character covered by one ownership snapshot hash
+STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE = 1_000
+STICKER_OWNERSHIP_SNAPSHOT_TTL = 24 * 60 * 60  # 24 hours
+# Interval of the runs comparing every item with the database instead of the changed chunks only
+STICKER_OWNERSHIP_FULL_RUN_INTERVAL = 6 * 60 * 60  # 6 hours
 CELERY_NOTICED_WALLETS_UPLOAD_QUEUE_NAME = "noticed-wallets-upload-queue"
 CELERY_SYSTEM_QUEUE_NAME = "system-queue"
 CELERY_GATEWAY_INDEX_QUEUE_NAME = "gateway-index-queue"
 CELERY_INDEX_PRICES_QUEUE_NAME = "index-prices-queue"
+# Gateway
+GATEWAY_PARTICIPANTS_PAGE_SIZE = 200  # Telethon fetches participants in chunks of 200
+GATEWAY_INDEX_BATCH_SIZE = 1_000
+# Chat rules plan
+RULES_PLAN_VERSION_KEY_TEMPLATE = "rules-plan-version:{chat_id}"
+RULES_PLAN_KEY_TEMPLATE = "rules-plan:{chat_id}:{version}"
+RULES_PLAN_CACHE_TTL = 60 * 60  # 1 hour
+RULES_PLAN_LOCAL_CACHE_SIZE = 1_024
+RULES_PLAN_LOCAL_CACHE_TTL = 5 * 60  # 5 minutes
+# User snapshots
+USER_SNAPSHOT_INVALIDATION_CHANNEL = "user-snapshot-invalidation"
+USER_SNAPSHOT_CACHE_TTL = 60  # 1 minute
+USER_SNAPSHOT_LOCAL_CACHE_SIZE = 10_000
+# Eligibility summaries
+ELIGIBILITY_SUMMARY_KEY_TEMPLATE = "eligibility-summary:{chat_id}:{user_id}"
+ELIGIBILITY_SUMMARY_CACHE_TTL = 10 * 60  # 10 minutes
+WALLET_ASSETS_VERSION_KEY_TEMPLATE = "wallet-assets-version:{address}"
+STICKER_ASSETS_VERSION_KEY_TEMPLATE = "sticker-assets-version:{telegram_id}"
+GIFT_ASSETS_VERSION_KEY_TEMPLATE = "gift-assets-version:{telegram_id}"
+# Should outlive the cached summaries, so an expired version can't match a stale summary
+ASSETS_VERSION_TTL = 24 * 60 * 60  # 1 day
 # Gifts
 GIFT_COLLECTIONS_METADATA_KEY = "gifts-metadata"
 CELERY_GIFT_FETCH_QUEUE_NAME = "gift-fetch-queue"
@@ -59,6 +84,13 @@ CERTS_PATH = PACKAGE_ROOT.parent.parent / "config" / "certs"
 REQUEST_TIMEOUT = 30
 CONNECT_TIMEOUT = 10
 READ_TIMEOUT = 30
+# External whitelist sources
+EXTERNAL_SOURCES_REFRESH_CONCURRENCY = 10
+# Total time for a single source, so slow endpoints can't delay the next 3-minute refresh cycle
+EXTERNAL_SOURCE_FETCH_DEADLINE = 60
+EXTERNAL_SOURCE_FETCH_STATE_KEY_TEMPLATE = "external-source-fetch-state:{source_id}"
+EXTERNAL_SOURCE_FETCH_STATE_TTL = 24 * 60 * 60  # 1 day
+EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS = (1, 5, 15, 30, 60)
 PROMOTE_JETTON_TEMPLATE = (
     "https://app.ston.fi/swap?chartVisible=false&ft=TON&tt={jetton_master_address}"
 )
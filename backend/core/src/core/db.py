@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from core.settings import core_settings
@@ -6,10 +7,26 @@ from core.settings import core_settings
 
 # Database setup
 DATABASE_URL = core_settings.db_connection_string
+DB_POOL_SIZE = 300
 engine = create_engine(
     DATABASE_URL,
-    pool_size=300,
+    pool_size=DB_POOL_SIZE,
     pool_recycle=3600,
     pool_pre_ping=True,
 )
 Base = declarative_base()
+
+
+def create_async_db_engine(pool_size: int) -> AsyncEngine:
+    """
+    Creates the engine for the code running in the event loop, e.g. API routes.
+    It's created only by the processes using it, so the others don't keep a second pool.
+
+    :param pool_size: Number of connections kept in the pool
+    """
+    return create_async_engine(
+        DATABASE_URL,
+        pool_size=pool_size,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+    )
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, computed_field
+from typing import Annotated, Any
+
+from pydantic import BaseModel, Discriminator, Tag, computed_field
 
 from core.enums.rule import EligibilityCheckType
 from core.dtos.gift.collection import GiftCollectionDTO
@@ -65,6 +67,44 @@ class EligibilitySummaryStickerCollectionInternalDTO(EligibilitySummaryInternalD
     character: MinimalStickerCharacterDTO | None
 
 
+_ELIGIBILITY_SUMMARY_TYPES_WITH_DETAILS = {
+    EligibilityCheckType.JETTON.value,
+    EligibilityCheckType.NFT_COLLECTION.value,
+    EligibilityCheckType.GIFT_COLLECTION.value,
+    EligibilityCheckType.STICKER_COLLECTION.value,
+}
+
+
+def _get_eligibility_summary_tag(value: Any) -> str:
+    check_type = value["type"] if isinstance(value, dict) else value.type
+    check_type = EligibilityCheckType(check_type).value
+    return (
+        check_type if check_type in _ELIGIBILITY_SUMMARY_TYPES_WITH_DETAILS else "base"
+    )
+
+
+# Keeps the type-specific details when the summary is restored from JSON
+EligibilitySummaryInternalItemType = Annotated[
+    Annotated[
+        EligibilitySummaryJettonInternalDTO, Tag(EligibilityCheckType.JETTON.value)
+    ]
+    | Annotated[
+        EligibilitySummaryNftCollectionInternalDTO,
+        Tag(EligibilityCheckType.NFT_COLLECTION.value),
+    ]
+    | Annotated[
+        EligibilitySummaryGiftCollectionInternalDTO,
+        Tag(EligibilityCheckType.GIFT_COLLECTION.value),
+    ]
+    | Annotated[
+        EligibilitySummaryStickerCollectionInternalDTO,
+        Tag(EligibilityCheckType.STICKER_COLLECTION.value),
+    ]
+    | Annotated[EligibilitySummaryInternalDTO, Tag("base")],
+    Discriminator(_get_eligibility_summary_tag),
+]
+
+
 class RulesEligibilityGroupSummaryInternalDTO(BaseModel):
     """
     Represents a summary of eligibility groups consisting of multiple eligibility
@@ -75,7 +115,7 @@ class RulesEligibilityGroupSummaryInternalDTO(BaseModel):
     """
 
     id: int
-    items: list[EligibilitySummaryInternalDTO]
+    items: list[EligibilitySummaryInternalItemType]
 
     def __bool__(self):
         # If there are no items on the list - user should not be eligible for that empty group
@@ -110,3 +150,13 @@ class RulesEligibilitySummaryInternalDTO(BaseModel):
 
     def __repr__(self):
         return f"<{self.__class__.__name__} ({self.items=})>"
+
+
+class CachedRulesEligibilitySummaryInternalDTO(BaseModel):
+    """
+    Eligibility summary of the user in the chat stored in the cache
+    along with the stamp of the data it was computed from.
+    """
+
+    stamp: str
+    summary: RulesEligibilitySummaryInternalDTO
@@ -0,0 +1,241 @@
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict
+
+from core.dtos.chat.rule import TelegramChatEligibilityRulesDTO
+from core.dtos.gift.collection import GiftCollectionDTO
+from core.dtos.resource import JettonDTO, NftCollectionDTO
+from core.dtos.sticker import MinimalStickerCollectionDTO, MinimalStickerCharacterDTO
+from core.models.rule import (
+    TelegramChatEmoji,
+    TelegramChatGiftCollection,
+    TelegramChatJetton,
+    TelegramChatNFTCollection,
+    TelegramChatPremium,
+    TelegramChatStickerCollection,
+    TelegramChatToncoin,
+    TelegramChatWhitelist,
+    TelegramChatWhitelistExternalSource,
+)
+from core.utils.whitelist import WhitelistMembers
+
+
+class BaseRulePlanDTO(BaseModel):
+    """
+    Immutable snapshot of the rule attributes required for the eligibility check.
+    Attribute names mirror the ORM models, so the same matching helpers work for both.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    group_id: int
+    is_enabled: bool
+
+
+class ThresholdRulePlanDTO(BaseRulePlanDTO):
+    threshold: int
+    category: str | None = None
+
+
+class ToncoinRulePlanDTO(ThresholdRulePlanDTO):
+    @classmethod
+    def from_orm(cls, obj: TelegramChatToncoin) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            threshold=obj.threshold,
+            category=obj.category,
+        )
+
+
+class JettonRulePlanDTO(ThresholdRulePlanDTO):
+    address: str
+    jetton: JettonDTO
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatJetton) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            threshold=obj.threshold,
+            category=obj.category,
+            address=obj.address,
+            jetton=JettonDTO.from_orm(obj.jetton),
+        )
+
+
+class NftCollectionRulePlanDTO(ThresholdRulePlanDTO):
+    address: str | None
+    asset: str | None
+    nft_collection: NftCollectionDTO | None
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatNFTCollection) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            threshold=obj.threshold,
+            category=obj.category,
+            address=obj.address,
+            asset=obj.asset,
+            nft_collection=(
+                NftCollectionDTO.from_orm(obj.nft_collection)
+                if obj.nft_collection
+                else None
+            ),
+        )
+
+
+class StickerCollectionRulePlanDTO(ThresholdRulePlanDTO):
+    collection_id: int | None
+    character_id: int | None
+    collection: MinimalStickerCollectionDTO | None
+    character: MinimalStickerCharacterDTO | None
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatStickerCollection) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            threshold=obj.threshold,
+            category=obj.category,
+            collection_id=obj.collection_id,
+            character_id=obj.character_id,
+            collection=(
+                MinimalStickerCollectionDTO.from_orm(obj.collection)
+                if obj.collection
+                else None
+            ),
+            character=(
+                MinimalStickerCharacterDTO.from_orm(obj.character)
+                if obj.character
+                else None
+            ),
+        )
+
+
+class GiftCollectionRulePlanDTO(ThresholdRulePlanDTO):
+    collection_slug: str | None
+    model: str | None
+    backdrop: str | None
+    pattern: str | None
+    collection: GiftCollectionDTO | None
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatGiftCollection) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            threshold=obj.threshold,
+            category=obj.category,
+            collection_slug=obj.collection_slug,
+            model=obj.model,
+            backdrop=obj.backdrop,
+            pattern=obj.pattern,
+            collection=(
+                GiftCollectionDTO.from_orm(obj.collection) if obj.collection else None
+            ),
+        )
+
+
+class PremiumRulePlanDTO(BaseRulePlanDTO):
+    @classmethod
+    def from_orm(cls, obj: TelegramChatPremium) -> Self:
+        return cls(id=obj.id, group_id=obj.group_id, is_enabled=obj.is_enabled)
+
+
+class EmojiRulePlanDTO(BaseRulePlanDTO):
+    emoji_id: str
+
+    @classmethod
+    def from_orm(cls, obj: TelegramChatEmoji) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            emoji_id=obj.emoji_id,
+        )
+
+
+class WhitelistRulePlanDTO(BaseRulePlanDTO):
+    name: str
+    content: WhitelistMembers
+
+    @classmethod
+    def from_orm(
+        cls, obj: TelegramChatWhitelist | TelegramChatWhitelistExternalSource
+    ) -> Self:
+        return cls(
+            id=obj.id,
+            group_id=obj.group_id,
+            is_enabled=obj.is_enabled,
+            name=obj.name,
+            content=WhitelistMembers(obj.content or ()),
+        )
+
+
+class TelegramChatRulesPlanDTO(BaseModel):
+    """
+    Compiled, immutable set of the enabled eligibility rules of the chat.
+    It doesn't reference any ORM objects, so it's safe to share between sessions
+    and to keep in the cache.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    chat_id: int
+    toncoin: tuple[ToncoinRulePlanDTO, ...]
+    jettons: tuple[JettonRulePlanDTO, ...]
+    nft_collections: tuple[NftCollectionRulePlanDTO, ...]
+    stickers: tuple[StickerCollectionRulePlanDTO, ...]
+    gifts: tuple[GiftCollectionRulePlanDTO, ...]
+    premium: tuple[PremiumRulePlanDTO, ...]
+    whitelist_external_sources: tuple[WhitelistRulePlanDTO, ...]
+    whitelist_sources: tuple[WhitelistRulePlanDTO, ...]
+    emoji: tuple[EmojiRulePlanDTO, ...]
+
+    @classmethod
+    def from_rules(
+        cls, chat_id: int, eligibility_rules: TelegramChatEligibilityRulesDTO
+    ) -> Self:
+        return cls(
+            chat_id=chat_id,
+            toncoin=tuple(
+                ToncoinRulePlanDTO.from_orm(rule) for rule in eligibility_rules.toncoin
+            ),
+            jettons=tuple(
+                JettonRulePlanDTO.from_orm(rule) for rule in eligibility_rules.jettons
+            ),
+            nft_collections=tuple(
+                NftCollectionRulePlanDTO.from_orm(rule)
+                for rule in eligibility_rules.nft_collections
+            ),
+            stickers=tuple(
+                StickerCollectionRulePlanDTO.from_orm(rule)
+                for rule in eligibility_rules.stickers
+            ),
+            gifts=tuple(
+                GiftCollectionRulePlanDTO.from_orm(rule)
+                for rule in eligibility_rules.gifts
+            ),
+            premium=tuple(
+                PremiumRulePlanDTO.from_orm(rule) for rule in eligibility_rules.premium
+            ),
+            whitelist_external_sources=tuple(
+                WhitelistRulePlanDTO.from_orm(rule)
+                for rule in eligibility_rules.whitelist_external_sources
+            ),
+            whitelist_sources=tuple(
+                WhitelistRulePlanDTO.from_orm(rule)
+                for rule in eligibility_rules.whitelist_sources
+            ),
+            emoji=tuple(
+                EmojiRulePlanDTO.from_orm(rule) for rule in eligibility_rules.emoji
+            ),
+        )
@@ -66,6 +66,18 @@ class WhitelistRuleCPO(BaseModel):
     users: list[int]
 
 
+class ExternalSourceFetchStateDTO(BaseModel):
+    """
+    Validators of the last applied response of the external source.
+    They are only valid for the same URL and credentials, identified by the fingerprint.
+    """
+
+    fingerprint: str
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 class BaseWhitelistRuleDTO(BaseModel):
     id: int
     type: EligibilityCheckType
@@ -1,6 +1,10 @@
-from typing import Any, TypeVar, Generic
+import base64
+from decimal import Decimal
+from typing import Any, TypeVar, Generic, Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from core.exceptions.api import InvalidPaginationCursor
 
 
 _T = TypeVar("_T")
@@ -11,14 +15,43 @@ class OrderingRuleDTO(BaseModel, Generic[_T]):
     is_ascending: bool = False
 
 
+class PaginationCursorDTO(BaseModel):
+    """
+    Position of the last returned item for the keyset pagination.
+    Sorting rule is stored together with the position, so the cursor
+    can't be applied to the list sorted in another way.
+    """
+
+    field: str
+    is_ascending: bool
+    # Validated as a finite number fitting the widest sorting column,
+    # so it can always be coerced to the column type
+    value: Decimal = Field(allow_inf_nan=False, max_digits=21, decimal_places=6)
+    id: int
+
+    def encode(self) -> str:
+        return base64.urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        try:
+            return cls.model_validate_json(base64.urlsafe_b64decode(cursor))
+        except ValueError as e:
+            raise InvalidPaginationCursor(
+                f"Invalid pagination cursor {cursor!r}."
+            ) from e
+
+
 class PaginationMetadataDTO(BaseModel):
     offset: int
     limit: int
     include_total_count: bool = False
+    cursor: str | None = None
 
 
 class PaginatedResultWithoutCountDTO(BaseModel, Generic[_T]):
     items: list[Any]
+    next_cursor: str | None = None
 
 
 class PaginatedResultDTO(PaginatedResultWithoutCountDTO, Generic[_T]):
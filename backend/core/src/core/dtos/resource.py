@@ -33,6 +33,18 @@ class NftItemMetadataDTO(BaseNftItemMetadataDTO):
         )
 
 
+class NftItemTraitsDTO(BaseModel):
+    """
+    Normalized name of the NFT item used by the custom NFT rules,
+    e.g. digits of the Telegram Number without the country code
+    """
+
+    name: str | None = None
+    length: int | None = None
+    # Check TELEGRAM_NUMBER_CLUB_FLAGS for the bits
+    flags: int = 0
+
+
 class NftCollectionMetadataDTO(BaseNftCollectionMetadataDTO):
     @classmethod
     def from_items_metadata(cls, items_metadata: list[NftItemMetadataDTO]) -> Self:
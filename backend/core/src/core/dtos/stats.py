@@ -11,3 +11,10 @@ class StatsDTO(BaseModel):
     total_gift_unique_items: int
     total_jettons: int
     total_wallets: int
+
+
+class RedisPoolStatsDTO(BaseModel):
+    name: str
+    created: int
+    in_use: int
+    available: int
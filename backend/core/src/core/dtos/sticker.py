@@ -1,4 +1,3 @@
-import json
 from typing import Self, Any
 
 from pydantic import BaseModel
@@ -100,10 +99,6 @@ class StickerItemDTO(BaseStickerItemDTO):
         )
 
 
-class ExternalStickerItemDTO(BaseStickerItemDTO):
-    ...
-
-
 class StickerDomCollectionOwnershipMetadataDTO(BaseModel):
     collection_id: int
     url: str
@@ -119,38 +114,17 @@ class BaseStickerDomCollectionOwnershipDTO(BaseModel):
     timestamp: str
 
 
-class ExternalStickerDomCollectionOwnershipDTO(BaseStickerDomCollectionOwnershipDTO):
-    ownership_data: list[ExternalStickerItemDTO]
-
-    @classmethod
-    def from_raw(cls, raw: bytes | str, collection_id: int) -> Self:
-        json_data = json.loads(raw)
-        ownership_data = [
-            ExternalStickerItemDTO(
-                # ID should not contain ID of the owner (user_id) to ensure
-                # that after changing the owner it'll stay the same
-                id=f"{collection_id}_{character_id}_{instance_id}",
-                collection_id=collection_id,
-                character_id=character_id,
-                telegram_user_id=user_id,
-                instance=instance_id,
-            )
-            for character_id, instances_per_user in json_data["data"].items()
-            for user_instances in instances_per_user
-            for user_id, instances in user_instances.items()
-            for instance_id in instances
-        ]
-        return cls(
-            collection_id=collection_id,
-            timestamp=json_data["timestamp"],
-            ownership_data=ownership_data,
-        )
-
-
 class StickerDomCollectionOwnershipDTO(BaseStickerDomCollectionOwnershipDTO):
     ownership_data: list[StickerItemDTO]
 
 
+class StickerOwnershipSnapshotDTO(BaseModel):
+    # Hash per chunk of the collection items, see `ExternalStickerAction.get_ownership_snapshot`
+    chunks: dict[str, str]
+    # Unix time of the last run that compared every item with the database
+    full_run_at: float
+
+
 class StickerDomCollectionWithCharacters(StickerCollectionDTO):
     characters: list[StickerCharacterDTO]
 
@@ -1,11 +1,49 @@
 from typing import Self
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from telethon.tl.types import User as TelethonUser
 
+from core.models.user import User
 from core.settings import core_settings
 
 
+class UserSnapshotDTO(BaseModel):
+    """
+    Immutable copy of the user attributes required to serve authenticated requests.
+    It doesn't reference any ORM objects, so it's safe to keep in the cache.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    id: int
+    telegram_id: int
+    first_name: str
+    last_name: str | None
+    username: str | None
+    is_premium: bool
+    language: str
+    is_blocked: bool
+    is_admin: bool
+    allows_write_to_pm: bool
+    wallets: tuple[str, ...]
+
+    @classmethod
+    def from_orm(cls, obj: User) -> Self:
+        return cls(
+            id=obj.id,
+            telegram_id=obj.telegram_id,
+            first_name=obj.first_name,
+            last_name=obj.last_name,
+            username=obj.username,
+            is_premium=obj.is_premium,
+            language=obj.language,
+            is_blocked=obj.is_blocked,
+            is_admin=obj.is_admin,
+            allows_write_to_pm=obj.allows_write_to_pm,
+            wallets=tuple(wallet.address for wallet in obj.wallets),
+        )
+
+
 class UserInitDataPO(BaseModel):
     id: int
     username: str | None = None
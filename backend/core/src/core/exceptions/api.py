@@ -1,2 +1,6 @@
 class InvalidSortingParameter(Exception):
     pass
+
+
+class InvalidPaginationCursor(Exception):
+    pass
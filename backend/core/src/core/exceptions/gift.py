@@ -4,3 +4,7 @@ class GiftCollectionAlreadyExistsError(Exception):
 
 class GiftCollectionNotExistsError(Exception):
     pass
+
+
+class GiftBatchFetchError(Exception):
+    pass
@@ -2,11 +2,20 @@ import asyncio
 import logging
 import time
 from collections.abc import Callable, Awaitable, AsyncGenerator
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
+import httpx
 from pydantic import BaseModel
 from pytonapi import AsyncTonapi
-from pytonapi.exceptions import TONAPIInternalServerError, TONAPINotFoundError
+from pytonapi.async_tonapi import methods
+from pytonapi.async_tonapi.client import AsyncTonapiClientBase
+from pytonapi.exceptions import (
+    TONAPIError,
+    TONAPIInternalServerError,
+    TONAPINotFoundError,
+    TONAPIUnauthorizedError,
+)
 from pytonapi.schema.accounts import Account
 from pytonapi.schema.jettons import JettonHolders, JettonsBalances, JettonInfo
 from pytonapi.schema.nft import NftItems, NftCollection
@@ -22,6 +31,66 @@ logger = logging.getLogger(__name__)
 DEFAULT_TONAPI_OFFSET = 0
 DEFAULT_TONAPI_LIMIT = 1000
 DEFAULT_TONAPI_MAX_RETRIES = 10
+DEFAULT_TONAPI_MAX_CONNECTIONS = 10
+
+
+class PooledClientMixin(AsyncTonapiClientBase):
+    """
+    pytonapi opens a new HTTP client for every request, so connections are never reused.
+    This mixin sends the requests through the shared HTTP client instead.
+    """
+
+    def __init__(self, *args, http_client: httpx.AsyncClient, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.http_client = http_client
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        try:
+            response = await self.http_client.request(
+                method=method,
+                url=self.base_url + path,
+                headers=headers,
+                params=params or {},
+                json=body or {},
+            )
+            return await self._AsyncTonapiClientBase__process_response(response)
+        except httpx.LocalProtocolError:
+            raise TONAPIUnauthorizedError
+        except httpx.HTTPStatusError as e:
+            raise TONAPIError(e)
+
+
+class PooledAccountsMethod(PooledClientMixin, methods.AccountsMethod):
+    ...
+
+
+class PooledJettonsMethod(PooledClientMixin, methods.JettonsMethod):
+    ...
+
+
+class PooledNftMethod(PooledClientMixin, methods.NftMethod):
+    ...
+
+
+class PooledAsyncTonapi(PooledClientMixin, AsyncTonapi):
+    @property
+    def accounts(self) -> PooledAccountsMethod:
+        return PooledAccountsMethod(**self.__dict__)
+
+    @property
+    def jettons(self) -> PooledJettonsMethod:
+        return PooledJettonsMethod(**self.__dict__)
+
+    @property
+    def nft(self) -> PooledNftMethod:
+        return PooledNftMethod(**self.__dict__)
 
 
 class TonApiService:
@@ -30,6 +99,37 @@ class TonApiService:
             api_key=core_settings.ton_api_key,
             max_retries=DEFAULT_TONAPI_MAX_RETRIES,
         )
+        self._http_client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        """
+        Switch the service to the pooled HTTP client,
+        so all the requests made inside the context reuse the same connections.
+        """
+        self._http_client = httpx.AsyncClient(
+            headers=self._tonapi.headers,
+            timeout=httpx.Timeout(timeout=self._tonapi.timeout),
+            limits=httpx.Limits(max_connections=DEFAULT_TONAPI_MAX_CONNECTIONS),
+        )
+        self._tonapi = PooledAsyncTonapi(
+            api_key=core_settings.ton_api_key,
+            max_retries=DEFAULT_TONAPI_MAX_RETRIES,
+            http_client=self._http_client,
+        )
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self._http_client.aclose()
+        self._http_client = None
+        self._tonapi = AsyncTonapi(
+            api_key=core_settings.ton_api_key,
+            max_retries=DEFAULT_TONAPI_MAX_RETRIES,
+        )
 
     @classmethod
     async def _get_all_paginated(
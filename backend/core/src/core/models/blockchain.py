@@ -1,4 +1,13 @@
-from sqlalchemy import String, Boolean, DateTime, func, BigInteger, ForeignKey, Integer
+from sqlalchemy import (
+    String,
+    Boolean,
+    DateTime,
+    func,
+    BigInteger,
+    ForeignKey,
+    Integer,
+    SmallInteger,
+)
 from sqlalchemy.dialects.mysql import TEXT
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 
@@ -63,21 +72,41 @@ class NftItem(Base):
     __tablename__ = "nft_item"
 
     address = mapped_column(BlockchainAddressRawField, primary_key=True)
+    # PostgreSQL doesn't index foreign keys automatically
     owner_address = mapped_column(
         ForeignKey("user_wallet.address", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     collection_address = mapped_column(
         ForeignKey("nft_collection.address", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
-    # Check NftItemMetadataDTO for expected structure
+    # Check NftItemMetadataDTO for expected structure.
+    # Deferred, as it's rarely read and decoding it for every loaded item is costly.
+    # Use `undefer` when the metadata of multiple items is needed.
     blockchain_metadata: Mapped[BaseNftItemMetadataDTO] = mapped_column(
         NftItemMetadataField,
         nullable=True,
+        deferred=True,
         doc="Metadata of the NFT, such as attributes, traits, etc.",
     )
+    # Derived from the metadata when the item is indexed, check NftItemTraitsDTO
+    trait_name = mapped_column(
+        String(255),
+        nullable=True,
+        doc="Normalized name used by the custom rules, e.g. digits of the Telegram Number",
+    )
+    trait_length = mapped_column(SmallInteger, nullable=True)
+    trait_flags = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Bitmask of the Telegram Number clubs the item belongs to",
+    )
     created_at = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -1,10 +1,14 @@
 from sqlalchemy import (
     BigInteger,
+    Computed,
+    Integer,
     String,
     DateTime,
     func,
     Boolean,
     ForeignKey,
+    Index,
+    Numeric,
 )
 from sqlalchemy.orm import mapped_column, relationship
 
@@ -14,6 +18,13 @@ from core.models.mixin import PricedEntityMixin
 
 class TelegramChat(PricedEntityMixin):
     __tablename__ = "telegram_chat"
+    __table_args__ = (
+        # Chats catalogue is sorted by these columns and the ID is used as a tiebreaker
+        # in the same direction for the keyset pagination,
+        # so the index could be scanned either forward or backward
+        Index("ix_telegram_chat_members_count_id", "members_count", "id"),
+        Index("ix_telegram_chat_tcv_id", "tcv", "id"),
+    )
 
     id = mapped_column(BigInteger, primary_key=True)
     username = mapped_column(String(255), nullable=True)
@@ -48,6 +59,29 @@ class TelegramChat(PricedEntityMixin):
         default=True,
         doc="Whether the chat should be managed by the bot and available for users..",
     )
+    members_count = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Number of chat members. Maintained by the chat members service.",
+    )
+    managed_members_count = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        index=True,
+        doc="Number of chat members managed by the bot. Maintained by the chat members service.",
+    )
+    tcv = mapped_column(
+        Numeric(precision=21, scale=6),
+        Computed("coalesce(price, 0) * managed_members_count", persisted=True),
+        doc=(
+            "Total chat value: price of the chat multiplied by the number of managed members."
+            " Only managed members are taken into account to avoid inflating metrics with fake/bot users."
+        ),
+    )
     created_at = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     def __repr__(self):
@@ -6,6 +6,7 @@ from sqlalchemy import (
     func,
     UniqueConstraint,
     PrimaryKeyConstraint,
+    Index,
 )
 from sqlalchemy.dialects.mysql import BIGINT
 from sqlalchemy.orm import mapped_column, relationship
@@ -108,6 +109,7 @@ class JettonWallet(Base):
     owner_address = mapped_column(
         ForeignKey("user_wallet.address", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     balance = mapped_column(BIGINT, default=DEFAULT_WALLET_BALANCE, nullable=False)
     rating = mapped_column(Integer, default=None, nullable=True)
@@ -118,5 +120,15 @@ class JettonWallet(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    __table_args__ = (
+        # Covers the holders queries, so they don't have to visit the table
+        Index(
+            "ix_jetton_wallet_jetton_master_address_balance",
+            "jetton_master_address",
+            "balance",
+            postgresql_include=["owner_address"],
+        ),
+    )
+
     def __repr__(self):
         return f"<JettonWallet(address={self.address}, jetton_master_address={self.jetton_master_address})>"
@@ -4,7 +4,7 @@ from string import ascii_lowercase
 from typing import Any, Iterable
 
 from slugify import slugify
-from sqlalchemy import func, case, exists
+from sqlalchemy import func, exists, select, update, or_, and_, ColumnElement
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Query
 from telethon.tl.types import Channel
@@ -15,9 +15,10 @@ from core.dtos.chat import TelegramChatOrderingRuleDTO
 from core.dtos.pagination import (
     PaginatedResultWithoutCountDTO,
     PaginatedResultDTO,
+    PaginationCursorDTO,
 )
 from core.enums.chat import CustomTelegramChatOrderingRulesEnum
-from core.exceptions.api import InvalidSortingParameter
+from core.exceptions.api import InvalidSortingParameter, InvalidPaginationCursor
 from core.models.chat import TelegramChat, TelegramChatUser
 from core.models.rule import TelegramChatRuleGroup
 
@@ -29,13 +30,12 @@ logger = logging.getLogger(__name__)
 DEFAULT_SLUG_SUFFIX_LENGTH = 6
 MAX_SLUG_SUFFIX_ATTEMPTS = 5
 
-
-MANAGED_USERS_COUNT_QUERY = func.sum(
-    case((TelegramChatUser.is_managed.is_(True), 1), else_=0)
-)
-TCV_QUERY = func.sum(
-    case((TelegramChatUser.is_managed.is_(True), TelegramChat.price), else_=0)
-)
+CUSTOM_ORDERING_COLUMNS = {
+    CustomTelegramChatOrderingRulesEnum.USERS_COUNT: TelegramChat.members_count,
+    # Only managed users are taken into account to avoid inflating metrics
+    # with fake/bot users
+    CustomTelegramChatOrderingRulesEnum.TCV: TelegramChat.tcv,
+}
 
 
 class TelegramChatService(BaseService):
@@ -205,31 +205,60 @@ class TelegramChatService(BaseService):
             Each rule specifies a field to order by and whether it should be sorted
             in ascending or descending order.
         :return: A tuple where the first element is the updated Query object with the
-            custom ordering applied, and the second element is the modified list of
-            ordering rules after processing.
+            custom ordering applied, and the second element is the list of the remaining
+            ordering rules that are not custom ones.
         """
+        remaining_rules = []
         for rule in order_by:
-            match rule.field:
-                case CustomTelegramChatOrderingRulesEnum.USERS_COUNT:
-                    ordering_rule = func.count(TelegramChatUser.user_id)
-                    if not rule.is_ascending:
-                        ordering_rule = ordering_rule.desc()
-                    query = query.order_by(ordering_rule)
-                    order_by.remove(rule)
-                    continue
-                case CustomTelegramChatOrderingRulesEnum.TCV:
-                    # Only take into account managed users to avoid inflating metrics
-                    # with fake/bot users
-                    ordering_rule = TCV_QUERY
-                    if not rule.is_ascending:
-                        ordering_rule = ordering_rule.desc()
-                    query = query.order_by(ordering_rule)
-                    order_by.remove(rule)
-                    continue
-                case _:
-                    continue
-
-        return query, order_by
+            if (ordering_rule := CUSTOM_ORDERING_COLUMNS.get(rule.field)) is None:
+                remaining_rules.append(rule)
+                continue
+
+            if not rule.is_ascending:
+                ordering_rule = ordering_rule.desc()
+            query = query.order_by(ordering_rule)
+
+        return query, remaining_rules
+
+    @staticmethod
+    def _get_keyset_rule(
+        order_by: list[TelegramChatOrderingRuleDTO],
+    ) -> TelegramChatOrderingRuleDTO | None:
+        """
+        Returns the ordering rule the keyset pagination could be applied to.
+        It's only supported for a single rule on one of the indexed custom ordering fields,
+        since the ID is the only tiebreaker stored in the cursor.
+        """
+        if len(order_by) != 1 or order_by[0].field not in CUSTOM_ORDERING_COLUMNS:
+            return None
+        return order_by[0]
+
+    @staticmethod
+    def _get_keyset_filter(
+        rule: TelegramChatOrderingRuleDTO, cursor: PaginationCursorDTO
+    ) -> ColumnElement[bool]:
+        """
+        Builds the filter selecting items placed after the cursor position.
+        Items are sorted by the rule column and then by the ID in the same direction.
+        The redundant inclusive comparison lets the database use the composite index
+        to seek to the cursor position.
+        """
+        if cursor.field != rule.field or cursor.is_ascending != rule.is_ascending:
+            raise InvalidPaginationCursor(
+                f"Pagination cursor {cursor!r} doesn't match the ordering {rule!r}."
+            )
+
+        column = CUSTOM_ORDERING_COLUMNS[rule.field]
+        value = column.type.python_type(cursor.value)
+        if rule.is_ascending:
+            return and_(
+                column >= value,
+                or_(column > value, TelegramChat.id > cursor.id),
+            )
+        return and_(
+            column <= value,
+            or_(column < value, TelegramChat.id < cursor.id),
+        )
 
     def get_all_paginated(
         self,
@@ -239,43 +268,45 @@ class TelegramChatService(BaseService):
         include_total_count: bool = False,
         configured_only: bool = False,
         order_by: list[TelegramChatOrderingRuleDTO] | None = None,
+        cursor: str | None = None,
     ) -> PaginatedResultDTO | PaginatedResultWithoutCountDTO:
         """
         Retrieves a paginated list of TelegramChat records based on the provided filters,
-        offset, limit, and order conditions.
+        offset or cursor, limit, and order conditions.
 
         The method supports filtering the records using the `filters` parameter, which
         is a dictionary of column-value pairs. It also allows for pagination by specifying
         the `offset` and `limit` arguments. Additionally, you can specify the ordering
         of results by passing a tuple of column names via the `order_by` parameter.
 
+        When the results are sorted by a single custom ordering rule, the next page cursor
+        is returned. Passing it back as `cursor` fetches the next page using the keyset
+        pagination, which performance doesn't degrade for the deep pages as with offset.
+
         By enabling the `include_total_count` option, the method returns the total count
         of records matching the filters, alongside the retrieved results.
 
         :param filters: Dictionary of column-value pairs to filter the TelegramChat records.
             Example: {"column_name": "value", "another_column": 5}.
         :param offset: Integer, specifying the number of records to skip before starting to
-            return results.
+            return results. Ignored if the cursor is provided.
         :param limit: Integer, specifying the maximum number of records to retrieve.
         :param include_total_count: Boolean flag indicating whether to include the total
             count of filtered records in the result. Default is False.
         :param configured_only: Boolean flag indicating whether to include only chats
             that have at least one rule group configured (any rule exists). Default is False.
         :param order_by: Optional tuple of items by which to order the results.
+        :param cursor: Optional cursor of the previous page to continue from.
 
         :return: Instance of PaginatedResultDTO if `include_total_count` is True, containing
             both the retrieved results and the total count. If `include_total_count` is False,
             an instance of PaginatedResultWithoutCountDTO is returned containing only the results.
+        :raises InvalidSortingParameter: If the ordering is invalid or doesn't support cursors
+        :raises InvalidPaginationCursor: If the cursor is malformed or was issued for
+            another ordering
         """
-        query = self.db_session.query(
-            TelegramChat,
-            func.count(TelegramChatUser.user_id).label("members_count"),
-            TCV_QUERY.label("tcv"),
-        )
-        query = query.outerjoin(
-            TelegramChatUser, TelegramChatUser.chat_id == TelegramChat.id
-        )
-
+        order_by = order_by or []
+        query = self.db_session.query(TelegramChat)
         query = query.filter(
             # Ensure chat is not hidden
             TelegramChat.is_enabled.is_(True),
@@ -287,11 +318,27 @@ class TelegramChatService(BaseService):
         if configured_only:
             # Since it's the inner join, it'll filter out those, where there is no group set -> no tasks configured
             query = query.filter(
-                exists().where(TelegramChatRuleGroup.chat_id == TelegramChat.id)
+                exists().where(TelegramChatRuleGroup.chat_id == TelegramChat.id),
+                TelegramChat.managed_members_count
+                >= DEFAULT_MANAGED_USERS_PUBLIC_THRESHOLD,
             )
-            query = query.having(
-                MANAGED_USERS_COUNT_QUERY >= DEFAULT_MANAGED_USERS_PUBLIC_THRESHOLD
+
+        total_count: int | None = None
+        if include_total_count:
+            total_count = query.count()
+
+        keyset_rule = self._get_keyset_rule(order_by)
+        if cursor:
+            if not keyset_rule:
+                raise InvalidSortingParameter(
+                    f"Ordering {order_by!r} doesn't support the cursor pagination."
+                )
+            query = query.filter(
+                self._get_keyset_filter(
+                    keyset_rule, cursor=PaginationCursorDTO.decode(cursor)
+                )
             )
+            offset = 0
 
         # First, apply any custom rules provided
         query, order_by = self._custom_ordering_rules(query, order_by)
@@ -299,6 +346,10 @@ class TelegramChatService(BaseService):
         # Then go to the default attribute-based rules
         # The default ordering is required to make ordering stable
         order_by_items = (TelegramChat.id,)
+        if keyset_rule and not keyset_rule.is_ascending:
+            # The tiebreaker follows the rule direction to match the keyset filter
+            # and scan the composite index backward
+            order_by_items = (TelegramChat.id.desc(),)
         if order_by:
             # Apply other rules first
             order_by_items = (
@@ -307,19 +358,29 @@ class TelegramChatService(BaseService):
             )
 
         query = query.order_by(*order_by_items)
-        query = query.group_by(TelegramChat.id)
-
-        total_count: int | None = None
-        if include_total_count:
-            total_count = query.count()
 
-        query = query.offset(offset).limit(limit)
-        items = query.all()
+        # Fetch one more item to know whether there is the next page
+        items = query.offset(offset).limit(limit + 1).all()
+        next_cursor: str | None = None
+        if len(items) > limit:
+            items = items[:limit]
+            if keyset_rule:
+                last_item = items[-1]
+                next_cursor = PaginationCursorDTO(
+                    field=keyset_rule.field,
+                    is_ascending=keyset_rule.is_ascending,
+                    value=getattr(
+                        last_item, CUSTOM_ORDERING_COLUMNS[keyset_rule.field].key
+                    ),
+                    id=last_item.id,
+                ).encode()
 
         if include_total_count:
-            return PaginatedResultDTO(items=items, total_count=total_count)
+            return PaginatedResultDTO(
+                items=items, total_count=total_count, next_cursor=next_cursor
+            )
         else:
-            return PaginatedResultWithoutCountDTO(items=items)
+            return PaginatedResultWithoutCountDTO(items=items, next_cursor=next_cursor)
 
     def get_all(
         self,
@@ -352,15 +413,53 @@ class TelegramChatService(BaseService):
         query = query.order_by(TelegramChat.id)
         return query.all()
 
-    def get_tcv(self, chat_ids: list[int]) -> dict[int, float]:
-        result = (
-            self.db_session.query(TelegramChat.id, TCV_QUERY)
-            .join(TelegramChatUser, TelegramChat.id == TelegramChatUser.chat_id)
-            .filter(TelegramChat.id.in_(chat_ids))
+    def reconcile_members_counters(
+        self, chat_ids: Iterable[int] | None = None
+    ) -> list[int]:
+        """
+        Recalculates the members counters of the chats from the chat members table
+        and fixes the ones that changed or drifted, e.g. because of members deleted together
+        with their users or changes made outside of the chat members service.
+
+        :param chat_ids: IDs of the chats to recalculate the counters for, all chats if not set
+        :return: IDs of the chats which counters were fixed
+        """
+        counters = (
+            select(
+                TelegramChat.id.label("chat_id"),
+                func.count(TelegramChatUser.user_id).label("members_count"),
+                func.count(TelegramChatUser.user_id)
+                .filter(TelegramChatUser.is_managed.is_(True))
+                .label("managed_members_count"),
+            )
+            .outerjoin(TelegramChatUser, TelegramChatUser.chat_id == TelegramChat.id)
             .group_by(TelegramChat.id)
-            .all()
         )
-        return {r[0]: r[1] for r in result}
+        if chat_ids is not None:
+            counters = counters.where(TelegramChat.id.in_(list(chat_ids)))
+        counters = counters.subquery()
+        statement = (
+            update(TelegramChat)
+            .where(
+                TelegramChat.id == counters.c.chat_id,
+                or_(
+                    TelegramChat.members_count != counters.c.members_count,
+                    TelegramChat.managed_members_count
+                    != counters.c.managed_members_count,
+                ),
+            )
+            .values(
+                members_count=counters.c.members_count,
+                managed_members_count=counters.c.managed_members_count,
+            )
+            .returning(TelegramChat.id)
+            .execution_options(synchronize_session=False)
+        )
+        fixed_chat_ids = list(self.db_session.execute(statement).scalars())
+        self.db_session.expire_all()
+        if fixed_chat_ids:
+            logger.info(f"Members counters of chats {fixed_chat_ids!r} updated.")
+        return fixed_chat_ids
 
     def refresh_invite_link(self, chat_id: int, invite_link: str) -> TelegramChat:
         chat = self.get(chat_id)
@@ -0,0 +1,175 @@
+import logging
+from collections.abc import Iterable
+
+from core.constants import (
+    ASSETS_VERSION_TTL,
+    ELIGIBILITY_SUMMARY_CACHE_TTL,
+    ELIGIBILITY_SUMMARY_KEY_TEMPLATE,
+    GIFT_ASSETS_VERSION_KEY_TEMPLATE,
+    RULES_PLAN_VERSION_KEY_TEMPLATE,
+    STICKER_ASSETS_VERSION_KEY_TEMPLATE,
+    WALLET_ASSETS_VERSION_KEY_TEMPLATE,
+)
+from core.dtos.chat.rule.internal import (
+    CachedRulesEligibilitySummaryInternalDTO,
+    RulesEligibilitySummaryInternalDTO,
+)
+from core.dtos.user import UserSnapshotDTO
+from core.models.user import User
+from core.services.superredis import AsyncRedisService, RedisService
+
+
+logger = logging.getLogger(__name__)
+
+
+def _get_summary_keys(
+    chat_id: int, user: User | UserSnapshotDTO, wallet_address: str | None
+) -> list[str]:
+    return [
+        ELIGIBILITY_SUMMARY_KEY_TEMPLATE.format(chat_id=chat_id, user_id=user.id),
+        RULES_PLAN_VERSION_KEY_TEMPLATE.format(chat_id=chat_id),
+        WALLET_ASSETS_VERSION_KEY_TEMPLATE.format(address=wallet_address),
+        STICKER_ASSETS_VERSION_KEY_TEMPLATE.format(telegram_id=user.telegram_id),
+        GIFT_ASSETS_VERSION_KEY_TEMPLATE.format(telegram_id=user.telegram_id),
+    ]
+
+
+def _parse_summary(
+    values: list[str | None],
+    user: User | UserSnapshotDTO,
+    wallet_address: str | None,
+) -> tuple[str, RulesEligibilitySummaryInternalDTO | None]:
+    value, *versions = values
+    stamp = ":".join(
+        [
+            *(version or "0" for version in versions),
+            wallet_address or "",
+            # Premium status is not an asset, but is checked by the premium rules
+            str(int(user.is_premium)),
+        ]
+    )
+    if not value:
+        return stamp, None
+
+    cached = CachedRulesEligibilitySummaryInternalDTO.model_validate_json(value)
+    if cached.stamp != stamp:
+        return stamp, None
+
+    return stamp, cached.summary
+
+
+def _dump_summary(stamp: str, summary: RulesEligibilitySummaryInternalDTO) -> str:
+    return CachedRulesEligibilitySummaryInternalDTO(
+        stamp=stamp, summary=summary
+    ).model_dump_json()
+
+
+class EligibilitySummaryCacheService:
+    """
+    Redis cache of the users' eligibility summaries in the chats.
+
+    Each summary is stored with the stamp of the data it was computed from:
+    the rules plan version of the chat, the linked wallet and the versions of the user's assets.
+    Versions are bumped by the indexers, so summaries with an outdated stamp are recomputed on the next read.
+    """
+
+    def __init__(self, redis_service: RedisService | None = None) -> None:
+        self.redis_service = redis_service or RedisService()
+
+    def get(
+        self, chat_id: int, user: User | UserSnapshotDTO, wallet_address: str | None
+    ) -> tuple[str, RulesEligibilitySummaryInternalDTO | None]:
+        """
+        Get the cached summary if it's computed from the current data.
+
+        :param chat_id: Chat ID the summary belongs to
+        :param user: User the summary belongs to
+        :param wallet_address: Address of the wallet linked by the user to the chat
+        :return: Current stamp that should be used to cache a recomputed summary
+            and the cached summary or None if it's missing or outdated
+        """
+        values = self.redis_service.get_many(
+            *_get_summary_keys(
+                chat_id=chat_id, user=user, wallet_address=wallet_address
+            )
+        )
+        return _parse_summary(values, user=user, wallet_address=wallet_address)
+
+    def set(
+        self,
+        chat_id: int,
+        user_id: int,
+        stamp: str,
+        summary: RulesEligibilitySummaryInternalDTO,
+    ) -> None:
+        """
+        Cache the summary under the stamp obtained before it was computed,
+        so the data changed during the computation makes it outdated right away.
+        """
+        self.redis_service.set(
+            ELIGIBILITY_SUMMARY_KEY_TEMPLATE.format(chat_id=chat_id, user_id=user_id),
+            _dump_summary(stamp=stamp, summary=summary),
+            ex=ELIGIBILITY_SUMMARY_CACHE_TTL,
+        )
+
+    def bump_wallet_versions(self, addresses: Iterable[str]) -> None:
+        self.redis_service.incr_all(
+            (
+                WALLET_ASSETS_VERSION_KEY_TEMPLATE.format(address=address)
+                for address in addresses
+            ),
+            ex=ASSETS_VERSION_TTL,
+        )
+
+    def bump_sticker_versions(self, telegram_ids: Iterable[int | str]) -> None:
+        self.redis_service.incr_all(
+            (
+                STICKER_ASSETS_VERSION_KEY_TEMPLATE.format(telegram_id=telegram_id)
+                for telegram_id in telegram_ids
+            ),
+            ex=ASSETS_VERSION_TTL,
+        )
+
+    def bump_gift_versions(self, telegram_ids: Iterable[int | str]) -> None:
+        self.redis_service.incr_all(
+            (
+                GIFT_ASSETS_VERSION_KEY_TEMPLATE.format(telegram_id=telegram_id)
+                for telegram_id in telegram_ids
+            ),
+            ex=ASSETS_VERSION_TTL,
+        )
+
+
+class AsyncEligibilitySummaryCacheService:
+    """
+    Asyncio counterpart of the :class:`EligibilitySummaryCacheService`
+    for the code running in the event loop, e.g. the API routes served over the async session.
+    """
+
+    def __init__(self, redis_service: AsyncRedisService | None = None) -> None:
+        self.redis_service = redis_service or AsyncRedisService()
+
+    async def get(
+        self, chat_id: int, user: User | UserSnapshotDTO, wallet_address: str | None
+    ) -> tuple[str, RulesEligibilitySummaryInternalDTO | None]:
+        """See `EligibilitySummaryCacheService.get`."""
+        values = await self.redis_service.get_many(
+            *_get_summary_keys(
+                chat_id=chat_id, user=user, wallet_address=wallet_address
+            )
+        )
+        return _parse_summary(values, user=user, wallet_address=wallet_address)
+
+    async def set(
+        self,
+        chat_id: int,
+        user_id: int,
+        stamp: str,
+        summary: RulesEligibilitySummaryInternalDTO,
+    ) -> None:
+        """See `EligibilitySummaryCacheService.set`."""
+        await self.redis_service.set(
+            ELIGIBILITY_SUMMARY_KEY_TEMPLATE.format(chat_id=chat_id, user_id=user_id),
+            _dump_summary(stamp=stamp, summary=summary),
+            ex=ELIGIBILITY_SUMMARY_CACHE_TTL,
+        )
@@ -42,6 +42,7 @@ from core.models.rule import (
     TelegramChatRuleBase,
 )
 from core.services.base import BaseService
+from core.services.chat.rule.plan import invalidate_rules_plan
 
 
 logger = logging.getLogger(__name__)
@@ -79,6 +80,7 @@ class BaseTelegramChatRuleService(BaseService, ABC, Generic[TelegramChatRuleT]):
         new_rule = self.model(**dto.model_dump())  # noqa
         self.db_session.add(new_rule)
         self.db_session.flush()
+        invalidate_rules_plan(self.db_session, chat_id=new_rule.chat_id)
         logger.debug(f"Telegram Chat Rule {new_rule!r} created.")
         return new_rule
 
@@ -118,6 +120,7 @@ class BaseTelegramChatRuleService(BaseService, ABC, Generic[TelegramChatRuleT]):
         for key, value in dto.model_dump(exclude_unset=True).items():
             setattr(rule, key, value)
         self.db_session.flush()
+        invalidate_rules_plan(self.db_session, chat_id=rule.chat_id)
         logger.debug(f"{rule!r} updated.")
         return rule
 
@@ -139,6 +142,7 @@ class BaseTelegramChatRuleService(BaseService, ABC, Generic[TelegramChatRuleT]):
             self.model.id == rule_id, self.model.chat_id == chat_id
         ).delete(synchronize_session="fetch")
         self.db_session.flush()
+        invalidate_rules_plan(self.db_session, chat_id=chat_id)
         logger.debug(
             f"Telegram Chat Rule {self.model.__name__!r} {rule_id=!r} deleted."
         )
@@ -0,0 +1,213 @@
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from redis import RedisError
+from sqlalchemy.orm import Session
+
+from core.constants import (
+    RULES_PLAN_CACHE_TTL,
+    RULES_PLAN_KEY_TEMPLATE,
+    RULES_PLAN_LOCAL_CACHE_SIZE,
+    RULES_PLAN_LOCAL_CACHE_TTL,
+    RULES_PLAN_VERSION_KEY_TEMPLATE,
+)
+from core.dtos.chat.rule.plan import TelegramChatRulesPlanDTO
+from core.services.db import on_outermost_commit
+from core.services.superredis import AsyncRedisService, RedisService
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_INVALIDATIONS_SESSION_KEY = "pending_rules_plan_invalidations"
+
+
+class TelegramChatRulesPlanCacheService:
+    """
+    Two-level cache for the compiled chat rules plans.
+
+    Plans are keyed by the chat ID and the version token stored in Redis.
+    Bumping the version makes all the previously cached plans of the chat unreachable
+    both in Redis and in the in-process cache of every worker, so no explicit deletion is needed.
+
+    Versions are random tokens rather than counters, so a version key evicted from Redis
+    is recreated with a new value instead of starting over and matching the old plans again.
+    The in-process entries keep the version they were cached under and expire after a short TTL,
+    so a worker doesn't serve a plan longer than that even if it misses a bump.
+    """
+
+    _local_cache: OrderedDict[
+        int, tuple[str, float, TelegramChatRulesPlanDTO]
+    ] = OrderedDict()
+    _local_cache_lock = threading.Lock()
+
+    def __init__(self, redis_service: RedisService | None = None) -> None:
+        self.redis_service = redis_service or RedisService()
+
+    def get_version(self, chat_id: int) -> str:
+        key = RULES_PLAN_VERSION_KEY_TEMPLATE.format(chat_id=chat_id)
+        if version := self.redis_service.get(key):
+            return version
+
+        version = _new_version()
+        if self.redis_service.set(key, version, nx=True):
+            return version
+        # Created concurrently by another worker
+        return self.redis_service.get(key) or version
+
+    def get(self, chat_id: int, version: str) -> TelegramChatRulesPlanDTO | None:
+        """
+        Get the plan from the in-process cache or from Redis otherwise.
+
+        :param chat_id: Chat ID the plan belongs to
+        :param version: Current version of the chat rules
+        :return: Cached plan or None if there is no plan for this version yet
+        """
+        if plan := self._get_local(chat_id=chat_id, version=version):
+            return plan
+
+        value = self.redis_service.get(
+            RULES_PLAN_KEY_TEMPLATE.format(chat_id=chat_id, version=version)
+        )
+        if not value:
+            return None
+
+        plan = TelegramChatRulesPlanDTO.model_validate_json(value)
+        self._set_local(plan=plan, version=version)
+        return plan
+
+    def set(self, plan: TelegramChatRulesPlanDTO, version: str) -> None:
+        self.redis_service.set(
+            RULES_PLAN_KEY_TEMPLATE.format(chat_id=plan.chat_id, version=version),
+            plan.model_dump_json(),
+            ex=RULES_PLAN_CACHE_TTL,
+        )
+        self._set_local(plan=plan, version=version)
+
+    def bump_versions(self, *chat_ids: int) -> None:
+        for chat_id in chat_ids:
+            self.redis_service.set(
+                RULES_PLAN_VERSION_KEY_TEMPLATE.format(chat_id=chat_id),
+                _new_version(),
+            )
+            logger.debug(f"Rules plan version bumped for chat {chat_id!r}")
+
+    @classmethod
+    def _get_local(cls, chat_id: int, version: str) -> TelegramChatRulesPlanDTO | None:
+        with cls._local_cache_lock:
+            if not (cached := cls._local_cache.get(chat_id)):
+                return None
+
+            cached_version, expires_at, plan = cached
+            if cached_version != version or expires_at <= time.monotonic():
+                del cls._local_cache[chat_id]
+                return None
+
+            cls._local_cache.move_to_end(chat_id)
+            return plan
+
+    @classmethod
+    def _set_local(cls, plan: TelegramChatRulesPlanDTO, version: str) -> None:
+        with cls._local_cache_lock:
+            cls._local_cache[plan.chat_id] = (
+                version,
+                time.monotonic() + RULES_PLAN_LOCAL_CACHE_TTL,
+                plan,
+            )
+            cls._local_cache.move_to_end(plan.chat_id)
+            while len(cls._local_cache) > RULES_PLAN_LOCAL_CACHE_SIZE:
+                cls._local_cache.popitem(last=False)
+
+    @classmethod
+    def clear_local(cls) -> None:
+        with cls._local_cache_lock:
+            cls._local_cache.clear()
+
+
+class AsyncTelegramChatRulesPlanCacheService:
+    """
+    Asyncio counterpart of the :class:`TelegramChatRulesPlanCacheService`
+    for the code running in the event loop. The in-process cache is shared with it.
+    """
+
+    def __init__(self, redis_service: AsyncRedisService | None = None) -> None:
+        self.redis_service = redis_service or AsyncRedisService()
+
+    async def get_version(self, chat_id: int) -> str:
+        """See `TelegramChatRulesPlanCacheService.get_version`."""
+        key = RULES_PLAN_VERSION_KEY_TEMPLATE.format(chat_id=chat_id)
+        if version := await self.redis_service.get(key):
+            return version
+
+        version = _new_version()
+        if await self.redis_service.set(key, version, nx=True):
+            return version
+        return await self.redis_service.get(key) or version
+
+    async def get(self, chat_id: int, version: str) -> TelegramChatRulesPlanDTO | None:
+        """See `TelegramChatRulesPlanCacheService.get`."""
+        if plan := TelegramChatRulesPlanCacheService._get_local(
+            chat_id=chat_id, version=version
+        ):
+            return plan
+
+        value = await self.redis_service.get(
+            RULES_PLAN_KEY_TEMPLATE.format(chat_id=chat_id, version=version)
+        )
+        if not value:
+            return None
+
+        plan = TelegramChatRulesPlanDTO.model_validate_json(value)
+        TelegramChatRulesPlanCacheService._set_local(plan=plan, version=version)
+        return plan
+
+    async def set(self, plan: TelegramChatRulesPlanDTO, version: str) -> None:
+        await self.redis_service.set(
+            RULES_PLAN_KEY_TEMPLATE.format(chat_id=plan.chat_id, version=version),
+            plan.model_dump_json(),
+            ex=RULES_PLAN_CACHE_TTL,
+        )
+        TelegramChatRulesPlanCacheService._set_local(plan=plan, version=version)
+
+
+def _new_version() -> str:
+    return secrets.token_hex(8)
+
+
+def _bump_versions(chat_ids: Iterable[int]) -> None:
+    try:
+        TelegramChatRulesPlanCacheService().bump_versions(*chat_ids)
+    except RedisError as e:
+        logger.error(
+            f"Failed to bump rules plan versions for chats {sorted(chat_ids)!r}. "
+            f"Cached plans will expire in {RULES_PLAN_CACHE_TTL} seconds.",
+            exc_info=e,
+        )
+
+
+def invalidate_rules_plan(db_session: Session, chat_id: int) -> None:
+    """
+    Schedule the rules plan version bump for the chat.
+    The version is bumped only after the session is committed, so concurrent readers
+    can't cache a plan built from the uncommitted data under the new version.
+
+    :param db_session: Session in which the rules of the chat were changed
+    :param chat_id: Chat ID which rules were changed
+    """
+    on_outermost_commit(
+        db_session,
+        key=PENDING_INVALIDATIONS_SESSION_KEY,
+        item=chat_id,
+        flush=_bump_versions,
+    )
+
+
+def has_pending_invalidation(db_session: Session, chat_id: int) -> bool:
+    """
+    Check whether the rules of the chat were changed in the current session,
+    but not committed yet. Cached plans are outdated for such chats.
+    """
+    return chat_id in db_session.info.get(PENDING_INVALIDATIONS_SESSION_KEY, ())
@@ -1,16 +1,43 @@
+import asyncio
+import bisect
 import logging
+import time
+from collections.abc import AsyncGenerator, Iterable
 from typing import Generic
 
 from httpx import HTTPError
+from pydantic import ValidationError
+from redis import RedisError
+from sqlalchemy.orm import Session
 
-from core.dtos.chat.rule.whitelist import WhitelistRuleItemsDifferenceDTO
+from core.constants import (
+    EXTERNAL_SOURCE_FETCH_DEADLINE,
+    EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS,
+    EXTERNAL_SOURCE_FETCH_STATE_KEY_TEMPLATE,
+    EXTERNAL_SOURCE_FETCH_STATE_TTL,
+    EXTERNAL_SOURCES_REFRESH_CONCURRENCY,
+)
+from core.dtos.chat.rule.whitelist import (
+    ExternalSourceFetchStateDTO,
+    WhitelistRuleCPO,
+    WhitelistRuleItemsDifferenceDTO,
+)
 from core.exceptions.chat import TelegramChatInvalidExternalSourceError
 from core.models.rule import TelegramChatWhitelistExternalSource, TelegramChatWhitelist
 from core.services.chat.rule.base import BaseTelegramChatRuleService, TelegramChatRuleT
-from core.utils.external_source import fetch_dynamic_allowed_members
+from core.services.chat.rule.plan import invalidate_rules_plan
+from core.services.db import on_outermost_commit
+from core.services.superredis import RedisService
+from core.utils.external_source import (
+    create_external_source_client,
+    fetch_dynamic_allowed_members,
+    fetch_dynamic_allowed_members_if_modified,
+)
 
 logger = logging.getLogger(__name__)
 
+PENDING_FETCH_STATES_SESSION_KEY = "pending_external_source_fetch_states"
+
 
 class BaseTelegramChatExternalSourceService(
     BaseTelegramChatRuleService,
@@ -21,6 +48,7 @@ class BaseTelegramChatExternalSourceService(
     ) -> TelegramChatRuleT:
         rule.content = content
         self.db_session.flush()
+        invalidate_rules_plan(self.db_session, chat_id=rule.chat_id)
         return rule
 
 
@@ -83,8 +111,235 @@ class TelegramChatExternalSourceService(
         logger.info(f"Refreshed external source {url!r} successfully")
         return difference
 
+    @staticmethod
+    def get_fetch_states(
+        source_ids: Iterable[int],
+    ) -> dict[int, ExternalSourceFetchStateDTO]:
+        source_ids = list(source_ids)
+        if not source_ids:
+            return {}
+
+        try:
+            values = RedisService().get_many(
+                *(
+                    EXTERNAL_SOURCE_FETCH_STATE_KEY_TEMPLATE.format(source_id=source_id)
+                    for source_id in source_ids
+                )
+            )
+        except RedisError as e:
+            logger.warning(
+                "Failed to get external sources fetch states. Fetching all of them.",
+                exc_info=e,
+            )
+            return {}
+
+        fetch_states = {}
+        for source_id, value in zip(source_ids, values):
+            if not value:
+                continue
+            try:
+                fetch_states[
+                    source_id
+                ] = ExternalSourceFetchStateDTO.model_validate_json(value)
+            except ValidationError as e:
+                # The source is fetched in full and the state is overwritten afterward
+                logger.warning(
+                    f"Invalid fetch state of external source {source_id!r}: {e}"
+                )
+        return fetch_states
+
+    def set_content(
+        self,
+        rule: TelegramChatWhitelistExternalSource,
+        content: list[int],
+        fetch_state: ExternalSourceFetchStateDTO | None = None,
+    ) -> TelegramChatWhitelistExternalSource:
+        """
+        Set the content of the external source.
+
+        :param rule: External source to update
+        :param content: Fetched allowed members
+        :param fetch_state: State of the fetch the content was obtained with.
+            It's saved only after the session is committed, so the content is not skipped
+            as unchanged on the next refresh if the transaction is rolled back.
+        """
+        rule = super().set_content(rule, content)
+        if fetch_state:
+            _save_fetch_state_on_commit(
+                self.db_session, source_id=rule.id, fetch_state=fetch_state
+            )
+        return rule
+
+    async def fetch_modified(
+        self,
+        sources: list[TelegramChatWhitelistExternalSource],
+    ) -> AsyncGenerator[
+        tuple[
+            TelegramChatWhitelistExternalSource,
+            WhitelistRuleItemsDifferenceDTO,
+            ExternalSourceFetchStateDTO,
+        ],
+        None,
+    ]:
+        """
+        Fetches the external sources concurrently over a single pooled HTTP client
+        and yields the ones which content was modified in completion order.
+        Errors are logged and the failed sources are skipped.
+
+        Each fetch is limited by a deadline, so a few slow endpoints can't delay the refresh cycle,
+        and the fetch durations histogram is logged once all sources are processed.
+
+        :param sources: Enabled external sources to fetch
+        :return: An asynchronous generator yielding the source, the difference between
+            its current and fetched content and the fetch state to save along with the content
+        """
+        fetch_states = self.get_fetch_states(source.id for source in sources)
+        sources_by_id = {source.id: source for source in sources}
+        semaphore = asyncio.Semaphore(EXTERNAL_SOURCES_REFRESH_CONCURRENCY)
+        durations: dict[int, float] = {}
+
+        async def _fetch(
+            source_id: int, url: str, auth_key: str | None, auth_value: str | None
+        ) -> tuple[
+            int,
+            tuple[WhitelistRuleCPO | None, ExternalSourceFetchStateDTO] | Exception,
+        ]:
+            async with semaphore:
+                started_at = time.perf_counter()
+                try:
+                    async with asyncio.timeout(EXTERNAL_SOURCE_FETCH_DEADLINE):
+                        result = await fetch_dynamic_allowed_members_if_modified(
+                            client,
+                            url=url,
+                            auth_key=auth_key,
+                            auth_value=auth_value,
+                            fetch_state=fetch_states.get(source_id),
+                        )
+                except Exception as e:
+                    result = e
+                finally:
+                    durations[source_id] = time.perf_counter() - started_at
+                return source_id, result
+
+        async with create_external_source_client() as client:
+            fetches = [
+                # Attributes are read upfront, so the fetches don't touch the session
+                asyncio.ensure_future(
+                    _fetch(source.id, source.url, source.auth_key, source.auth_value)
+                )
+                for source in sources
+            ]
+            try:
+                for fetched in asyncio.as_completed(fetches):
+                    source_id, result = await fetched
+                    source = sources_by_id[source_id]
+                    if isinstance(result, Exception):
+                        self._log_fetch_error(url=source.url, error=result)
+                        continue
+
+                    allowed_members, fetch_state = result
+                    if allowed_members is None:
+                        logger.info(
+                            f"External source {source.url!r} was not modified. Skipping."
+                        )
+                        # Nothing is changed in the database, so the state can be saved right away
+                        _save_fetch_states({source_id: fetch_state})
+                        continue
+
+                    yield (
+                        source,
+                        WhitelistRuleItemsDifferenceDTO(
+                            previous=source.content,
+                            current=allowed_members.users,
+                        ),
+                        fetch_state,
+                    )
+            finally:
+                for fetch in fetches:
+                    fetch.cancel()
+                await asyncio.gather(*fetches, return_exceptions=True)
+
+        _log_fetch_durations(
+            {
+                sources_by_id[source_id].url: duration
+                for source_id, duration in durations.items()
+            }
+        )
+
+    @staticmethod
+    def _log_fetch_error(url: str, error: Exception) -> None:
+        if isinstance(error, TimeoutError):
+            logger.warning(
+                f"Fetching external source {url!r} took longer than {EXTERNAL_SOURCE_FETCH_DEADLINE} seconds."
+            )
+        elif isinstance(error, HTTPError):
+            logger.warning(f"Failed to fetch external source {url!r}: {error}")
+        elif isinstance(error, TelegramChatInvalidExternalSourceError):
+            logger.warning(f"Invalid external source {url!r}: {error}")
+        else:
+            logger.error(
+                f"Failed to fetch external source {url!r}: {error}", exc_info=error
+            )
+
 
 class TelegramChatWhitelistService(
     BaseTelegramChatExternalSourceService[TelegramChatWhitelist]
 ):
     model = TelegramChatWhitelist
+
+
+def _log_fetch_durations(durations: dict[str, float]) -> None:
+    if not durations:
+        return
+
+    buckets = [0] * (len(EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS) + 1)
+    for duration in durations.values():
+        buckets[
+            bisect.bisect_left(EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS, duration)
+        ] += 1
+
+    histogram = ", ".join(
+        [
+            *(
+                f"<={bound}s: {count}"
+                for bound, count in zip(EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS, buckets)
+            ),
+            f">{EXTERNAL_SOURCE_FETCH_DURATION_BUCKETS[-1]}s: {buckets[-1]}",
+        ]
+    )
+    slowest_url, slowest_duration = max(durations.items(), key=lambda item: item[1])
+    logger.info(
+        f"Fetched {len(durations)} external sources. Durations: {histogram}. "
+        f"Slowest: {slowest_url!r} ({slowest_duration:.2f}s)."
+    )
+
+
+def _save_fetch_states(fetch_states: dict[int, ExternalSourceFetchStateDTO]) -> None:
+    try:
+        RedisService().set_all(
+            {
+                EXTERNAL_SOURCE_FETCH_STATE_KEY_TEMPLATE.format(
+                    source_id=source_id
+                ): fetch_state.model_dump_json()
+                for source_id, fetch_state in fetch_states.items()
+            },
+            ex=EXTERNAL_SOURCE_FETCH_STATE_TTL,
+        )
+    except RedisError as e:
+        logger.warning(
+            f"Failed to save fetch states of external sources {list(fetch_states)!r}. "
+            "They will be fetched in full next time.",
+            exc_info=e,
+        )
+
+
+def _save_fetch_state_on_commit(
+    db_session: Session, source_id: int, fetch_state: ExternalSourceFetchStateDTO
+) -> None:
+    on_outermost_commit(
+        db_session,
+        key=PENDING_FETCH_STATES_SESSION_KEY,
+        item=source_id,
+        flush=_save_fetch_states,
+        value=fetch_state,
+    )
@@ -1,17 +1,76 @@
 from typing import Iterable
 
-from sqlalchemy import func, and_, or_, select, cast, Integer
+from redis import RedisError
+from sqlalchemy import (
+    func,
+    and_,
+    or_,
+    select,
+    cast,
+    delete,
+    literal_column,
+    Integer,
+    ColumnElement,
+)
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import contains_eager, joinedload
 
+from core.constants import UPDATED_MEMBERS_COUNTERS_CHAT_IDS
 from core.models.wallet import TelegramChatUserWallet
 from core.models.chat import TelegramChatUser, TelegramChat
+from core.models.user import User
 from core.services.base import BaseService
 from core.services.chat import logger
+from core.services.db import on_outermost_commit
+from core.services.superredis import RedisService
+from core.utils.misc import batched
+
+
+PENDING_MEMBERS_COUNTERS_SESSION_KEY = "pending_members_counters_chat_ids"
+
+
+def _publish_members_counters(chat_ids: Iterable[int]) -> None:
+    try:
+        RedisService().add_to_set(
+            UPDATED_MEMBERS_COUNTERS_CHAT_IDS, *map(str, sorted(chat_ids))
+        )
+    except RedisError as e:
+        logger.error(
+            f"Failed to schedule members counters refresh for chats {sorted(chat_ids)!r}. "
+            "They will be fixed by the next reconciliation.",
+            exc_info=e,
+        )
 
 
 class TelegramChatUserService(BaseService):
+    def _schedule_members_counters_refresh(self, chat_id: int) -> None:
+        """
+        Schedules the recalculation of the members counters stored on the chat.
+        Chats are published only after the session is committed and the counters
+        are recalculated by the `refresh-chat-members-counters` task in its own short transaction,
+        so membership changes never lock the hot chat row.
+
+        :param chat_id: Chat ID which members changed
+        """
+        on_outermost_commit(
+            self.db_session,
+            key=PENDING_MEMBERS_COUNTERS_SESSION_KEY,
+            item=chat_id,
+            flush=_publish_members_counters,
+        )
+
+    def _delete(self, chat_id: int, *criteria: ColumnElement[bool]) -> int:
+        deleted_count = self.db_session.execute(
+            delete(TelegramChatUser)
+            .where(TelegramChatUser.chat_id == chat_id, *criteria)
+            .execution_options(synchronize_session="fetch")
+        ).rowcount
+        if deleted_count:
+            self._schedule_members_counters_refresh(chat_id)
+        self.db_session.flush()
+        return deleted_count
+
     def _create(
         self,
         chat_id: int,
@@ -43,6 +102,7 @@ class TelegramChatUserService(BaseService):
             chat_id, user_id, is_admin, is_managed, is_manager_admin
         )
         self.db_session.flush()
+        self._schedule_members_counters_refresh(chat_id)
         return chat_user
 
     def get(self, chat_id: int, user_id: int) -> TelegramChatUser:
@@ -73,25 +133,6 @@ class TelegramChatUserService(BaseService):
                 is_manager_admin=is_manager_admin,
             )
 
-    def get_members_count(self, chat_id: int) -> int:
-        return (
-            self.db_session.query(TelegramChatUser)
-            .filter(TelegramChatUser.chat_id == chat_id)
-            .count()
-        )
-
-    def get_members_count_by_chat_id(
-        self, chat_ids: list[int] | None = None
-    ) -> dict[int, int]:
-        query = self.db_session.query(
-            TelegramChatUser.chat_id, func.count(TelegramChatUser.user_id)
-        )
-        if chat_ids:
-            query = query.filter(TelegramChatUser.chat_id.in_(chat_ids))
-
-        query = query.group_by(TelegramChatUser.chat_id)
-        return dict(query.all())
-
     def get_all_pairs(
         self, chat_member_pairs: Iterable[tuple[int, int]]
     ) -> list[TelegramChatUser]:
@@ -205,6 +246,35 @@ class TelegramChatUserService(BaseService):
             yield users
             last_seen_user_id = users[-1].user_id
 
+    def yield_by_telegram_ids(
+        self, chat_id: int, telegram_ids: Iterable[int], batch_size: int = 1_000
+    ) -> Iterable[list[TelegramChatUser]]:
+        """
+        Yields members of a single chat that have any of the given Telegram IDs in batches.
+        It's used to recheck only the chat whose rule changed instead of all the memberships of the users.
+
+        :param chat_id: The chat to look for the members in.
+        :param telegram_ids: Telegram IDs of the users to look for.
+        :param batch_size: Maximum number of Telegram IDs looked up in a single query.
+        """
+        for chunk in batched(sorted(set(telegram_ids)), batch_size):
+            stmt = (
+                select(TelegramChatUser)
+                .join(TelegramChatUser.user)
+                .where(
+                    TelegramChatUser.chat_id == chat_id,
+                    User.telegram_id.in_(chunk),
+                )
+                .options(
+                    contains_eager(TelegramChatUser.user),
+                    joinedload(TelegramChatUser.wallet_link).options(
+                        joinedload(TelegramChatUserWallet.wallet),
+                    ),
+                )
+            )
+            if members := list(self.db_session.execute(stmt).scalars().unique().all()):
+                yield members
+
     def get_all_by_linked_wallet(self, addresses: list[str]) -> list[TelegramChatUser]:
         query = self.db_session.query(TelegramChatUser)
         query = query.join(
@@ -267,6 +337,59 @@ class TelegramChatUserService(BaseService):
                 is_manager_admin,
             )
 
+    def bulk_create_or_update(
+        self,
+        chat_id: int,
+        members: Iterable[tuple[int, bool, bool]],
+        is_managed: bool,
+    ) -> None:
+        """
+        Creates or updates chat members in a single INSERT ... ON CONFLICT DO UPDATE statement.
+        Same as :meth:`create_or_update`, the managed flag is set for new members only.
+
+        :param chat_id: Chat ID the members belong to
+        :param members: Tuples of the user ID, whether the user is an admin
+            and whether the user is an admin with manager privileges
+        :param is_managed: Whether new members are managed by the bot
+        """
+        unique_members = {
+            user_id: (is_admin, is_manager_admin)
+            for user_id, is_admin, is_manager_admin in members
+        }
+        if not unique_members:
+            return
+
+        statement = postgresql.insert(TelegramChatUser).values(
+            [
+                {
+                    "chat_id": chat_id,
+                    "user_id": user_id,
+                    "is_admin": is_admin or is_manager_admin,
+                    "is_manager_admin": is_manager_admin,
+                    "is_managed": is_managed,
+                }
+                for user_id, (is_admin, is_manager_admin) in sorted(
+                    unique_members.items()
+                )
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[TelegramChatUser.user_id, TelegramChatUser.chat_id],
+            set_={
+                "is_admin": statement.excluded.is_admin,
+                "is_manager_admin": statement.excluded.is_manager_admin,
+            },
+        )
+        # xmax is only set for the rows updated on conflict, so it tells new members apart
+        statement = statement.returning(literal_column("xmax = 0"))
+        created_count = sum(self.db_session.execute(statement).scalars())
+        if created_count:
+            self._schedule_members_counters_refresh(chat_id)
+        logger.debug(
+            f"{len(unique_members)} Telegram Chat Users of chat {chat_id!r} stored, "
+            f"{created_count} of them are new."
+        )
+
     def is_chat_member(self, chat_id: int, user_id: int) -> bool:
         return (
             self.db_session.query(TelegramChatUser)
@@ -315,11 +438,7 @@ class TelegramChatUserService(BaseService):
         logger.debug(f"Telegram Chat User {chat_user!r} demoted from admin.")
 
     def delete(self, chat_id: int, user_id: int) -> None:
-        self.db_session.query(TelegramChatUser).filter(
-            TelegramChatUser.chat_id == chat_id,
-            TelegramChatUser.user_id == user_id,
-        ).delete(synchronize_session="fetch")
-        self.db_session.flush()
+        self._delete(chat_id, TelegramChatUser.user_id == user_id)
         logger.debug(f"Telegram Chat User {user_id!r} in chat {chat_id!r} deleted.")
 
     def create_batch(self, chat_id: int, user_ids: list[int]) -> list[TelegramChatUser]:
@@ -341,15 +460,13 @@ class TelegramChatUserService(BaseService):
             for user_id in new_chat_members
         ]
         self.db_session.flush()
+        if chat_users:
+            self._schedule_members_counters_refresh(chat_id)
 
         return chat_users
 
     def delete_batch(self, chat_id: int, user_ids: list[int]) -> None:
-        self.db_session.query(TelegramChatUser).filter(
-            TelegramChatUser.chat_id == chat_id,
-            TelegramChatUser.user_id.in_(user_ids),
-        ).delete(synchronize_session="fetch")
-        self.db_session.flush()
+        self._delete(chat_id, TelegramChatUser.user_id.in_(user_ids))
         logger.debug(f"Telegram Chat Users {user_ids!r} in chat {chat_id!r} deleted.")
 
     def delete_stale_participants(
@@ -367,13 +484,11 @@ class TelegramChatUserService(BaseService):
             func.unnest(cast(active_user_ids, postgresql.ARRAY(Integer)))
         )
 
-        self.db_session.query(TelegramChatUser).filter(
-            TelegramChatUser.chat_id == chat_id,
-            TelegramChatUser.user_id.not_in(active_ids_query),
-        ).delete(synchronize_session="fetch")
-        self.db_session.flush()
+        deleted_count = self._delete(
+            chat_id, TelegramChatUser.user_id.not_in(active_ids_query)
+        )
         logger.info(
-            f"Stale participants cleaned up for chat {chat_id!r}. "
+            f"{deleted_count} stale participants cleaned up for chat {chat_id!r}. "
             f"Active users count: {len(active_user_ids)}"
         )
 
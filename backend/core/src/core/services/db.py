@@ -1,13 +1,66 @@
 import logging
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Callable, Generator, Hashable
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any
 
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import Session
 
 from ..db import Base, engine
 
 logger = logging.getLogger(__name__)
 
+ON_COMMIT_FLUSHES_SESSION_KEY = "on_outermost_commit_flushes"
+
+
+def _flush_pending_on_commit(db_session: Session) -> None:
+    # Savepoints are released as commits too, wait for the outermost one
+    if db_session.in_nested_transaction():
+        return
+
+    flushes = db_session.info.pop(ON_COMMIT_FLUSHES_SESSION_KEY, {})
+    for key, flush in flushes.items():
+        if pending := db_session.info.pop(key, None):
+            flush(pending)
+
+
+def _discard_pending_on_rollback(db_session: Session) -> None:
+    if db_session.in_nested_transaction():
+        return
+
+    for key in db_session.info.pop(ON_COMMIT_FLUSHES_SESSION_KEY, {}):
+        db_session.info.pop(key, None)
+
+
+def on_outermost_commit(
+    db_session: Session,
+    key: str,
+    item: Hashable,
+    flush: Callable[[dict[Any, Any]], None],
+    value: Any = None,
+) -> None:
+    """
+    Collects the item to be passed to the flush callback once the outermost transaction
+    of the session is committed. Pending items are discarded if it's rolled back.
+
+    Items are kept in the session info under the key as a dictionary, mapping them
+    to their latest values, so the callback receives every item only once.
+
+    :param db_session: Session, which transaction the item depends on
+    :param key: Session info key to collect the items under, unique for the callback
+    :param item: Item to collect
+    :param flush: Callback receiving all collected items after the commit
+    :param value: Optional value associated with the item
+    """
+    flushes = db_session.info.setdefault(ON_COMMIT_FLUSHES_SESSION_KEY, {})
+    flushes[key] = flush
+    if not event.contains(db_session, "after_commit", _flush_pending_on_commit):
+        event.listen(db_session, "after_commit", _flush_pending_on_commit)
+        event.listen(db_session, "after_rollback", _discard_pending_on_rollback)
+
+    db_session.info.setdefault(key, {})[item] = value
+
 
 class DBService:
     def __init__(self) -> None:
@@ -39,3 +92,26 @@ class DBService:
             raise exc
         finally:
             session.close()
+
+    @asynccontextmanager
+    async def async_db_session(
+        self,
+        bind: AsyncEngine,
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Asyncio counterpart of the `db_session` for the code running in the event loop.
+
+        :param bind: Async engine of the process, see `core.db.create_async_db_engine`
+        """
+        session = AsyncSession(bind=bind)
+        try:
+            yield session
+            await session.commit()
+        except Exception as exc:
+            logger.debug(
+                f"Internal Error: {exc.__class__.__name__}. Rolling back session."
+            )
+            await session.rollback()
+            raise exc
+        finally:
+            await session.close()
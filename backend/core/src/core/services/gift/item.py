@@ -1,6 +1,9 @@
 from collections import namedtuple
+from collections.abc import Iterable, Sequence
+from typing import Any
 
-from sqlalchemy import select, func
+from sqlalchemy import Row, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 
 from core.models.gift import GiftUnique
 from core.services.base import BaseService
@@ -19,12 +22,15 @@ class GiftUniqueService(BaseService):
         telegram_user_id: int | None = None,
         number_ge: int | None = None,
         number_le: int | None = None,
+        telegram_user_ids: Iterable[int] | None = None,
     ) -> list[GiftUnique]:
         query = self.db_session.query(GiftUnique)
         if collection_slug:
             query = query.filter(GiftUnique.collection_slug == collection_slug)
         if telegram_user_id:
             query = query.filter(GiftUnique.telegram_owner_id == telegram_user_id)
+        if telegram_user_ids is not None:
+            query = query.filter(GiftUnique.telegram_owner_id.in_(telegram_user_ids))
         if number_ge:
             query = query.filter(GiftUnique.number >= number_ge)
         if number_le:
@@ -32,6 +38,81 @@ class GiftUniqueService(BaseService):
 
         return query.order_by(GiftUnique.number).all()
 
+    def get_owners(
+        self,
+        collection_slug: str,
+        number_ge: int | None = None,
+        number_le: int | None = None,
+    ) -> dict[str, tuple[int | None, str | None]]:
+        """
+        Lightweight projection of the current owners of the collection items.
+        Full ORM objects aren't needed to detect ownership changes, so only the owner columns are loaded.
+
+        :return: Mapping of the item slug to the tuple of its Telegram owner ID and owner address
+        """
+        query = select(
+            GiftUnique.slug, GiftUnique.telegram_owner_id, GiftUnique.owner_address
+        ).where(GiftUnique.collection_slug == collection_slug)
+        if number_ge:
+            query = query.where(GiftUnique.number >= number_ge)
+        if number_le:
+            query = query.where(GiftUnique.number <= number_le)
+
+        return {
+            slug: (telegram_owner_id, owner_address)
+            for slug, telegram_owner_id, owner_address in self.db_session.execute(query)
+        }
+
+    def bulk_upsert(self, items: Sequence[dict[str, Any]]) -> Sequence[Row]:
+        """
+        Creates new items and updates the owners of the existing ones in a single statement.
+        Existing rows are touched only if the owner has actually changed.
+
+        :param items: Mappings of the item columns to write
+        :return: Rows with `slug`, `previous_telegram_owner_id` and `is_created` columns
+            for every item that was either created or updated
+        """
+        if not items:
+            return []
+
+        slugs = [item["slug"] for item in items]
+        # CTEs see the snapshot taken before the statement is executed,
+        # so this one still holds the owners that are about to be replaced
+        previous = (
+            select(GiftUnique.slug, GiftUnique.telegram_owner_id)
+            .where(GiftUnique.slug.in_(slugs))
+            .cte("previous")
+        )
+        upsert_query = insert(GiftUnique).values(items)
+        upserted = (
+            upsert_query.on_conflict_do_update(
+                index_elements=[GiftUnique.slug],
+                set_={
+                    "telegram_owner_id": upsert_query.excluded.telegram_owner_id,
+                    "owner_address": upsert_query.excluded.owner_address,
+                    "blockchain_address": upsert_query.excluded.blockchain_address,
+                    "last_updated": upsert_query.excluded.last_updated,
+                },
+                where=or_(
+                    GiftUnique.telegram_owner_id.is_distinct_from(
+                        upsert_query.excluded.telegram_owner_id
+                    ),
+                    GiftUnique.owner_address.is_distinct_from(
+                        upsert_query.excluded.owner_address
+                    ),
+                ),
+            )
+            .returning(GiftUnique.slug)
+            .cte("upserted")
+        )
+        query = select(
+            upserted.c.slug,
+            previous.c.telegram_owner_id.label("previous_telegram_owner_id"),
+            previous.c.slug.is_(None).label("is_created"),
+        ).outerjoin(previous, previous.c.slug == upserted.c.slug)
+
+        return self.db_session.execute(query).all()
+
     def get_unique_options(self, collection_slug: str):
         query = select(
             func.array_agg(func.distinct(GiftUnique.model)).label("models"),
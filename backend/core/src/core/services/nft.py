@@ -1,10 +1,14 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from typing import Any
+
 from core.utils.misc import batched
 
 from pytonapi.schema.nft import NftItem as TONNftItem, NftItems
-from sqlalchemy import desc
+from sqlalchemy import desc, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import NoResultFound
+from sqlalchemy.orm import aliased
 
 from core.models.blockchain import NFTCollection, NftItem
 from core.dtos.resource import (
@@ -14,10 +18,14 @@ from core.dtos.resource import (
 )
 from core.constants import DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE
 from core.services.base import BaseService
+from core.utils.custom_rules.traits import get_nft_item_traits
 
 
 logger = logging.getLogger(__name__)
 
+# Number of bound parameters of a single row in the NFT Items upsert
+NFT_ITEM_UPSERT_COLUMNS = 7
+
 
 class NftCollectionService(BaseService):
     def create(
@@ -102,12 +110,26 @@ class NftCollectionService(BaseService):
 
 
 class NftItemService(BaseService):
+    @staticmethod
+    def _get_metadata_values(nft_item: TONNftItem) -> dict[str, Any]:
+        """
+        :return: Values of the columns derived from the item metadata
+        """
+        metadata = NftItemMetadataDTO.from_nft_item(nft_item)
+        traits = get_nft_item_traits(nft_item.collection.address.to_raw(), metadata)
+        return {
+            "blockchain_metadata": metadata,
+            "trait_name": traits.name,
+            "trait_length": traits.length,
+            "trait_flags": traits.flags,
+        }
+
     def _create(self, nft_item: TONNftItem) -> NftItem:
         nft = NftItem(
             address=nft_item.address.to_raw(),
             owner_address=nft_item.owner.address.to_raw(),
             collection_address=nft_item.collection.address.to_raw(),
-            blockchain_metadata=NftItemMetadataDTO.from_nft_item(nft_item),
+            **self._get_metadata_values(nft_item),
         )
         self.db_session.add(nft)
         logger.info(f"NFT Item {nft.address!r} created.")
@@ -120,7 +142,8 @@ class NftItemService(BaseService):
             return nft
 
         nft.owner_address = nft_item.owner.address.to_raw()
-        nft.blockchain_metadata = NftItemMetadataDTO.from_nft_item(nft_item)
+        for key, value in self._get_metadata_values(nft_item).items():
+            setattr(nft, key, value)
         self.db_session.add(nft)
         logger.info(f"NFT Item {nft.address!r} updated.")
         return nft
@@ -139,12 +162,18 @@ class NftItemService(BaseService):
         return self.db_session.query(NftItem).filter(NftItem.address == address).one()
 
     def get_all(
-        self, owner_address: str | None = None, collection_address: str | None = None
+        self,
+        owner_address: str | None = None,
+        collection_address: str | None = None,
+        owner_addresses: Iterable[str] | None = None,
     ) -> list[NftItem]:
         query = self.db_session.query(NftItem)
         if owner_address:
             query = query.filter(NftItem.owner_address == owner_address)
 
+        if owner_addresses is not None:
+            query = query.filter(NftItem.owner_address.in_(owner_addresses))
+
         if collection_address:
             query = query.filter(NftItem.collection_address == collection_address)
         return query.all()
@@ -153,33 +182,87 @@ class NftItemService(BaseService):
         self, nft_items: NftItems, whitelist_collection_addresses: list[str]
     ) -> tuple[list[NftItem], set[str]]:
         """
-        Returns the persisted NFTs and the set of addresses that lost
+        Creates new NFTs and updates the owners of the existing ones with set-based upserts.
+        Existing rows are touched only if the owner has actually changed.
+
+        Returns the created or updated NFTs and the set of addresses that lost
         ownership in this batch so callers can re-queue eligibility checks
         for them.
         """
-        created_or_updated_nfts = []
-        previous_owners: set[str] = set()
+        whitelist_set = set(whitelist_collection_addresses)
+        # Deduplicate by address as a single upsert can't affect the same row twice
+        rows = {}
         for nft_item in nft_items.nft_items:
             if (
                 not nft_item.collection
-                or nft_item.collection.address.to_raw()
-                not in whitelist_collection_addresses
+                or nft_item.collection.address.to_raw() not in whitelist_set
             ):
                 continue
 
-            try:
-                existing = self.get(address=nft_item.address.to_raw())
-                if existing.owner_address != nft_item.owner.address.to_raw():
-                    previous_owners.add(existing.owner_address)
-                created_or_updated_nfts.append(self._update(nft_item, existing))
-            except NoResultFound:
-                logger.info(
-                    f"No NFT Item for address {nft_item.address!r} found. Creating new NFT Item."
-                )
-                created_or_updated_nfts.append(self._create(nft_item))
-        self.db_session.flush()
+            address = nft_item.address.to_raw()
+            rows[address] = {
+                "address": address,
+                "owner_address": nft_item.owner.address.to_raw(),
+                "collection_address": nft_item.collection.address.to_raw(),
+                **self._get_metadata_values(nft_item),
+            }
+
+        created_or_updated_nfts = []
+        previous_owners: set[str] = set()
+        for chunk in batched(
+            rows.values(),
+            DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE // NFT_ITEM_UPSERT_COLUMNS,
+        ):
+            for nft, previous_owner_address in self._upsert(chunk):
+                created_or_updated_nfts.append(nft)
+                if previous_owner_address is not None:
+                    previous_owners.add(previous_owner_address)
+
+        logger.info(
+            f"Created or updated {len(created_or_updated_nfts)} of {len(rows)} NFT Items."
+        )
         return created_or_updated_nfts, previous_owners
 
+    def _upsert(
+        self, rows: list[dict[str, Any]]
+    ) -> Sequence[tuple[NftItem, str | None]]:
+        """
+        :return: Created or updated NFTs along with the previous owner address
+            (None for the created ones)
+        """
+        # CTEs see the snapshot taken before the statement is executed,
+        # so this one still holds the owners that are about to be replaced
+        previous = (
+            select(NftItem.address, NftItem.owner_address)
+            .where(NftItem.address.in_([row["address"] for row in rows]))
+            .cte("previous")
+        )
+        upsert_query = insert(NftItem).values(rows)
+        upserted = (
+            upsert_query.on_conflict_do_update(
+                index_elements=[NftItem.address],
+                set_={
+                    "owner_address": upsert_query.excluded.owner_address,
+                    "blockchain_metadata": upsert_query.excluded.blockchain_metadata,
+                    "trait_name": upsert_query.excluded.trait_name,
+                    "trait_length": upsert_query.excluded.trait_length,
+                    "trait_flags": upsert_query.excluded.trait_flags,
+                    # ON CONFLICT doesn't apply column onupdate defaults
+                    "updated_at": func.now(),
+                },
+                where=NftItem.owner_address != upsert_query.excluded.owner_address,
+            )
+            .returning(*NftItem.__table__.c)
+            .cte("upserted")
+        )
+        upserted_nft = aliased(NftItem, upserted)
+        query = (
+            select(upserted_nft, previous.c.owner_address)
+            .outerjoin(previous, previous.c.address == upserted.c.address)
+            .execution_options(populate_existing=True)
+        )
+        return self.db_session.execute(query).tuples().all()
+
     def count(self) -> int:
         return self.db_session.query(NftItem).count()
 
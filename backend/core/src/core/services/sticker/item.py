@@ -19,6 +19,8 @@ class StickerItemService(BaseService):
         collection_id: int | None = None,
         character_id: int | None = None,
         item_ids: Iterable[str] | None = None,
+        telegram_user_ids: Iterable[int] | None = None,
+        instance_range: tuple[int, int] | None = None,
         _load_attributes: list[QueryableAttribute[Any]] | None = None,
     ) -> list[StickerItem]:
         """
@@ -37,6 +39,10 @@ class StickerItemService(BaseService):
             If None, this filter is not applied.
         :param item_ids: An iterable of item IDs to filter by.
             If None, this filter is not applied.
+        :param telegram_user_ids: An iterable of Telegram user IDs to filter by.
+            If None, this filter is not applied.
+        :param instance_range: A half-open range of instances (start, end) to filter by.
+            If None, this filter is not applied.
         :param _load_attributes: A list of attribute names to load for each StickerItem.
             If None, all attributes are loaded.
         :return: A list of `StickerItem` instances that match the specified criteria.
@@ -50,6 +56,13 @@ class StickerItemService(BaseService):
             query = query.filter(StickerItem.character_id == character_id)
         if item_ids is not None:
             query = query.filter(StickerItem.id.in_(item_ids))
+        if telegram_user_ids is not None:
+            query = query.filter(StickerItem.telegram_user_id.in_(telegram_user_ids))
+        if instance_range is not None:
+            start, end = instance_range
+            query = query.filter(
+                StickerItem.instance >= start, StickerItem.instance < end
+            )
 
         if _load_attributes:
             query = query.options(load_only(*_load_attributes))
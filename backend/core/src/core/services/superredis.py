@@ -1,26 +1,89 @@
+import asyncio
+import threading
+import weakref
+from collections.abc import AsyncGenerator, Iterable
 from typing import Any, Set
 
 import redis
+import redis.asyncio
 
 from core.constants import ASYNC_TASK_REDIS_PREFIX
+from core.dtos.stats import RedisPoolStatsDTO
 from core.settings import core_settings
 
 
+def _get_connection_kwargs(external: bool) -> dict[str, Any]:
+    return {
+        "host": core_settings.redis_host,
+        "port": core_settings.redis_port,
+        "db": (
+            core_settings.redis_db
+            if not external
+            else core_settings.redis_transaction_db
+        ),
+        "username": core_settings.redis_username,
+        "password": core_settings.redis_password,
+        "decode_responses": True,
+    }
+
+
+def _get_pool_stats(
+    name: str, pool: redis.ConnectionPool | redis.asyncio.ConnectionPool
+) -> RedisPoolStatsDTO:
+    # Pools don't expose their usage publicly
+    in_use = len(pool._in_use_connections)
+    available = len(pool._available_connections)
+    return RedisPoolStatsDTO(
+        name=name,
+        created=in_use + available,
+        in_use=in_use,
+        available=available,
+    )
+
+
+def _get_pool_name(external: bool) -> str:
+    return "transaction" if external else "main"
+
+
 class RedisService:
+    """
+    Redis client sharing a connection pool per database with all the services in the process,
+    so instantiating it doesn't open new connections.
+    The pool reconnects by itself in the processes forked after it was created.
+    """
+
+    _connection_pools: dict[bool, redis.ConnectionPool] = {}
+    _connection_pools_lock = threading.Lock()
+
     def __init__(self, external: bool = False) -> None:
+        """
+        :param external: Whether to connect to the database shared with the external indexers
+            (`redis_transaction_db`) instead of the main one
+        """
         self.client = redis.StrictRedis(
-            host=core_settings.redis_host,
-            port=core_settings.redis_port,
-            db=(
-                core_settings.redis_db
-                if not external
-                else core_settings.redis_transaction_db
-            ),
-            username=core_settings.redis_username,
-            password=core_settings.redis_password,
-            decode_responses=True,
+            connection_pool=self.get_connection_pool(external)
         )
 
+    @classmethod
+    def get_connection_pool(cls, external: bool = False) -> redis.ConnectionPool:
+        with cls._connection_pools_lock:
+            if external not in cls._connection_pools:
+                cls._connection_pools[external] = redis.ConnectionPool(
+                    **_get_connection_kwargs(external)
+                )
+            return cls._connection_pools[external]
+
+    @classmethod
+    def get_pool_stats(cls) -> list[RedisPoolStatsDTO]:
+        """
+        :return: Usage of the connection pools created in the process
+        """
+        with cls._connection_pools_lock:
+            return [
+                _get_pool_stats(_get_pool_name(external), pool)
+                for external, pool in cls._connection_pools.items()
+            ]
+
     def get(self, key: str) -> str:
         return self.client.get(key)
 
@@ -46,6 +109,9 @@ class RedisService:
         """
         return self.client.set(key, value, ex=ex, nx=nx)
 
+    def get_many(self, *keys: str) -> list[str | None]:
+        return self.client.mget(keys)
+
     def expire(self, key: str, ex: int) -> bool:
         """
         Set a timeout on a key.
@@ -64,6 +130,20 @@ class RedisService:
             pipeline.set(key, value, ex=ex)
         pipeline.execute()
 
+    def incr_all(self, keys: Iterable[str], ex: int | None = None) -> None:
+        """
+        Increment the integer values of the keys by one in a single round trip.
+
+        :param keys: The keys to increment.
+        :param ex: Optional expiration time in seconds to refresh on each of the keys.
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.incr(key)
+            if ex is not None:
+                pipeline.expire(key, ex)
+        pipeline.execute()
+
     def add_to_set(self, name: str, *values: str) -> None:
         """
         Add a value to a set
@@ -96,6 +176,18 @@ class RedisService:
         """
         return self.client.spop(name, count=count)
 
+    def pop_from_sets(self, *names: str, count: int) -> list[list[str]]:
+        """
+        Pop values from multiple sets in a single round trip
+        :param names: Names of the sets
+        :param count: Maximum number of values to pop from each set
+        :return: Values popped from each set in the order of the names
+        """
+        pipeline = self.client.pipeline(transaction=False)
+        for name in names:
+            pipeline.spop(name, count=count)
+        return [values or [] for values in pipeline.execute()]
+
     def delete(self, key: str) -> int:
         return self.client.delete(key)
 
@@ -111,6 +203,15 @@ class RedisService:
     def rpush(self, key: str, *values: str) -> int:
         return self.client.rpush(key, *values)
 
+    def publish(self, channel: str, message: str) -> int:
+        """
+        Publish a message to the channel
+        :param channel: Channel to publish to
+        :param message: Message to publish
+        :return: Number of subscribers that received the message
+        """
+        return self.client.publish(channel, message)
+
     def set_task_status(
         self, task_id: str, status: str, ex=core_settings.redis_task_status_expiration
     ) -> None:
@@ -143,3 +244,125 @@ class RedisService:
 
     def get_unique_stream_items(self) -> Set[str]:
         return {item["wallet"] for item in self.get_stream_items().values()}
+
+
+class AsyncRedisService:
+    """
+    Asyncio counterpart of the :class:`RedisService` for the code running in the event loop,
+    where blocking calls would stall all other coroutines.
+
+    Asyncio connections can't be used outside the event loop that opened them,
+    so the pools are shared per database by the services running in the same loop.
+    """
+
+    _connection_pools: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[bool, redis.asyncio.ConnectionPool]
+    ] = weakref.WeakKeyDictionary()
+
+    def __init__(self, external: bool = False) -> None:
+        self.external = external
+        self._client: redis.asyncio.StrictRedis | None = None
+
+    @property
+    def client(self) -> redis.asyncio.StrictRedis:
+        # Created on the first use, as the service may be instantiated outside the event loop
+        if self._client is None:
+            self._client = redis.asyncio.StrictRedis(
+                connection_pool=self.get_connection_pool(self.external)
+            )
+        return self._client
+
+    @classmethod
+    def get_connection_pool(
+        cls, external: bool = False
+    ) -> redis.asyncio.ConnectionPool:
+        loop_pools = cls._connection_pools.setdefault(asyncio.get_running_loop(), {})
+        if external not in loop_pools:
+            loop_pools[external] = redis.asyncio.ConnectionPool(
+                **_get_connection_kwargs(external)
+            )
+        return loop_pools[external]
+
+    @classmethod
+    def get_pool_stats(cls) -> list[RedisPoolStatsDTO]:
+        """
+        :return: Usage of the connection pools created in the running event loop
+        """
+        return [
+            _get_pool_stats(f"async_{_get_pool_name(external)}", pool)
+            for external, pool in cls._connection_pools.get(
+                asyncio.get_running_loop(), {}
+            ).items()
+        ]
+
+    @classmethod
+    async def close_pools(cls) -> None:
+        """
+        Disconnects the pools of the running event loop.
+        Should be awaited before the loop is closed.
+        """
+        loop_pools = cls._connection_pools.pop(asyncio.get_running_loop(), {})
+        await asyncio.gather(*(pool.disconnect() for pool in loop_pools.values()))
+
+    async def get(self, key: str) -> str | None:
+        return await self.client.get(key)
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        return await self.client.set(key, value, ex=ex, nx=nx)
+
+    async def get_many(self, *keys: str) -> list[str | None]:
+        return await self.client.mget(keys)
+
+    async def delete(self, key: str) -> int:
+        return await self.client.delete(key)
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.client.publish(channel, message)
+
+    async def pop_from_sets(self, *names: str, count: int) -> list[list[str]]:
+        """
+        Pop values from multiple sets in a single round trip
+        :param names: Names of the sets
+        :param count: Maximum number of values to pop from each set
+        :return: Values popped from each set in the order of the names
+        """
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for name in names:
+                pipeline.spop(name, count=count)
+            return [values or [] for values in await pipeline.execute()]
+
+    async def blpop(
+        self, keys: str | list[str], timeout: int = 0
+    ) -> tuple[str, str] | None:
+        """
+        Remove and get the first element in a list, or wait until one is available
+        without blocking the event loop
+        :param keys: Key(s) to pop from
+        :param timeout: Timeout in seconds
+        :return: Tuple of (key, value) or None
+        """
+        return await self.client.blpop(keys, timeout=timeout)
+
+    async def rpush(self, key: str, *values: str) -> int:
+        return await self.client.rpush(key, *values)
+
+    async def subscribe(self, *channels: str) -> AsyncGenerator[str, None]:
+        """
+        Subscribe to the channels and yield the published messages
+        :param channels: Channels to subscribe to
+        :return: Asynchronous generator of the messages data
+        """
+        async with self.client.pubsub() as pubsub:
+            await pubsub.subscribe(*channels)
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+
+    async def close(self) -> None:
+        """
+        Releases the client. Connections stay in the shared pool for the other services.
+        """
+        if self._client is not None:
+            await self._client.aclose()
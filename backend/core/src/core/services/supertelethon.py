@@ -391,6 +391,7 @@ class TelethonService:
     async def index_gifts_batch(
         self,
         slugs: list[str],
+        sleep_on_flood_wait: bool = True,
     ) -> list[StarGiftUnique]:
         """
         Indexes a batch of gifts by processing a list of slugs.
@@ -403,6 +404,8 @@ class TelethonService:
         More info: https://docs.telethon.dev/en/stable/concepts/full-api.html#requests-in-parallel
 
         :param slugs: A list of slug strings used to fetch unique star gifts.
+        :param sleep_on_flood_wait: Whether to wait a bit and return partial results on flood wait.
+            If False, the FloodWaitError is raised, so the caller could reschedule the batch.
         :return: A list of StarGiftUnique objects that correspond to the provided
             slugs.
         """
@@ -417,7 +420,12 @@ class TelethonService:
                 logger.error("Account is frozen. Exiting the process")
                 raise FrozenMethodInvalidError
 
-            elif any((isinstance(exc, FloodWaitError) for exc in e.exceptions)):
+            elif flood_wait_error := next(
+                (exc for exc in e.exceptions if isinstance(exc, FloodWaitError)), None
+            ):
+                if not sleep_on_flood_wait:
+                    raise flood_wait_error
+
                 # Typical Flood timeout for gifts fetching is 3 seconds
                 # We can go forward, but there is a chance of get banned or lose some data because of the errors
                 logger.warning(
@@ -431,6 +439,8 @@ class TelethonService:
             )
         except RPCError as e:
             # If there is only one item left – it'll raise an RPCError instead of MultiError
+            if isinstance(e, FloodWaitError) and not sleep_on_flood_wait:
+                raise e
             logger.error(f"Error occurred while fetching gift: {e}")
             gifts = []
 
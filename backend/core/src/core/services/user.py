@@ -1,10 +1,24 @@
 from typing import Iterable, Any
 
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import joinedload, load_only, QueryableAttribute
 
 from core.dtos.user import TelegramUserDTO
 from core.models.user import User
 from core.services.base import BaseService
+from core.services.user_snapshot import invalidate_user_snapshot
+
+
+# Columns of the existing users rewritten by the upsert
+USER_UPSERT_UPDATED_COLUMNS = (
+    "first_name",
+    "last_name",
+    "username",
+    "is_premium",
+    "language",
+    "allows_write_to_pm",
+)
 
 
 class UserService(BaseService):
@@ -34,8 +48,13 @@ class UserService(BaseService):
             .one()
         )
 
-    def get(self, user_id: int) -> User:
-        return (
+    def get(self, user_id: int, refresh: bool = False) -> User:
+        """
+        :param user_id: ID of the user
+        :param refresh: Reload the user and its wallets even if they are already loaded in the session
+        :return: User with the loaded wallets
+        """
+        query = (
             self.db_session.query(User)
             .options(
                 joinedload(User.wallets),
@@ -43,7 +62,14 @@ class UserService(BaseService):
             .filter(
                 User.id == user_id,
             )
-            .one()
+        )
+        if refresh:
+            query = query.execution_options(populate_existing=True)
+        return query.one()
+
+    def is_admin(self, user_id: int) -> bool:
+        return bool(
+            self.db_session.query(User.is_admin).filter(User.id == user_id).scalar()
         )
 
     def create(self, telegram_user: TelegramUserDTO) -> User:
@@ -70,7 +96,101 @@ class UserService(BaseService):
         # TODO add photo_url
         self.db_session.add(user)
         self.db_session.flush()
+        invalidate_user_snapshot(self.db_session, user.id)
         return user
 
+    def bulk_create_or_update(
+        self, telegram_users: Iterable[TelegramUserDTO]
+    ) -> dict[int, int]:
+        """
+        Creates or updates users in a single INSERT ... ON CONFLICT DO UPDATE statement.
+        Rows are written in the Telegram ID order,
+        so concurrent batches with shared users lock them in the same order.
+        Existing users are rewritten only if their data has actually changed,
+        and their cached snapshots are invalidated after the commit.
+
+        :param telegram_users: Telegram users to store. Duplicates are collapsed.
+        :return: Mapping of the Telegram ID to the user ID
+        """
+        unique_users = {
+            telegram_user.id: telegram_user for telegram_user in telegram_users
+        }
+        if not unique_users:
+            return {}
+
+        statement = insert(User).values(
+            [
+                {
+                    "telegram_id": telegram_user.id,
+                    "first_name": telegram_user.first_name,
+                    "last_name": telegram_user.last_name,
+                    "username": telegram_user.username,
+                    "is_premium": bool(telegram_user.is_premium),
+                    "language": telegram_user.language_code,
+                    "allows_write_to_pm": telegram_user.allow_write_to_pm,
+                    "is_blocked": False,
+                    "is_admin": False,
+                }
+                for _, telegram_user in sorted(unique_users.items())
+            ]
+        )
+        # CTEs see the snapshot taken before the statement is executed,
+        # so this one holds only the users that existed before the upsert
+        previous = (
+            select(User.telegram_id, User.id)
+            .where(User.telegram_id.in_(unique_users))
+            .cte("previous")
+        )
+        upserted = (
+            statement.on_conflict_do_update(
+                index_elements=[User.telegram_id],
+                set_={
+                    column: statement.excluded[column]
+                    for column in USER_UPSERT_UPDATED_COLUMNS
+                },
+                # Skip rewriting users which data hasn't changed
+                where=or_(
+                    *(
+                        getattr(User, column).is_distinct_from(
+                            statement.excluded[column]
+                        )
+                        for column in USER_UPSERT_UPDATED_COLUMNS
+                    )
+                ),
+            )
+            .returning(User.telegram_id, User.id)
+            .cte("upserted")
+        )
+        query = select(
+            func.coalesce(upserted.c.telegram_id, previous.c.telegram_id),
+            func.coalesce(upserted.c.id, previous.c.id),
+            # Created users have no snapshots to invalidate
+            and_(upserted.c.id.is_not(None), previous.c.id.is_not(None)),
+        ).select_from(
+            upserted.join(
+                previous,
+                previous.c.telegram_id == upserted.c.telegram_id,
+                full=True,
+            )
+        )
+
+        user_ids = {}
+        for telegram_id, user_id, is_updated in self.db_session.execute(query):
+            user_ids[telegram_id] = user_id
+            if is_updated:
+                invalidate_user_snapshot(self.db_session, user_id)
+
+        # Unchanged users created concurrently after the statement snapshot
+        # are neither rewritten nor seen by the CTE
+        if missing_telegram_ids := unique_users.keys() - user_ids.keys():
+            user_ids.update(
+                self.db_session.execute(
+                    select(User.telegram_id, User.id).where(
+                        User.telegram_id.in_(missing_telegram_ids)
+                    )
+                ).tuples()
+            )
+        return user_ids
+
     def count(self) -> int:
         return self.db_session.query(User).count()
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from redis import RedisError
+from sqlalchemy.orm import Session
+
+from core.constants import (
+    USER_SNAPSHOT_CACHE_TTL,
+    USER_SNAPSHOT_INVALIDATION_CHANNEL,
+    USER_SNAPSHOT_LOCAL_CACHE_SIZE,
+)
+from core.dtos.user import UserSnapshotDTO
+from core.services.db import on_outermost_commit
+from core.services.superredis import AsyncRedisService, RedisService
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_INVALIDATIONS_SESSION_KEY = "pending_user_snapshot_invalidations"
+INVALIDATIONS_LISTENER_RETRY_INTERVAL = 1
+
+
+class UserSnapshotCacheService:
+    """
+    In-process LRU cache of the user snapshots, so authenticated requests
+    don't have to load the user from the database.
+
+    Snapshots expire after a short TTL. Users changed by the services are also published
+    to the Redis channel, so every process drops their snapshots right after the commit.
+    """
+
+    _local_cache: OrderedDict[int, tuple[float, UserSnapshotDTO]] = OrderedDict()
+    _local_cache_lock = threading.Lock()
+    # Bumped on every invalidation, so snapshots loaded before it are not cached
+    _version = 0
+
+    @classmethod
+    def get_version(cls) -> int:
+        return cls._version
+
+    @classmethod
+    def get(cls, user_id: int) -> UserSnapshotDTO | None:
+        with cls._local_cache_lock:
+            if not (cached := cls._local_cache.get(user_id)):
+                return None
+
+            expires_at, snapshot = cached
+            if expires_at <= time.monotonic():
+                del cls._local_cache[user_id]
+                return None
+
+            cls._local_cache.move_to_end(user_id)
+            return snapshot
+
+    @classmethod
+    def set(cls, snapshot: UserSnapshotDTO, version: int) -> None:
+        """
+        Cache the snapshot unless any invalidation happened since it was loaded.
+
+        :param snapshot: Snapshot of the user
+        :param version: Cache version obtained with `get_version` before the snapshot was loaded
+        """
+        with cls._local_cache_lock:
+            if version != cls._version:
+                return
+
+            cls._local_cache[snapshot.id] = (
+                time.monotonic() + USER_SNAPSHOT_CACHE_TTL,
+                snapshot,
+            )
+            cls._local_cache.move_to_end(snapshot.id)
+            while len(cls._local_cache) > USER_SNAPSHOT_LOCAL_CACHE_SIZE:
+                cls._local_cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, *user_ids: int) -> None:
+        with cls._local_cache_lock:
+            cls._version += 1
+            for user_id in user_ids:
+                cls._local_cache.pop(user_id, None)
+
+    @classmethod
+    def clear_local(cls) -> None:
+        with cls._local_cache_lock:
+            cls._version += 1
+            cls._local_cache.clear()
+
+    @classmethod
+    async def listen_invalidations(cls) -> None:
+        """
+        Drop the snapshots of the users published to the invalidation channel.
+        Runs until cancelled and resubscribes if the connection to Redis is lost.
+        """
+        while True:
+            redis_service = AsyncRedisService()
+            try:
+                # Invalidations published while the process wasn't subscribed are lost
+                cls.clear_local()
+                async for message in redis_service.subscribe(
+                    USER_SNAPSHOT_INVALIDATION_CHANNEL
+                ):
+                    cls.invalidate(*map(int, message.split(",")))
+            except RedisError as e:
+                logger.warning(
+                    "User snapshot invalidations listener disconnected, retrying.",
+                    exc_info=e,
+                )
+                await asyncio.sleep(INVALIDATIONS_LISTENER_RETRY_INTERVAL)
+            finally:
+                await redis_service.close()
+
+
+def _publish_invalidations(user_ids: Iterable[int]) -> None:
+    try:
+        RedisService().publish(
+            USER_SNAPSHOT_INVALIDATION_CHANNEL,
+            ",".join(map(str, sorted(user_ids))),
+        )
+    except RedisError as e:
+        logger.error(
+            f"Failed to publish user snapshot invalidations for users {sorted(user_ids)!r}. "
+            f"Cached snapshots will expire in {USER_SNAPSHOT_CACHE_TTL} seconds.",
+            exc_info=e,
+        )
+
+
+def invalidate_user_snapshot(db_session: Session, user_id: int) -> None:
+    """
+    Schedule the invalidation of the cached user snapshots in all processes.
+    It's published only after the session is committed, so concurrent readers
+    can't cache a snapshot of the uncommitted data.
+
+    :param db_session: Session in which the user was changed
+    :param user_id: ID of the changed user
+    """
+    on_outermost_commit(
+        db_session,
+        key=PENDING_INVALIDATIONS_SESSION_KEY,
+        item=user_id,
+        flush=_publish_invalidations,
+    )
@@ -1,10 +1,11 @@
 import logging
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterable, Sequence
 from core.utils.misc import batched
 
-from pytonapi.schema.jettons import JettonBalance, JettonsBalances
-from sqlalchemy import select
-from sqlalchemy.exc import NoResultFound, IntegrityError
+from pytonapi.schema.jettons import JettonsBalances
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
 from core.constants import DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE
@@ -16,10 +17,14 @@ from core.models.user import User
 from core.models.blockchain import Jetton
 from core.models.wallet import UserWallet, JettonWallet, TelegramChatUserWallet
 from core.services.base import BaseService
+from core.services.user_snapshot import invalidate_user_snapshot
 
 
 logger = logging.getLogger(__name__)
 
+# Number of bound parameters of a single row in the Jetton Wallets upsert
+JETTON_WALLET_UPSERT_COLUMNS = 4
+
 
 class WalletService(BaseService):
     def connect_user_wallet(self, user_id: int, wallet_address: str) -> UserWallet:
@@ -33,6 +38,7 @@ class WalletService(BaseService):
             new_wallet = UserWallet(user_id=user_id, address=wallet_address)
             self.db_session.add(new_wallet)
             self.db_session.flush()
+            invalidate_user_snapshot(self.db_session, user_id)
             return new_wallet
         except IntegrityError:
             self.db_session.rollback()
@@ -88,6 +94,7 @@ class WalletService(BaseService):
             UserWallet.user_id == user_id,
         ).delete()
         self.db_session.flush()
+        invalidate_user_snapshot(self.db_session, user_id)
 
     def turn_visibility_on(self, user_id: int) -> None:
         self.db_session.query(UserWallet).filter(
@@ -156,6 +163,20 @@ class TelegramChatUserWalletService(BaseService):
         ).delete(synchronize_session=False)
         self.db_session.flush()
 
+    def get_address(self, user_id: int, chat_id: int) -> str | None:
+        """
+        Get the address of the wallet linked by the user to the chat
+        without loading the wallet itself.
+        """
+        return (
+            self.db_session.query(TelegramChatUserWallet.address)
+            .filter(
+                TelegramChatUserWallet.user_id == user_id,
+                TelegramChatUserWallet.chat_id == chat_id,
+            )
+            .scalar()
+        )
+
     def get(self, user_id: int, chat_id: int) -> TelegramChatUserWallet:
         return (
             self.db_session.query(TelegramChatUserWallet)
@@ -177,27 +198,6 @@ class TelegramChatUserWalletService(BaseService):
 
 
 class JettonWalletService(BaseService):
-    def _create(
-        self, jetton_balance: JettonBalance, owner_address: str
-    ) -> JettonWallet:
-        jetton_wallet = JettonWallet(
-            address=jetton_balance.wallet_address.address.to_raw(),
-            jetton_master_address=jetton_balance.jetton.address.to_raw(),
-            owner_address=owner_address,
-            balance=int(jetton_balance.balance),
-        )
-        self.db_session.add(jetton_wallet)
-        logger.debug(f"Jetton Wallet {jetton_wallet.address!r} created.")
-        return jetton_wallet
-
-    def _update(
-        self, jetton_wallet: JettonWallet, jetton_balance: JettonBalance
-    ) -> JettonWallet:
-        jetton_wallet.balance = int(jetton_balance.balance)
-        self.db_session.add(jetton_wallet)
-        logger.debug(f"Jetton Wallet {jetton_wallet.address!r} updated.")
-        return jetton_wallet
-
     def get(self, address: str) -> JettonWallet:
         return (
             self.db_session.query(JettonWallet)
@@ -220,11 +220,15 @@ class JettonWalletService(BaseService):
         owner_address: str | None = None,
         jetton_master_address: str | None = None,
         min_balance: int | None = None,
+        owner_addresses: Iterable[str] | None = None,
     ) -> list[JettonWallet]:
         query = self.db_session.query(JettonWallet)
         if owner_address:
             query = query.filter(JettonWallet.owner_address == owner_address)
 
+        if owner_addresses is not None:
+            query = query.filter(JettonWallet.owner_address.in_(owner_addresses))
+
         if jetton_master_address:
             query = query.filter(
                 JettonWallet.jetton_master_address == jetton_master_address
@@ -234,19 +238,23 @@ class JettonWalletService(BaseService):
             query = query.filter(JettonWallet.balance >= int(min_balance))
         return query.order_by(JettonWallet.address).all()
 
-    def _create_or_update(
-        self, jetton_balance: JettonBalance, owner_address: str
-    ) -> JettonWallet:
-        try:
-            jetton_wallet = self.get(jetton_balance.wallet_address.address.to_raw())
-            return self._update(
-                jetton_wallet=jetton_wallet, jetton_balance=jetton_balance
-            )
-        except NoResultFound:
-            logger.debug(
-                f"No Jetton Wallet for address {jetton_balance.wallet_address.address!r} found. Creating new Jetton Wallet."
-            )
-            return self._create(jetton_balance, owner_address)
+    def get_owner_addresses(
+        self, jetton_master_address: str, min_balance: int | None = None
+    ) -> list[str]:
+        """
+        Selects only the owners, so the query is answered
+        by the `ix_jetton_wallet_jetton_master_address_balance` index alone.
+
+        :param jetton_master_address: Address of the jetton
+        :param min_balance: Minimal balance of the wallet to be included
+        :return: Addresses of the wallets owning the jetton
+        """
+        query = select(JettonWallet.owner_address).where(
+            JettonWallet.jetton_master_address == jetton_master_address
+        )
+        if min_balance:
+            query = query.where(JettonWallet.balance >= int(min_balance))
+        return list(self.db_session.scalars(query))
 
     def bulk_create_or_update(
         self,
@@ -255,27 +263,55 @@ class JettonWalletService(BaseService):
         owner_address: str,
     ) -> list[JettonWallet]:
         """
-        Create or update Jetton Wallets for the given JettonsBalances
+        Create or update Jetton Wallets for the given JettonsBalances with set-based upserts.
+        Existing wallets are touched only if the balance has actually changed.
 
         :param jettons_balances: list of JettonBalances
         :param whitelisted_jettons: jettons that should be refreshed
         :param owner_address: address of the wallet owner
         :return: list of created or updated Jetton Wallets
         """
-        whitelist_addresses = [jetton.address for jetton in whitelisted_jettons]
+        whitelist_addresses = {jetton.address for jetton in whitelisted_jettons}
 
-        jetton_wallets = []
+        # Deduplicate by address as a single upsert can't affect the same row twice
+        rows = {}
         for jetton_balance in jettons_balances.balances:
             if jetton_balance.jetton.address.to_raw() not in whitelist_addresses:
                 continue
-            jetton_wallet = self._create_or_update(
-                jetton_balance, owner_address=owner_address
+            address = jetton_balance.wallet_address.address.to_raw()
+            rows[address] = {
+                "address": address,
+                "jetton_master_address": jetton_balance.jetton.address.to_raw(),
+                "owner_address": owner_address,
+                "balance": int(jetton_balance.balance),
+            }
+
+        jetton_wallets = []
+        for chunk in batched(
+            rows.values(),
+            DEFAULT_DB_QUERY_MAX_PARAMETERS_SIZE // JETTON_WALLET_UPSERT_COLUMNS,
+        ):
+            upsert_query = insert(JettonWallet).values(chunk)
+            upsert_query = (
+                upsert_query.on_conflict_do_update(
+                    index_elements=[JettonWallet.address],
+                    set_={
+                        "balance": upsert_query.excluded.balance,
+                        # ON CONFLICT doesn't apply column onupdate defaults
+                        "updated_at": func.now(),
+                    },
+                    # Skip rewriting rows which balance hasn't changed
+                    where=JettonWallet.balance != upsert_query.excluded.balance,
+                )
+                .returning(JettonWallet)
+                .execution_options(populate_existing=True)
             )
-            jetton_wallets.append(jetton_wallet)
-        self.db_session.flush()
+            jetton_wallets.extend(self.db_session.scalars(upsert_query))
+
         logger.debug(
-            "Created/updated %s Jetton Wallets for user %s",
+            "Created/updated %s of %s Jetton Wallets for user %s",
             len(jetton_wallets),
+            len(rows),
             owner_address,
         )
         return jetton_wallets
@@ -1,18 +1,10 @@
 from collections.abc import Callable
 
-from core.utils.custom_rules.constants import (
-    DIGIT_REPEATS_AT_LEAST_TWICE,
-    DIGIT_REPEATS_AT_LEAST_THRICE,
-    DIGIT_REPEATS_AT_LEAST_FOURTH,
-    DIGIT_REPEATS_AT_LEAST_FIFTH,
-    DIGIT_IS_YEAR,
-    DIGIT_IS_BINARY,
-)
 from core.utils.custom_rules.telegram_gifts import handle_telegram_gifts_type_category
 from core.utils.custom_rules.telegram_numbers import (
+    TELEGRAM_NUMBER_CLUB_FLAGS,
+    handle_telegram_numbers_club_category,
     handle_telegram_numbers_length_category,
-    handle_telegram_numbers_substring_category,
-    handle_telegram_numbers_regex_match_category,
 )
 from core.enums.nft import (
     TelegramNumberCategory,
@@ -39,45 +31,10 @@ CATEGORY_TO_METHOD_BY_ASSET_MAPPING: dict[
         TelegramNumberCategory.DIGITS_11: handle_telegram_numbers_length_category(
             target_length=8
         ),
-        TelegramNumberCategory.CLUB_007: handle_telegram_numbers_substring_category(
-            substring="007"
-        ),
-        TelegramNumberCategory.CLUB_69: handle_telegram_numbers_substring_category(
-            substring="69"
-        ),
-        TelegramNumberCategory.CLUB_420: handle_telegram_numbers_substring_category(
-            substring="420"
-        ),
-        TelegramNumberCategory.CLUB_666: handle_telegram_numbers_substring_category(
-            substring="666"
-        ),
-        TelegramNumberCategory.CLUB_777: handle_telegram_numbers_substring_category(
-            substring="777"
-        ),
-        TelegramNumberCategory.CLUB_888: handle_telegram_numbers_substring_category(
-            substring="888"
-        ),
-        TelegramNumberCategory.CLUB_1337: handle_telegram_numbers_substring_category(
-            substring="1337"
-        ),
-        TelegramNumberCategory.REPEAT_2: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_REPEATS_AT_LEAST_TWICE,
-        ),
-        TelegramNumberCategory.REPEAT_3: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_REPEATS_AT_LEAST_THRICE,
-        ),
-        TelegramNumberCategory.REPEAT_4: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_REPEATS_AT_LEAST_FOURTH,
-        ),
-        TelegramNumberCategory.REPEAT_5: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_REPEATS_AT_LEAST_FIFTH,
-        ),
-        TelegramNumberCategory.YEAR: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_IS_YEAR,
-        ),
-        TelegramNumberCategory.CLUB_BINARY: handle_telegram_numbers_regex_match_category(
-            regex_pattern=DIGIT_IS_BINARY,
-        ),
+        **{
+            club_category: handle_telegram_numbers_club_category(club_category)
+            for club_category in TELEGRAM_NUMBER_CLUB_FLAGS
+        },
     },
     NftCollectionAsset.TELEGRAM_USERNAME: {
         # Telegram Usernames
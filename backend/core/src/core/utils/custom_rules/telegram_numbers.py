@@ -1,8 +1,16 @@
 import re
 from collections.abc import Callable
 
-from core.enums.nft import NftCollectionAsset
+from core.enums.nft import NftCollectionAsset, TelegramNumberCategory
 from core.utils.custom_rules.addresses import NFT_ASSET_TO_ADDRESS_MAPPING
+from core.utils.custom_rules.constants import (
+    DIGIT_IS_BINARY,
+    DIGIT_IS_YEAR,
+    DIGIT_REPEATS_AT_LEAST_FIFTH,
+    DIGIT_REPEATS_AT_LEAST_FOURTH,
+    DIGIT_REPEATS_AT_LEAST_THRICE,
+    DIGIT_REPEATS_AT_LEAST_TWICE,
+)
 from core.models.blockchain import NftItem
 
 
@@ -17,32 +25,67 @@ class TelegramNumber:
         return len(self.digits)
 
 
-def _is_telegram_number(nft_item: NftItem) -> bool:
-    if (
-        nft_item.collection_address
-        != NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TELEGRAM_NUMBER]
-    ):
-        return False
-
-    if not nft_item.blockchain_metadata.name:
-        return False
-
-    return True
-
-
-def _is_valid_length(item: NftItem, target_length: int) -> bool:
-    telegram_number = TelegramNumber(item.blockchain_metadata.name)
-    return len(telegram_number) <= target_length
-
-
-def _is_substring_in_number(item: NftItem, substring: str) -> bool:
-    telegram_number = TelegramNumber(item.blockchain_metadata.name)
-    return substring in telegram_number.digits
+def _contains(substring: str) -> Callable[[str], bool]:
+    return lambda digits: substring in digits
+
+
+def _matches(regex_pattern: re.Pattern) -> Callable[[str], bool]:
+    return lambda digits: bool(regex_pattern.match(digits))
+
+
+# Bits of `NftItem.trait_flags` set for the numbers that belong to the club.
+# They are persisted, so the bits of the existing clubs must never be reassigned.
+TELEGRAM_NUMBER_CLUB_FLAGS: dict[TelegramNumberCategory, int] = {
+    TelegramNumberCategory.CLUB_007: 1 << 0,
+    TelegramNumberCategory.CLUB_69: 1 << 1,
+    TelegramNumberCategory.CLUB_420: 1 << 2,
+    TelegramNumberCategory.CLUB_666: 1 << 3,
+    TelegramNumberCategory.CLUB_777: 1 << 4,
+    TelegramNumberCategory.CLUB_888: 1 << 5,
+    TelegramNumberCategory.CLUB_1337: 1 << 6,
+    TelegramNumberCategory.CLUB_BINARY: 1 << 7,
+    TelegramNumberCategory.REPEAT_2: 1 << 8,
+    TelegramNumberCategory.REPEAT_3: 1 << 9,
+    TelegramNumberCategory.REPEAT_4: 1 << 10,
+    TelegramNumberCategory.REPEAT_5: 1 << 11,
+    TelegramNumberCategory.YEAR: 1 << 12,
+}
+
+TELEGRAM_NUMBER_CLUB_PREDICATES: dict[TelegramNumberCategory, Callable[[str], bool]] = {
+    TelegramNumberCategory.CLUB_007: _contains("007"),
+    TelegramNumberCategory.CLUB_69: _contains("69"),
+    TelegramNumberCategory.CLUB_420: _contains("420"),
+    TelegramNumberCategory.CLUB_666: _contains("666"),
+    TelegramNumberCategory.CLUB_777: _contains("777"),
+    TelegramNumberCategory.CLUB_888: _contains("888"),
+    TelegramNumberCategory.CLUB_1337: _contains("1337"),
+    TelegramNumberCategory.CLUB_BINARY: _matches(DIGIT_IS_BINARY),
+    TelegramNumberCategory.REPEAT_2: _matches(DIGIT_REPEATS_AT_LEAST_TWICE),
+    TelegramNumberCategory.REPEAT_3: _matches(DIGIT_REPEATS_AT_LEAST_THRICE),
+    TelegramNumberCategory.REPEAT_4: _matches(DIGIT_REPEATS_AT_LEAST_FOURTH),
+    TelegramNumberCategory.REPEAT_5: _matches(DIGIT_REPEATS_AT_LEAST_FIFTH),
+    TelegramNumberCategory.YEAR: _matches(DIGIT_IS_YEAR),
+}
+
+
+def get_telegram_number_flags(digits: str) -> int:
+    """
+    :param digits: Digits of the number without the country code
+    :return: Bitmask of the clubs the number belongs to
+    """
+    flags = 0
+    for category, predicate in TELEGRAM_NUMBER_CLUB_PREDICATES.items():
+        if predicate(digits):
+            flags |= TELEGRAM_NUMBER_CLUB_FLAGS[category]
+    return flags
 
 
-def _is_regex_matched(item: NftItem, regex_pattern: re.Pattern) -> bool:
-    telegram_number = TelegramNumber(item.blockchain_metadata.name)
-    return bool(regex_pattern.match(telegram_number.digits))
+def _is_telegram_number(nft_item: NftItem) -> bool:
+    return (
+        nft_item.collection_address
+        == NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TELEGRAM_NUMBER]
+        and nft_item.trait_length is not None
+    )
 
 
 def handle_telegram_numbers_length_category(
@@ -60,42 +103,33 @@ def handle_telegram_numbers_length_category(
     """
 
     def _inner(nfts: list[NftItem]) -> list[NftItem]:
-        return list(
-            filter(
-                lambda item: _is_telegram_number(item)
-                and _is_valid_length(item, target_length=target_length),
-                nfts,
-            )
-        )
+        return [
+            item
+            for item in nfts
+            if _is_telegram_number(item) and item.trait_length <= target_length
+        ]
 
     return _inner
 
 
-def handle_telegram_numbers_substring_category(
-    substring: str,
+def handle_telegram_numbers_club_category(
+    category: TelegramNumberCategory,
 ) -> Callable[[list[NftItem]], list[NftItem]]:
-    def _inner(nfts: list[NftItem]) -> list[NftItem]:
-        return list(
-            filter(
-                lambda item: _is_telegram_number(item)
-                and _is_substring_in_number(item, substring=substring),
-                nfts,
-            )
-        )
-
-    return _inner
+    """
+    Filters a list of `NftItem` objects corresponding to the Telegram Numbers category
+    by the club flags computed when the items were indexed.
 
+    :param category: The club category of the Telegram numbers for filtering.
+    :return: A callable function that takes a list of `NftItem` objects and returns
+        a filtered list of `NftItem` objects whose Telegram numbers belong to the club.
+    """
+    flag = TELEGRAM_NUMBER_CLUB_FLAGS[category]
 
-def handle_telegram_numbers_regex_match_category(
-    regex_pattern: re.Pattern,
-) -> Callable[[list[NftItem]], list[NftItem]]:
     def _inner(nfts: list[NftItem]) -> list[NftItem]:
-        return list(
-            filter(
-                lambda item: _is_telegram_number(item)
-                and _is_regex_matched(item, regex_pattern=regex_pattern),
-                nfts,
-            )
-        )
+        return [
+            item
+            for item in nfts
+            if _is_telegram_number(item) and item.trait_flags & flag
+        ]
 
     return _inner
@@ -44,15 +44,13 @@ def handle_telegram_username_length_category(
                 )
                 continue
 
-            if not nft.blockchain_metadata.name:
+            if nft.trait_length is None:
                 logger.debug(
                     f"Skipping NFT {nft.address} because it doesn't have a name in metadata."
                 )
                 continue
 
-            telegram_username = TelegramUsername(nft.blockchain_metadata.name)
-
-            if len(telegram_username) <= target_length:
+            if nft.trait_length <= target_length:
                 logger.debug(f"Adding NFT {nft.address} to the valid list.")
                 valid_nfts.append(nft)
 
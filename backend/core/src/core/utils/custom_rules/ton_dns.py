@@ -28,10 +28,10 @@ def handle_ton_dns_length_category(
             ):
                 continue
 
-            if nft.blockchain_metadata.name is None:
+            if nft.trait_length is None:
                 continue
 
-            if len(nft.blockchain_metadata.name) <= target_length:
+            if nft.trait_length <= target_length:
                 valid_nfts.append(nft)
 
         return valid_nfts
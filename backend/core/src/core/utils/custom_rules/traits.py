@@ -0,0 +1,50 @@
+from core.dtos.base import BaseNftItemMetadataDTO
+from core.dtos.resource import NftItemTraitsDTO
+from core.enums.nft import NftCollectionAsset
+from core.utils.custom_rules.addresses import NFT_ASSET_TO_ADDRESS_MAPPING
+from core.utils.custom_rules.telegram_numbers import (
+    TelegramNumber,
+    get_telegram_number_flags,
+)
+from core.utils.custom_rules.telegram_usernames import TelegramUsername
+
+
+def get_nft_item_traits(
+    collection_address: str, metadata: BaseNftItemMetadataDTO | None
+) -> NftItemTraitsDTO:
+    """
+    Normalizes the name of the NFT item from the collections supported by the custom rules,
+    so the rules compare the persisted traits instead of parsing the metadata on every check.
+
+    :param collection_address: Raw address of the item collection
+    :param metadata: Metadata of the item
+    :return: Traits of the item. Empty if the collection has no custom rules or the item has no name
+    """
+    if not metadata or not metadata.name:
+        return NftItemTraitsDTO()
+
+    name = metadata.name
+    if (
+        collection_address
+        == NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TELEGRAM_NUMBER]
+    ):
+        telegram_number = TelegramNumber(name)
+        return NftItemTraitsDTO(
+            name=telegram_number.digits,
+            length=len(telegram_number),
+            flags=get_telegram_number_flags(telegram_number.digits),
+        )
+
+    if (
+        collection_address
+        == NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TELEGRAM_USERNAME]
+    ):
+        telegram_username = TelegramUsername(name)
+        return NftItemTraitsDTO(
+            name=telegram_username.username, length=len(telegram_username)
+        )
+
+    if collection_address == NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TON_DNS]:
+        return NftItemTraitsDTO(name=name, length=len(name))
+
+    return NftItemTraitsDTO()
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import ssl
 
@@ -5,7 +6,10 @@ import httpx
 from pydantic import ValidationError
 
 from core.constants import REQUEST_TIMEOUT, READ_TIMEOUT, CONNECT_TIMEOUT
-from core.dtos.chat.rule.whitelist import WhitelistRuleCPO
+from core.dtos.chat.rule.whitelist import (
+    ExternalSourceFetchStateDTO,
+    WhitelistRuleCPO,
+)
 from core.exceptions.chat import TelegramChatInvalidExternalSourceError
 
 
@@ -19,6 +23,48 @@ ssl_context.verify_mode = ssl.CERT_REQUIRED
 timeout = httpx.Timeout(REQUEST_TIMEOUT, read=READ_TIMEOUT, connect=CONNECT_TIMEOUT)
 
 
+def create_external_source_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Create an HTTP client for the external sources.
+    A single client should be shared across concurrent requests to reuse the connections.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout, follow_redirects=True, verify=ssl_context, **kwargs
+    )
+
+
+def get_external_source_fingerprint(
+    url: str, auth_key: str | None, auth_value: str | None
+) -> str:
+    return hashlib.sha256(
+        "\n".join((url, auth_key or "", auth_value or "")).encode()
+    ).hexdigest()
+
+
+def _get_auth_headers(auth_key: str | None, auth_value: str | None) -> dict[str, str]:
+    if auth_key and auth_value:
+        return {auth_key: auth_value}
+    return {}
+
+
+def _raise_for_status(url: str, response: httpx.Response) -> None:
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        logger.exception(f"Failed to fetch allowed members from {url}.")
+        raise TelegramChatInvalidExternalSourceError(str(e)) from e
+
+
+def _validate_allowed_members(url: str, content: bytes) -> WhitelistRuleCPO:
+    try:
+        validated_response = WhitelistRuleCPO.model_validate_json(content, strict=True)
+    except ValidationError as e:
+        raise TelegramChatInvalidExternalSourceError(str(e))
+
+    logger.info(f"Fetched {len(validated_response.users)} from {url}.")
+    return validated_response
+
+
 async def fetch_dynamic_allowed_members(
     url: str,
     auth_key: str | None = None,
@@ -36,25 +82,63 @@ async def fetch_dynamic_allowed_members(
     :raises HTTPStatusError: If the HTTP request fails or returns a non-2xx status code.
     :raises TelegramChatInvalidExternalSourceError: If the response fails validation.
     """
-    headers = {}
-    if auth_key and auth_value:
-        headers = {auth_key: auth_value}
-
-    async with httpx.AsyncClient(
-        timeout=timeout, follow_redirects=True, verify=ssl_context
-    ) as client:
-        response = await client.get(url, headers=headers)
-    try:
-        response.raise_for_status()
-    except httpx.HTTPStatusError as e:
-        logger.exception(f"Failed to fetch allowed members from {url}.")
-        raise TelegramChatInvalidExternalSourceError(str(e)) from e
-    try:
-        validated_response = WhitelistRuleCPO.model_validate(
-            response.json(), strict=True
+    async with create_external_source_client() as client:
+        response = await client.get(
+            url, headers=_get_auth_headers(auth_key, auth_value)
         )
-    except ValidationError as e:
-        raise TelegramChatInvalidExternalSourceError(str(e))
+    _raise_for_status(url, response)
+    return _validate_allowed_members(url, response.content)
 
-    logger.info(f"Fetched {len(validated_response.users)} from {url}.")
-    return validated_response
+
+async def fetch_dynamic_allowed_members_if_modified(
+    client: httpx.AsyncClient,
+    url: str,
+    auth_key: str | None,
+    auth_value: str | None,
+    fetch_state: ExternalSourceFetchStateDTO | None,
+) -> tuple[WhitelistRuleCPO | None, ExternalSourceFetchStateDTO]:
+    """
+    Fetches the allowed members from an external source only if they were modified since the last fetch.
+
+    The request is made conditional with the ETag and Last-Modified validators of the previous response,
+    and the response body is hashed, so the sources that don't support conditional requests
+    are not parsed and validated again if the payload is the same.
+
+    :param client: HTTP client to use for the request.
+    :param url: The URL of the external source to fetch the allowed members from.
+    :param auth_key: Optional key to be used for authorization in the HTTP headers.
+    :param auth_value: Optional value corresponding to the authorization key for HTTP headers.
+    :param fetch_state: State of the previous fetch of the source if any.
+    :return: Validated allowed members or None if they were not modified
+        and the state of the current fetch that should be used for the next one.
+    :raises HTTPError: If the HTTP request fails.
+    :raises TelegramChatInvalidExternalSourceError: If the response has an error status or fails validation.
+    """
+    fingerprint = get_external_source_fingerprint(url, auth_key, auth_value)
+    if fetch_state and fetch_state.fingerprint != fingerprint:
+        # URL or credentials were changed, validators of the other source are not applicable
+        fetch_state = None
+
+    headers = _get_auth_headers(auth_key, auth_value)
+    if fetch_state and fetch_state.etag:
+        headers["If-None-Match"] = fetch_state.etag
+    if fetch_state and fetch_state.last_modified:
+        headers["If-Modified-Since"] = fetch_state.last_modified
+
+    response = await client.get(url, headers=headers)
+    if fetch_state and response.status_code == httpx.codes.NOT_MODIFIED:
+        logger.debug(f"Allowed members from {url} were not modified.")
+        return None, fetch_state
+
+    _raise_for_status(url, response)
+    current_fetch_state = ExternalSourceFetchStateDTO(
+        fingerprint=fingerprint,
+        content_hash=hashlib.sha256(response.content).hexdigest(),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    if fetch_state and fetch_state.content_hash == current_fetch_state.content_hash:
+        logger.debug(f"Allowed members from {url} are the same as previously fetched.")
+        return None, current_fetch_state
+
+    return _validate_allowed_members(url, response.content), current_fetch_state
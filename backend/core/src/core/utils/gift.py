@@ -1,6 +1,7 @@
 import logging
 
 from core.models.gift import GiftUnique
+from core.dtos.chat.rule.plan import GiftCollectionRulePlanDTO
 from core.models.rule import TelegramChatGiftCollection
 
 
@@ -8,7 +9,8 @@ logger = logging.getLogger(__name__)
 
 
 def find_relevant_gift_items(
-    rule: TelegramChatGiftCollection, gift_items: list[GiftUnique]
+    rule: TelegramChatGiftCollection | GiftCollectionRulePlanDTO,
+    gift_items: list[GiftUnique],
 ) -> list[GiftUnique]:
     """
     Finds and returns a list of relevant gift items based on the specified rule.
@@ -1,5 +1,6 @@
 import logging
 
+from core.dtos.chat.rule.plan import NftCollectionRulePlanDTO
 from core.models.rule import TelegramChatNFTCollection
 from core.models.blockchain import NftItem
 from core.utils.custom_rules.mapping import CATEGORY_TO_METHOD_BY_ASSET_MAPPING
@@ -9,7 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 def find_relevant_nft_items(
-    rule: TelegramChatNFTCollection, nft_items: list[NftItem]
+    rule: TelegramChatNFTCollection | NftCollectionRulePlanDTO,
+    nft_items: list[NftItem],
 ) -> list[NftItem]:
     """
     Filters a list of NFT items based on the given rule. The function determines the
@@ -47,23 +47,33 @@ def check_available(session_file: Path) -> bool:
             raise e
 
 
-class SessionLockManager:
+class SessionPoolLockManager:
     def __init__(
         self,
         session_dir_path: Path | None,
+        max_sessions: int | None = None,
         renew_interval_seconds: int = RENEW_SESSION_LOCK_INTERVAL_SECONDS,
         cache_ttl: int = DEFAULT_SESSION_EXPIRATION_SECONDS,
     ) -> None:
+        """
+        Locks available Telethon sessions from the directory for the exclusive usage.
+
+        :param session_dir_path: Directory with the *.session files
+        :param max_sessions: Maximum number of sessions to lock. If None, all available sessions are locked.
+        :param renew_interval_seconds: How often the locks are extended
+        :param cache_ttl: TTL of the lock keys
+        """
         if not session_dir_path or not session_dir_path.is_dir():
             raise AttributeError(
                 f"Invalid session directory path: {session_dir_path!r}"
             )
 
         self.session_dir_path = session_dir_path
+        self.max_sessions = max_sessions
         self.redis_service = RedisService()
         self.stop_event = threading.Event()
-        self._lock_key = None
-        self._renew_lock_thread = None
+        self._lock_keys: list[str] = []
+        self.renew_thread = None
         self.renew_interval_seconds = renew_interval_seconds
         self._ttl = cache_ttl
 
@@ -89,43 +99,51 @@ class SessionLockManager:
             )
             return False
 
-        self._lock_key = lock_key
+        self._lock_keys.append(lock_key)
         return True
 
     def release_lock(self) -> None:
-        if not self._lock_key:
+        if not self._lock_keys:
             logger.debug("No lock to release.")
             return
 
-        logger.info(f"Releasing lock: {self._lock_key}")
-        try:
-            self.redis_service.delete(self._lock_key)
-        except Exception as e:
-            logger.exception(f"Failed to release lock: {e}")
-
-    def _renew_loop(self) -> None:
-        while not self.stop_event.wait(self.renew_interval_seconds):
+        for lock_key in self._lock_keys:
+            logger.info(f"Releasing lock: {lock_key}")
             try:
-                self.redis_service.expire(self._lock_key, self._ttl)
-                logger.debug(f"Extended lock TTL: {self._lock_key}")
+                self.redis_service.delete(lock_key)
             except Exception as e:
-                logger.exception(f"Failed to renew TTL for {self._lock_key}: {e}")
+                logger.exception(f"Failed to release lock: {e}")
+        self._lock_keys = []
 
-    def __enter__(self) -> Path:
+    def _renew_loop(self) -> None:
+        while not self.stop_event.wait(self.renew_interval_seconds):
+            for lock_key in self._lock_keys:
+                try:
+                    self.redis_service.expire(lock_key, self._ttl)
+                    logger.debug(f"Extended lock TTL: {lock_key}")
+                except Exception as e:
+                    logger.exception(f"Failed to renew TTL for {lock_key}: {e}")
+
+    def __enter__(self) -> list[Path]:
         active_managers.add(self)
-        target_session_file = None
+        target_session_files = []
         for session_file in self.session_dir_path.glob("*.session-dirty"):
             logger.warning(f"- DIRTY SESSION, please review: {session_file.name!r}")
 
         for session_file in self.session_dir_path.glob("*.session"):
+            if (
+                self.max_sessions is not None
+                and len(target_session_files) >= self.max_sessions
+            ):
+                break
+
             if not self.acquire_lock(session_file):
                 continue
 
-            target_session_file = session_file
+            target_session_files.append(session_file)
             logger.info(f"Acquired session lock: {session_file.name!r}")
-            break
 
-        if not target_session_file:
+        if not target_session_files:
             active_managers.discard(self)
             raise SessionUnavailableError(
                 f"No available session found in {self.session_dir_path!r}"
@@ -133,7 +151,7 @@ class SessionLockManager:
 
         self.renew_thread = threading.Thread(target=self._renew_loop, daemon=True)
         self.renew_thread.start()
-        return target_session_file
+        return target_session_files
 
     def __exit__(
         self, exc_type: Exception, exc_val: str, exc_tb: Exception.__traceback__
@@ -145,6 +163,24 @@ class SessionLockManager:
         active_managers.discard(self)
 
 
+class SessionLockManager(SessionPoolLockManager):
+    def __init__(
+        self,
+        session_dir_path: Path | None,
+        renew_interval_seconds: int = RENEW_SESSION_LOCK_INTERVAL_SECONDS,
+        cache_ttl: int = DEFAULT_SESSION_EXPIRATION_SECONDS,
+    ) -> None:
+        super().__init__(
+            session_dir_path,
+            max_sessions=1,
+            renew_interval_seconds=renew_interval_seconds,
+            cache_ttl=cache_ttl,
+        )
+
+    def __enter__(self) -> Path:
+        return super().__enter__()[0]
+
+
 @signals.worker_shutdown.connect
 def clean_up_locks_on_shutdown(*args, **kwargs):
     for manager in active_managers:
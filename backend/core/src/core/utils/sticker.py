@@ -1,14 +1,22 @@
+import json
 import logging
+import re
+from collections.abc import Iterator
 
+from core.dtos.chat.rule.plan import StickerCollectionRulePlanDTO
 from core.models.rule import TelegramChatStickerCollection
 from core.models.sticker import StickerItem
 
 
 logger = logging.getLogger(__name__)
 
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+
 
 def find_relevant_sticker_items(
-    rule: TelegramChatStickerCollection, sticker_items: list[StickerItem]
+    rule: TelegramChatStickerCollection | StickerCollectionRulePlanDTO,
+    sticker_items: list[StickerItem],
 ) -> list[StickerItem]:
     """
     Find relevant sticker items based on specified rules.
@@ -41,3 +49,89 @@ def find_relevant_sticker_items(
         relevant_sticker_items.append(item)
 
     return relevant_sticker_items
+
+
+def _skip_whitespace(raw: str, idx: int) -> int:
+    return _JSON_WHITESPACE.match(raw, idx).end()
+
+
+def _consume(raw: str, idx: int, expected: str) -> int:
+    idx = _skip_whitespace(raw, idx)
+    if raw[idx : idx + 1] != expected:
+        raise ValueError(
+            f"Expected {expected!r} at position {idx}, got {raw[idx:idx + 1]!r}"
+        )
+    return idx + 1
+
+
+def _consume_separator(raw: str, idx: int, closing: str) -> tuple[int, bool]:
+    """
+    Consumes the separator after the container element.
+
+    :return: Position after the separator and whether the container is closed
+    """
+    idx = _skip_whitespace(raw, idx)
+    separator = raw[idx : idx + 1]
+    if separator == ",":
+        return idx + 1, False
+    if separator == closing:
+        return idx + 1, True
+    raise ValueError(
+        f"Expected ',' or {closing!r} at position {idx}, got {separator!r}"
+    )
+
+
+def _is_empty_container(raw: str, idx: int, closing: str) -> tuple[int, bool]:
+    idx = _skip_whitespace(raw, idx)
+    if raw[idx : idx + 1] == closing:
+        return idx + 1, True
+    return idx, False
+
+
+def iter_sticker_dom_ownerships(raw: str) -> Iterator[tuple[int, int, int]]:
+    """
+    Lazily decodes the StickerDom collection ownership bucket.
+    The bucket has the following structure::
+
+        {"timestamp": ..., "data": {"<character_id>": [{"<user_id>": [<instance>, ...]}, ...]}}
+
+    Only a single ``{user_id: instances}`` object is decoded at a time,
+    so memory usage doesn't grow with the number of items in the collection.
+
+    :param raw: Decrypted bucket content
+    :return: Iterator of the (external character ID, Telegram user ID, instance) tuples
+    """
+    idx = _consume(raw, 0, "{")
+    idx, is_closed = _is_empty_container(raw, idx, "}")
+    while not is_closed:
+        key, idx = _JSON_DECODER.raw_decode(raw, _skip_whitespace(raw, idx))
+        idx = _consume(raw, idx, ":")
+
+        if key != "data":
+            # Other keys, like timestamp, are small and not used for indexing
+            _, idx = _JSON_DECODER.raw_decode(raw, _skip_whitespace(raw, idx))
+            idx, is_closed = _consume_separator(raw, idx, "}")
+            continue
+
+        idx = _consume(raw, idx, "{")
+        idx, is_data_closed = _is_empty_container(raw, idx, "}")
+        while not is_data_closed:
+            character_id, idx = _JSON_DECODER.raw_decode(
+                raw, _skip_whitespace(raw, idx)
+            )
+            character_id = int(character_id)
+            idx = _consume(raw, idx, ":")
+            idx = _consume(raw, idx, "[")
+            idx, is_list_closed = _is_empty_container(raw, idx, "]")
+            while not is_list_closed:
+                user_instances, idx = _JSON_DECODER.raw_decode(
+                    raw, _skip_whitespace(raw, idx)
+                )
+                for user_id, instances in user_instances.items():
+                    user_id = int(user_id)
+                    for instance in instances:
+                        yield character_id, user_id, int(instance)
+                idx, is_list_closed = _consume_separator(raw, idx, "]")
+            idx, is_data_closed = _consume_separator(raw, idx, "}")
+
+        idx, is_closed = _consume_separator(raw, idx, "}")
@@ -1,4 +1,9 @@
 import asyncio
+import functools
+import os
+import threading
+from collections.abc import Awaitable, Callable
+from typing import ParamSpec, TypeVar
 
 from celery import Celery
 from celery.result import AsyncResult
@@ -17,6 +22,73 @@ sender.conf.update(
     }
 )
 
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+class WorkerEventLoop:
+    """
+    Event loop that runs in a background thread for the whole life of the worker process.
+
+    Unlike `async_to_sync`, which runs every call in a new event loop, it lets tasks reuse
+    clients bound to the loop, e.g. keep-alive connection pools.
+    The loop is created lazily, so the forked pool processes don't inherit it from the parent.
+    """
+
+    _loop: asyncio.AbstractEventLoop | None = None
+    _pid: int | None = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_loop(cls) -> asyncio.AbstractEventLoop:
+        with cls._lock:
+            if cls._loop is None or cls._pid != os.getpid():
+                cls._loop = asyncio.new_event_loop()
+                cls._pid = os.getpid()
+                threading.Thread(
+                    target=cls._loop.run_forever,
+                    name="worker-event-loop",
+                    daemon=True,
+                ).start()
+            return cls._loop
+
+    @classmethod
+    def run(cls, func: Callable[P, Awaitable[R]]) -> Callable[P, R]:
+        """
+        Wraps a coroutine function to be called from the synchronous task code.
+
+        :param func: Coroutine function to run in the worker event loop
+        :return: A synchronous function that blocks until the coroutine is completed
+        """
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return asyncio.run_coroutine_threadsafe(
+                func(*args, **kwargs), cls.get_loop()
+            ).result()
+
+        return wrapper
+
+    @classmethod
+    def shutdown(cls, *cleanups: Callable[[], Awaitable[None]]) -> None:
+        """
+        Runs the cleanups in the loop and stops it. Does nothing if the loop wasn't started.
+
+        :param cleanups: Coroutine functions closing the clients bound to the loop
+        """
+        with cls._lock:
+            loop, cls._loop = cls._loop, None
+            if loop is None or cls._pid != os.getpid():
+                return
+
+        async def _cleanup() -> None:
+            await asyncio.gather(
+                *(cleanup() for cleanup in cleanups), return_exceptions=True
+            )
+
+        asyncio.run_coroutine_threadsafe(_cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
 
 async def wait_for_task(
     *,
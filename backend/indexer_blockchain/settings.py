@@ -3,6 +3,10 @@ from core.settings import CoreSettings
 
 class BlockchainIndexerSettings(CoreSettings):
     worker_concurrency: int = 5
+    # Number of wallets fetched concurrently within a single task
+    wallet_fetch_concurrency: int = 4
+    # Number of noticed wallets dispatched in a single task
+    noticed_wallets_batch_size: int = 20
 
 
 blockchain_indexer_settings = BlockchainIndexerSettings()
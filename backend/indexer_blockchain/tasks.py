@@ -1,6 +1,7 @@
 import asyncio
 
 from celery.utils.log import get_task_logger
+from pytonapi.schema.accounts import Account
 from pytonapi.schema.jettons import JettonsBalances
 from pytonapi.schema.nft import NftItems
 
@@ -10,11 +11,13 @@ from core.constants import (
     CELERY_NOTICED_WALLETS_UPLOAD_QUEUE_NAME,
 )
 from core.ext.tonapi import TonApiService
+from core.services.chat.eligibility import EligibilitySummaryCacheService
 from core.services.db import DBService
 from core.services.jetton import JettonService
 from core.services.nft import NftCollectionService, NftItemService
 from core.services.superredis import RedisService
 from core.services.wallet import JettonWalletService, WalletService
+from core.utils.misc import batched
 from indexer_blockchain.celery_app import app
 from indexer_blockchain.settings import blockchain_indexer_settings
 
@@ -33,70 +36,43 @@ async def get_all_nfts_per_user(
     return NftItems(nft_items=nft_items)
 
 
-@app.task(
-    name="fetch-wallet-details",
-    queue=CELERY_WALLET_FETCH_QUEUE_NAME,
-)
-def fetch_wallet_details(address: str) -> None:
-    if address in blockchain_indexer_settings.blacklisted_wallets:
-        logger.warning(f"Wallet {address!r} is blacklisted.")
-        return
-
-    # TODO: Refactor to an action
-    blockchain_service = TonApiService()
+async def fetch_wallet_assets(
+    blockchain_service: TonApiService, address: str
+) -> tuple[JettonsBalances, NftItems]:
+    jettons_balances, nft_items = await asyncio.gather(
+        blockchain_service.get_all_jetton_balances(address),
+        get_all_nfts_per_user(blockchain_service=blockchain_service, address=address),
+    )
+    return jettons_balances, nft_items
 
-    account_info = asyncio.run(blockchain_service.get_account_info(address))
-    current_last_activity = account_info.last_activity
-    raw_address = account_info.address.to_raw()
 
+def get_stored_last_activities(raw_addresses: list[str]) -> dict[str, int | None]:
     with DBService().db_session() as db_session:
         wallet_service = WalletService(db_session)
-        wallet = wallet_service.get_user_wallet(raw_address)
-        stored_last_activity = wallet.last_activity if wallet else None
-
-    if stored_last_activity is not None and current_last_activity is not None:
-        if stored_last_activity == current_last_activity:
-            logger.info(
-                f"Skipping wallet {address!r} sync: last_activity has not changed ({current_last_activity})."
-            )
-            return
-
-    jettons_balances: JettonsBalances = asyncio.run(
-        blockchain_service.get_all_jetton_balances(address)
-    )
-
-    with DBService().db_session() as db_session:
-        # Pre-calculate whitelist collection addresses for NFT fetch
-        nft_collection_service = NftCollectionService(db_session)
-        whitelisted_nfts = nft_collection_service.get_whitelisted()
-        whitelist_collection_addresses = [
-            collection.address for collection in whitelisted_nfts
-        ]
+        return {
+            wallet.address: wallet.last_activity
+            for wallet in wallet_service.get_all(addresses=raw_addresses)
+        }
 
-    # Perform async NFT fetch OUTSIDE the DB session
-    nft_items: NftItems = asyncio.run(
-        get_all_nfts_per_user(
-            blockchain_service=blockchain_service,
-            address=address,
-        )
-    )
 
-    # Pre-filter fetched NFT items against whitelisted collections in memory
-    whitelist_set = set(whitelist_collection_addresses)
-    filtered_nfts = [
-        item
-        for item in nft_items.nft_items
-        if item.collection and item.collection.address.to_raw() in whitelist_set
-    ]
-    nft_items = NftItems(nft_items=filtered_nfts)
+def store_wallet_details(
+    address: str,
+    account_info: Account,
+    jettons_balances: JettonsBalances,
+    nft_items: NftItems,
+) -> set[str]:
+    """
+    Stores the fetched wallet balance, jettons and NFT items.
 
+    :return: Addresses of the previous owners of the wallet NFT items
+    """
     with DBService().db_session() as db_session:
         wallet_service = WalletService(db_session)
         wallet_service.set_balance(
-            raw_address,
+            account_info.address.to_raw(),
             # It already contains the balance in nano
             int(str(account_info.balance)),
-            last_activity=current_last_activity,
+            last_activity=account_info.last_activity,
         )
 
         jetton_service = JettonService(db_session)
@@ -114,6 +90,21 @@ def fetch_wallet_details(address: str) -> None:
         ]
         jetton_wallet_service.delete_missing(address, active_jetton_wallets)
 
+        nft_collection_service = NftCollectionService(db_session)
+        whitelist_collection_addresses = [
+            collection.address
+            for collection in nft_collection_service.get_whitelisted()
+        ]
+        # Pre-filter fetched NFT items against whitelisted collections in memory
+        whitelist_set = set(whitelist_collection_addresses)
+        nft_items = NftItems(
+            nft_items=[
+                item
+                for item in nft_items.nft_items
+                if item.collection and item.collection.address.to_raw() in whitelist_set
+            ]
+        )
+
         nft_service = NftItemService(db_session)
         _, evicted_owners = nft_service.bulk_create_or_update(
             nft_items, whitelist_collection_addresses
@@ -123,10 +114,132 @@ def fetch_wallet_details(address: str) -> None:
         nft_service.delete_missing(address, active_nft_items)
 
     logger.info(f"NFT items for {address!r} updated.")
-    redis_service = RedisService()
-    redis_service.add_to_set(UPDATED_WALLETS_SET_NAME, address)
-    for evicted_owner in evicted_owners - {address}:
-        redis_service.add_to_set(UPDATED_WALLETS_SET_NAME, evicted_owner)
+    return evicted_owners
+
+
+async def index_wallets(addresses: list[str]) -> None:
+    """
+    Indexes balances, jettons and NFT items of the wallets in a single pipeline.
+    All the requests share the pooled TON API client: account info of all the wallets
+    is requested at once, then assets of the changed wallets are fetched concurrently
+    and stored one by one as soon as they are ready.
+
+    :param addresses: Wallet addresses to index
+    :raises: The first error that occurred, after all other wallets are processed
+    """
+    errors = []
+    async with TonApiService() as blockchain_service:
+        accounts_info = await asyncio.gather(
+            *(blockchain_service.get_account_info(address) for address in addresses),
+            return_exceptions=True,
+        )
+        for address, account_info in zip(addresses, accounts_info):
+            if isinstance(account_info, Exception):
+                logger.error(
+                    f"Failed to fetch account info for {address!r}.",
+                    exc_info=account_info,
+                )
+                errors.append(account_info)
+
+        fetched_accounts = {
+            address: account_info
+            for address, account_info in zip(addresses, accounts_info)
+            if not isinstance(account_info, Exception)
+        }
+        stored_last_activities = await asyncio.to_thread(
+            get_stored_last_activities,
+            [
+                account_info.address.to_raw()
+                for account_info in fetched_accounts.values()
+            ],
+        )
+
+        accounts_to_index = {}
+        for address, account_info in fetched_accounts.items():
+            stored_last_activity = stored_last_activities.get(
+                account_info.address.to_raw()
+            )
+            if (
+                stored_last_activity is not None
+                and account_info.last_activity is not None
+                and stored_last_activity == account_info.last_activity
+            ):
+                logger.info(
+                    f"Skipping wallet {address!r} sync: last_activity has not changed ({account_info.last_activity})."
+                )
+                continue
+            accounts_to_index[address] = account_info
+
+        semaphore = asyncio.Semaphore(
+            blockchain_indexer_settings.wallet_fetch_concurrency
+        )
+
+        async def _fetch(
+            address: str,
+        ) -> tuple[str, tuple[JettonsBalances, NftItems] | Exception]:
+            async with semaphore:
+                try:
+                    return address, await fetch_wallet_assets(
+                        blockchain_service, address
+                    )
+                except Exception as e:
+                    return address, e
+
+        redis_service = RedisService()
+        eligibility_summary_cache_service = EligibilitySummaryCacheService(
+            redis_service
+        )
+        for fetched in asyncio.as_completed(
+            [_fetch(address) for address in accounts_to_index]
+        ):
+            address, assets = await fetched
+            if isinstance(assets, Exception):
+                logger.error(
+                    f"Failed to fetch assets for {address!r}.", exc_info=assets
+                )
+                errors.append(assets)
+                continue
+
+            jettons_balances, nft_items = assets
+            try:
+                # Other wallets keep being fetched while the current one is stored
+                evicted_owners = await asyncio.to_thread(
+                    store_wallet_details,
+                    address,
+                    accounts_to_index[address],
+                    jettons_balances,
+                    nft_items,
+                )
+            except Exception as e:
+                logger.error(f"Failed to store wallet {address!r}.", exc_info=e)
+                errors.append(e)
+                continue
+
+            redis_service.add_to_set(UPDATED_WALLETS_SET_NAME, address)
+            for evicted_owner in evicted_owners - {address}:
+                redis_service.add_to_set(UPDATED_WALLETS_SET_NAME, evicted_owner)
+            eligibility_summary_cache_service.bump_wallet_versions(
+                evicted_owners | {address}
+            )
+
+    if errors:
+        raise errors[0]
+
+
+@app.task(
+    name="fetch-wallet-details",
+    queue=CELERY_WALLET_FETCH_QUEUE_NAME,
+)
+def fetch_wallet_details(*addresses: str) -> None:
+    addresses_to_index = []
+    for address in dict.fromkeys(addresses):
+        if address in blockchain_indexer_settings.blacklisted_wallets:
+            logger.warning(f"Wallet {address!r} is blacklisted.")
+            continue
+        addresses_to_index.append(address)
+
+    if addresses_to_index:
+        asyncio.run(index_wallets(addresses_to_index))
 
 
 @app.task(
@@ -137,5 +250,7 @@ def load_noticed_wallets():
     redis_service = RedisService(external=True)
     noticed_wallets = redis_service.get_unique_stream_items()
     logger.info(f"Loading {len(noticed_wallets)} noticed wallets")
-    for wallet in noticed_wallets:
-        fetch_wallet_details.apply_async(args=(wallet,))
+    for batch in batched(
+        sorted(noticed_wallets), blockchain_indexer_settings.noticed_wallets_batch_size
+    ):
+        fetch_wallet_details.apply_async(args=batch)
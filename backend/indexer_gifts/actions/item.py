@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 
 from core.actions.base import BaseAction
 from core.constants import GIFT_COLLECTIONS_METADATA_KEY
-from core.models.gift import GiftUnique, GiftCollection
+from core.models.gift import GiftCollection
 from core.services.gift.collection import GiftCollectionService
 from core.services.gift.item import GiftUniqueService
 from core.services.superredis import RedisService
@@ -18,12 +18,12 @@ logger = logging.getLogger(__name__)
 
 
 class IndexerGiftUniqueAction(BaseAction):
-    def __init__(self, db_session: Session, session_path: Path) -> None:
+    def __init__(self, db_session: Session, session_paths: list[Path]) -> None:
         super().__init__(db_session)
         self.collection_service = GiftCollectionService(db_session)
         self.service = GiftUniqueService(db_session)
         self.redis_service = RedisService()
-        self.indexer = GiftUniqueIndexer(session_path=session_path)
+        self.indexer = GiftUniqueIndexer(session_paths=session_paths)
 
     async def index_all(self) -> AsyncGenerator[set[int], None]:
         """
@@ -58,16 +58,14 @@ class IndexerGiftUniqueAction(BaseAction):
         if stop is None:
             stop = collection.upgraded_count
 
-        existing_items = {
-            item.slug: item
-            for item in self.service.get_all(
-                collection_slug=collection.slug,
-                number_ge=start,
-                number_le=stop,
-            )
-        }
+        # Only owners are needed to detect changes, so full ORM objects are not loaded
+        existing_owners = self.service.get_owners(
+            collection_slug=collection.slug,
+            number_ge=start,
+            number_le=stop,
+        )
         logger.info(
-            f"Found existing {len(existing_items)} unique items "
+            f"Found existing {len(existing_owners)} unique items "
             f"for collection {collection.slug!r} and starting from index {start} to {stop}..."
         )
         targeted_telegram_owner_ids = set()
@@ -78,63 +76,60 @@ class IndexerGiftUniqueAction(BaseAction):
             start=start,
             stop=stop,
         ):
-            to_create = []
-            to_update = []
+            now = datetime.datetime.now(tz=datetime.UTC)
+            to_upsert = []
             for item in batch:
-                if existing_item := existing_items.get(item.slug):
-                    # Update record only if necessary
-                    if any(
-                        (
-                            item.telegram_owner_id != existing_item.telegram_owner_id,
-                            item.owner_address != existing_item.owner_address,
-                        )
-                    ):
-                        # Ignore if the owner was previously hidden
-                        if isinstance(existing_item.telegram_owner_id, int):
-                            # Store Telegram ID of the previous owner to perform and actions on losing ownership if needed
-                            targeted_telegram_owner_ids.add(
-                                existing_item.telegram_owner_id
-                            )
-                        to_update.append(
-                            {
-                                "slug": item.slug,
-                                "telegram_owner_id": item.telegram_owner_id,
-                                "owner_address": item.owner_address,
-                                "blockchain_address": item.blockchain_address,
-                                "last_updated": datetime.datetime.now(tz=datetime.UTC),
-                            }
-                        )
-                    else:
-                        logger.debug(
-                            f"No changes detected for item {item.slug!r} in collection {collection.slug!r}. Skipping."
-                        )
-                else:
-                    to_create.append(
-                        GiftUnique(
-                            slug=item.slug,
-                            collection_slug=collection.slug,
-                            model=item.model,
-                            backdrop=item.backdrop,
-                            number=item.number,
-                            pattern=item.pattern,
-                            telegram_owner_id=item.telegram_owner_id,
-                            owner_address=item.owner_address,
-                            blockchain_address=item.blockchain_address,
-                            last_updated=datetime.datetime.now(tz=datetime.UTC),
-                        )
+                # Every item is met only once per pass, so the projection can shrink as it goes
+                if existing_owners.pop(item.slug, None) == (
+                    item.telegram_owner_id,
+                    item.owner_address,
+                ):
+                    logger.debug(
+                        f"No changes detected for item {item.slug!r} in collection {collection.slug!r}. Skipping."
                     )
-            if to_create:
+                    continue
+
+                to_upsert.append(
+                    {
+                        "slug": item.slug,
+                        "collection_slug": collection.slug,
+                        "model": item.model,
+                        "backdrop": item.backdrop,
+                        "number": item.number,
+                        "pattern": item.pattern,
+                        "telegram_owner_id": item.telegram_owner_id,
+                        "owner_address": item.owner_address,
+                        "blockchain_address": item.blockchain_address,
+                        "last_updated": now,
+                    }
+                )
+
+            if not to_upsert:
+                continue
+
+            created_count = 0
+            updated_count = 0
+            for row in self.service.bulk_upsert(to_upsert):
+                if row.is_created:
+                    created_count += 1
+                    continue
+
+                updated_count += 1
+                # Ignore if the owner was previously hidden
+                if isinstance(row.previous_telegram_owner_id, int):
+                    # Store Telegram ID of the previous owner to perform and actions on losing ownership if needed
+                    targeted_telegram_owner_ids.add(row.previous_telegram_owner_id)
+
+            if created_count:
                 # Cache has to be cleared as new metadata could appear.
                 # It could be extended to clear only when new metadata options appear.
                 self.redis_service.delete(GIFT_COLLECTIONS_METADATA_KEY)
 
-            self.db_session.bulk_save_objects(to_create)
             logger.info(
-                f"Created {len(to_create)} new unique items for collection {collection.slug!r}."
+                f"Created {created_count} new unique items for collection {collection.slug!r}."
             )
-            self.db_session.bulk_update_mappings(GiftUnique, to_update)
             logger.info(
-                f"Updated {len(to_update)} existing unique items for collection {collection.slug!r}."
+                f"Updated {updated_count} existing unique items for collection {collection.slug!r}."
             )
             self.db_session.commit()
 
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from pathlib import Path
 from typing import AsyncGenerator
@@ -6,6 +7,7 @@ from telethon.errors import RPCError
 
 from core.dtos.gift.item import GiftUniqueDTO
 from core.services.supertelethon import TelethonService
+from indexer_gifts.indexers.scheduler import GiftBatchScheduler
 from indexer_gifts.settings import gifts_indexer_settings
 from indexer_gifts.utils import parse_collection_slug_from_gift_slug
 
@@ -13,43 +15,56 @@ logger = logging.getLogger(__name__)
 
 
 class GiftUniqueIndexer:
-    def __init__(self, session_path: Path) -> None:
-        self.telethon_service = TelethonService(session_path=session_path)
+    def __init__(self, session_paths: list[Path]) -> None:
+        self.telethon_services = {
+            session_path: TelethonService(session_path=session_path)
+            for session_path in session_paths
+        }
+        # A single session is enough for the user-specific requests
+        self.telethon_service = self.telethon_services[session_paths[0]]
+        self.scheduler = GiftBatchScheduler(
+            telethon_services=self.telethon_services,
+            concurrency_per_session=gifts_indexer_settings.telegram_session_concurrency,
+        )
 
     async def index_collection_items(
         self, collection_slug: str, start: int, stop: int
     ) -> AsyncGenerator[list[GiftUniqueDTO], None]:
         """
-        Indexes all gifts from a specific collection using the telethon service. This process
-        involves fetching a specific number of gifts from a collection, converting them into
-        GiftUniqueDTO objects, and yielding them in batches of a defined size.
+        Indexes all gifts from a specific collection using all the provided sessions.
+        The range is split into request batches that are fetched concurrently,
+        converted into GiftUniqueDTO objects, and yielded in batches of a defined size.
 
         :param collection_slug: The unique identifier of the collection to be indexed.
         :param start: The first index of the gifts to be indexed from the collection.
         :param stop: The total number of gifts to be indexed from the collection.
         :return: An asynchronous generator yielding lists of GiftUniqueDTO objects.
         """
-        await self.telethon_service.start()
+        await asyncio.gather(
+            *(
+                telethon_service.start()
+                for telethon_service in self.telethon_services.values()
+            )
+        )
         try:
-            entities = []
-            for num in range(
-                start, stop + 1, gifts_indexer_settings.telegram_batch_request_size
-            ):
-                gifts = await self.telethon_service.index_gifts_batch(
-                    slugs=[
-                        f"{collection_slug}-{gift_id}"
-                        for i in range(
-                            gifts_indexer_settings.telegram_batch_request_size
-                        )
-                        if (gift_id := num + i) <= stop
-                    ]
+            request_batches = [
+                [
+                    f"{collection_slug}-{gift_id}"
+                    for gift_id in range(
+                        num,
+                        min(
+                            num + gifts_indexer_settings.telegram_batch_request_size,
+                            stop + 1,
+                        ),
+                    )
+                ]
+                for num in range(
+                    start, stop + 1, gifts_indexer_settings.telegram_batch_request_size
                 )
-
-                logger.debug(
-                    f"Indexed gifts {num}...{num + gifts_indexer_settings.telegram_batch_request_size - 1} "
-                    f"for {collection_slug!r}."
-                )
-
+            ]
+            entities = []
+            indexed_count = 0
+            async for gifts in self.scheduler.fetch(request_batches):
                 entities.extend(
                     [
                         GiftUniqueDTO.from_telethon(
@@ -64,7 +79,10 @@ class GiftUniqueIndexer:
                     len(entities)
                     >= gifts_indexer_settings.telegram_batch_processing_size
                 ):
-                    logger.info(f"Indexed {num} unique gifts for {collection_slug!r}.")
+                    indexed_count += len(entities)
+                    logger.info(
+                        f"Indexed {indexed_count} unique gifts for {collection_slug!r}."
+                    )
                     yield entities
                     entities = []
 
@@ -74,8 +92,13 @@ class GiftUniqueIndexer:
                 f"Failed to index gifts for collection {collection_slug!r}"
             )
         finally:
-            # Free session for the next process
-            await self.telethon_service.stop()
+            # Free sessions for the next process
+            await asyncio.gather(
+                *(
+                    telethon_service.stop()
+                    for telethon_service in self.telethon_services.values()
+                )
+            )
 
     async def index_user_gifts(
         self,
@@ -0,0 +1,208 @@
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Iterable
+from pathlib import Path
+
+from telethon.errors import (
+    AuthKeyDuplicatedError,
+    FloodWaitError,
+    FrozenMethodInvalidError,
+    PhoneNumberBannedError,
+)
+from telethon.tl.types import StarGiftUnique
+
+from core.exceptions.gift import GiftBatchFetchError
+from core.services.supertelethon import TelethonService
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the session can't be used anymore and should be reviewed
+FATAL_SESSION_ERRORS = (
+    PhoneNumberBannedError,
+    AuthKeyDuplicatedError,
+    FrozenMethodInvalidError,
+)
+# Number of successful batches in a row required to restore one concurrency slot
+CONCURRENCY_RECOVERY_SUCCESSES = 10
+DISABLED_SLOT_POLL_INTERVAL = 1
+# Attempts of a single batch failed with unexpected errors, flood waits are not counted
+MAX_BATCH_ATTEMPTS = 3
+
+
+class GiftSessionState:
+    """
+    Adaptive request budget of the single Telethon session.
+    Concurrency is halved on every flood wait and restored one slot at a time
+    after a series of successful batches.
+    """
+
+    def __init__(
+        self, session_path: Path, telethon_service: TelethonService, concurrency: int
+    ) -> None:
+        self.session_path = session_path
+        self.telethon_service = telethon_service
+        self.max_concurrency = concurrency
+        self.concurrency = concurrency
+        self.resume_at = 0.0
+        self.successes = 0
+        self.error: Exception | None = None
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.error is None
+
+    def on_success(self) -> None:
+        self.successes += 1
+        if (
+            self.successes >= CONCURRENCY_RECOVERY_SUCCESSES
+            and self.concurrency < self.max_concurrency
+        ):
+            self.concurrency += 1
+            self.successes = 0
+
+    def on_flood_wait(self, seconds: int) -> None:
+        self.resume_at = max(
+            self.resume_at, asyncio.get_running_loop().time() + seconds
+        )
+        self.concurrency = max(1, self.concurrency // 2)
+        self.successes = 0
+        logger.warning(
+            f"Session {self.session_path.name!r} got flood wait for {seconds} seconds. "
+            f"Concurrency reduced to {self.concurrency}."
+        )
+
+
+class GiftBatchScheduler:
+    def __init__(
+        self,
+        telethon_services: dict[Path, TelethonService],
+        concurrency_per_session: int,
+    ) -> None:
+        """
+        Spreads gift batch requests across multiple Telethon sessions.
+
+        :param telethon_services: Telethon services by the session path they use
+        :param concurrency_per_session: Maximum number of concurrent batch requests per session
+        """
+        self.sessions = [
+            GiftSessionState(
+                session_path=session_path,
+                telethon_service=telethon_service,
+                concurrency=concurrency_per_session,
+            )
+            for session_path, telethon_service in telethon_services.items()
+        ]
+
+    @property
+    def failed_sessions(self) -> list[GiftSessionState]:
+        return [session for session in self.sessions if not session.is_healthy]
+
+    async def _worker(
+        self,
+        session: GiftSessionState,
+        slot: int,
+        batches: asyncio.Queue[tuple[list[str], int]],
+        results: asyncio.Queue[list[StarGiftUnique] | GiftBatchFetchError | None],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while session.is_healthy and not batches.empty():
+                if slot >= session.concurrency:
+                    # The slot is disabled after flood waits until the session recovers
+                    await asyncio.sleep(DISABLED_SLOT_POLL_INTERVAL)
+                    continue
+
+                if (delay := session.resume_at - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                try:
+                    slugs, attempt = batches.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    gifts = await session.telethon_service.index_gifts_batch(
+                        slugs=slugs, sleep_on_flood_wait=False
+                    )
+                except FloodWaitError as e:
+                    session.on_flood_wait(e.seconds)
+                    batches.put_nowait((slugs, attempt))
+                    continue
+                except FATAL_SESSION_ERRORS as e:
+                    logger.error(
+                        f"Session {session.session_path.name!r} can't be used anymore: {e!r}"
+                    )
+                    session.error = e
+                    batches.put_nowait((slugs, attempt))
+                    return
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to fetch gifts {slugs[0]!r}..{slugs[-1]!r} "
+                        f"with session {session.session_path.name!r} "
+                        f"(attempt {attempt}/{MAX_BATCH_ATTEMPTS}): {e!r}"
+                    )
+                    if attempt >= MAX_BATCH_ATTEMPTS:
+                        error = GiftBatchFetchError(
+                            f"Failed to fetch gifts {slugs[0]!r}..{slugs[-1]!r} "
+                            f"after {MAX_BATCH_ATTEMPTS} attempts"
+                        )
+                        error.__cause__ = e
+                        await results.put(error)
+                        return
+                    batches.put_nowait((slugs, attempt + 1))
+                    continue
+
+                session.on_success()
+                await results.put(gifts)
+        finally:
+            await results.put(None)
+
+    async def fetch(
+        self, batches: Iterable[list[str]]
+    ) -> AsyncGenerator[list[StarGiftUnique], None]:
+        """
+        Fetches the gift batches using all the healthy sessions concurrently.
+        Batches interrupted by flood waits are rescheduled, so no gifts are skipped.
+        Batches failed with other errors are retried up to `MAX_BATCH_ATTEMPTS` times.
+
+        :param batches: Batches of gift slugs to request
+        :return: An asynchronous generator yielding gifts of each fetched batch in completion order
+        :raises GiftBatchFetchError: If any batch failed in all the attempts
+        :raises: The error of the last failed session if no healthy sessions are left
+        """
+        pending: asyncio.Queue[tuple[list[str], int]] = asyncio.Queue()
+        for batch in batches:
+            pending.put_nowait((batch, 1))
+
+        while not pending.empty():
+            if not (
+                healthy_sessions := [
+                    session for session in self.sessions if session.is_healthy
+                ]
+            ):
+                raise self.failed_sessions[-1].error
+
+            workers_count = sum(session.max_concurrency for session in healthy_sessions)
+            # Bounded, so fetched gifts don't pile up if the consumer is slower
+            results: asyncio.Queue[
+                list[StarGiftUnique] | GiftBatchFetchError | None
+            ] = asyncio.Queue(maxsize=workers_count * 2)
+            workers = [
+                asyncio.create_task(self._worker(session, slot, pending, results))
+                for session in healthy_sessions
+                for slot in range(session.max_concurrency)
+            ]
+            try:
+                finished_workers = 0
+                while finished_workers < len(workers):
+                    if (gifts := await results.get()) is None:
+                        finished_workers += 1
+                        continue
+                    if isinstance(gifts, GiftBatchFetchError):
+                        raise gifts
+                    yield gifts
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
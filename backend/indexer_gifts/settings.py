@@ -16,6 +16,10 @@ class GiftsIndexerSettings(CoreSettings):
     telegram_batch_request_size: int = DEFAULT_TELEGRAM_BATCH_REQUEST_SIZE
 
     telegram_indexer_session_path: Path | None = None
+    # Maximum number of sessions used by a single indexing task, all available ones if not set
+    telegram_sessions_per_task: int | None = None
+    # Maximum number of concurrent batch requests per session
+    telegram_session_concurrency: int = 3
 
     @field_validator("telegram_indexer_session_path", mode="before")
     def validate_and_transform_path(cls, value: str | Path | None) -> Path | None:
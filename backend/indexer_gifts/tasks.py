@@ -12,13 +12,17 @@ from core.constants import (
     CELERY_GIFT_FETCH_QUEUE_NAME,
     DEFAULT_CELERY_TASK_RETRY_DELAY,
     DEFAULT_CELERY_TASK_MAX_RETRIES,
-    DEFAULT_TELEGRAM_TASK_BATCH_PROCESSING_SIZE,
 )
 from core.dtos.gift.collection import GiftCollectionDTO
 from core.exceptions.gift import GiftCollectionNotExistsError
+from core.services.chat.eligibility import EligibilitySummaryCacheService
 from core.services.db import DBService
 from core.services.gift.collection import GiftCollectionService
-from core.utils.session import SessionLockManager, SessionUnavailableError
+from core.utils.session import (
+    SessionLockManager,
+    SessionPoolLockManager,
+    SessionUnavailableError,
+)
 from indexer_gifts.actions.collection import IndexerGiftCollectionAction
 from indexer_gifts.actions.item import IndexerGiftUniqueAction
 from indexer_gifts.celery_app import app
@@ -71,46 +75,69 @@ async def index_whitelisted_gift_collections() -> list[GiftCollectionDTO]:
         return collections_dtos
 
 
+def mark_failed_sessions_dirty(action: IndexerGiftUniqueAction) -> None:
+    for session in action.indexer.scheduler.failed_sessions:
+        # Rename session to mark as dirty
+        session.session_path.rename(f"{session.session_path}-dirty")
+
+
+def push_updated_gift_owners(
+    action: IndexerGiftUniqueAction, telegram_ids: set[int]
+) -> None:
+    """
+    Schedules the recheck of the users which gifts ownership changed
+    and invalidates their cached eligibility summaries.
+    """
+    if not telegram_ids:
+        return
+
+    action.redis_service.add_to_set(UPDATED_GIFT_USER_IDS, *telegram_ids)
+    EligibilitySummaryCacheService(action.redis_service).bump_gift_versions(
+        telegram_ids
+    )
+
+
 async def index_gift_collection_ownerships(
-    slug: str, start: int | None, stop: int | None
+    slug: str | None, start: int | None, stop: int | None
 ) -> None:
     """
     Indexes gift ownership data for a specified collection by processing
     unique gift actions related to the given collection slug. After indexing,
     updated user identifiers are logged, and certain identifiers are stored
     within a Redis set for further processing.
+    Requests are spread across all the available sessions.
 
     :param slug: The slug that uniquely identifies the gift collection whose
-                 ownership data is being indexed.
+                 ownership data is being indexed. If None, all whitelisted collections are indexed.
     :param start: The starting index for processing unique gift actions.
     :param stop: The ending index for processing unique gift actions.
     """
     with DBService().db_session() as db_session:
-        with SessionLockManager(
-            gifts_indexer_settings.telegram_indexer_session_path
-        ) as session_path:
-            action = IndexerGiftUniqueAction(db_session, session_path=session_path)
+        with SessionPoolLockManager(
+            gifts_indexer_settings.telegram_indexer_session_path,
+            max_sessions=gifts_indexer_settings.telegram_sessions_per_task,
+        ) as session_paths:
+            logger.info(f"Indexing gift ownerships with {len(session_paths)} sessions.")
+            action = IndexerGiftUniqueAction(db_session, session_paths=session_paths)
+            updated_telegram_ids_count = 0
             try:
-                batch_telegram_ids = await action.index(
-                    slug=slug, start=start, stop=stop
-                )
-                logger.info(
-                    f"Indexed {len(batch_telegram_ids)} unique gift actions for collection {slug!r}."
-                )
-            except (
-                PhoneNumberBannedError,
-                AuthKeyDuplicatedError,
-                FrozenMethodInvalidError,
-            ) as e:
-                # Rename session to mark as dirty
-                session_path.rename(f"{session_path}-dirty")
-                raise e
-
-            if batch_telegram_ids:
-                logger.info(f"Updated user IDs count: {len(batch_telegram_ids)}")
-                action.redis_service.add_to_set(
-                    UPDATED_GIFT_USER_IDS, *batch_telegram_ids
-                )
+                if slug is not None:
+                    telegram_ids = await action.index(slug=slug, start=start, stop=stop)
+                    push_updated_gift_owners(action, telegram_ids)
+                    updated_telegram_ids_count += len(telegram_ids)
+                else:
+                    # Ownership of every collection is committed separately, so its previous owners
+                    # are pushed right away and get rechecked even if the next collection fails
+                    async for telegram_ids in action.index_all():
+                        push_updated_gift_owners(action, telegram_ids)
+                        updated_telegram_ids_count += len(telegram_ids)
+            finally:
+                mark_failed_sessions_dirty(action)
+
+            logger.info(
+                f"Indexed gift ownerships for collection {slug!r}. "
+                f"Updated user IDs count: {updated_telegram_ids_count}"
+            )
 
         logger.info(f"Gift ownerships for collection {slug!r} indexed.")
 
@@ -128,7 +155,7 @@ async def index_gift_collection_ownerships(
     ignore_result=True,
 )
 def fetch_gift_collection_ownership_details(
-    slug: str, start: int | None = None, stop: int | None = None
+    slug: str | None = None, start: int | None = None, stop: int | None = None
 ) -> None:
     logger.info(
         f"Received task to index collection {slug!r} ownership details. Start ID: {start}, Stop ID: {stop}"
@@ -152,32 +179,16 @@ def fetch_gift_ownership_details():
     """
     Fetch details of gift ownership for each gift collection in a whitelisted list.
 
-    This task fetches ownership details for gift collections by dividing
-    the processing into batches of a predefined size.
-    It uses the Celery task queue system and works in conjunction with the function that fetches
-    ownership details for each batch.
-
     The function runs asynchronously to index whitelisted gift collections
-    and iterates through these collections to process their ownership details.
-    It dispatches separate tasks for each batch of upgraded items within the
-    collections.
+    and dispatches a single task that processes ownership details of all the collections.
+    That task spreads the gift number ranges across all the available sessions.
     Tasks will be retried automatically on session or phone-number-related errors
      up to a maximum defined limit.
     """
-    collections = asyncio.run(index_whitelisted_gift_collections())
-    for collection in collections:
-        for i in range(
-            1, collection.upgraded_count, DEFAULT_TELEGRAM_TASK_BATCH_PROCESSING_SIZE
-        ):
-            app.send_task(
-                "fetch-gift-collection-ownership-details",
-                args=(
-                    collection.slug,
-                    i,
-                    min(
-                        i + DEFAULT_TELEGRAM_TASK_BATCH_PROCESSING_SIZE,
-                        collection.upgraded_count,
-                    ),
-                ),
-                queue=CELERY_GIFT_FETCH_QUEUE_NAME,
-            )
+    asyncio.run(index_whitelisted_gift_collections())
+    # A single pass over all the collections uses all the available sessions at once,
+    # so the pass duration depends on the number of sessions rather than on the queue
+    app.send_task(
+        "fetch-gift-collection-ownership-details",
+        queue=CELERY_GIFT_FETCH_QUEUE_NAME,
+    )
@@ -18,6 +18,8 @@ from indexer_price.indexers.dyor import DyorIndexer
 from indexer_price.indexers.getgems import GetGemsIndexer
 from indexer_price.indexers.sticker_tools import StickerToolsIndexer
 from indexer_price.indexers.ton import TonPriceIndexer
+from indexer_price.services.fetcher import PriceFetcher
+from indexer_price.settings import price_indexer_settings
 
 VALID_VERIFICATION_STATUSES = (
     VerificationStatus.JVS_APPROVED,
@@ -87,19 +89,18 @@ class JettonPriceIndexerAction(PriceIndexerAction):
     async def refresh_jettons_price(self) -> None:
         """
         Asynchronously refreshes the prices of jettons by fetching their latest information
-        and updates the database. The method processes all whitelisted jettons available in
-        the service, validates their status, and updates prices in batches for efficiency.
+        and updates the database. The information of all whitelisted jettons is fetched
+        concurrently, and the prices of the valid ones are updated in batches as they arrive.
         Commits changes to the database after processing all jetton prices and logs the process.
         """
         all_jettons = self.jetton_service.get_all(whitelisted_only=True)
+        fetcher = PriceFetcher(
+            provider="DYOR",
+            fetch=lambda jetton: self.indexer.get_jetton_info(jetton.address),
+            concurrency=price_indexer_settings.dyor_concurrency,
+        )
         update_batch: dict[str, float] = {}
-        for jetton in all_jettons:
-            try:
-                jetton_info = await self.indexer.get_jetton_info(jetton.address)
-            except Exception as e:
-                logger.exception(f"Error occurred while fetching jetton info: {e}")
-                continue
-
+        async for jetton, jetton_info in fetcher.fetch_all(all_jettons):
             if not self._validate_jetton_status(jetton_info):
                 continue
 
@@ -155,16 +156,17 @@ class NftCollectionPriceIndexerAction(PriceIndexerAction):
             return
 
         all_nft_collections = self.nft_collection_service.get_all(whitelisted_only=True)
+        fetcher = PriceFetcher(
+            provider="GetGems",
+            fetch=lambda nft_collection: self.indexer.get_collection_basic_info(
+                address=nft_collection.address
+            ),
+            concurrency=price_indexer_settings.getgems_concurrency,
+        )
         update_batch: dict[str, float] = {}
-        for nft_collection in all_nft_collections:
-            try:
-                nft_collection_info = await self.indexer.get_collection_basic_info(
-                    address=nft_collection.address
-                )
-            except Exception as e:
-                logger.exception(f"Error occurred while fetching collection info: {e}")
-                continue
-
+        async for nft_collection, nft_collection_info in fetcher.fetch_all(
+            all_nft_collections
+        ):
             if not self._validate_nft_collection_status(nft_collection_info):
                 continue
 
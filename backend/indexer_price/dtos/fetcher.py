@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+
+class FetchStatsDTO(BaseModel):
+    """
+    Outcome of fetching the assets info from a single provider along with the latency metrics.
+    """
+
+    provider: str
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    elapsed: float = 0.0
+    # Time spent on each successfully fetched item, including rate limiter waits and retries
+    latencies: list[float] = []
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def p95_latency(self) -> float:
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    @property
+    def max_latency(self) -> float:
+        return max(self.latencies, default=0.0)
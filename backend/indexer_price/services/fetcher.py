@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import Generic, TypeVar
+
+import httpx
+
+from indexer_price.dtos.fetcher import FetchStatsDTO
+from indexer_price.settings import price_indexer_settings
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+RETRYABLE_STATUS_CODES = frozenset({429})
+# Upper bound of a single backoff, including the one requested in the `Retry-After` header
+MAX_BACKOFF = 60
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _get_retry_after(error: Exception) -> float | None:
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    try:
+        return float(error.response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+class PriceFetcher(Generic[ItemT, ResultT]):
+    """
+    Fetches the info of the assets from a single provider concurrently.
+
+    Rate limits are enforced by the provider's indexer, the fetcher only keeps enough requests
+    in flight for its limiter to be always saturated. Rate limited (429), failed (5xx)
+    and timed out requests are retried with the exponential backoff, which doesn't block
+    the other workers.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        fetch: Callable[[ItemT], Awaitable[ResultT]],
+        concurrency: int,
+        max_attempts: int | None = None,
+        backoff: float | None = None,
+    ) -> None:
+        self.provider = provider
+        self.fetch = fetch
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts or price_indexer_settings.price_fetch_attempts
+        self.backoff = (
+            backoff
+            if backoff is not None
+            else price_indexer_settings.price_fetch_backoff
+        )
+        self.stats = FetchStatsDTO(provider=provider)
+
+    async def _fetch_with_retries(self, item: ItemT) -> ResultT:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return await self.fetch(item)
+            except Exception as e:
+                if attempt == self.max_attempts or not _is_retryable(e):
+                    raise
+
+                delay = _get_retry_after(e)
+                if delay is None:
+                    delay = self.backoff * 2 ** (attempt - 1)
+                delay = min(delay, MAX_BACKOFF)
+                self.stats.retried += 1
+                logger.warning(
+                    f"Request to {self.provider} for {item!r} failed: {e}. "
+                    f"Retrying in {delay:.2f}s (attempt {attempt}/{self.max_attempts})."
+                )
+                await asyncio.sleep(delay)
+
+    async def _worker(
+        self,
+        items: asyncio.Queue[ItemT],
+        results: asyncio.Queue[tuple[ItemT, ResultT | None, bool]],
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                item = items.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            started_at = loop.time()
+            try:
+                result = await self._fetch_with_retries(item)
+            except Exception as e:
+                logger.exception(
+                    f"Error occurred while fetching {item!r} from {self.provider}: {e}"
+                )
+                self.stats.failed += 1
+                await results.put((item, None, False))
+                continue
+
+            self.stats.succeeded += 1
+            self.stats.latencies.append(loop.time() - started_at)
+            await results.put((item, result, True))
+
+    async def fetch_all(
+        self, items: Sequence[ItemT]
+    ) -> AsyncIterator[tuple[ItemT, ResultT]]:
+        """
+        Fetches the info of all items and yields it as soon as it's received,
+        so the consumer can process the results while the rest are still being fetched.
+        Errors are logged and the failed items are skipped.
+
+        :param items: Items to fetch the info for
+        :return: Pairs of the item and its info in the order of completion
+        """
+        if not items:
+            return
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        pending: asyncio.Queue[ItemT] = asyncio.Queue()
+        for item in items:
+            pending.put_nowait(item)
+
+        results: asyncio.Queue[tuple[ItemT, ResultT | None, bool]] = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._worker(pending, results))
+            for _ in range(min(self.concurrency, len(items)))
+        ]
+        try:
+            for _ in range(len(items)):
+                item, result, is_success = await results.get()
+                if is_success:
+                    yield item, result
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            self.stats.elapsed = loop.time() - started_at
+            logger.info(
+                f"Fetched {self.stats.succeeded} of {len(items)} items from {self.provider} "
+                f"in {self.stats.elapsed:.2f}s. Failed: {self.stats.failed}, "
+                f"retried: {self.stats.retried} time(s). "
+                f"Latency: mean {self.stats.mean_latency:.2f}s, "
+                f"p95 {self.stats.p95_latency:.2f}s, max {self.stats.max_latency:.2f}s."
+            )
@@ -6,5 +6,14 @@ class PriceIndexerSettings(CoreSettings):
 
     getgems_api_key: str | None = None
 
+    # Requests in flight per provider. Should be large enough
+    # to keep the provider's rate limiter saturated while the responses are awaited
+    dyor_concurrency: int = 3
+    getgems_concurrency: int = 5
+    # Attempts of a single request failed with 429, 5xx or a network error
+    price_fetch_attempts: int = 4
+    # Delay before the first retry in seconds, doubled on every next attempt
+    price_fetch_backoff: float = 1.0
+
 
 price_indexer_settings = PriceIndexerSettings()
@@ -1,19 +1,24 @@
 import logging
+import time
 from collections import defaultdict
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Iterator
 
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.orm import Session
 
 from core.actions.base import BaseAction
 from core.actions.sticker.external import ExternalStickerAction
-from core.constants import DEFAULT_BATCH_PROCESSING_SIZE
+from core.constants import (
+    DEFAULT_BATCH_PROCESSING_SIZE,
+    STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE,
+    STICKER_OWNERSHIP_SNAPSHOT_TTL,
+)
 from core.dtos.sticker import (
-    ExternalStickerDomCollectionOwnershipDTO,
     StickerDomCollectionOwnershipMetadataDTO,
     StickerCollectionDTO,
     StickerDomCollectionWithCharacters,
     StickerItemDTO,
+    StickerOwnershipSnapshotDTO,
 )
 from core.models.user import User
 from core.models.sticker import StickerItem
@@ -23,6 +28,7 @@ from core.services.sticker.item import StickerItemService
 from core.services.superredis import RedisService
 from core.services.user import UserService
 from core.utils.misc import batched
+from core.utils.sticker import iter_sticker_dom_ownerships
 from indexer_stickers.indexers.stickerdom import StickerDomService
 from indexer_stickers.settings import stickers_indexer_settings
 
@@ -167,11 +173,9 @@ class IndexerStickerItemAction(BaseAction):
         logger.info("Successfully updated collections")
         return collections
 
-    async def _get_updated_ownership_info(
-        self, collection_id: int
-    ) -> ExternalStickerDomCollectionOwnershipDTO | None:
+    async def _get_updated_ownership_info(self, collection_id: int) -> str | None:
         """
-        Fetch and return updated collection ownership information if it has changed.
+        Fetch and return updated raw collection ownership information if it has changed.
 
         This method retrieves the current metadata for a collection and compares it with cached metadata.
         If the metadata has not changed, the method skips the update and returns None. Otherwise, it fetches
@@ -180,7 +184,7 @@ class IndexerStickerItemAction(BaseAction):
 
         :param collection_id: Unique identifier of the sticker collection for which ownership information
             is required.
-        :return: Updated ownership information for the collection or None if metadata is unchanged.
+        :return: Decrypted ownership information for the collection or None if metadata is unchanged.
         """
         metadata = await self.sticker_dom_service.fetch_collection_ownership_metadata(
             collection_id=collection_id
@@ -234,7 +238,7 @@ class IndexerStickerItemAction(BaseAction):
             batch processing of the given collection.
         """
         if (
-            new_items := await self._get_updated_ownership_info(
+            raw_ownership_data := await self._get_updated_ownership_info(
                 collection_id=collection_dto.id
             )
         ) is None:
@@ -258,25 +262,70 @@ class IndexerStickerItemAction(BaseAction):
             character.external_id: character.id for character in characters
         }
 
-        new_internal_items = self.external_sticker_action.map_external_data_to_internal(
-            collection_id=collection.id,
-            items=new_items.ownership_data,
-            characters_id_by_external_id=character_id_by_external_id,
+        snapshot = self.external_sticker_action.get_ownership_snapshot(
+            self._iter_internal_items(
+                collection_id=collection.id,
+                raw_ownership_data=raw_ownership_data,
+                characters_id_by_external_id=character_id_by_external_id,
+            )
+        )
+        previous_snapshot = self._get_ownership_snapshot(collection_id=collection.id)
+        now = time.time()
+        is_full_run = self.external_sticker_action.is_full_ownership_run(
+            previous_snapshot, now=now
+        )
+        full_run_at = now if is_full_run else previous_snapshot.full_run_at
+        previous_chunks = previous_snapshot.chunks if previous_snapshot else {}
+        changed_chunk_keys = {
+            chunk_key
+            for chunk_key in snapshot.keys() | previous_chunks.keys()
+            if snapshot.get(chunk_key) != previous_chunks.get(chunk_key)
+        }
+        logger.info(
+            f"{len(changed_chunk_keys)} of {len(snapshot)} ownership chunks changed "
+            f"for collection {collection.id!r} ({is_full_run=})."
+        )
+
+        # Instances of the processed items are kept to find the burned items.
+        # Full runs check whole characters, incremental runs check changed chunks only,
+        # including the ones that have no items anymore.
+        current_instances: dict[tuple[int, int | None], set[int]] = defaultdict(set)
+        if not is_full_run:
+            for chunk_key in changed_chunk_keys:
+                character_id, chunk_index = map(int, chunk_key.split(":"))
+                current_instances[(character_id, chunk_index)] = set()
+
+        changed_items = (
+            item
+            for item in self._iter_internal_items(
+                collection_id=collection.id,
+                raw_ownership_data=raw_ownership_data,
+                characters_id_by_external_id=character_id_by_external_id,
+            )
+            if is_full_run
+            or self.external_sticker_action.get_snapshot_chunk_key(
+                self.external_sticker_action.get_snapshot_chunk(
+                    item.character_id, item.instance
+                )
+            )
+            in changed_chunk_keys
         )
-        # WARNING!!!
-        # This has to be done to free up some RAM since there could be hundreds of thousands/millions of records
-        # Don't use this object later, or it'll cause a RuntimeError
-        del new_items
-
-        for batch_start in range(
-            0,
-            len(new_internal_items),
+
+        for batch in batched(
+            changed_items,
             stickers_indexer_settings.sticker_dom_batch_processing_size,
         ):
-            batch = new_internal_items[
-                batch_start : batch_start
-                + stickers_indexer_settings.sticker_dom_batch_processing_size
-            ]
+            for new_item in batch:
+                chunk_index = (
+                    None
+                    if is_full_run
+                    else self.external_sticker_action.get_snapshot_chunk(
+                        new_item.character_id, new_item.instance
+                    )[1]
+                )
+                current_instances[(new_item.character_id, chunk_index)].add(
+                    new_item.instance
+                )
 
             # Query previous items by the internal IDs (avoids mismatch between external and internal ids).
             previous_items_ownership = {
@@ -348,16 +397,58 @@ class IndexerStickerItemAction(BaseAction):
             # as there is another check on the caller if the yield set is not empty
             yield updated_users_ids
 
+        # The buffer is fully consumed, no need to keep it until the cleanup is done
+        del raw_ownership_data, changed_items
+
         async for _batch in self.clean_burned_items(
-            collection_id=collection.id, current_items=new_internal_items
+            collection_id=collection.id,
+            current_instances=current_instances,
         ):
             if _batch:
                 yield _batch
 
+        # Only store the snapshot once all the changes are persisted,
+        # otherwise failed chunks would be skipped on the next run
+        self.redis_service.set(
+            self.external_sticker_action.get_snapshot_cache_key(
+                collection_id=collection.id
+            ),
+            StickerOwnershipSnapshotDTO(
+                chunks=snapshot, full_run_at=full_run_at
+            ).model_dump_json(),
+            ex=STICKER_OWNERSHIP_SNAPSHOT_TTL,
+        )
+
+    def _iter_internal_items(
+        self,
+        collection_id: int,
+        raw_ownership_data: str,
+        characters_id_by_external_id: dict[int, int],
+    ) -> Iterator[StickerItemDTO]:
+        # Items are decoded and mapped lazily, batch by batch,
+        # since there could be hundreds of thousands/millions of records.
+        return self.external_sticker_action.map_external_data_to_internal(
+            collection_id=collection_id,
+            items=iter_sticker_dom_ownerships(raw_ownership_data),
+            characters_id_by_external_id=characters_id_by_external_id,
+        )
+
+    def _get_ownership_snapshot(
+        self, collection_id: int
+    ) -> StickerOwnershipSnapshotDTO | None:
+        cached_snapshot = self.redis_service.get(
+            self.external_sticker_action.get_snapshot_cache_key(
+                collection_id=collection_id
+            )
+        )
+        return self.external_sticker_action.parse_ownership_snapshot(
+            collection_id=collection_id, cached_snapshot=cached_snapshot
+        )
+
     async def clean_burned_items(
         self,
         collection_id: int,
-        current_items: list[StickerItemDTO],
+        current_instances: dict[tuple[int, int | None], set[int]],
     ) -> AsyncGenerator[set[int], None]:
         """
         Cleans up the burned items from a sticker collection by comparing current items with
@@ -365,31 +456,34 @@ class IndexerStickerItemAction(BaseAction):
         and determines the Telegram user IDs associated with the removed items.
 
         This function yields the Telegram user IDs for which the items were removed
-        after processing each character's items.
+        after processing each character's items or snapshot chunk.
 
         :param collection_id: The ID of the collection from which the items belong.
-        :param current_items: A list of current items represented by StickerItemDTO objects.
+        :param current_instances: Instances of the current items grouped by the internal character ID
+            and the snapshot chunk index. If the chunk index is None, all the items of the character are checked.
         :return: An asynchronous generator that yields sets of Telegram user IDs associated with removed items.
         """
-        # Group items by character_ids
-        items_by_characters: dict[int, set[str]] = defaultdict(set)
-        for item in current_items:
-            items_by_characters[item.character_id].add(item.id)
-
-        for character_id, current_ids in items_by_characters.items():
+        for (character_id, chunk_index), instances in current_instances.items():
             # Load all the previously existed records
-            # but only fetch ID and Telegram User ID
-            all_previous_ids = {
-                _item.id
-                for _item in self.sticker_item_service.get_all(
-                    collection_id=collection_id,
-                    character_id=character_id,
-                    _load_attributes=[StickerItem.id],
-                )
-            }
+            # but only fetch ID and instance
+            previous_items = self.sticker_item_service.get_all(
+                collection_id=collection_id,
+                character_id=character_id,
+                instance_range=(
+                    (
+                        chunk_index * STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE,
+                        (chunk_index + 1) * STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE,
+                    )
+                    if chunk_index is not None
+                    else None
+                ),
+                _load_attributes=[StickerItem.id, StickerItem.instance],
+            )
 
             # Get a set of removed keys
-            removed_item_ids = all_previous_ids - current_ids
+            removed_item_ids = {
+                _item.id for _item in previous_items if _item.instance not in instances
+            }
 
             if removed_item_ids:
                 logger.warning(
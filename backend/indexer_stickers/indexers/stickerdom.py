@@ -4,7 +4,6 @@ from httpx import AsyncClient, Timeout
 
 from core.constants import REQUEST_TIMEOUT, READ_TIMEOUT, CONNECT_TIMEOUT
 from core.dtos.sticker import (
-    ExternalStickerDomCollectionOwnershipDTO,
     StickerDomCollectionOwnershipMetadataDTO,
     StickerDomCollectionWithCharacters,
 )
@@ -101,19 +100,18 @@ class StickerDomService:
     @staticmethod
     async def fetch_collection_ownership_data(
         metadata: StickerDomCollectionOwnershipMetadataDTO,
-    ) -> ExternalStickerDomCollectionOwnershipDTO:
+    ) -> str:
         """
         Fetch the collection ownership data asynchronously for a given metadata.
 
         This function performs an encrypted data fetch operation using HTTP GET
         request and decrypts the received bucket data with AES-GCM encryption.
-        It processes the decrypted raw data into a structured DTO object for
-        further use.
+        The decrypted data is returned as is, so it could be decoded lazily
+        with `iter_sticker_dom_ownerships`.
 
         :param metadata: Object containing metadata needed to fetch and decrypt
                          the collection ownership data.
-        :return: Structured data transfer object (DTO) containing decrypted
-                 and parsed ownership data.
+        :return: Decrypted ownership data of the collection.
         :raises HTTPError: If the request to the metadata URL fails.
         :raises ValueError: If decryption of the data fails due to an invalid
                             nonce, ciphertext, or tag.
@@ -135,7 +133,4 @@ class StickerDomService:
                 dek=metadata.plain_dek,
                 tag=tag,
             )
-            return ExternalStickerDomCollectionOwnershipDTO.from_raw(
-                raw_collections_data,
-                collection_id=metadata.collection_id,
-            )
+            return raw_collections_data.decode("utf-8")
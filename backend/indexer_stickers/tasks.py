@@ -5,6 +5,7 @@ from celery.utils.log import get_task_logger
 from core.actions.sticker import StickerCollectionAction
 from core.constants import UPDATED_STICKERS_USER_IDS, CELERY_STICKER_FETCH_QUEUE_NAME
 from core.dtos.sticker import StickerCollectionDTO
+from core.services.chat.eligibility import EligibilitySummaryCacheService
 from core.services.db import DBService
 from indexer_stickers.actions import IndexerStickerItemAction
 from indexer_stickers.celery_app import app
@@ -44,6 +45,9 @@ async def get_sticker_ownership_details(collection_id: int) -> None:
                 action.redis_service.add_to_set(
                     UPDATED_STICKERS_USER_IDS, *targeted_users_ids
                 )
+                EligibilitySummaryCacheService(
+                    action.redis_service
+                ).bump_sticker_versions(targeted_users_ids)
 
 
 @app.task(
@@ -28,6 +28,16 @@ def create_app() -> Celery:
                     "schedule": crontab(minute="*/3"),  # Every 3 minutes
                     "options": {"queue": CELERY_SYSTEM_QUEUE_NAME},
                 },
+                "refresh-chat-members-counters": {
+                    "task": "refresh-chat-members-counters",
+                    "schedule": crontab(minute="*/1"),  # Every minute
+                    "options": {"queue": CELERY_SYSTEM_QUEUE_NAME},
+                },
+                "reconcile-chat-members-counters": {
+                    "task": "reconcile-chat-members-counters",
+                    "schedule": crontab(hour="*/1", minute="15"),  # Every hour
+                    "options": {"queue": CELERY_SYSTEM_QUEUE_NAME},
+                },
                 "load-noticed-wallets": {
                     "task": "load-noticed-wallets",
                     "schedule": crontab(minute="*/1"),  # Every minute
@@ -0,0 +1,55 @@
+"""
+Per-call latency benchmark of the Bot API client.
+
+Compares a new client per call (a new connection and TLS handshake every time)
+with the client shared by the process, which reuses keep-alive connections.
+Calls `getMe`, so it doesn't change anything on the bot side.
+
+Usage:
+    TELEGRAM_BOT_TOKEN=<token> python -m tests.benchmarks.bot_api_latency --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from community_manager.services.bot_api import TelegramBotApiService
+
+
+async def measure(shared: bool, requests: int) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        async with TelegramBotApiService(shared=shared) as service:
+            await service.bot.get_me()
+        latencies.append(time.perf_counter() - started_at)
+    return latencies
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+async def run(args: argparse.Namespace) -> None:
+    # Warm up DNS resolution and the shared client before measuring
+    await measure(shared=True, requests=1)
+
+    for title, shared in (("client per call", False), ("shared client", True)):
+        latencies = await measure(shared=shared, requests=args.requests)
+        print(f"{title}: {len(latencies)} requests")
+        print(f"  mean: {statistics.mean(latencies) * 1000:.1f} ms")
+        for percent in (50, 95, 99):
+            print(f"  p{percent}: {percentile(latencies, percent) * 1000:.1f} ms")
+
+    await TelegramBotApiService.close_shared()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
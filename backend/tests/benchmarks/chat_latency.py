@@ -0,0 +1,85 @@
+"""
+Latency load test for the chat page endpoint.
+
+Sends concurrent requests to the running API and reports latency percentiles,
+so the sync and async database paths can be compared under the same load.
+
+Usage:
+    python -m tests.benchmarks.chat_latency --base-url http://localhost:8000/api \
+        --slug my-chat --token <access token> --concurrency 50 --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run_worker(
+    client: httpx.AsyncClient,
+    path: str,
+    requests_queue: asyncio.Queue[int],
+    latencies: list[float],
+    errors: list[int],
+) -> None:
+    while True:
+        try:
+            requests_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+        started_at = time.perf_counter()
+        response = await client.get(path)
+        latencies.append(time.perf_counter() - started_at)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1]
+
+
+async def run(args: argparse.Namespace) -> None:
+    requests_queue: asyncio.Queue[int] = asyncio.Queue()
+    for idx in range(args.requests):
+        requests_queue.put_nowait(idx)
+
+    latencies: list[float] = []
+    errors: list[int] = []
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {args.token}"},
+        limits=httpx.Limits(max_connections=args.concurrency),
+        timeout=60,
+    ) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(
+                run_worker(
+                    client, f"/chats/{args.slug}", requests_queue, latencies, errors
+                )
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started_at
+
+    print(f"requests: {len(latencies)}, errors: {len(errors)}")
+    print(f"throughput: {len(latencies) / elapsed:.1f} req/s")
+    for percent in (50, 95, 99):
+        print(f"p{percent}: {percentile(latencies, percent) * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", required=True)
+    parser.add_argument("--slug", required=True)
+    parser.add_argument("--token", required=True)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2_000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
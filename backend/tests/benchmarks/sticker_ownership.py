@@ -0,0 +1,142 @@
+"""
+Peak memory benchmark for the StickerDom ownership ingestion.
+
+Compares the full decoding of the bucket into the DTOs with the streaming decoding
+used by the stickers indexer. Each mode runs in a separate process, so peak RSS
+values don't affect each other.
+
+Usage:
+    python -m tests.benchmarks.sticker_ownership --items 2000000
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+from collections import defaultdict
+import tempfile
+import time
+from pathlib import Path
+
+from core.actions.sticker.external import ExternalStickerAction
+from core.dtos.sticker import StickerItemDTO
+from core.utils.misc import batched
+from core.utils.sticker import iter_sticker_dom_ownerships
+
+
+COLLECTION_ID = 1
+CHARACTERS_COUNT = 20
+INSTANCES_PER_USER = 4
+BATCH_SIZE = 1_000
+
+
+def build_bucket(items_count: int) -> str:
+    items_per_character = items_count // CHARACTERS_COUNT
+    data = {}
+    for character_id in range(1, CHARACTERS_COUNT + 1):
+        instances_per_user = []
+        for instance in range(1, items_per_character + 1, INSTANCES_PER_USER):
+            user_id = 1_000_000 + instance
+            instances_per_user.append(
+                {
+                    str(user_id): list(
+                        range(
+                            instance,
+                            min(instance + INSTANCES_PER_USER, items_per_character + 1),
+                        )
+                    )
+                }
+            )
+        data[str(character_id)] = instances_per_user
+    return json.dumps({"timestamp": "2025-01-01T00:00:00Z", "data": data})
+
+
+def get_peak_rss_mb() -> float:
+    status_path = Path("/proc/self/status")
+    if status_path.exists():
+        # Unlike ru_maxrss, VmHWM is not inherited from the parent process on Linux
+        for line in status_path.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+
+    # macOS reports bytes
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
+
+
+def run_full(raw: str) -> int:
+    json_data = json.loads(raw)
+    items = [
+        StickerItemDTO(
+            id=f"{COLLECTION_ID}_{character_id}_{instance_id}",
+            collection_id=COLLECTION_ID,
+            character_id=character_id,
+            telegram_user_id=user_id,
+            instance=instance_id,
+        )
+        for character_id, instances_per_user in json_data["data"].items()
+        for user_instances in instances_per_user
+        for user_id, instances in user_instances.items()
+        for instance_id in instances
+    ]
+    return len(items)
+
+
+def run_streaming(raw: str) -> int:
+    items = ExternalStickerAction.map_external_data_to_internal(
+        collection_id=COLLECTION_ID,
+        items=iter_sticker_dom_ownerships(raw),
+        characters_id_by_external_id={
+            character_id: character_id
+            for character_id in range(1, CHARACTERS_COUNT + 1)
+        },
+    )
+    # Mirrors the indexer, which keeps instances of the whole collection for the cleanup
+    current_instances_by_character: dict[int, set[int]] = defaultdict(set)
+    count = 0
+    for batch in batched(items, BATCH_SIZE):
+        for item in batch:
+            current_instances_by_character[item.character_id].add(item.instance)
+        count += len(batch)
+    return count
+
+
+def measure(mode: str, bucket_path: Path, results: multiprocessing.Queue) -> None:
+    raw = bucket_path.read_text()
+    baseline_rss = get_peak_rss_mb()
+    started_at = time.perf_counter()
+    processed = {"full": run_full, "streaming": run_streaming}[mode](raw)
+    results.put(
+        (
+            mode,
+            processed,
+            time.perf_counter() - started_at,
+            get_peak_rss_mb() - baseline_rss,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=2_000_000)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The bucket is built once, outside the measured processes
+        bucket_path = Path(tmp_dir) / "bucket.json"
+        bucket_path.write_text(build_bucket(args.items))
+
+        for mode in ("full", "streaming"):
+            process = context.Process(target=measure, args=(mode, bucket_path, results))
+            process.start()
+            mode, processed, elapsed, peak_rss_mb = results.get()
+            process.join()
+            print(
+                f"{mode:>10}: {processed} items in {elapsed:.2f}s, "
+                f"peak RSS above the raw bucket: {peak_rss_mb:.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
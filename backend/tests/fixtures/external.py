@@ -39,3 +39,89 @@ def mock_telegram_bot_api_service(mocker):
     mock_class.return_value = mock_instance
 
     return mock_instance
+
+
+@pytest.fixture(autouse=True)
+def mock_rules_plan_cache_redis(mocker):
+    """
+    Mock Redis used by the rules plan cache, so every test compiles plans
+    from its own database state instead of reusing plans cached by previous runs.
+
+    The in-process cache is cleared before and after each test for the same reason.
+    """
+    from core.services.chat.rule.plan import TelegramChatRulesPlanCacheService
+
+    mock_redis_service = MagicMock()
+    mock_redis_service.get.return_value = None
+    mocker.patch(
+        "core.services.chat.rule.plan.RedisService", return_value=mock_redis_service
+    )
+
+    TelegramChatRulesPlanCacheService.clear_local()
+    yield mock_redis_service
+    TelegramChatRulesPlanCacheService.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def mock_user_snapshot_redis(mocker):
+    """
+    Mock Redis used to publish the user snapshot invalidations
+    and keep the in-process snapshots cache isolated between tests.
+    """
+    from core.services.user_snapshot import UserSnapshotCacheService
+
+    mock_redis_service = MagicMock()
+    mocker.patch(
+        "core.services.user_snapshot.RedisService", return_value=mock_redis_service
+    )
+
+    UserSnapshotCacheService.clear_local()
+    yield mock_redis_service
+    UserSnapshotCacheService.clear_local()
+
+
+@pytest.fixture(autouse=True)
+def mock_eligibility_summary_cache_redis(mocker):
+    """
+    Mock Redis used by the eligibility summaries cache, so every test computes
+    summaries from its own database state.
+    """
+    mock_redis_service = MagicMock()
+    mock_redis_service.get_many.side_effect = lambda *keys: [None] * len(keys)
+    mocker.patch(
+        "core.services.chat.eligibility.RedisService", return_value=mock_redis_service
+    )
+    return mock_redis_service
+
+
+@pytest.fixture(autouse=True)
+def mock_authorization_async_redis(mocker):
+    """
+    Mock async Redis used by the authorization action running in the event loop,
+    so every test compiles plans and computes summaries from its own database state.
+    """
+    mock_redis_service = MagicMock()
+    mock_redis_service.get = AsyncMock(return_value=None)
+    mock_redis_service.get_many = AsyncMock(
+        side_effect=lambda *keys: [None] * len(keys)
+    )
+    mock_redis_service.set = AsyncMock()
+    mocker.patch(
+        "core.actions.authorization.AsyncRedisService", return_value=mock_redis_service
+    )
+    return mock_redis_service
+
+
+@pytest.fixture(autouse=True)
+def mock_external_source_fetch_state_redis(mocker):
+    """
+    Mock Redis used to keep the external sources fetch states,
+    so every test fetches the sources in full.
+    """
+    mock_redis_service = MagicMock()
+    mock_redis_service.get_many.side_effect = lambda *keys: [None] * len(keys)
+    mocker.patch(
+        "core.services.chat.rule.whitelist.RedisService",
+        return_value=mock_redis_service,
+    )
+    return mock_redis_service
@@ -105,6 +105,7 @@ async def test_create_chat_parallel_execution(mocker):
         invite_link="https://t.me/+new_invite_link",  # Updated invite link
         is_full_control=False,
         is_enabled=True,
+        members_count=10,
     )
     created_chat_dto = TelegramChatDTO(
         id=chat_id,
@@ -121,9 +122,6 @@ async def test_create_chat_parallel_execution(mocker):
     )
     action._create = AsyncMock(return_value=created_chat_dto)
 
-    # Mock services calls
-    mock_user_service.get_members_count.return_value = 10
-
     # Event
     event = MagicMock(spec=ChatAdminChangeEventBuilder.Event)
     event.is_self = True
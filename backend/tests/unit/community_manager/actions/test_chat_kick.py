@@ -45,3 +45,6 @@ async def test_kick_chat_member_normal_user(db_session):
         await action.kick_chat_member(chat_user)
 
         mock_service_instance.kick_chat_member.assert_awaited_once()
+        action.telegram_chat_user_service.delete_batch.assert_called_once_with(
+            chat_id=1, user_ids=[1]
+        )
@@ -7,8 +7,10 @@ from community_manager.actions.chat import (
     CommunityManagerTaskChatAction,
     CommunityManagerUserChatAction,
 )
-from core.dtos.chat.rule.whitelist import WhitelistRuleItemsDifferenceDTO
-from core.services.chat.rule.whitelist import TelegramChatExternalSourceService
+from core.dtos.chat.rule.whitelist import (
+    ExternalSourceFetchStateDTO,
+    WhitelistRuleCPO,
+)
 from tests.factories.chat import TelegramChatFactory, TelegramChatUserFactory
 from tests.factories.rule.external_source import (
     TelegramChatWhitelistExternalSourceFactory,
@@ -43,29 +45,28 @@ async def test_refresh_external_sources__removed_user_is_kicked(
     )
     db_session.flush()
 
-    mock_validate = AsyncMock(
-        return_value=WhitelistRuleItemsDifferenceDTO(
-            previous=[1001, 1002],
-            current=[1001],
+    mock_fetch = AsyncMock(
+        return_value=(
+            WhitelistRuleCPO(users=[1001]),
+            ExternalSourceFetchStateDTO(fingerprint="fingerprint", content_hash="hash"),
         )
     )
 
     action = CommunityManagerTaskChatAction(db_session)
 
-    with patch.object(
-        TelegramChatExternalSourceService,
-        "validate_external_source",
-        mock_validate,
+    with patch(
+        "core.services.chat.rule.whitelist.fetch_dynamic_allowed_members_if_modified",
+        mock_fetch,
     ), patch.object(
         CommunityManagerUserChatAction,
-        "kick_chat_member",
+        "kick_chat_members",
         new_callable=AsyncMock,
     ) as mock_kick:
         await action.refresh_external_sources()
 
         # User 1002 was removed from the API response and should be kicked
         mock_kick.assert_awaited_once()
-        kicked_member = mock_kick.await_args.args[0]
+        [kicked_member] = mock_kick.await_args.args[0]
         assert kicked_member.user.telegram_id == 1002
         assert kicked_member.chat_id == chat.id
 
@@ -94,24 +95,111 @@ async def test_refresh_external_sources__no_removed_users__no_kicks(
     )
     db_session.flush()
 
-    mock_validate = AsyncMock(
-        return_value=WhitelistRuleItemsDifferenceDTO(
-            previous=[1001],
-            current=[1001],
+    mock_fetch = AsyncMock(
+        return_value=(
+            WhitelistRuleCPO(users=[1001]),
+            ExternalSourceFetchStateDTO(fingerprint="fingerprint", content_hash="hash"),
         )
     )
 
     action = CommunityManagerTaskChatAction(db_session)
 
-    with patch.object(
-        TelegramChatExternalSourceService,
-        "validate_external_source",
-        mock_validate,
+    with patch(
+        "core.services.chat.rule.whitelist.fetch_dynamic_allowed_members_if_modified",
+        mock_fetch,
     ), patch.object(
         CommunityManagerUserChatAction,
-        "kick_chat_member",
+        "kick_chat_members",
         new_callable=AsyncMock,
     ) as mock_kick:
         await action.refresh_external_sources()
 
         mock_kick.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_external_sources__not_modified__content_kept(
+    db_session: Session,
+):
+    chat = TelegramChatFactory.with_session(db_session).create(is_full_control=True)
+    group = TelegramChatRuleGroupFactory.with_session(db_session).create(chat=chat)
+    source = TelegramChatWhitelistExternalSourceFactory.with_session(db_session).create(
+        chat=chat,
+        group=group,
+        content=[1001, 1002],
+        is_enabled=True,
+        url="https://example.com/api/whitelist",
+    )
+    db_session.flush()
+
+    mock_fetch = AsyncMock(
+        return_value=(
+            None,
+            ExternalSourceFetchStateDTO(fingerprint="fingerprint", content_hash="hash"),
+        )
+    )
+
+    action = CommunityManagerTaskChatAction(db_session)
+
+    with patch(
+        "core.services.chat.rule.whitelist.fetch_dynamic_allowed_members_if_modified",
+        mock_fetch,
+    ), patch.object(
+        CommunityManagerUserChatAction,
+        "kick_ineligible_chat_members",
+        new_callable=AsyncMock,
+    ) as mock_kick:
+        await action.refresh_external_sources()
+
+        mock_fetch.assert_awaited_once()
+        mock_kick.assert_not_awaited()
+
+    db_session.refresh(source)
+    assert source.content == [1001, 1002]
+
+
+@pytest.mark.asyncio
+async def test_refresh_external_sources__other_chats_of_removed_user_not_rechecked(
+    db_session: Session,
+):
+    chat, other_chat = TelegramChatFactory.with_session(db_session).create_batch(
+        2, is_full_control=True
+    )
+    group = TelegramChatRuleGroupFactory.with_session(db_session).create(chat=chat)
+    user_removed = UserFactory.with_session(db_session).create(telegram_id=1002)
+    for target_chat in (chat, other_chat):
+        TelegramChatUserFactory.with_session(db_session).create(
+            chat=target_chat, user=user_removed, is_managed=True
+        )
+
+    TelegramChatWhitelistExternalSourceFactory.with_session(db_session).create(
+        chat=chat,
+        group=group,
+        content=[1001, 1002],
+        is_enabled=True,
+        url="https://example.com/api/whitelist",
+    )
+    db_session.flush()
+
+    mock_fetch = AsyncMock(
+        return_value=(
+            WhitelistRuleCPO(users=[1001]),
+            ExternalSourceFetchStateDTO(fingerprint="fingerprint", content_hash="hash"),
+        )
+    )
+
+    action = CommunityManagerTaskChatAction(db_session)
+
+    with patch(
+        "core.services.chat.rule.whitelist.fetch_dynamic_allowed_members_if_modified",
+        mock_fetch,
+    ), patch.object(
+        CommunityManagerUserChatAction,
+        "kick_ineligible_chat_members",
+        new_callable=AsyncMock,
+    ) as mock_kick:
+        await action.refresh_external_sources()
+
+        mock_kick.assert_awaited_once()
+        checked_members = mock_kick.await_args.kwargs["chat_members"]
+        assert [member.chat_id for member in checked_members] == [chat.id]
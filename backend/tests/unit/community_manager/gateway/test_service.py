@@ -1,9 +1,11 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
 from community_manager.gateway.service import TelegramGatewayService
+from core.constants import GATEWAY_INDEX_BATCH_SIZE, GATEWAY_PARTICIPANTS_PAGE_SIZE
 from core.dtos.gateway import IndexChatCommand
 
 
@@ -24,9 +26,7 @@ def gateway_service(mocker: MockerFixture) -> TelegramGatewayService:
     telethon_service = MagicMock()
     service = TelegramGatewayService(telethon_service=telethon_service)
     mocker.patch("community_manager.gateway.service.SessionLocal", autospec=False)
-    mocker.patch(
-        "community_manager.gateway.service.TelegramUserDTO.from_telethon_user"
-    )
+    mocker.patch("community_manager.gateway.service.TelegramUserDTO.from_telethon_user")
     mocker.patch(
         "community_manager.gateway.service.is_chat_participant_admin",
         return_value=False,
@@ -70,6 +70,9 @@ async def test_handle_index_chat_skips_cleanup_when_per_user_error(
     gateway_service: TelegramGatewayService, mocker: MockerFixture
 ) -> None:
     mock_user_action_cls = mocker.patch("community_manager.gateway.service.UserAction")
+    mock_user_action_cls.return_value.bulk_create_or_update.side_effect = RuntimeError(
+        "bulk boom"
+    )
     mock_user_action_cls.return_value.create_or_update.side_effect = RuntimeError(
         "boom"
     )
@@ -89,3 +92,189 @@ async def test_handle_index_chat_skips_cleanup_when_per_user_error(
 
     mock_chat_user_service.delete_stale_participants.assert_not_called()
     mock_app.send_task.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_index_chat_falls_back_to_per_user_writes(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    mock_user_action = mocker.patch(
+        "community_manager.gateway.service.UserAction"
+    ).return_value
+    mock_user_action.bulk_create_or_update.side_effect = RuntimeError("bulk boom")
+    mock_chat_user_service = mocker.patch(
+        "community_manager.gateway.service.TelegramChatUserService"
+    ).return_value
+    mock_app = mocker.patch("community_manager.gateway.service.app")
+
+    gateway_service.telethon_service.get_participants.return_value = _async_iter(
+        [_participant(101), _participant(202)]
+    )
+
+    await gateway_service._handle_index_chat(
+        IndexChatCommand(chat_id=-100, cleanup=True)
+    )
+
+    assert mock_user_action.create_or_update.call_count == 2
+    assert mock_chat_user_service.create_or_update.call_count == 2
+    # All users were stored one by one, so the active users list is complete
+    mock_chat_user_service.delete_stale_participants.assert_called_once()
+    mock_app.send_task.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_index_chat_writes_participants_in_batches(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    mock_user_action = mocker.patch(
+        "community_manager.gateway.service.UserAction"
+    ).return_value
+    mock_user_action.bulk_create_or_update.side_effect = lambda telegram_users: {
+        telegram_user.id: telegram_user.id for telegram_user in telegram_users
+    }
+    mocker.patch(
+        "community_manager.gateway.service.TelegramUserDTO.from_telethon_user",
+        side_effect=lambda participant: participant,
+    )
+    mock_chat_user_service = mocker.patch(
+        "community_manager.gateway.service.TelegramChatUserService"
+    ).return_value
+    mocker.patch("community_manager.gateway.service.app")
+
+    participants_count = GATEWAY_INDEX_BATCH_SIZE + 1
+    gateway_service.telethon_service.get_participants.return_value = _async_iter(
+        [_participant(user_id) for user_id in range(participants_count)]
+    )
+
+    await gateway_service._handle_index_chat(
+        IndexChatCommand(chat_id=-100, cleanup=True)
+    )
+
+    assert mock_user_action.bulk_create_or_update.call_count == 2
+    mock_user_action.create_or_update.assert_not_called()
+    active_user_ids = mock_chat_user_service.delete_stale_participants.call_args[1][
+        "active_user_ids"
+    ]
+    assert sorted(active_user_ids) == list(range(participants_count))
+
+
+@pytest.mark.asyncio
+async def test_handle_index_chat_serializes_commands_of_same_chat(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    release = asyncio.Event()
+    indexed_chat_ids = []
+
+    async def _index_chat(command: IndexChatCommand) -> None:
+        indexed_chat_ids.append(command.chat_id)
+        await release.wait()
+
+    mocker.patch.object(gateway_service, "_index_chat", side_effect=_index_chat)
+
+    tasks = [
+        asyncio.create_task(
+            gateway_service._handle_index_chat(IndexChatCommand(chat_id=chat_id))
+        )
+        for chat_id in (-100, -100, -200)
+    ]
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    # The second command of the same chat waits for the first one
+    assert sorted(indexed_chat_ids) == [-200, -100]
+
+    release.set()
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+
+    assert sorted(indexed_chat_ids) == [-200, -100, -100]
+    # Released locks are not kept
+    assert gateway_service._chat_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_start_processes_commands_concurrently(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    gateway_service.concurrency = 2
+    commands = [
+        ("queue", IndexChatCommand(chat_id=-100).model_dump_json()),
+        ("queue", IndexChatCommand(chat_id=-200).model_dump_json()),
+    ]
+
+    async def _blpop(*args, **kwargs):
+        if commands:
+            return commands.pop(0)
+        await asyncio.sleep(0)
+        return None
+
+    gateway_service.redis_service = mocker.AsyncMock()
+    gateway_service.redis_service.blpop.side_effect = _blpop
+
+    started_chat_ids = []
+    both_started = asyncio.Event()
+
+    async def _handle_index_chat(command: IndexChatCommand) -> None:
+        started_chat_ids.append(command.chat_id)
+        if len(started_chat_ids) == 2:
+            both_started.set()
+        # Would block forever if commands were processed one at a time
+        await both_started.wait()
+        gateway_service.stop()
+
+    mocker.patch.object(
+        gateway_service, "_handle_index_chat", side_effect=_handle_index_chat
+    )
+
+    await asyncio.wait_for(gateway_service.start(), timeout=5)
+
+    assert sorted(started_chat_ids) == [-200, -100]
+    gateway_service.redis_service.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_does_not_pop_commands_without_free_worker(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    gateway_service.concurrency = 1
+    gateway_service.redis_service = mocker.AsyncMock()
+    gateway_service.redis_service.blpop.return_value = (
+        "queue",
+        IndexChatCommand(chat_id=-100).model_dump_json(),
+    )
+    release = asyncio.Event()
+
+    async def _handle_index_chat(command: IndexChatCommand) -> None:
+        await release.wait()
+
+    mocker.patch.object(
+        gateway_service, "_handle_index_chat", side_effect=_handle_index_chat
+    )
+
+    start_task = asyncio.create_task(gateway_service.start())
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    assert gateway_service.redis_service.blpop.await_count == 1
+
+    gateway_service.stop()
+    release.set()
+    await asyncio.wait_for(start_task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_iter_participants_spends_flood_budget_per_page(
+    gateway_service: TelegramGatewayService, mocker: MockerFixture
+) -> None:
+    gateway_service.flood_limiter = mocker.AsyncMock()
+    gateway_service.telethon_service.get_participants.return_value = _async_iter(
+        [_participant(user_id) for user_id in range(GATEWAY_PARTICIPANTS_PAGE_SIZE + 1)]
+    )
+
+    participants = [
+        participant
+        async for participant in gateway_service._iter_participants(chat_id=-100)
+    ]
+
+    assert len(participants) == GATEWAY_PARTICIPANTS_PAGE_SIZE + 1
+    # One page is full and the second one has a single participant
+    assert gateway_service.flood_limiter.acquire.await_count == 2
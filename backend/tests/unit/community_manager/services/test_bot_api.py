@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from community_manager.services.bot_api import TelegramBotApiService
+
+
+@pytest.fixture
+def bot_token(monkeypatch):
+    monkeypatch.setattr(
+        "community_manager.services.bot_api.community_manager_settings.telegram_bot_token",
+        "123456:TEST-TOKEN",
+    )
+
+
+@pytest_asyncio.fixture
+async def shared_bot_cleanup(bot_token):
+    yield
+    await TelegramBotApiService.close_shared()
+
+
+@pytest.mark.asyncio
+async def test_shared_bot_is_reused(shared_bot_cleanup) -> None:
+    async with TelegramBotApiService() as first_service:
+        first_bot = first_service.bot
+
+    async with TelegramBotApiService() as second_service:
+        assert second_service.bot is first_bot
+
+    # Exiting the context must not close the pooled connections
+    session = await first_bot.session.create_session()
+    assert not session.closed
+
+
+@pytest.mark.asyncio
+async def test_shared_bot_is_recreated_in_another_loop(shared_bot_cleanup) -> None:
+    async def get_bot():
+        async with TelegramBotApiService() as service:
+            return service.bot
+
+    current_loop_bot = await get_bot()
+    other_loop_bot = await asyncio.to_thread(asyncio.run, get_bot())
+
+    assert other_loop_bot is not current_loop_bot
+    assert await get_bot() is not current_loop_bot
+
+
+@pytest.mark.asyncio
+async def test_not_shared_bot_is_closed_on_exit(shared_bot_cleanup) -> None:
+    async with TelegramBotApiService(shared=False) as service:
+        session = await service.bot.session.create_session()
+        assert service.bot is not TelegramBotApiService.get_shared_bot()
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_close_shared(bot_token) -> None:
+    bot = TelegramBotApiService.get_shared_bot()
+    session = await bot.session.create_session()
+
+    await TelegramBotApiService.close_shared()
+
+    assert session.closed
+    assert TelegramBotApiService.get_shared_bot() is not bot
+    await TelegramBotApiService.close_shared()
@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+from aiolimiter import AsyncLimiter
+from pytest_mock import MockerFixture
+
+from community_manager.dtos.chat import KickTargetDTO
+from community_manager.services import kick
+from community_manager.services.kick import KickExecutor
+
+
+@pytest.fixture(autouse=True)
+def isolated_limiters(mocker: MockerFixture) -> None:
+    """Limiters are shared by the process, keep each test within its own event loop"""
+    mocker.patch.object(kick, "_global_limiter", AsyncLimiter(1_000, 1))
+    mocker.patch.object(kick, "_chat_limiters", {})
+
+
+def build_target(user_id: int, chat_id: int = 1, **kwargs) -> KickTargetDTO:
+    return KickTargetDTO(
+        chat_id=chat_id,
+        chat_title="Test Chat",
+        user_id=user_id,
+        telegram_id=1000 + user_id,
+        **{"allows_write_to_pm": False, **kwargs},
+    )
+
+
+@pytest.mark.asyncio
+async def test_kicks_run_concurrently() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def kick_chat_member(**kwargs) -> bool:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    bot_service = MagicMock()
+    bot_service.kick_chat_member = AsyncMock(side_effect=kick_chat_member)
+    executor = KickExecutor(
+        bot_service, concurrency=5, global_limiter=AsyncLimiter(1_000, 1)
+    )
+
+    result = await executor.kick(
+        [build_target(user_id, chat_id=user_id) for user_id in range(20)]
+    )
+
+    assert len(result.kicked) == 20
+    assert max_in_flight == 5
+    assert result.kicks_per_second > 0
+    for call in bot_service.kick_chat_member.await_args_list:
+        assert call.kwargs["sleep_on_rate_limit"] is False
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_and_retries_kick() -> None:
+    bot_service = MagicMock()
+    bot_service.kick_chat_member = AsyncMock(
+        side_effect=[
+            TelegramRetryAfter(method=MagicMock(), message="Flood", retry_after=0),
+            True,
+        ]
+    )
+    bot_service.send_message = AsyncMock()
+    executor = KickExecutor(bot_service, concurrency=1)
+
+    result = await executor.kick([build_target(1, allows_write_to_pm=True)])
+
+    assert [target.user_id for target in result.kicked] == [1]
+    assert result.rate_limited_count == 1
+    assert bot_service.kick_chat_member.await_count == 2
+    bot_service.send_message.assert_awaited_once()
+    assert bot_service.send_message.await_args.kwargs["chat_id"] == 1001
+
+
+@pytest.mark.asyncio
+async def test_admins_and_failures_are_reported() -> None:
+    bot_service = MagicMock()
+    bot_service.kick_chat_member = AsyncMock(
+        side_effect=[
+            TelegramBadRequest(method=MagicMock(), message="user is an administrator"),
+            TelegramBadRequest(method=MagicMock(), message="user not found"),
+        ]
+    )
+    executor = KickExecutor(bot_service, concurrency=1)
+
+    result = await executor.kick([build_target(1), build_target(2)])
+
+    assert not result.kicked
+    assert [target.user_id for target in result.admins] == [1]
+    assert [target.user_id for target in result.failed] == [2]
+
+
+@pytest.mark.asyncio
+async def test_executors_share_limiters(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        kick.community_manager_settings, "kick_chat_rate_limit_period", 60
+    )
+    bot_service = MagicMock()
+    bot_service.kick_chat_member = AsyncMock(return_value=True)
+
+    first_executor = KickExecutor(bot_service)
+    second_executor = KickExecutor(bot_service)
+    await first_executor.kick([build_target(1)])
+
+    assert second_executor.global_limiter is first_executor.global_limiter
+    # The chat limiter used by the first run still holds its capacity
+    chat_limiter = kick._chat_limiters[1]
+    await second_executor.kick([build_target(2)])
+    assert kick._chat_limiters[1] is chat_limiter
@@ -0,0 +1,48 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.actions.chat import AsyncTelegramChatAction
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("is_enabled", [True, False])
+async def test_get_with_eligibility_summary_runs_sync_action_over_async_session(
+    mocker: MockerFixture, is_enabled: bool
+) -> None:
+    sync_session = MagicMock()
+    async_session = MagicMock()
+    async_session.run_sync = AsyncMock(side_effect=lambda fn: fn(sync_session))
+    action_class = mocker.patch("core.actions.chat.TelegramChatAction")
+    action = action_class.return_value
+    action._get_by_slug.return_value.is_enabled = is_enabled
+    authorization_action_class = mocker.patch(
+        "core.actions.chat.AsyncAuthorizationAction"
+    )
+    get_user_eligibility_summary = (
+        authorization_action_class.return_value.get_user_eligibility_summary
+    ) = AsyncMock()
+    user = MagicMock()
+
+    result = await AsyncTelegramChatAction(async_session).get_with_eligibility_summary(
+        slug="chat", user=user
+    )
+
+    action_class.assert_called_with(sync_session)
+    action._get_by_slug.assert_called_once_with("chat")
+    chat = action._get_by_slug.return_value
+    if is_enabled:
+        # The summary is fetched outside of the sync session, so the cache is read with the async client
+        authorization_action_class.assert_called_once_with(async_session)
+        get_user_eligibility_summary.assert_awaited_once_with(
+            user=user, chat_id=chat.id
+        )
+        expected_summary = get_user_eligibility_summary.return_value
+    else:
+        get_user_eligibility_summary.assert_not_called()
+        expected_summary = None
+    action._get_with_eligibility_summary.assert_called_once_with(
+        chat, user, expected_summary
+    )
+    assert result is action._get_with_eligibility_summary.return_value
@@ -1,3 +1,5 @@
+import base64
+import json
 from unittest.mock import AsyncMock, MagicMock, Mock
 
 import pytest
@@ -7,8 +9,11 @@ from sqlalchemy.orm import Session
 from telethon.tl.types import ChatAdminRights
 
 from community_manager.actions.chat import CommunityManagerChatAction
-from core.dtos.pagination import PaginationMetadataDTO
+from core.dtos.pagination import PaginationCursorDTO, PaginationMetadataDTO
+from core.enums.chat import CustomTelegramChatOrderingRulesEnum
+from core.exceptions.api import InvalidPaginationCursor
 from core.models.chat import TelegramChat, TelegramChatUser
+from core.services.chat import TelegramChatService
 from tests.factories.rule.group import TelegramChatRuleGroupFactory
 from tests.utils.misc import AsyncIterator
 from core.actions.chat import TelegramChatAction
@@ -71,6 +76,7 @@ def test_get_all__success(db_session: Session) -> None:
         TelegramChatUserFactory.with_session(db_session).create_batch(
             DEFAULT_MANAGED_USERS_PUBLIC_THRESHOLD, chat=chat
         )
+    TelegramChatService(db_session).reconcile_members_counters()
     # The default ordering is by users-count -> ID
     ordered_chats = (
         db_session.query(TelegramChat)
@@ -133,6 +139,7 @@ def test_get_all__pagination__success(
         TelegramChatUserFactory.with_session(db_session).create_batch(
             DEFAULT_MANAGED_USERS_PUBLIC_THRESHOLD, chat=chat
         )
+    TelegramChatService(db_session).reconcile_members_counters()
 
     ordered_chats = sorted(chats, key=lambda _chat: _chat.id)
 
@@ -188,6 +195,7 @@ def test_get_all__sorting__success(db_session: Session, is_ascending: bool) -> N
     TelegramChatUserFactory.with_session(db_session).create(
         chat=chats[0], user=user, is_admin=True
     )
+    TelegramChatService(db_session).reconcile_members_counters()
     ordered_chats = sorted(
         chats, key=lambda chat: (chat.title, chat.id), reverse=not is_ascending
     )
@@ -215,6 +223,87 @@ def test_get_all__sorting__success(db_session: Session, is_ascending: bool) -> N
         assert actual_chat.members_count == len(expected_chat.users)
 
 
+@pytest.mark.parametrize(
+    "is_ascending",
+    [True, False],
+)
+def test_get_all__cursor_pagination__success(
+    db_session: Session, is_ascending: bool
+) -> None:
+    chats = TelegramChatFactory.with_session(db_session).create_batch(7)
+    for idx, chat in enumerate(chats):
+        TelegramChatRuleGroupFactory.with_session(db_session).create(chat=chat)
+        # Every two chats have the same members count to check the ID tiebreaker
+        TelegramChatUserFactory.with_session(db_session).create_batch(
+            DEFAULT_MANAGED_USERS_PUBLIC_THRESHOLD + idx // 2, chat=chat
+        )
+    TelegramChatService(db_session).reconcile_members_counters()
+    members_count_order = 1 if is_ascending else -1
+    expected_chat_ids = [
+        chat.id
+        for chat in sorted(
+            chats,
+            key=lambda _chat: (
+                members_count_order * _chat.members_count,
+                members_count_order * _chat.id,
+            ),
+        )
+    ]
+    sorting_params = TelegramChatOrderingRuleDTO(
+        field=CustomTelegramChatOrderingRulesEnum.USERS_COUNT,
+        is_ascending=is_ascending,
+    )
+    action = TelegramChatAction(db_session)
+
+    chat_ids = []
+    cursor = None
+    while True:
+        result = action.get_all(
+            pagination_params=PaginationMetadataDTO(
+                offset=0, limit=3, include_total_count=True, cursor=cursor
+            ),
+            sorting_params=sorting_params,
+        )
+        assert result.total_count == len(chats)
+        chat_ids.extend(chat.id for chat in result.items)
+        if not (cursor := result.next_cursor):
+            break
+
+    assert chat_ids == expected_chat_ids
+
+
+def test_get_all__cursor_pagination__invalid_cursor(db_session: Session) -> None:
+    action = TelegramChatAction(db_session)
+    cursor = PaginationCursorDTO(
+        field=CustomTelegramChatOrderingRulesEnum.TCV,
+        is_ascending=False,
+        value="0",
+        id=1,
+    ).encode()
+    invalid_value_cursors = [
+        base64.urlsafe_b64encode(
+            json.dumps(
+                {
+                    "field": CustomTelegramChatOrderingRulesEnum.TCV,
+                    "is_ascending": False,
+                    "value": value,
+                    "id": 1,
+                }
+            ).encode()
+        ).decode()
+        for value in ("not-a-number", "NaN", "1e100")
+    ]
+
+    for invalid_cursor in ("not-a-cursor", cursor, *invalid_value_cursors):
+        with pytest.raises(InvalidPaginationCursor):
+            action.get_all(
+                pagination_params=PaginationMetadataDTO(
+                    offset=0, limit=10, cursor=invalid_cursor
+                ),
+                sorting_params=None,
+            )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("admin_rights", "should_raise"),
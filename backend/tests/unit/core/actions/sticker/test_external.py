@@ -0,0 +1,128 @@
+import json
+
+from core.actions.sticker.external import ExternalStickerAction
+from core.constants import (
+    STICKER_OWNERSHIP_FULL_RUN_INTERVAL,
+    STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE,
+)
+from core.dtos.sticker import StickerItemDTO, StickerOwnershipSnapshotDTO
+
+
+def build_item(
+    character_id: int, instance: int, telegram_user_id: int
+) -> StickerItemDTO:
+    return StickerItemDTO(
+        id=f"1_{character_id}_{instance}",
+        collection_id=1,
+        character_id=character_id,
+        instance=instance,
+        telegram_user_id=telegram_user_id,
+    )
+
+
+ITEMS = [
+    build_item(character_id=1, instance=1, telegram_user_id=100),
+    build_item(character_id=1, instance=2, telegram_user_id=200),
+    build_item(
+        character_id=1,
+        instance=STICKER_OWNERSHIP_SNAPSHOT_CHUNK_SIZE + 1,
+        telegram_user_id=300,
+    ),
+    build_item(character_id=2, instance=1, telegram_user_id=100),
+]
+
+
+def test_ownership_snapshot_does_not_depend_on_items_order() -> None:
+    assert ExternalStickerAction.get_ownership_snapshot(
+        ITEMS
+    ) == ExternalStickerAction.get_ownership_snapshot(reversed(ITEMS))
+
+
+def test_ownership_snapshot_changes_only_for_affected_chunk() -> None:
+    snapshot = ExternalStickerAction.get_ownership_snapshot(ITEMS)
+    assert snapshot.keys() == {"1:0", "1:1", "2:0"}
+
+    # Owner of the second item changed
+    updated_items = [
+        ITEMS[0],
+        build_item(character_id=1, instance=2, telegram_user_id=300),
+        *ITEMS[2:],
+    ]
+    updated_snapshot = ExternalStickerAction.get_ownership_snapshot(updated_items)
+
+    assert updated_snapshot["1:0"] != snapshot["1:0"]
+    assert updated_snapshot["1:1"] == snapshot["1:1"]
+    assert updated_snapshot["2:0"] == snapshot["2:0"]
+
+
+def test_ownership_snapshot_changes_when_item_is_burned() -> None:
+    snapshot = ExternalStickerAction.get_ownership_snapshot(ITEMS)
+    updated_snapshot = ExternalStickerAction.get_ownership_snapshot(ITEMS[1:])
+
+    assert updated_snapshot["1:0"] != snapshot["1:0"]
+    assert updated_snapshot["1:1"] == snapshot["1:1"]
+
+
+def test_ownership_snapshot_is_stable() -> None:
+    # Digests must not depend on the process, since snapshots are shared via Redis
+    assert ExternalStickerAction.get_ownership_snapshot(ITEMS[:1]) == {
+        "1:0": f"1-{ExternalStickerAction.get_ownership_digest(1, 100):x}"
+    }
+    assert ExternalStickerAction.get_ownership_digest(
+        1, 100
+    ) != ExternalStickerAction.get_ownership_digest(100, 1)
+
+
+def test_ownership_snapshot_changes_when_owners_are_swapped() -> None:
+    snapshot = ExternalStickerAction.get_ownership_snapshot(ITEMS)
+    # Owners of the first two items swapped
+    updated_items = [
+        build_item(character_id=1, instance=1, telegram_user_id=200),
+        build_item(character_id=1, instance=2, telegram_user_id=100),
+        *ITEMS[2:],
+    ]
+    updated_snapshot = ExternalStickerAction.get_ownership_snapshot(updated_items)
+
+    assert updated_snapshot["1:0"] != snapshot["1:0"]
+
+
+def test_parse_ownership_snapshot() -> None:
+    snapshot = StickerOwnershipSnapshotDTO(chunks={"1:0": "1-a"}, full_run_at=10.0)
+
+    assert (
+        ExternalStickerAction.parse_ownership_snapshot(
+            collection_id=1, cached_snapshot=snapshot.model_dump_json()
+        )
+        == snapshot
+    )
+    assert (
+        ExternalStickerAction.parse_ownership_snapshot(
+            collection_id=1, cached_snapshot=None
+        )
+        is None
+    )
+
+
+def test_parse_ownership_snapshot_in_previous_format() -> None:
+    # Snapshots were stored as a plain mapping of the chunk key to its hash
+    cached_snapshot = json.dumps({"1:0": "1-a"})
+
+    assert (
+        ExternalStickerAction.parse_ownership_snapshot(
+            collection_id=1, cached_snapshot=cached_snapshot
+        )
+        is None
+    )
+
+
+def test_is_full_ownership_run() -> None:
+    snapshot = StickerOwnershipSnapshotDTO(chunks={}, full_run_at=1_000.0)
+
+    assert ExternalStickerAction.is_full_ownership_run(None, now=1_000.0)
+    assert not ExternalStickerAction.is_full_ownership_run(snapshot, now=1_000.0)
+    assert not ExternalStickerAction.is_full_ownership_run(
+        snapshot, now=1_000.0 + STICKER_OWNERSHIP_FULL_RUN_INTERVAL - 1
+    )
+    assert ExternalStickerAction.is_full_ownership_run(
+        snapshot, now=1_000.0 + STICKER_OWNERSHIP_FULL_RUN_INTERVAL
+    )
@@ -0,0 +1,122 @@
+from contextlib import contextmanager
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from core.actions.authorization import AuthorizationAction
+from core.models.chat import TelegramChat, TelegramChatUser
+from core.models.wallet import TelegramChatUserWallet
+from core.services.chat.user import TelegramChatUserService
+from tests.factories import TelegramChatFactory, TelegramChatUserFactory, UserFactory
+from tests.factories.nft import NftItemFactory
+from tests.factories.rule.blockchain import (
+    TelegramChatJettonRuleFactory,
+    TelegramChatNFTCollectionRuleFactory,
+)
+from tests.factories.wallet import JettonWalletFactory, UserWalletFactory
+
+
+@contextmanager
+def count_queries(db_session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, *args, **kwargs) -> None:
+        statements.append(statement)
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", _before_cursor_execute)
+
+
+def create_chat_with_members(db_session: Session, members_count: int) -> TelegramChat:
+    """
+    Creates a chat with an NFT collection and a jetton rule and the requested number
+    of members with connected wallets. Every even member holds required assets.
+    """
+    chat = TelegramChatFactory.with_session(db_session).create()
+    nft_rule = TelegramChatNFTCollectionRuleFactory.with_session(db_session).create(
+        chat=chat
+    )
+    jetton_rule = TelegramChatJettonRuleFactory.with_session(db_session).create(
+        chat=chat, group=nft_rule.group
+    )
+    for idx in range(members_count):
+        user = UserFactory.with_session(db_session).create()
+        wallet = UserWalletFactory.with_session(db_session).create(user=user)
+        TelegramChatUserFactory.with_session(db_session).create(chat=chat, user=user)
+        db_session.add(
+            TelegramChatUserWallet(
+                user_id=user.id, chat_id=chat.id, address=wallet.address
+            )
+        )
+        if idx % 2 == 0:
+            NftItemFactory.with_session(db_session).create(
+                owner_address=wallet.address, collection=nft_rule.nft_collection
+            )
+            JettonWalletFactory.with_session(db_session).create(
+                owner_address=wallet.address,
+                jetton=jetton_rule.jetton,
+                balance=jetton_rule.threshold,
+            )
+    db_session.flush()
+    return chat
+
+
+def get_chat_members(db_session: Session, chat: TelegramChat) -> list[TelegramChatUser]:
+    db_session.expire_all()
+    return TelegramChatUserService(db_session).get_all(chat_ids=[chat.id])
+
+
+@pytest.mark.usefixtures("db_session")
+class TestGetIneligibleChatMembers:
+    def test_returns_members_without_required_assets(self, db_session: Session):
+        chat = create_chat_with_members(db_session, members_count=6)
+        chat_members = get_chat_members(db_session, chat)
+        action = AuthorizationAction(db_session)
+
+        ineligible_members = action.get_ineligible_chat_members(chat_members)
+
+        assert len(ineligible_members) == 3
+        for member in ineligible_members:
+            assert not action.jetton_wallet_service.get_all(
+                owner_address=member.wallet_link.address
+            )
+
+    def test_queries_count_does_not_depend_on_batch_size(self, db_session: Session):
+        small_chat = create_chat_with_members(db_session, members_count=2)
+        large_chat = create_chat_with_members(db_session, members_count=20)
+        action = AuthorizationAction(db_session)
+
+        small_chat_members = get_chat_members(db_session, small_chat)
+        with count_queries(db_session) as small_batch_statements:
+            action.get_ineligible_chat_members(small_chat_members)
+
+        large_chat_members = get_chat_members(db_session, large_chat)
+        with count_queries(db_session) as large_batch_statements:
+            action.get_ineligible_chat_members(large_chat_members)
+
+        assert len(large_batch_statements) == len(small_batch_statements)
+
+    def test_skips_asset_queries_when_chat_has_no_asset_rules(
+        self, db_session: Session
+    ):
+        chat = TelegramChatFactory.with_session(db_session).create()
+        for _ in range(5):
+            TelegramChatUserFactory.with_session(db_session).create(chat=chat)
+        chat_members = get_chat_members(db_session, chat)
+        action = AuthorizationAction(db_session)
+
+        with count_queries(db_session) as statements:
+            ineligible_members = action.get_ineligible_chat_members(chat_members)
+
+        assert ineligible_members == []
+        assert not any(
+            table in statement
+            for statement in statements
+            for table in ("nft_item", "jetton_wallet", "sticker_item", "gift_unique")
+        )
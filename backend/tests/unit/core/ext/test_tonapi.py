@@ -0,0 +1,47 @@
+import httpx
+import pytest
+from pytonapi import AsyncTonapi
+from pytonapi.exceptions import TONAPINotFoundError
+
+from core.ext.tonapi import PooledAsyncTonapi, TonApiService
+
+ACCOUNT_ADDRESS = "0:1111111111111111111111111111111111111111111111111111111111111111"
+
+
+def handle_request(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/missing"):
+        return httpx.Response(404, json={"error": "account not found"})
+
+    return httpx.Response(
+        200,
+        json={
+            "address": ACCOUNT_ADDRESS,
+            "balance": 1_000,
+            "last_activity": 123456,
+            "status": "active",
+            "get_methods": [],
+            "is_wallet": True,
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client_within_context() -> None:
+    service = TonApiService()
+
+    async with service as blockchain_service:
+        http_client = blockchain_service._http_client
+        http_client._transport = httpx.MockTransport(handle_request)
+        assert isinstance(blockchain_service._tonapi, PooledAsyncTonapi)
+        assert blockchain_service._tonapi.accounts.http_client is http_client
+
+        account_info = await blockchain_service.get_account_info("first")
+        await blockchain_service.get_account_info("second")
+
+        assert int(str(account_info.balance)) == 1_000
+        assert account_info.last_activity == 123456
+        with pytest.raises(TONAPINotFoundError):
+            await blockchain_service.get_account_info("missing")
+
+    assert http_client.is_closed
+    assert type(service._tonapi) is AsyncTonapi
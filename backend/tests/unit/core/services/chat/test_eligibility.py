@@ -0,0 +1,200 @@
+import pytest
+
+from core.dtos.chat.rule.internal import (
+    EligibilitySummaryInternalDTO,
+    EligibilitySummaryJettonInternalDTO,
+    RulesEligibilityGroupSummaryInternalDTO,
+    RulesEligibilitySummaryInternalDTO,
+)
+from core.dtos.resource import JettonDTO
+from core.dtos.user import UserSnapshotDTO
+from core.enums.rule import EligibilityCheckType
+from core.services.chat.eligibility import (
+    AsyncEligibilitySummaryCacheService,
+    EligibilitySummaryCacheService,
+)
+from core.services.chat.rule.plan import TelegramChatRulesPlanCacheService
+
+
+class InMemoryRedisService:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    def get_many(self, *keys: str) -> list[str | None]:
+        return [self.data.get(key) for key in keys]
+
+    def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def incr_all(self, keys, ex: int | None = None) -> None:
+        for key in keys:
+            self.data[key] = str(int(self.data.get(key, 0)) + 1)
+
+
+class AsyncInMemoryRedisService:
+    def __init__(self, redis_service: InMemoryRedisService) -> None:
+        self.redis_service = redis_service
+
+    async def get_many(self, *keys: str) -> list[str | None]:
+        return self.redis_service.get_many(*keys)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        return self.redis_service.set(key, value, ex=ex)
+
+
+def build_user(is_premium: bool = False) -> UserSnapshotDTO:
+    return UserSnapshotDTO(
+        id=1,
+        telegram_id=100,
+        first_name="John",
+        last_name=None,
+        username=None,
+        is_premium=is_premium,
+        language="en",
+        is_blocked=False,
+        is_admin=False,
+        allows_write_to_pm=True,
+        wallets=("wallet",),
+    )
+
+
+def build_summary() -> RulesEligibilitySummaryInternalDTO:
+    return RulesEligibilitySummaryInternalDTO(
+        groups=[
+            RulesEligibilityGroupSummaryInternalDTO(
+                id=1,
+                items=[
+                    EligibilitySummaryJettonInternalDTO(
+                        id=1,
+                        group_id=1,
+                        type=EligibilityCheckType.JETTON,
+                        title="Jetton",
+                        address_raw="jetton",
+                        actual=10,
+                        expected=5,
+                        is_enabled=True,
+                        jetton=JettonDTO(
+                            address="jetton",
+                            name="Jetton",
+                            description=None,
+                            symbol="JTN",
+                            logo_path=None,
+                            is_enabled=True,
+                        ),
+                    ),
+                    EligibilitySummaryInternalDTO(
+                        id=2,
+                        group_id=1,
+                        type=EligibilityCheckType.PREMIUM,
+                        title="Telegram Premium",
+                        actual=1,
+                        expected=1,
+                        is_enabled=True,
+                    ),
+                ],
+            )
+        ],
+        wallet="wallet",
+    )
+
+
+def cache_summary(
+    cache_service: EligibilitySummaryCacheService, user: UserSnapshotDTO
+) -> None:
+    stamp, summary = cache_service.get(chat_id=1, user=user, wallet_address="wallet")
+    assert summary is None
+    cache_service.set(chat_id=1, user_id=user.id, stamp=stamp, summary=build_summary())
+
+
+def test_cached_summary_keeps_rule_specific_details() -> None:
+    cache_service = EligibilitySummaryCacheService(redis_service=InMemoryRedisService())
+    user = build_user()
+    cache_summary(cache_service, user)
+
+    _, summary = cache_service.get(chat_id=1, user=user, wallet_address="wallet")
+
+    assert summary == build_summary()
+    assert isinstance(summary.items[0], EligibilitySummaryJettonInternalDTO)
+    assert summary.items[0].jetton.symbol == "JTN"
+    assert bool(summary) is True
+
+
+def test_cached_summary_is_outdated_after_any_version_bump() -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = EligibilitySummaryCacheService(redis_service=redis_service)
+    user = build_user()
+
+    for bump in (
+        lambda: TelegramChatRulesPlanCacheService(redis_service).bump_versions(1),
+        lambda: cache_service.bump_wallet_versions(["wallet"]),
+        lambda: cache_service.bump_sticker_versions([user.telegram_id]),
+        lambda: cache_service.bump_gift_versions([str(user.telegram_id)]),
+    ):
+        cache_summary(cache_service, user)
+        bump()
+        _, summary = cache_service.get(chat_id=1, user=user, wallet_address="wallet")
+        assert summary is None
+
+
+def test_cached_summary_is_outdated_for_other_wallet_or_premium_status() -> None:
+    cache_service = EligibilitySummaryCacheService(redis_service=InMemoryRedisService())
+    user = build_user()
+    cache_summary(cache_service, user)
+
+    _, summary = cache_service.get(chat_id=1, user=user, wallet_address="other")
+    assert summary is None
+    _, summary = cache_service.get(chat_id=1, user=user, wallet_address=None)
+    assert summary is None
+    _, summary = cache_service.get(
+        chat_id=1, user=build_user(is_premium=True), wallet_address="wallet"
+    )
+    assert summary is None
+
+
+def test_bumps_of_other_users_assets_keep_summary() -> None:
+    cache_service = EligibilitySummaryCacheService(redis_service=InMemoryRedisService())
+    user = build_user()
+    cache_summary(cache_service, user)
+
+    cache_service.bump_wallet_versions(["other-wallet"])
+    cache_service.bump_sticker_versions([200])
+    cache_service.bump_gift_versions([200])
+
+    _, summary = cache_service.get(chat_id=1, user=user, wallet_address="wallet")
+    assert summary == build_summary()
+
+
+@pytest.mark.asyncio
+async def test_async_cache_shares_summaries_with_sync_cache() -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = EligibilitySummaryCacheService(redis_service=redis_service)
+    async_cache_service = AsyncEligibilitySummaryCacheService(
+        redis_service=AsyncInMemoryRedisService(redis_service)
+    )
+    user = build_user()
+    cache_summary(cache_service, user)
+
+    _, summary = await async_cache_service.get(
+        chat_id=1, user=user, wallet_address="wallet"
+    )
+    assert summary == build_summary()
+
+    cache_service.bump_wallet_versions(["wallet"])
+    stamp, summary = await async_cache_service.get(
+        chat_id=1, user=user, wallet_address="wallet"
+    )
+    assert summary is None
+
+    await async_cache_service.set(
+        chat_id=1, user_id=user.id, stamp=stamp, summary=build_summary()
+    )
+    _, summary = cache_service.get(chat_id=1, user=user, wallet_address="wallet")
+    assert summary == build_summary()
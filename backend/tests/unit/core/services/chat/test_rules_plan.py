@@ -0,0 +1,145 @@
+import time
+from unittest.mock import ANY, MagicMock
+
+from pytest_mock import MockerFixture
+from sqlalchemy.orm import Session
+
+from core.constants import RULES_PLAN_LOCAL_CACHE_TTL
+from core.dtos.chat.rule.plan import TelegramChatRulesPlanDTO, WhitelistRulePlanDTO
+from core.services.chat.rule.plan import (
+    TelegramChatRulesPlanCacheService,
+    has_pending_invalidation,
+    invalidate_rules_plan,
+)
+
+
+class InMemoryRedisService:
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def delete(self, key: str) -> int:
+        return int(self.data.pop(key, None) is not None)
+
+
+def build_plan(chat_id: int) -> TelegramChatRulesPlanDTO:
+    return TelegramChatRulesPlanDTO(
+        chat_id=chat_id,
+        toncoin=(),
+        jettons=(),
+        nft_collections=(),
+        stickers=(),
+        gifts=(),
+        premium=(),
+        whitelist_external_sources=(),
+        whitelist_sources=(
+            WhitelistRulePlanDTO(
+                id=1,
+                group_id=1,
+                is_enabled=True,
+                name="Whitelist",
+                content=frozenset({1, 2, 3}),
+            ),
+        ),
+        emoji=(),
+    )
+
+
+def test_plan_is_served_from_redis_after_local_cache_is_cleared() -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = TelegramChatRulesPlanCacheService(redis_service=redis_service)
+    plan = build_plan(chat_id=1)
+    version = cache_service.get_version(chat_id=1)
+
+    cache_service.set(plan=plan, version=version)
+    TelegramChatRulesPlanCacheService.clear_local()
+
+    cached_plan = cache_service.get(chat_id=1, version=version)
+    assert cached_plan == plan
+    assert cached_plan.whitelist_sources[0].content == frozenset({1, 2, 3})
+
+
+def test_plan_is_unreachable_after_version_bump() -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = TelegramChatRulesPlanCacheService(redis_service=redis_service)
+    previous_version = cache_service.get_version(chat_id=1)
+    cache_service.set(plan=build_plan(chat_id=1), version=previous_version)
+
+    cache_service.bump_versions(1)
+
+    version = cache_service.get_version(chat_id=1)
+    assert version != previous_version
+    assert cache_service.get(chat_id=1, version=version) is None
+
+
+def test_plan_is_unreachable_after_version_eviction() -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = TelegramChatRulesPlanCacheService(redis_service=redis_service)
+    previous_version = cache_service.get_version(chat_id=1)
+    cache_service.set(plan=build_plan(chat_id=1), version=previous_version)
+
+    redis_service.delete("rules-plan-version:1")
+
+    version = cache_service.get_version(chat_id=1)
+    assert version != previous_version
+    assert cache_service.get_version(chat_id=1) == version
+    assert cache_service.get(chat_id=1, version=version) is None
+
+
+def test_local_plan_expires(mocker: MockerFixture) -> None:
+    redis_service = InMemoryRedisService()
+    cache_service = TelegramChatRulesPlanCacheService(redis_service=redis_service)
+    version = cache_service.get_version(chat_id=1)
+    cache_service.set(plan=build_plan(chat_id=1), version=version)
+    # Plans are dropped from Redis, e.g. evicted, so only the in-process copy is left
+    redis_service.data.clear()
+
+    assert cache_service.get(chat_id=1, version=version) is not None
+
+    mocker.patch(
+        "core.services.chat.rule.plan.time.monotonic",
+        return_value=time.monotonic() + RULES_PLAN_LOCAL_CACHE_TTL,
+    )
+    assert cache_service.get(chat_id=1, version=version) is None
+
+
+def test_invalidate_rules_plan_bumps_version_after_commit(
+    mock_rules_plan_cache_redis: MagicMock,
+) -> None:
+    db_session = Session()
+
+    invalidate_rules_plan(db_session, chat_id=1)
+    invalidate_rules_plan(db_session, chat_id=1)
+
+    assert has_pending_invalidation(db_session, chat_id=1)
+    mock_rules_plan_cache_redis.set.assert_not_called()
+
+    db_session.commit()
+
+    mock_rules_plan_cache_redis.set.assert_called_once_with("rules-plan-version:1", ANY)
+    assert not has_pending_invalidation(db_session, chat_id=1)
+
+
+def test_invalidate_rules_plan_is_discarded_on_rollback(
+    mock_rules_plan_cache_redis: MagicMock,
+) -> None:
+    db_session = Session()
+    # Start the transaction, so there is something to roll back
+    db_session.begin()
+
+    invalidate_rules_plan(db_session, chat_id=1)
+    db_session.rollback()
+    db_session.commit()
+
+    mock_rules_plan_cache_redis.set.assert_not_called()
+    assert not has_pending_invalidation(db_session, chat_id=1)
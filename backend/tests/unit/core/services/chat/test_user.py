@@ -1,8 +1,16 @@
+from unittest.mock import patch
+
 import pytest
 from sqlalchemy.orm import Session
 
+from core.constants import UPDATED_MEMBERS_COUNTERS_CHAT_IDS
 from core.models.chat import TelegramChatUser
-from core.services.chat.user import TelegramChatUserService
+from core.services.chat import TelegramChatService
+from core.services.chat.user import (
+    PENDING_MEMBERS_COUNTERS_SESSION_KEY,
+    TelegramChatUserService,
+    _publish_members_counters,
+)
 from tests.factories import TelegramChatFactory, TelegramChatUserFactory, UserFactory
 
 
@@ -38,3 +46,122 @@ async def test_yield_all_for_chat_batching(db_session: Session) -> None:
     # Verify order
     user_ids = [u.user_id for u in all_yielded_users]
     assert user_ids == sorted(user_ids)
+
+
+def test_yield_by_telegram_ids_is_scoped_to_chat(db_session: Session) -> None:
+    chat, other_chat = TelegramChatFactory.with_session(db_session).create_batch(2)
+    users = [
+        UserFactory.with_session(db_session).create(telegram_id=2000 + i)
+        for i in range(5)
+    ]
+    for user in users:
+        for target_chat in (chat, other_chat):
+            TelegramChatUserFactory.with_session(db_session).create(
+                chat=target_chat, user=user
+            )
+    service = TelegramChatUserService(db_session)
+
+    batches = list(
+        service.yield_by_telegram_ids(
+            chat_id=chat.id,
+            telegram_ids=[2000, 2001, 2002, 2003, 9999],
+            batch_size=2,
+        )
+    )
+
+    assert [len(batch) for batch in batches] == [2, 2]
+    members = [member for batch in batches for member in batch]
+    assert {member.chat_id for member in members} == {chat.id}
+    assert {member.user.telegram_id for member in members} == {2000, 2001, 2002, 2003}
+
+
+def test_bulk_create_or_update_keeps_managed_flag_of_existing_members(
+    db_session: Session,
+) -> None:
+    chat = TelegramChatFactory.with_session(db_session).create()
+    existing_user, new_user = UserFactory.with_session(db_session).create_batch(2)
+    TelegramChatUserFactory.with_session(db_session).create(
+        chat=chat, user=existing_user, is_admin=False, is_managed=True
+    )
+    service = TelegramChatUserService(db_session)
+
+    service.bulk_create_or_update(
+        chat_id=chat.id,
+        members=[(existing_user.id, True, False), (new_user.id, False, True)],
+        is_managed=False,
+    )
+    db_session.expire_all()
+
+    existing_member = service.get(chat.id, existing_user.id)
+    assert existing_member.is_admin is True
+    assert existing_member.is_managed is True
+
+    new_member = service.get(chat.id, new_user.id)
+    # Manager admins are always admins
+    assert new_member.is_admin is True
+    assert new_member.is_manager_admin is True
+    assert new_member.is_managed is False
+
+    TelegramChatService(db_session).reconcile_members_counters(chat_ids=[chat.id])
+    # Only the new member is counted, it's not managed by the bot
+    assert chat.members_count == 2
+    assert chat.managed_members_count == 1
+
+
+def test_members_counters_are_refreshed_after_membership_changes(
+    db_session: Session,
+) -> None:
+    chat, other_chat = TelegramChatFactory.with_session(db_session).create_batch(
+        2, price=2
+    )
+    users = UserFactory.with_session(db_session).create_batch(4)
+    service = TelegramChatUserService(db_session)
+
+    service.create(chat.id, users[0].id, is_admin=False, is_managed=False)
+    service.create_batch(chat.id, [user.id for user in users[1:]])
+    service.delete(chat.id, users[0].id)
+    service.delete_batch(chat.id, [users[1].id])
+    # Nothing was deleted, so the other chat is not scheduled
+    service.delete_batch(other_chat.id, [users[2].id])
+
+    # Counters are not touched by the membership changes themselves
+    assert chat.members_count == 0
+    assert list(db_session.info[PENDING_MEMBERS_COUNTERS_SESSION_KEY]) == [chat.id]
+
+    chat_ids = TelegramChatService(db_session).reconcile_members_counters(
+        chat_ids=list(db_session.info[PENDING_MEMBERS_COUNTERS_SESSION_KEY])
+    )
+
+    assert chat_ids == [chat.id]
+    assert chat.members_count == 2
+    assert chat.managed_members_count == 2
+    assert chat.tcv == 4
+
+
+def test_pending_members_counters_are_published_on_commit() -> None:
+    with patch("core.services.chat.user.RedisService") as redis_service_mock:
+        _publish_members_counters({2: None, 1: None})
+
+    redis_service_mock.return_value.add_to_set.assert_called_once_with(
+        UPDATED_MEMBERS_COUNTERS_CHAT_IDS, "1", "2"
+    )
+
+
+def test_reconcile_members_counters_fixes_drifted_chats(db_session: Session) -> None:
+    chat, other_chat = TelegramChatFactory.with_session(db_session).create_batch(2)
+    TelegramChatUserFactory.with_session(db_session).create_batch(3, chat=chat)
+    TelegramChatUserFactory.with_session(db_session).create(
+        chat=other_chat, is_managed=False
+    )
+    # Emulate members removed bypassing the chat members service
+    db_session.query(TelegramChatUser).filter(
+        TelegramChatUser.chat_id == chat.id
+    ).delete()
+
+    chat_ids = TelegramChatService(db_session).reconcile_members_counters()
+
+    assert chat_ids == [chat.id]
+    assert chat.members_count == 0
+    assert chat.managed_members_count == 0
+    assert other_chat.members_count == 1
+    assert other_chat.managed_members_count == 0
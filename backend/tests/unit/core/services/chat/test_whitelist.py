@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+from core.dtos.chat.rule.whitelist import ExternalSourceFetchStateDTO
+from core.services.chat.rule.whitelist import TelegramChatExternalSourceService
+
+
+def test_invalid_fetch_states_are_treated_as_missing(
+    mock_external_source_fetch_state_redis: MagicMock,
+) -> None:
+    fetch_state = ExternalSourceFetchStateDTO(
+        fingerprint="fingerprint", content_hash="hash", etag='"v1"'
+    )
+    mock_external_source_fetch_state_redis.get_many.side_effect = None
+    mock_external_source_fetch_state_redis.get_many.return_value = [
+        fetch_state.model_dump_json(),
+        '{"etag": "v1"}',
+        "invalid",
+        None,
+    ]
+
+    fetch_states = TelegramChatExternalSourceService.get_fetch_states([1, 2, 3, 4])
+
+    assert fetch_states == {1: fetch_state}
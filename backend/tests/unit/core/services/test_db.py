@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy.orm import Session
+
+from core.services.db import _flush_pending_on_commit, on_outermost_commit
+
+
+def test_on_outermost_commit_flushes_latest_values_once() -> None:
+    db_session = Session()
+    flush_ids = MagicMock()
+    flush_states = MagicMock()
+
+    on_outermost_commit(db_session, key="ids", item=2, flush=flush_ids)
+    on_outermost_commit(db_session, key="ids", item=1, flush=flush_ids)
+    on_outermost_commit(db_session, key="ids", item=2, flush=flush_ids)
+    on_outermost_commit(
+        db_session, key="states", item=1, flush=flush_states, value="old"
+    )
+    on_outermost_commit(
+        db_session, key="states", item=1, flush=flush_states, value="new"
+    )
+    flush_ids.assert_not_called()
+
+    db_session.commit()
+    db_session.commit()
+
+    flush_ids.assert_called_once_with({2: None, 1: None})
+    flush_states.assert_called_once_with({1: "new"})
+
+
+def test_on_outermost_commit_is_discarded_on_rollback() -> None:
+    db_session = Session()
+    db_session.begin()
+    flush = MagicMock()
+
+    on_outermost_commit(db_session, key="ids", item=1, flush=flush)
+    db_session.rollback()
+    db_session.commit()
+
+    flush.assert_not_called()
+
+
+def test_on_outermost_commit_waits_for_outermost_transaction() -> None:
+    db_session = Session()
+    flush = MagicMock()
+    on_outermost_commit(db_session, key="ids", item=1, flush=flush)
+
+    nested_session = MagicMock(info=db_session.info)
+    nested_session.in_nested_transaction.return_value = True
+    # Savepoint release
+    _flush_pending_on_commit(nested_session)
+    flush.assert_not_called()
+
+    db_session.commit()
+    flush.assert_called_once_with({1: None})
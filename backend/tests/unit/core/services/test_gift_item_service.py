@@ -0,0 +1,55 @@
+import datetime
+
+from sqlalchemy.orm import Session
+
+from core.models.gift import GiftCollection, GiftUnique
+from core.services.gift.item import GiftUniqueService
+
+
+def build_item(
+    slug: str, number: int, telegram_owner_id: int | None, owner_address: str | None
+) -> dict:
+    return {
+        "slug": slug,
+        "collection_slug": "collection",
+        "number": number,
+        "model": "model",
+        "backdrop": "backdrop",
+        "pattern": "pattern",
+        "telegram_owner_id": telegram_owner_id,
+        "owner_address": owner_address,
+        "blockchain_address": None,
+        "last_updated": datetime.datetime.now(tz=datetime.UTC),
+    }
+
+
+def test_bulk_upsert_returns_previous_owners_of_changed_items_only(
+    db_session: Session,
+) -> None:
+    db_session.add(GiftCollection(slug="collection", title="Collection"))
+    db_session.add_all(
+        [
+            GiftUnique(**build_item("collection-1", 1, 1, None)),
+            GiftUnique(**build_item("collection-2", 2, 2, "address")),
+        ]
+    )
+    db_session.flush()
+    service = GiftUniqueService(db_session)
+
+    rows = service.bulk_upsert(
+        [
+            build_item("collection-1", 1, 3, None),
+            build_item("collection-2", 2, 2, "address"),
+            build_item("collection-3", 3, 4, None),
+        ]
+    )
+
+    assert {
+        (row.slug, row.previous_telegram_owner_id, row.is_created) for row in rows
+    } == {("collection-1", 1, False), ("collection-3", None, True)}
+    db_session.expire_all()
+    assert service.get_owners(collection_slug="collection") == {
+        "collection-1": (3, None),
+        "collection-2": (2, "address"),
+        "collection-3": (4, None),
+    }
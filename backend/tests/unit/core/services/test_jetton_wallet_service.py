@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+from pytonapi.schema.jettons import JettonsBalances
+from sqlalchemy.orm import Session
+
+from core.services.wallet import JettonWalletService
+from tests.factories.jetton import JettonFactory
+from tests.factories.wallet import JettonWalletFactory, UserWalletFactory
+
+
+def _build_jetton_balance(address: str, jetton_address: str, balance: int):
+    jetton_balance = MagicMock()
+    jetton_balance.wallet_address.address.to_raw.return_value = address
+    jetton_balance.jetton.address.to_raw.return_value = jetton_address
+    jetton_balance.balance = str(balance)
+    return jetton_balance
+
+
+def test_bulk_create_or_update_writes_only_changed_balances(
+    db_session: Session,
+) -> None:
+    wallet = UserWalletFactory.with_session(db_session).create()
+    jetton = JettonFactory.with_session(db_session).create()
+    non_whitelisted_jetton = JettonFactory.with_session(db_session).create()
+    unchanged = JettonWalletFactory.with_session(db_session).create(
+        owner_address=wallet.address, jetton=jetton, balance=10
+    )
+    changed = JettonWalletFactory.with_session(db_session).create(
+        owner_address=wallet.address, jetton=jetton, balance=10
+    )
+    new_address = "0:new_jetton_wallet_address_used_only_for_this_unit_test_xxxxx"
+    jettons_balances = MagicMock(spec=JettonsBalances)
+    jettons_balances.balances = [
+        _build_jetton_balance(unchanged.address, jetton.address, 10),
+        _build_jetton_balance(changed.address, jetton.address, 20),
+        _build_jetton_balance(new_address, jetton.address, 30),
+        _build_jetton_balance("0:skipped", non_whitelisted_jetton.address, 40),
+    ]
+
+    jetton_wallets = JettonWalletService(db_session).bulk_create_or_update(
+        jettons_balances, whitelisted_jettons=[jetton], owner_address=wallet.address
+    )
+
+    assert {
+        (jetton_wallet.address, jetton_wallet.balance)
+        for jetton_wallet in jetton_wallets
+    } == {(changed.address, 20), (new_address, 30)}
+    # Stale objects in the session are refreshed by the upsert
+    assert changed.balance == 20
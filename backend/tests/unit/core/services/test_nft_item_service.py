@@ -1,5 +1,6 @@
 import pytest
 from pytest_mock import MockerFixture
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from core.services.nft import NftItemService
@@ -120,3 +121,41 @@ def test_bulk_create_or_update_skips_non_whitelisted_collections(
 
     assert persisted == []
     assert evicted_owners == set()
+
+
+def test_bulk_create_or_update_upserts_batch_in_single_statement(
+    db_session: Session, mocker: MockerFixture
+) -> None:
+    previous_wallets = UserWalletFactory.with_session(db_session).create_batch(3)
+    new_wallet = UserWalletFactory.with_session(db_session).create()
+    collection = NFTCollectionFactory.with_session(db_session).create()
+    nfts = [
+        NftItemFactory.with_session(db_session).create(
+            owner_address=wallet.address, collection=collection
+        )
+        for wallet in previous_wallets
+    ]
+    tonapi_nfts = [
+        _build_tonapi_nft_item(
+            mocker,
+            address=nft.address,
+            owner_address=new_wallet.address,
+            collection_address=collection.address,
+        )
+        for nft in nfts
+    ]
+    statements = []
+    event.listen(
+        db_session.connection(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    persisted, evicted_owners = NftItemService(db_session).bulk_create_or_update(
+        _build_tonapi_nft_items(tonapi_nfts),
+        whitelist_collection_addresses=[collection.address],
+    )
+
+    assert len(statements) == 1
+    assert {nft.owner_address for nft in persisted} == {new_wallet.address}
+    assert evicted_owners == {wallet.address for wallet in previous_wallets}
@@ -0,0 +1,98 @@
+"""
+Query plan regression suite: the hot queries filtering assets by their owners
+must be answered with indexes, no matter how large the tables grow.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core.models.blockchain import Jetton
+from core.models.wallet import UserWallet
+from core.services.nft import NftItemService
+from core.services.wallet import JettonWalletService
+from tests.factories import JettonFactory
+from tests.factories.nft import NFTCollectionFactory, NftItemFactory
+from tests.factories.wallet import JettonWalletFactory, UserWalletFactory
+from tests.utils.query_plan import capture_statements, get_sequential_scans
+
+HotQuery = Callable[[Session, UserWallet, Jetton], Any]
+
+
+def nft_items_by_owner(db_session: Session, wallet: UserWallet, jetton: Jetton) -> Any:
+    return NftItemService(db_session).get_all(owner_address=wallet.address)
+
+
+def nft_items_by_owners(db_session: Session, wallet: UserWallet, jetton: Jetton) -> Any:
+    return NftItemService(db_session).get_all(owner_addresses=[wallet.address])
+
+
+def nft_items_delete_missing(
+    db_session: Session, wallet: UserWallet, jetton: Jetton
+) -> Any:
+    return NftItemService(db_session).delete_missing(
+        owner_address=wallet.address, keep_addresses=[]
+    )
+
+
+def jetton_wallets_by_owner(
+    db_session: Session, wallet: UserWallet, jetton: Jetton
+) -> Any:
+    return JettonWalletService(db_session).get_all(owner_address=wallet.address)
+
+
+def jetton_wallets_by_owners(
+    db_session: Session, wallet: UserWallet, jetton: Jetton
+) -> Any:
+    return JettonWalletService(db_session).get_all(owner_addresses=[wallet.address])
+
+
+def jetton_wallets_delete_missing(
+    db_session: Session, wallet: UserWallet, jetton: Jetton
+) -> Any:
+    return JettonWalletService(db_session).delete_missing(
+        owner_address=wallet.address, keep_addresses=[]
+    )
+
+
+def jetton_holders(db_session: Session, wallet: UserWallet, jetton: Jetton) -> Any:
+    return JettonWalletService(db_session).get_owner_addresses(
+        jetton_master_address=jetton.address, min_balance=100
+    )
+
+
+HOT_QUERIES: list[HotQuery] = [
+    nft_items_by_owner,
+    nft_items_by_owners,
+    nft_items_delete_missing,
+    jetton_wallets_by_owner,
+    jetton_wallets_by_owners,
+    jetton_wallets_delete_missing,
+    jetton_holders,
+]
+
+
+@pytest.mark.parametrize("hot_query", HOT_QUERIES, ids=lambda query: query.__name__)
+def test_hot_query_does_not_scan_tables_sequentially(
+    db_session: Session, hot_query: HotQuery
+) -> None:
+    wallet = UserWalletFactory.with_session(db_session).create()
+    other_wallet = UserWalletFactory.with_session(db_session).create()
+    collection = NFTCollectionFactory.with_session(db_session).create()
+    jetton = JettonFactory.with_session(db_session).create()
+    for owner in (wallet, other_wallet):
+        NftItemFactory.with_session(db_session).create_batch(
+            5, owner_address=owner.address, collection=collection
+        )
+        JettonWalletFactory.with_session(db_session).create_batch(
+            5, owner_address=owner.address, jetton=jetton
+        )
+
+    with capture_statements(db_session) as statements:
+        hot_query(db_session, wallet, jetton)
+
+    assert statements
+    for statement, parameters in statements:
+        assert not get_sequential_scans(db_session, statement, parameters), statement
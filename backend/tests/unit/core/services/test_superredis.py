@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.services.superredis import AsyncRedisService, RedisService
+
+
+def test_redis_services_share_connection_pool() -> None:
+    main_service = RedisService()
+    external_service = RedisService(external=True)
+
+    assert RedisService().client.connection_pool is main_service.client.connection_pool
+    assert (
+        RedisService(external=True).client.connection_pool
+        is external_service.client.connection_pool
+    )
+    assert (
+        main_service.client.connection_pool
+        is not external_service.client.connection_pool
+    )
+    assert {stats.name for stats in RedisService.get_pool_stats()} >= {
+        "main",
+        "transaction",
+    }
+
+
+def test_pop_from_sets_uses_single_pipeline(mocker) -> None:
+    service = RedisService()
+    pipeline = MagicMock()
+    pipeline.execute.return_value = [["wallet"], [], None]
+    mocker.patch.object(service.client, "pipeline", return_value=pipeline)
+
+    result = service.pop_from_sets("wallets", "stickers", "gifts", count=10)
+
+    assert result == [["wallet"], [], []]
+    assert [call.args for call in pipeline.spop.call_args_list] == [
+        ("wallets",),
+        ("stickers",),
+        ("gifts",),
+    ]
+    pipeline.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_redis_services_share_connection_pool_per_loop() -> None:
+    async def get_pool() -> object:
+        service = AsyncRedisService()
+        await service.close()
+        return service.client.connection_pool
+
+    try:
+        pool = await get_pool()
+
+        assert await get_pool() is pool
+        assert await asyncio.to_thread(asyncio.run, get_pool()) is not pool
+        assert [stats.name for stats in AsyncRedisService.get_pool_stats()] == [
+            "async_main"
+        ]
+    finally:
+        await AsyncRedisService.close_pools()
+
+    assert AsyncRedisService.get_pool_stats() == []
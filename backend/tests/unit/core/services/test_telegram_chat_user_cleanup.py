@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from core.services.chat import TelegramChatService
 from core.services.chat.user import TelegramChatUserService
 from tests.factories import TelegramChatFactory, TelegramChatUserFactory, UserFactory
 
@@ -13,14 +14,16 @@ def test_delete_stale_participants(db_session: Session) -> None:
         TelegramChatUserFactory.with_session(db_session).create(chat=chat, user=user)
 
     service = TelegramChatUserService(db_session)
-    assert service.get_members_count(chat.id) == 5
+    TelegramChatService(db_session).reconcile_members_counters(chat_ids=[chat.id])
+    assert chat.members_count == 5
 
     # Act: Clean up stale participants, keeping only user 0, 2, and 4
     active_user_ids = [users[0].id, users[2].id, users[4].id]
     service.delete_stale_participants(chat_id=chat.id, active_user_ids=active_user_ids)
 
     # Assert
-    assert service.get_members_count(chat.id) == 3
+    TelegramChatService(db_session).reconcile_members_counters(chat_ids=[chat.id])
+    assert chat.members_count == 3
     remaining_user_ids = {cu.user_id for cu in service.get_all(chat_ids=[chat.id])}
     assert remaining_user_ids == set(active_user_ids)
 
@@ -0,0 +1,77 @@
+from pytest_mock import MockerFixture
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from core.dtos.user import TelegramUserDTO
+from core.models.user import User
+from core.models.wallet import UserWallet
+from core.services.user import UserService
+from tests.factories import UserFactory
+
+
+def test_get_with_refresh_reloads_wallets(db_session: Session) -> None:
+    user = UserFactory.with_session(db_session).create()
+    service = UserService(db_session)
+    assert service.get(user.id).wallets == []
+
+    # Emulate the wallet stored without touching the loaded user
+    db_session.execute(
+        insert(UserWallet).values(address="0:" + "a" * 64, user_id=user.id)
+    )
+
+    assert service.get(user.id).wallets == []
+    assert [
+        wallet.address for wallet in service.get(user.id, refresh=True).wallets
+    ] == ["0:" + "a" * 64]
+
+
+def test_is_admin_ignores_loaded_user(db_session: Session) -> None:
+    user = UserFactory.with_session(db_session).create(is_admin=True)
+    service = UserService(db_session)
+    assert service.is_admin(user.id) is True
+
+    db_session.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(is_admin=False)
+        .execution_options(synchronize_session=False)
+    )
+
+    assert user.is_admin is True
+    assert service.is_admin(user.id) is False
+
+
+def build_telegram_user(user: User) -> TelegramUserDTO:
+    return TelegramUserDTO(
+        id=user.telegram_id,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        username=user.username,
+        is_premium=user.is_premium,
+        language_code=user.language,
+        allow_write_to_pm=user.allows_write_to_pm,
+    )
+
+
+def test_bulk_create_or_update_invalidates_changed_users_only(
+    db_session: Session, mocker: MockerFixture
+) -> None:
+    unchanged_user = UserFactory.with_session(db_session).create()
+    changed_user = UserFactory.with_session(db_session).create()
+    invalidate_mock = mocker.patch("core.services.user.invalidate_user_snapshot")
+
+    user_ids = UserService(db_session).bulk_create_or_update(
+        [
+            build_telegram_user(unchanged_user),
+            build_telegram_user(changed_user).model_copy(update={"is_premium": True}),
+            TelegramUserDTO(id=1, first_name="New", language_code="en"),
+        ]
+    )
+
+    new_user = UserService(db_session).get_by_telegram_id(1)
+    assert user_ids == {
+        unchanged_user.telegram_id: unchanged_user.id,
+        changed_user.telegram_id: changed_user.id,
+        1: new_user.id,
+    }
+    invalidate_mock.assert_called_once_with(db_session, changed_user.id)
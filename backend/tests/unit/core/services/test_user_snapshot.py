@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+
+from core.dtos.user import UserSnapshotDTO
+from core.services.user_snapshot import (
+    UserSnapshotCacheService,
+    invalidate_user_snapshot,
+)
+
+
+def build_snapshot(user_id: int) -> UserSnapshotDTO:
+    return UserSnapshotDTO(
+        id=user_id,
+        telegram_id=1000 + user_id,
+        first_name="John",
+        last_name=None,
+        username="john",
+        is_premium=False,
+        language="en",
+        is_blocked=False,
+        is_admin=False,
+        allows_write_to_pm=True,
+        wallets=("0:abc",),
+    )
+
+
+def test_snapshot_is_cached_until_invalidated() -> None:
+    snapshot = build_snapshot(user_id=1)
+    UserSnapshotCacheService.set(
+        snapshot, version=UserSnapshotCacheService.get_version()
+    )
+
+    assert UserSnapshotCacheService.get(1) == snapshot
+
+    UserSnapshotCacheService.invalidate(1)
+
+    assert UserSnapshotCacheService.get(1) is None
+
+
+def test_snapshot_loaded_before_invalidation_is_not_cached() -> None:
+    version = UserSnapshotCacheService.get_version()
+    # The user is changed while its outdated snapshot is being loaded
+    UserSnapshotCacheService.invalidate(1)
+
+    UserSnapshotCacheService.set(build_snapshot(user_id=1), version=version)
+
+    assert UserSnapshotCacheService.get(1) is None
+
+
+def test_snapshot_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    UserSnapshotCacheService.set(
+        build_snapshot(user_id=1), version=UserSnapshotCacheService.get_version()
+    )
+
+    monkeypatch.setattr("core.services.user_snapshot.USER_SNAPSHOT_CACHE_TTL", -1)
+    UserSnapshotCacheService.set(
+        build_snapshot(user_id=2), version=UserSnapshotCacheService.get_version()
+    )
+
+    assert UserSnapshotCacheService.get(1) is not None
+    assert UserSnapshotCacheService.get(2) is None
+
+
+def test_invalidate_user_snapshot_is_published_after_commit(
+    mock_user_snapshot_redis: MagicMock,
+) -> None:
+    db_session = Session()
+
+    invalidate_user_snapshot(db_session, user_id=2)
+    invalidate_user_snapshot(db_session, user_id=1)
+    mock_user_snapshot_redis.publish.assert_not_called()
+
+    db_session.commit()
+
+    mock_user_snapshot_redis.publish.assert_called_once_with(
+        "user-snapshot-invalidation", "1,2"
+    )
+
+
+def test_invalidate_user_snapshot_is_discarded_on_rollback(
+    mock_user_snapshot_redis: MagicMock,
+) -> None:
+    db_session = Session()
+    db_session.begin()
+
+    invalidate_user_snapshot(db_session, user_id=1)
+    db_session.rollback()
+    db_session.commit()
+
+    mock_user_snapshot_redis.publish.assert_not_called()
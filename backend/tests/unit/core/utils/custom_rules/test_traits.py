@@ -0,0 +1,105 @@
+import pytest
+
+from core.dtos.base import BaseNftItemMetadataDTO
+from core.enums.nft import (
+    NftCollectionAsset,
+    TelegramNumberCategory,
+    TelegramUsernameCategory,
+)
+from core.models.blockchain import NftItem
+from core.utils.custom_rules.addresses import NFT_ASSET_TO_ADDRESS_MAPPING
+from core.utils.custom_rules.mapping import CATEGORY_TO_METHOD_BY_ASSET_MAPPING
+from core.utils.custom_rules.telegram_numbers import TELEGRAM_NUMBER_CLUB_FLAGS
+from core.utils.custom_rules.traits import get_nft_item_traits
+
+TELEGRAM_NUMBERS_ADDRESS = NFT_ASSET_TO_ADDRESS_MAPPING[
+    NftCollectionAsset.TELEGRAM_NUMBER
+]
+TELEGRAM_USERNAMES_ADDRESS = NFT_ASSET_TO_ADDRESS_MAPPING[
+    NftCollectionAsset.TELEGRAM_USERNAME
+]
+
+
+def build_nft_item(collection_address: str, name: str | None) -> NftItem:
+    traits = get_nft_item_traits(
+        collection_address, BaseNftItemMetadataDTO(name=name, attributes=[])
+    )
+    return NftItem(
+        address=f"0:{name}",
+        collection_address=collection_address,
+        trait_name=traits.name,
+        trait_length=traits.length,
+        trait_flags=traits.flags,
+    )
+
+
+def test_telegram_number_traits() -> None:
+    traits = get_nft_item_traits(
+        TELEGRAM_NUMBERS_ADDRESS,
+        BaseNftItemMetadataDTO(name="+888 0077 7101", attributes=[]),
+    )
+
+    assert traits.name == "00777101"
+    assert traits.length == 8
+    assert traits.flags == (
+        TELEGRAM_NUMBER_CLUB_FLAGS[TelegramNumberCategory.CLUB_007]
+        | TELEGRAM_NUMBER_CLUB_FLAGS[TelegramNumberCategory.CLUB_777]
+        | TELEGRAM_NUMBER_CLUB_FLAGS[TelegramNumberCategory.REPEAT_2]
+    )
+
+
+@pytest.mark.parametrize(
+    ("collection_address", "name", "expected_name", "expected_length"),
+    [
+        (TELEGRAM_USERNAMES_ADDRESS, "@durov", "durov", 5),
+        (
+            NFT_ASSET_TO_ADDRESS_MAPPING[NftCollectionAsset.TON_DNS],
+            "access.ton",
+            "access.ton",
+            10,
+        ),
+        ("0:unknown", "Some NFT", None, None),
+        (TELEGRAM_NUMBERS_ADDRESS, None, None, None),
+    ],
+)
+def test_nft_item_traits(
+    collection_address: str,
+    name: str | None,
+    expected_name: str | None,
+    expected_length: int | None,
+) -> None:
+    traits = get_nft_item_traits(
+        collection_address, BaseNftItemMetadataDTO(name=name, attributes=[])
+    )
+
+    assert traits.name == expected_name
+    assert traits.length == expected_length
+    assert traits.flags == 0
+
+
+def test_telegram_numbers_categories_use_traits() -> None:
+    short_number = build_nft_item(TELEGRAM_NUMBERS_ADDRESS, "+888 0420")
+    long_number = build_nft_item(TELEGRAM_NUMBERS_ADDRESS, "+888 1337 1990")
+    username = build_nft_item(TELEGRAM_USERNAMES_ADDRESS, "@durov")
+    nft_items = [short_number, long_number, username]
+    handlers = CATEGORY_TO_METHOD_BY_ASSET_MAPPING[NftCollectionAsset.TELEGRAM_NUMBER]
+
+    assert handlers[TelegramNumberCategory.DIGITS_7](nft_items) == [short_number]
+    assert handlers[TelegramNumberCategory.DIGITS_11](nft_items) == [
+        short_number,
+        long_number,
+    ]
+    assert handlers[TelegramNumberCategory.CLUB_420](nft_items) == [short_number]
+    assert handlers[TelegramNumberCategory.CLUB_1337](nft_items) == [long_number]
+    assert handlers[TelegramNumberCategory.YEAR](nft_items) == []
+    assert handlers[TelegramNumberCategory.CLUB_BINARY](nft_items) == []
+
+
+def test_telegram_usernames_category_uses_traits() -> None:
+    username = build_nft_item(TELEGRAM_USERNAMES_ADDRESS, "@durov")
+    long_username = build_nft_item(TELEGRAM_USERNAMES_ADDRESS, "@accesstool")
+    handlers = CATEGORY_TO_METHOD_BY_ASSET_MAPPING[NftCollectionAsset.TELEGRAM_USERNAME]
+
+    assert handlers[TelegramUsernameCategory.LETTERS_5]([username, long_username]) == [
+        username
+    ]
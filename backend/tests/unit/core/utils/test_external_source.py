@@ -0,0 +1,100 @@
+import json
+
+import httpx
+import pytest
+
+from core.exceptions.chat import TelegramChatInvalidExternalSourceError
+from core.utils.external_source import (
+    fetch_dynamic_allowed_members_if_modified,
+    get_external_source_fingerprint,
+)
+
+URL = "https://example.com/api/whitelist"
+
+
+def build_client(
+    users: list[int], etag: str | None = None, requests: list | None = None
+) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        headers = {"ETag": etag} if etag else {}
+        return httpx.Response(
+            200, content=json.dumps({"users": users}), headers=headers
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_not_modified_response_is_skipped() -> None:
+    requests = []
+    async with build_client([1, 2], etag='"v1"', requests=requests) as client:
+        allowed_members, fetch_state = await fetch_dynamic_allowed_members_if_modified(
+            client, url=URL, auth_key="X-Key", auth_value="secret", fetch_state=None
+        )
+        assert allowed_members.users == [1, 2]
+        assert fetch_state.etag == '"v1"'
+
+        (
+            allowed_members,
+            next_fetch_state,
+        ) = await fetch_dynamic_allowed_members_if_modified(
+            client,
+            url=URL,
+            auth_key="X-Key",
+            auth_value="secret",
+            fetch_state=fetch_state,
+        )
+
+    assert allowed_members is None
+    assert next_fetch_state == fetch_state
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+    assert requests[1].headers["X-Key"] == "secret"
+
+
+@pytest.mark.asyncio
+async def test_same_payload_is_skipped_without_validators() -> None:
+    async with build_client([1, 2]) as client:
+        _, fetch_state = await fetch_dynamic_allowed_members_if_modified(
+            client, url=URL, auth_key=None, auth_value=None, fetch_state=None
+        )
+        allowed_members, _ = await fetch_dynamic_allowed_members_if_modified(
+            client, url=URL, auth_key=None, auth_value=None, fetch_state=fetch_state
+        )
+
+    assert allowed_members is None
+
+
+@pytest.mark.asyncio
+async def test_state_of_other_source_is_ignored() -> None:
+    requests = []
+    async with build_client([1, 2], etag='"v1"', requests=requests) as client:
+        _, fetch_state = await fetch_dynamic_allowed_members_if_modified(
+            client, url=URL, auth_key=None, auth_value=None, fetch_state=None
+        )
+        # Credentials were changed, so the members should be fetched again
+        allowed_members, _ = await fetch_dynamic_allowed_members_if_modified(
+            client,
+            url=URL,
+            auth_key="X-Key",
+            auth_value="other",
+            fetch_state=fetch_state,
+        )
+
+    assert allowed_members.users == [1, 2]
+    assert "If-None-Match" not in requests[1].headers
+    assert fetch_state.fingerprint != get_external_source_fingerprint(
+        URL, "X-Key", "other"
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalid_payload_is_rejected() -> None:
+    async with build_client(["1"]) as client:
+        with pytest.raises(TelegramChatInvalidExternalSourceError):
+            await fetch_dynamic_allowed_members_if_modified(
+                client, url=URL, auth_key=None, auth_value=None, fetch_state=None
+            )
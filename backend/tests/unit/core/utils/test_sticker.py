@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from core.utils.sticker import iter_sticker_dom_ownerships
+
+
+OWNERSHIP_DATA = {
+    "timestamp": "2025-01-01T00:00:00Z",
+    "data": {
+        "1": [{"100": [1, 2]}, {"200": [3]}],
+        "2": [],
+        "3": [{"300": [1], "400": [2, 3]}],
+    },
+}
+
+
+def expected_ownerships(ownership_data: dict) -> list[tuple[int, int, int]]:
+    return [
+        (int(character_id), int(user_id), instance)
+        for character_id, instances_per_user in ownership_data["data"].items()
+        for user_instances in instances_per_user
+        for user_id, instances in user_instances.items()
+        for instance in instances
+    ]
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        json.dumps(OWNERSHIP_DATA),
+        json.dumps(OWNERSHIP_DATA, indent=2),
+        json.dumps(OWNERSHIP_DATA, separators=(",", ":")),
+        # Data goes before the timestamp
+        json.dumps({"data": OWNERSHIP_DATA["data"], "timestamp": "2025"}),
+    ],
+)
+def test_iter_sticker_dom_ownerships__matches_full_decoding(raw: str) -> None:
+    assert list(iter_sticker_dom_ownerships(raw)) == expected_ownerships(OWNERSHIP_DATA)
+
+
+@pytest.mark.parametrize("raw", ["{}", '{"data": {}}', ' { "data" : { } } '])
+def test_iter_sticker_dom_ownerships__empty(raw: str) -> None:
+    assert list(iter_sticker_dom_ownerships(raw)) == []
+
+
+@pytest.mark.parametrize("raw", ['{"data": {"1": [{"100": [1]}', '{"data" {}}', "[]"])
+def test_iter_sticker_dom_ownerships__malformed(raw: str) -> None:
+    with pytest.raises(ValueError):
+        list(iter_sticker_dom_ownerships(raw))
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+
+from core.utils.task import WorkerEventLoop
+
+
+def test_worker_event_loop_is_reused() -> None:
+    async def get_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        first_loop = WorkerEventLoop.run(get_loop)()
+        second_loop = WorkerEventLoop.run(get_loop)()
+
+        assert first_loop is second_loop
+        assert first_loop.is_running()
+    finally:
+        WorkerEventLoop.shutdown()
+
+
+def test_worker_event_loop_shutdown_runs_cleanups() -> None:
+    cleaned_up_in: list[int] = []
+
+    async def get_thread_id() -> int:
+        return threading.get_ident()
+
+    async def cleanup() -> None:
+        cleaned_up_in.append(threading.get_ident())
+
+    loop_thread_id = WorkerEventLoop.run(get_thread_id)()
+    loop = WorkerEventLoop.get_loop()
+
+    WorkerEventLoop.shutdown(cleanup)
+
+    assert cleaned_up_in == [loop_thread_id]
+    # A new loop is started on the next call
+    assert WorkerEventLoop.get_loop() is not loop
+    WorkerEventLoop.shutdown()
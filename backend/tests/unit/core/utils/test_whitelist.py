@@ -0,0 +1,71 @@
+import base64
+
+import pytest
+from pydantic import ValidationError
+
+from core.dtos.chat.rule.plan import WhitelistRulePlanDTO
+from core.utils.whitelist import WhitelistMembers
+
+
+@pytest.mark.parametrize(
+    ("telegram_id", "expected"),
+    [
+        (1, True),
+        (500, True),
+        (2**40, True),
+        (0, False),
+        (2, False),
+        (2**40 + 1, False),
+        (2**70, False),
+        ("1", False),
+    ],
+)
+def test_whitelist_members_lookup(telegram_id: object, expected: bool) -> None:
+    members = WhitelistMembers([500, 1, 2**40, 1])
+
+    assert (telegram_id in members) is expected
+
+
+def test_whitelist_members_are_sorted_and_deduplicated() -> None:
+    members = WhitelistMembers([3, 1, 2, 3])
+
+    assert list(members) == [1, 2, 3]
+    assert len(members) == 3
+    assert members == frozenset({1, 2, 3})
+    assert not WhitelistMembers()
+
+
+def test_whitelist_rule_plan_json_roundtrip() -> None:
+    rule = WhitelistRulePlanDTO(
+        id=1,
+        group_id=1,
+        is_enabled=True,
+        name="Whitelist",
+        content=range(0, 200_000, 2),
+    )
+
+    dumped = rule.model_dump_json()
+    restored = WhitelistRulePlanDTO.model_validate_json(dumped)
+
+    assert restored == rule
+    assert 199_998 in restored.content
+    assert 199_999 not in restored.content
+    # Compressed array is much smaller than the list of IDs
+    assert len(dumped) < len(",".join(map(str, rule.content))) // 2
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        ["a"],
+        # Not a compressed array
+        base64.b64encode(b"invalid").decode(),
+        # Not a base64 string
+        "!",
+    ],
+)
+def test_whitelist_members_reject_invalid_values(content: object) -> None:
+    with pytest.raises(ValidationError):
+        WhitelistRulePlanDTO(
+            id=1, group_id=1, is_enabled=True, name="Whitelist", content=content
+        )
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock
 from sqlalchemy.orm import Session
 
+from core.constants import UPDATED_WALLETS_SET_NAME
 from core.models.wallet import UserWallet
 from pytonapi.schema.jettons import JettonsBalances
 from pytonapi.schema.nft import NftItems
@@ -26,9 +27,28 @@ def mock_db_session(db_session, mocker):
     )
 
 
+@pytest.fixture
+def mock_tonapi_service(mocker) -> MagicMock:
+    mock_service_class = mocker.patch("indexer_blockchain.tasks.TonApiService")
+    mock_service = mock_service_class.return_value
+    # The service is used as an async context manager to share the pooled client
+    mock_service.__aenter__.return_value = mock_service
+    return mock_service
+
+
+def build_account_info(raw_address: str, last_activity: int, balance: int) -> MagicMock:
+    account_info = MagicMock()
+    account_info.last_activity = last_activity
+    account_info.balance = balance
+    account_info.address.to_raw.return_value = raw_address
+    return account_info
+
+
 @pytest.mark.usefixtures("db_session")
 class TestIndexerTasks:
-    def test_fetch_wallet_details_initial_sync(self, db_session: Session, mocker):
+    def test_fetch_wallet_details_initial_sync(
+        self, db_session: Session, mock_tonapi_service: MagicMock
+    ):
         # 1. Arrange: Create wallet with last_activity = None
         raw_address = (
             "0:1111111111111111111111111111111111111111111111111111111111111111"
@@ -39,9 +59,7 @@ class TestIndexerTasks:
         )
         db_session.commit()
 
-        # Mock TonApiService
-        mock_service_class = mocker.patch("indexer_blockchain.tasks.TonApiService")
-        mock_service = mock_service_class.return_value
+        mock_service = mock_tonapi_service
 
         # Mock get_account_info
         account_info = MagicMock()
@@ -76,7 +94,7 @@ class TestIndexerTasks:
         assert updated_wallet.balance == 1000000000
 
     def test_fetch_wallet_details_skips_when_last_activity_unchanged(
-        self, db_session: Session, mocker
+        self, db_session: Session, mock_tonapi_service: MagicMock
     ):
         # 1. Arrange: Create wallet with last_activity = 123456
         raw_address = (
@@ -89,9 +107,7 @@ class TestIndexerTasks:
         )
         db_session.commit()
 
-        # Mock TonApiService
-        mock_service_class = mocker.patch("indexer_blockchain.tasks.TonApiService")
-        mock_service = mock_service_class.return_value
+        mock_service = mock_tonapi_service
 
         # Mock get_account_info (same last_activity)
         account_info = MagicMock()
@@ -120,7 +136,7 @@ class TestIndexerTasks:
         assert updated_wallet.balance == 5000000000
 
     def test_fetch_wallet_details_syncs_when_last_activity_changed(
-        self, db_session: Session, mocker
+        self, db_session: Session, mock_tonapi_service: MagicMock
     ):
         # 1. Arrange: Create wallet with last_activity = 123456
         raw_address = (
@@ -133,9 +149,7 @@ class TestIndexerTasks:
         )
         db_session.commit()
 
-        # Mock TonApiService
-        mock_service_class = mocker.patch("indexer_blockchain.tasks.TonApiService")
-        mock_service = mock_service_class.return_value
+        mock_service = mock_tonapi_service
 
         # Mock get_account_info (new last_activity = 999999)
         account_info = MagicMock()
@@ -168,3 +182,53 @@ class TestIndexerTasks:
         )
         assert updated_wallet.last_activity == 999999
         assert updated_wallet.balance == 6000000000
+
+    def test_fetch_wallet_details_indexes_changed_wallets_of_batch(
+        self,
+        db_session: Session,
+        mock_tonapi_service: MagicMock,
+        mock_redis_service: MagicMock,
+    ):
+        unchanged_address = (
+            "0:4444444444444444444444444444444444444444444444444444444444444444"
+        )
+        changed_address = (
+            "0:5555555555555555555555555555555555555555555555555555555555555555"
+        )
+        UserWalletFactory.with_session(db_session).create(
+            address=unchanged_address, last_activity=1, balance=1
+        )
+        UserWalletFactory.with_session(db_session).create(
+            address=changed_address, last_activity=1, balance=1
+        )
+        db_session.commit()
+
+        accounts_info = {
+            unchanged_address: build_account_info(unchanged_address, 1, 1),
+            changed_address: build_account_info(changed_address, 2, 2),
+        }
+        mock_tonapi_service.get_account_info = AsyncMock(
+            side_effect=lambda address: accounts_info[address]
+        )
+        mock_tonapi_service.get_all_jetton_balances = AsyncMock(
+            return_value=JettonsBalances(balances=[])
+        )
+
+        async def mock_get_nfts(*args, **kwargs):
+            yield NftItems(nft_items=[])
+
+        mock_tonapi_service.get_all_nft_items_for_user = mock_get_nfts
+
+        fetch_wallet_details(unchanged_address, changed_address)
+
+        assert mock_tonapi_service.get_account_info.call_count == 2
+        mock_tonapi_service.get_all_jetton_balances.assert_called_once_with(
+            changed_address
+        )
+        mock_redis_service.return_value.add_to_set.assert_called_once_with(
+            UPDATED_WALLETS_SET_NAME, changed_address
+        )
+        db_session.expire_all()
+        assert (
+            db_session.query(UserWallet).filter_by(address=changed_address).one()
+        ).balance == 2
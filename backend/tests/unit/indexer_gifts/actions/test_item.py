@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.constants import GIFT_COLLECTIONS_METADATA_KEY
+from indexer_gifts.actions.item import IndexerGiftUniqueAction
+
+
+def build_gift(slug: str, telegram_owner_id: int | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        slug=slug,
+        number=int(slug.rsplit("-", 1)[-1]),
+        model="model",
+        backdrop="backdrop",
+        pattern="pattern",
+        telegram_owner_id=telegram_owner_id,
+        owner_address=None,
+        blockchain_address=None,
+    )
+
+
+@pytest.fixture
+def action(mocker: MockerFixture) -> IndexerGiftUniqueAction:
+    mocker.patch("indexer_gifts.actions.item.RedisService")
+    mocker.patch("indexer_gifts.actions.item.GiftUniqueIndexer")
+    action = IndexerGiftUniqueAction(db_session=MagicMock(), session_paths=[])
+    action.service = MagicMock()
+    return action
+
+
+async def run_index(action: IndexerGiftUniqueAction, batches: list[list]) -> set[int]:
+    async def index_collection_items(**kwargs):
+        for batch in batches:
+            yield batch
+
+    action.indexer.index_collection_items = index_collection_items
+    collection = SimpleNamespace(slug="collection", upgraded_count=3)
+    return await action._index(collection, start=None, stop=None)
+
+
+@pytest.mark.asyncio
+async def test_index_writes_changed_items_only(
+    action: IndexerGiftUniqueAction,
+) -> None:
+    action.service.get_owners.return_value = {
+        "collection-1": (1, None),
+        "collection-2": (2, None),
+        "collection-3": (None, None),
+    }
+    action.service.bulk_upsert.return_value = [
+        SimpleNamespace(
+            slug="collection-1", previous_telegram_owner_id=1, is_created=False
+        ),
+        SimpleNamespace(
+            slug="collection-3", previous_telegram_owner_id=None, is_created=False
+        ),
+    ]
+
+    targeted_telegram_owner_ids = await run_index(
+        action,
+        [
+            [
+                build_gift("collection-1", 3),
+                build_gift("collection-2", 2),
+                build_gift("collection-3", 4),
+            ]
+        ],
+    )
+
+    [items] = action.service.bulk_upsert.call_args.args
+    assert [item["slug"] for item in items] == ["collection-1", "collection-3"]
+    # Previously hidden owners are ignored
+    assert targeted_telegram_owner_ids == {1}
+    action.redis_service.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_index_skips_write_for_unchanged_batch(
+    action: IndexerGiftUniqueAction,
+) -> None:
+    action.service.get_owners.return_value = {"collection-1": (1, None)}
+
+    targeted_telegram_owner_ids = await run_index(
+        action, [[build_gift("collection-1", 1)]]
+    )
+
+    assert targeted_telegram_owner_ids == set()
+    action.service.bulk_upsert.assert_not_called()
+    action.db_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_index_clears_metadata_cache_on_new_items(
+    action: IndexerGiftUniqueAction,
+) -> None:
+    action.service.get_owners.return_value = {}
+    action.service.bulk_upsert.return_value = [
+        SimpleNamespace(
+            slug="collection-1", previous_telegram_owner_id=None, is_created=True
+        )
+    ]
+
+    await run_index(action, [[build_gift("collection-1", 1)]])
+
+    action.redis_service.delete.assert_called_once_with(GIFT_COLLECTIONS_METADATA_KEY)
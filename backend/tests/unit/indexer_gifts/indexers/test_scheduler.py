@@ -0,0 +1,142 @@
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+from telethon.errors import FloodWaitError, PhoneNumberBannedError
+
+from core.exceptions.gift import GiftBatchFetchError
+from indexer_gifts.indexers.scheduler import MAX_BATCH_ATTEMPTS, GiftBatchScheduler
+
+
+def build_batches(batches_count: int) -> list[list[str]]:
+    return [[f"gift-{idx}"] for idx in range(batches_count)]
+
+
+def build_telethon_service(side_effect=None) -> AsyncMock:
+    telethon_service = AsyncMock()
+    telethon_service.index_gifts_batch.side_effect = side_effect or (
+        lambda slugs, sleep_on_flood_wait: slugs
+    )
+    return telethon_service
+
+
+async def collect(scheduler: GiftBatchScheduler, batches: list[list[str]]) -> list[str]:
+    return [gift async for gifts in scheduler.fetch(batches) for gift in gifts]
+
+
+@pytest.mark.asyncio
+async def test_fetch_spreads_batches_across_sessions() -> None:
+    telethon_services = {
+        Path("first.session"): build_telethon_service(),
+        Path("second.session"): build_telethon_service(),
+    }
+    scheduler = GiftBatchScheduler(telethon_services, concurrency_per_session=2)
+
+    gifts = await collect(scheduler, build_batches(20))
+
+    assert sorted(gifts) == sorted(slug for [slug] in build_batches(20))
+    for telethon_service in telethon_services.values():
+        telethon_service.index_gifts_batch.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_reschedules_batch_after_flood_wait() -> None:
+    calls = []
+
+    def index_gifts_batch(slugs: list[str], sleep_on_flood_wait: bool) -> list[str]:
+        assert sleep_on_flood_wait is False
+        calls.append(slugs)
+        if len(calls) == 1:
+            raise FloodWaitError(request=None, capture=0)
+        return slugs
+
+    scheduler = GiftBatchScheduler(
+        {Path("first.session"): build_telethon_service(index_gifts_batch)},
+        concurrency_per_session=2,
+    )
+
+    gifts = await collect(scheduler, build_batches(3))
+
+    assert sorted(gifts) == ["gift-0", "gift-1", "gift-2"]
+    [session] = scheduler.sessions
+    # Concurrency is halved after the flood wait
+    assert session.concurrency == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_continues_with_healthy_sessions_when_one_is_banned() -> None:
+    def banned(slugs: list[str], sleep_on_flood_wait: bool) -> list[str]:
+        raise PhoneNumberBannedError(request=None)
+
+    scheduler = GiftBatchScheduler(
+        {
+            Path("banned.session"): build_telethon_service(banned),
+            Path("healthy.session"): build_telethon_service(),
+        },
+        concurrency_per_session=1,
+    )
+
+    gifts = await collect(scheduler, build_batches(5))
+
+    assert sorted(gifts) == sorted(slug for [slug] in build_batches(5))
+    assert [session.session_path for session in scheduler.failed_sessions] == [
+        Path("banned.session")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fetch_raises_when_all_sessions_failed() -> None:
+    def banned(slugs: list[str], sleep_on_flood_wait: bool) -> list[str]:
+        raise PhoneNumberBannedError(request=None)
+
+    scheduler = GiftBatchScheduler(
+        {Path("banned.session"): build_telethon_service(banned)},
+        concurrency_per_session=1,
+    )
+
+    with pytest.raises(PhoneNumberBannedError):
+        await collect(scheduler, build_batches(2))
+
+
+@pytest.mark.asyncio
+async def test_fetch_retries_batch_after_unexpected_error() -> None:
+    calls = []
+
+    def index_gifts_batch(slugs: list[str], sleep_on_flood_wait: bool) -> list[str]:
+        calls.append(slugs)
+        if slugs == ["gift-1"] and calls.count(slugs) == 1:
+            raise ConnectionError("Connection lost")
+        return slugs
+
+    scheduler = GiftBatchScheduler(
+        {Path("first.session"): build_telethon_service(index_gifts_batch)},
+        concurrency_per_session=2,
+    )
+
+    gifts = await collect(scheduler, build_batches(3))
+
+    assert sorted(gifts) == ["gift-0", "gift-1", "gift-2"]
+    assert calls.count(["gift-1"]) == 2
+    assert not scheduler.failed_sessions
+
+
+@pytest.mark.asyncio
+async def test_fetch_raises_when_batch_attempts_are_exhausted() -> None:
+    calls = []
+
+    def index_gifts_batch(slugs: list[str], sleep_on_flood_wait: bool) -> list[str]:
+        calls.append(slugs)
+        if slugs == ["gift-1"]:
+            raise ConnectionError("Connection lost")
+        return slugs
+
+    scheduler = GiftBatchScheduler(
+        {Path("first.session"): build_telethon_service(index_gifts_batch)},
+        concurrency_per_session=1,
+    )
+
+    with pytest.raises(GiftBatchFetchError, match="gift-1") as exc_info:
+        await collect(scheduler, build_batches(3))
+
+    assert isinstance(exc_info.value.__cause__, ConnectionError)
+    assert calls.count(["gift-1"]) == MAX_BATCH_ATTEMPTS
@@ -0,0 +1,36 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.constants import UPDATED_GIFT_USER_IDS
+from indexer_gifts.tasks import index_gift_collection_ownerships
+
+
+@pytest.mark.asyncio
+async def test_updated_owners_are_pushed_per_collection() -> None:
+    action = MagicMock()
+    action.indexer.scheduler.failed_sessions = []
+
+    async def index_all():
+        yield {1, 2}
+        yield set()
+        raise RuntimeError("Collection failed")
+
+    action.index_all = index_all
+
+    with (
+        patch("indexer_gifts.tasks.DBService"),
+        patch("indexer_gifts.tasks.SessionPoolLockManager"),
+        patch("indexer_gifts.tasks.IndexerGiftUniqueAction", return_value=action),
+        patch(
+            "indexer_gifts.tasks.EligibilitySummaryCacheService"
+        ) as eligibility_cache_mock,
+        pytest.raises(RuntimeError),
+    ):
+        await index_gift_collection_ownerships(slug=None, start=None, stop=None)
+
+    # Owners of the collection indexed before the failure are still rechecked
+    action.redis_service.add_to_set.assert_called_once_with(UPDATED_GIFT_USER_IDS, 1, 2)
+    eligibility_cache_mock.return_value.bump_gift_versions.assert_called_once_with(
+        {1, 2}
+    )
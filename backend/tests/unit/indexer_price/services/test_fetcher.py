@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+import pytest
+
+from indexer_price.services.fetcher import PriceFetcher
+
+
+def build_status_error(
+    status_code: int, headers: dict | None = None
+) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com/")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("Error", request=request, response=response)
+
+
+async def collect(fetcher: PriceFetcher, items: list) -> dict:
+    return {item: result async for item, result in fetcher.fetch_all(items)}
+
+
+@pytest.mark.asyncio
+async def test_fetches_concurrently() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return item * 2
+
+    fetcher = PriceFetcher(provider="Test", fetch=fetch, concurrency=4)
+
+    results = await collect(fetcher, list(range(20)))
+
+    assert results == {item: item * 2 for item in range(20)}
+    assert max_in_flight == 4
+    assert fetcher.stats.succeeded == 20
+    assert len(fetcher.stats.latencies) == 20
+    assert fetcher.stats.p95_latency >= fetcher.stats.mean_latency > 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        build_status_error(429, headers={"Retry-After": "0"}),
+        build_status_error(503),
+        httpx.ConnectTimeout("Timeout"),
+    ],
+)
+async def test_retries_transient_errors(error: Exception) -> None:
+    attempts = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise error
+        return item
+
+    fetcher = PriceFetcher(provider="Test", fetch=fetch, concurrency=1, backoff=0)
+
+    assert await collect(fetcher, [1]) == {1: 1}
+    assert attempts == 2
+    assert fetcher.stats.retried == 1
+    assert fetcher.stats.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_skips_failed_items() -> None:
+    attempts: dict[int, int] = {}
+
+    async def fetch(item: int) -> int:
+        attempts[item] = attempts.get(item, 0) + 1
+        if item == 1:
+            raise build_status_error(404)
+        if item == 2:
+            raise build_status_error(500)
+        return item
+
+    fetcher = PriceFetcher(
+        provider="Test", fetch=fetch, concurrency=2, max_attempts=3, backoff=0
+    )
+
+    assert await collect(fetcher, [1, 2, 3]) == {3: 3}
+    # Client errors are not retried, server errors are retried until attempts run out
+    assert attempts == {1: 1, 2: 3, 3: 1}
+    assert fetcher.stats.succeeded == 1
+    assert fetcher.stats.failed == 2
+    assert fetcher.stats.retried == 2
+
+
+@pytest.mark.asyncio
+async def test_stops_workers_when_consumer_stops() -> None:
+    fetched = []
+
+    async def fetch(item: int) -> int:
+        await asyncio.sleep(0.01)
+        fetched.append(item)
+        return item
+
+    fetcher = PriceFetcher(provider="Test", fetch=fetch, concurrency=2)
+
+    async for _ in fetcher.fetch_all(list(range(10))):
+        break
+    await asyncio.sleep(0.05)
+
+    assert len(fetched) < 10
@@ -0,0 +1,62 @@
+import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+EXPLAINED_STATEMENTS = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+@contextmanager
+def capture_statements(db_session: Session) -> Iterator[list[tuple[str, Any]]]:
+    """
+    Collects the statements executed in the session along with their parameters,
+    so their plans can be checked with `get_sequential_scans`.
+    """
+    statements: list[tuple[str, Any]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and statement.lstrip().upper().startswith(
+            EXPLAINED_STATEMENTS
+        ):
+            statements.append((statement, parameters))
+
+    connection = db_session.connection()
+    event.listen(connection, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", _capture)
+
+
+def _iter_plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _iter_plan_nodes(child)
+
+
+def get_sequential_scans(
+    db_session: Session, statement: str, parameters: Any
+) -> set[str]:
+    """
+    Explains the statement with sequential scans discouraged for the rest of the transaction.
+    The planner still picks them when no index can be used, so they reveal missing indexes
+    even on the small tables of the test database.
+
+    :return: Names of the tables scanned sequentially
+    """
+    connection = db_session.connection()
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    ).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return {
+        node["Relation Name"]
+        for node in _iter_plan_nodes(plan[0]["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    }